@@ -18,10 +18,13 @@ from typing import (
     overload,
 )
 
+from earnorm.tracing import get_tracer
+
 if TYPE_CHECKING:
     from earnorm.base.model.base import BaseModel
 
 logger = logging.getLogger(__name__)
+_trace = get_tracer(__name__)
 
 T = TypeVar("T")
 ModelT = TypeVar("ModelT", bound="BaseModel")
@@ -67,21 +70,22 @@ def model(method: F) -> F:
     @functools.wraps(method)
     async def wrapper(cls: type["BaseModel"], *args: Any, **kwargs: Any) -> Any:
         try:
-            # Log method call
-            logger.debug(f"Calling {cls.__name__}.{method.__name__} with args={args}, kwargs={kwargs}")
+            _trace("Calling %s.%s with args=%s, kwargs=%s", cls.__name__, method.__name__, args, kwargs)
 
             # Execute method with all args and kwargs
             result = await method(cls, *args, **kwargs)
 
-            # Log result
-            logger.debug(f"Method {cls.__name__}.{method.__name__} returned: {result}")
+            _trace("Method %s.%s returned: %s", cls.__name__, method.__name__, result)
 
             return result
 
         except Exception as e:
             # Log error with more details
             logger.error(
-                f"Error in {cls.__name__}.{method.__name__}: {e!s}",
+                "Error in %s.%s: %s",
+                cls.__name__,
+                method.__name__,
+                e,
                 exc_info=True,
                 extra={
                     "args": args,
@@ -123,26 +127,30 @@ def multi(method: F) -> F:
             if not hasattr(self, "_ids"):
                 raise ValueError(f"Method {method.__name__} must be called on recordset")
 
-            # Get record IDs safely
-            record_ids = getattr(self, "_ids", [])
-
-            # Log method call
-            logger.debug(
-                f"Calling {self.__class__.__name__}.{method.__name__} on records {record_ids} with args={args}, kwargs={kwargs}"
-            )
+            if _trace.enabled:
+                _trace(
+                    "Calling %s.%s on %d records with args=%s, kwargs=%s",
+                    self.__class__.__name__,
+                    method.__name__,
+                    len(self._ids),
+                    args,
+                    kwargs,
+                )
 
             # Execute method
             result = await method(self, *args, **kwargs)
 
-            # Log result
-            logger.debug(f"Method {self.__class__.__name__}.{method.__name__} returned: {result}")
+            _trace("Method %s.%s returned: %s", self.__class__.__name__, method.__name__, result)
 
             return result
 
         except Exception as e:
             # Log error
             logger.error(
-                f"Error in {self.__class__.__name__}.{method.__name__}: {e!s}",
+                "Error in %s.%s: %s",
+                self.__class__.__name__,
+                method.__name__,
+                e,
                 exc_info=True,
             )
             raise
@@ -181,23 +189,29 @@ def one(method: F) -> F:
             if not record_ids or len(record_ids) != 1:
                 raise ValueError(f"Method {method.__name__} must be called on single record")
 
-            # Log method call
-            logger.debug(
-                f"Calling {self.__class__.__name__}.{method.__name__} on record {record_ids[0]} with args={args}, kwargs={kwargs}"
+            _trace(
+                "Calling %s.%s on record %s with args=%s, kwargs=%s",
+                self.__class__.__name__,
+                method.__name__,
+                record_ids[0],
+                args,
+                kwargs,
             )
 
             # Execute method
             result = await method(self, *args, **kwargs)
 
-            # Log result
-            logger.debug(f"Method {self.__class__.__name__}.{method.__name__} returned: {result}")
+            _trace("Method %s.%s returned: %s", self.__class__.__name__, method.__name__, result)
 
             return result
 
         except Exception as e:
             # Log error
             logger.error(
-                f"Error in {self.__class__.__name__}.{method.__name__}: {e!s}",
+                "Error in %s.%s: %s",
+                self.__class__.__name__,
+                method.__name__,
+                e,
                 exc_info=True,
             )
             raise
@@ -20,6 +20,7 @@ Examples:
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
@@ -33,6 +34,7 @@ from typing import (
     overload,
 )
 
+from earnorm.base.database.count_cache import CountCache
 from earnorm.base.database.query.core.query import BaseQuery
 from earnorm.base.database.query.interfaces.domain import DomainExpression
 from earnorm.base.database.query.interfaces.operations.aggregate import (
@@ -41,7 +43,8 @@ from earnorm.base.database.query.interfaces.operations.aggregate import (
 from earnorm.base.database.query.interfaces.operations.join import (
     JoinProtocol as JoinQuery,
 )
-from earnorm.base.database.transaction.base import TransactionManager
+from earnorm.base.database.transaction.base import TransactionManager, UnitOfWork
+from earnorm.base.database.update_ops import FieldUpdate
 from earnorm.types import DatabaseModel
 from earnorm.types.relations import RelationOptions, RelationType
 
@@ -93,6 +96,8 @@ class DatabaseAdapter(Generic[ModelT], ABC):
     def __init__(self) -> None:
         """Initialize database adapter."""
         self._env = None
+        # Exact search_count results, dropped when the adapter writes
+        self.count_cache = CountCache()
 
     @property
     def env(self) -> Any:
@@ -112,6 +117,20 @@ class DatabaseAdapter(Generic[ModelT], ABC):
         """
         self._env = value
 
+    def cache_name(self, model_type: type[ModelT]) -> str:
+        """Get name the count cache keys results of a model by.
+
+        Writes invalidate the cache with the name of the collection they
+        wrote to, so results must be cached under that same name.
+
+        Args:
+            model_type: Model class
+
+        Returns:
+            str: Collection name
+        """
+        return str(model_type._name)  # type: ignore
+
     @abstractmethod
     async def init(self) -> None:
         """Initialize and connect to database.
@@ -635,12 +654,12 @@ class DatabaseAdapter(Generic[ModelT], ABC):
 
     @abstractmethod
     @overload
-    async def delete(self, model: type[ModelT], filter: dict[str, Any]) -> int:
+    async def delete(self, model: type[ModelT], filter: dict[str, Any] | DomainExpression) -> int:
         """Delete multiple records by filter.
 
         Args:
             model: Model type
-            filter: Filter to match records
+            filter: Filter or domain expression to match records
 
         Returns:
             Number of records deleted
@@ -654,7 +673,7 @@ class DatabaseAdapter(Generic[ModelT], ABC):
     async def delete(
         self,
         model: ModelT | type[ModelT],
-        filter: dict[str, Any] | None = None,
+        filter: dict[str, Any] | DomainExpression | None = None,
     ) -> int | None:
         """Delete one or multiple records.
 
@@ -664,11 +683,12 @@ class DatabaseAdapter(Generic[ModelT], ABC):
 
         Args:
             model: Model instance or model type
-            filter: Filter to match records (only used with model type)
+            filter: Filter or domain expression to match records (only used with model type)
 
         Returns:
             - None when deleting single record
-            - Number of records deleted when using filter
+            - Number of records deleted when using filter, 0 when the
+              deletion is recorded in a unit of work
 
         Raises:
             DatabaseError: If deletion fails
@@ -943,6 +963,163 @@ class DatabaseAdapter(Generic[ModelT], ABC):
         """Check if object is a model instance."""
         return not isinstance(obj, type) and isinstance(obj, DatabaseModel)
 
+    async def sync_schema(self, model_type: type[ModelT]) -> list[str]:
+        """Create collection/table objects declared by a model.
+
+        Backends override this to create unique indexes and other declared
+        schema objects. The default implementation creates nothing.
+
+        Args:
+            model_type: Model class
+
+        Returns:
+            list[str]: Names of the ensured objects
+
+        Raises:
+            DatabaseError: If schema objects cannot be created
+        """
+        return []
+
+    async def find_existing(
+        self,
+        model_type: type[ModelT],
+        field_name: str,
+        values: list[Any],
+        exclude_ids: list[str] | None = None,
+    ) -> list[Any]:
+        """Find which values of a field are already stored.
+
+        Args:
+            model_type: Model class
+            field_name: Field name
+            values: Python values to look up
+            exclude_ids: IDs of records whose values are ignored
+
+        Returns:
+            list[Any]: Stored values matching any of the values
+
+        Raises:
+            NotImplementedError: If the backend does not support batched lookups
+        """
+        raise NotImplementedError(f"{self.backend_type} adapter does not support uniqueness pre-checks")
+
+    async def apply_updates(
+        self,
+        model_type: type[ModelT],
+        filter_or_domain: dict[str, Any] | DomainExpression,
+        updates: Sequence[FieldUpdate],
+    ) -> int:
+        """Apply partial updates to matching records atomically.
+
+        Args:
+            model_type: Model class
+            filter_or_domain: Records to update
+            updates: Partial updates holding database values
+
+        Returns:
+            int: Number of modified records
+
+        Raises:
+            NotImplementedError: If the backend does not support partial updates
+        """
+        raise NotImplementedError(f"{self.backend_type} adapter does not support partial updates")
+
+    async def upsert(
+        self,
+        model_type: type[ModelT],
+        filter_or_domain: dict[str, Any] | DomainExpression,
+        values: dict[str, Any],
+        on_insert: dict[str, Any] | None = None,
+    ) -> tuple[str, bool]:
+        """Update the record matching a filter, or insert it, in one operation.
+
+        Args:
+            model_type: Model class
+            filter_or_domain: Record to update, equality conditions are copied into inserted records
+            values: Database values set in any case
+            on_insert: Database values only set when inserting
+
+        Returns:
+            Tuple[str, bool]: Record ID and whether it was inserted
+
+        Raises:
+            NotImplementedError: If the backend does not support upserts
+        """
+        raise NotImplementedError(f"{self.backend_type} adapter does not support upserts")
+
+    async def upsert_many(
+        self,
+        model_type: type[ModelT],
+        rows: Sequence[tuple[dict[str, Any] | DomainExpression, dict[str, Any], dict[str, Any]]],
+    ) -> dict[str, int]:
+        """Upsert many records in one round trip.
+
+        Args:
+            model_type: Model class
+            rows: Filter or domain, values set in any case and values only set when inserting, per record
+
+        Returns:
+            Dict[str, int]: Numbers of matched, modified and inserted records
+
+        Raises:
+            NotImplementedError: If the backend does not support upserts
+        """
+        raise NotImplementedError(f"{self.backend_type} adapter does not support upserts")
+
+    async def find_and_modify(
+        self,
+        model_type: type[ModelT],
+        filter_or_domain: dict[str, Any] | DomainExpression,
+        values: dict[str, Any],
+        updates: Sequence[FieldUpdate] = (),
+        return_new: bool = True,
+    ) -> dict[str, Any] | None:
+        """Update the record matching a filter and return it in one operation.
+
+        Args:
+            model_type: Model class
+            filter_or_domain: Record to update
+            values: Database values to set
+            updates: Partial updates applied in the same operation
+            return_new: Return the record after the update instead of before
+
+        Returns:
+            Optional[Dict[str, Any]]: Stored record, None if no record matches
+
+        Raises:
+            NotImplementedError: If the backend does not support atomic read-modify-write
+        """
+        raise NotImplementedError(f"{self.backend_type} adapter does not support find and modify")
+
+    def unit_of_work(self, max_retries: int = 3) -> UnitOfWork:
+        """Create unit of work recording ORM writes across models.
+
+        Args:
+            max_retries: Maximum attempts for the transaction and for its commit
+
+        Returns:
+            UnitOfWork: Context manager flushing recorded writes in one transaction
+
+        Raises:
+            NotImplementedError: If the backend does not support units of work
+        """
+        raise NotImplementedError(f"{self.backend_type} adapter does not support units of work")
+
+    def materialized_view(self, model_type: type[ModelT], name: str) -> Any:
+        """Get materialized aggregate view declared by a model.
+
+        Args:
+            model_type: Model class declaring ``_materialized``
+            name: View name
+
+        Returns:
+            Materialized view
+
+        Raises:
+            NotImplementedError: If the backend does not support materialized views
+        """
+        raise NotImplementedError(f"{self.backend_type} adapter does not support materialized views")
+
     @abstractmethod
     async def setup_relations(self, model: type[ModelT], relations: dict[str, RelationOptions]) -> None:
         """Set up relation fields for model.
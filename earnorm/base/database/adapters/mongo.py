@@ -6,6 +6,7 @@ It handles the conversion between string IDs (used by models) and ObjectId (used
 
 import json
 import logging
+from collections.abc import Sequence
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
@@ -25,9 +26,25 @@ from motor.motor_asyncio import (
     AsyncIOMotorCollection,
     AsyncIOMotorDatabase,
 )
-from pymongo.operations import DeleteOne, InsertOne, UpdateOne
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from pymongo.operations import DeleteMany, DeleteOne, InsertOne, UpdateMany, UpdateOne
+from pymongo.read_concern import ReadConcern
+from pymongo.read_preferences import (
+    Nearest,
+    Primary,
+    PrimaryPreferred,
+    Secondary,
+    SecondaryPreferred,
+)
 
 from earnorm.base.database.adapter import DatabaseAdapter, FieldType
+from earnorm.base.database.materialized import (
+    STATE_COLLECTION,
+    MaterializedView,
+    materialized_specs,
+    watermark_indexes,
+)
 from earnorm.base.database.query.backends.mongo.converter import MongoConverter
 from earnorm.base.database.query.backends.mongo.operations.aggregate import (
     MongoAggregate,
@@ -42,17 +59,40 @@ from earnorm.base.database.query.interfaces.operations.aggregate import (
 from earnorm.base.database.query.interfaces.operations.join import (
     JoinProtocol as JoinQuery,
 )
-from earnorm.base.database.transaction.backends.mongo import MongoTransactionManager
+from earnorm.base.database.read_options import ReadOptions, current_read_options
+from earnorm.base.database.timeseries import ensure_timeseries_collection, timeseries_spec
+from earnorm.base.database.transaction.backends.mongo import MongoTransactionManager, MongoUnitOfWork
+from earnorm.base.database.transaction.base import current_unit_of_work
+from earnorm.base.database.unique import (
+    duplicate_key_error,
+    is_duplicate_key_error,
+    outdated_indexes,
+    unique_collation,
+    unique_indexes,
+)
+from earnorm.base.database.update_ops import FieldUpdate, compile_updates
 from earnorm.di import container
 from earnorm.exceptions import DatabaseError
 from earnorm.pool.backends.mongo import MongoPool
 from earnorm.pool.protocols import AsyncConnectionProtocol
+from earnorm.tracing import get_tracer
 from earnorm.types import DatabaseModel, JsonDict
 from earnorm.types.relations import RelationOptions, RelationType
 
 ModelT = TypeVar("ModelT", bound=DatabaseModel)
 T = TypeVar("T")
 
+_trace = get_tracer(__name__)
+
+# Read preference mode name to pymongo read preference
+READ_PREFERENCE_MAPPING = {
+    "primary": Primary(),
+    "primaryPreferred": PrimaryPreferred(),
+    "secondary": Secondary(),
+    "secondaryPreferred": SecondaryPreferred(),
+    "nearest": Nearest(),
+}
+
 # Type mapping for field conversions
 TYPE_MAPPING = {
     "string": str,
@@ -104,6 +144,9 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
         self._pool_name = pool_name
         self._pool: MongoPool[AsyncIOMotorDatabase[dict[str, Any]], AsyncIOMotorCollection[JsonDict]] | None = None
         self._sync_db: AsyncIOMotorDatabase[dict[str, Any]] | None = None
+        # Collection handles per (collection, read preference, read concern)
+        self._read_collections: dict[tuple[str, str | None, str | None], AsyncIOMotorCollection[dict[str, Any]]] = {}
+        self._materialized_views: dict[tuple[str, str], MaterializedView] = {}
 
     async def init(self) -> None:
         """Initialize the adapter.
@@ -188,6 +231,7 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
         if self._sync_db is not None:
             self._sync_db.client.close()
             self._sync_db = None
+        self._read_collections.clear()
         self._pool = None
 
     async def get_collection(self, name: str) -> AsyncIOMotorCollection[JsonDict]:
@@ -254,6 +298,73 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
 
         return self._sync_db[collection_name]  # type: ignore
 
+    def cache_name(self, model_type: type[ModelT]) -> str:
+        """Get name the count cache keys results of a model by.
+
+        Args:
+            model_type: Model class
+
+        Returns:
+            str: Name of the collection writes to the model go to
+        """
+        return self._get_collection(model_type).name
+
+    def _get_read_options(self, model_type: type[ModelT] | str) -> ReadOptions:
+        """Resolve read options for a read-only operation.
+
+        Per-call options (``Model.with_context``) take precedence over the
+        model's ``_read_preference`` / ``_read_concern``. Unset options fall
+        back to the client defaults configured for the environment.
+
+        Args:
+            model_type: Model class or collection name
+
+        Returns:
+            ReadOptions: Effective read options
+        """
+        options = current_read_options()
+        if isinstance(model_type, str):
+            return options
+        model_options = ReadOptions(
+            preference=getattr(model_type, "_read_preference", None),
+            concern=getattr(model_type, "_read_concern", None),
+        )
+        return options.merge(model_options)
+
+    def _get_read_collection(
+        self, model_type: type[ModelT] | str, collection_name: str | None = None
+    ) -> AsyncIOMotorCollection[dict[str, Any]]:
+        """Get collection handle for read-only operations.
+
+        One handle is kept per collection and read preference/concern pair,
+        so secondaries can serve reporting queries while writes keep using
+        the default handle.
+
+        Args:
+            model_type: Model class or collection name
+            collection_name: Collection name, defaults to the model's collection
+
+        Returns:
+            Collection instance configured with the effective read options
+        """
+        if collection_name is None:
+            collection_name = model_type if isinstance(model_type, str) else self._get_collection_name(model_type)
+
+        options = self._get_read_options(model_type)
+        if not options:
+            return self._get_collection(collection_name)
+
+        key = (collection_name, options.preference, options.concern)
+        collection = self._read_collections.get(key)
+        if collection is None:
+            collection = self._get_collection(collection_name).with_options(
+                read_preference=(READ_PREFERENCE_MAPPING[options.preference] if options.preference else None),
+                read_concern=ReadConcern(options.concern) if options.concern else None,
+            )
+            self._read_collections[key] = collection
+            _trace("Created %s collection handle for %s", options, collection_name)
+        return collection
+
     def _to_object_id(self, str_id: str | None) -> ObjectId | None:
         """Convert string ID to MongoDB ObjectId.
 
@@ -333,7 +444,6 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
             if "_id" in converted_doc:
                 str_id = self._to_string_id(converted_doc.pop("_id"))
                 converted_doc["id"] = str_id
-                self.logger.debug(f"Converted _id to id: {str_id}")
 
             return converted_doc
         except Exception as e:
@@ -358,7 +468,7 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
         query_type: Literal["base", "aggregate", "join"] = "base",
     ) -> BaseQuery[ModelT] | AggregateQuery[ModelT] | JoinQuery[ModelT, Any]:
         """Create query builder of specified type."""
-        collection = self._get_collection(self._get_collection_name(model_type))
+        collection = self._get_read_collection(model_type)
 
         if query_type == "base":
             query = MongoQuery[ModelT](collection=collection, model_type=model_type)
@@ -385,9 +495,40 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
 
         # Create transaction manager with type hints
         manager: MongoTransactionManager[ModelT] = MongoTransactionManager(db=self._sync_db)
-        manager.set_model_type(model_type)
+        manager.set_model_type(model_type, self._get_collection(model_type).name)
         return manager
 
+    def unit_of_work(self, max_retries: int = 3) -> MongoUnitOfWork:
+        """Create unit of work recording ORM writes across models.
+
+        Inside the unit of work, ``create``, ``update``, ``delete`` and
+        ``apply_updates`` record their writes, which are flushed as one
+        ``bulk_write`` per collection in a single transaction on exit.
+
+        Args:
+            max_retries: Maximum attempts for the transaction and for its commit
+
+        Returns:
+            MongoUnitOfWork: Unit of work context manager
+
+        Raises:
+            RuntimeError: If not connected
+        """
+        if self._sync_db is None:
+            raise RuntimeError("Not connected to MongoDB")
+        return MongoUnitOfWork(self._sync_db, max_retries=max_retries, on_commit=self.count_cache.invalidate)
+
+    def _recording_unit(self) -> MongoUnitOfWork | None:
+        """Get unit of work recording writes of this adapter.
+
+        Returns:
+            Optional[MongoUnitOfWork]: Active unit of work on this database, if any
+        """
+        unit = current_unit_of_work()
+        if isinstance(unit, MongoUnitOfWork) and unit.database is self._sync_db:
+            return unit
+        return None
+
     @overload
     async def create(self, model_type: type[ModelT], values: dict[str, Any]) -> str: ...
 
@@ -403,15 +544,28 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
         try:
             collection = self._get_collection(model_type)
 
+            # Record inserts in the active unit of work
+            unit = self._recording_unit()
+            if unit is not None:
+                ids = unit.insert(collection.name, [values] if isinstance(values, dict) else values, model_type)
+                return str(ids[0]) if isinstance(values, dict) else [str(id_) for id_ in ids]
+
             # Handle single record
             if isinstance(values, dict):
                 result = await collection.insert_one(values)
+                self.count_cache.invalidate(collection.name)
                 return str(result.inserted_id)
 
             # Handle multiple records
             result = await collection.insert_many(values)
+            self.count_cache.invalidate(collection.name)
             return [str(id) for id in result.inserted_ids]
 
+        except (DuplicateKeyError, BulkWriteError) as e:
+            if is_duplicate_key_error(e):
+                raise duplicate_key_error(model_type, e) from e
+            self.logger.error(f"Failed to create records: {e}")
+            raise DatabaseError(message=f"Failed to create records: {e}", backend="mongodb") from e
         except Exception as e:
             self.logger.error(f"Failed to create records: {e}")
             raise DatabaseError(message=f"Failed to create records: {e}", backend="mongodb") from e
@@ -465,7 +619,12 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
                     raise ValueError(f"Invalid MongoDB ObjectId: {model.id}")
 
                 values_dict = await model.to_dict()
+                unit = self._recording_unit()
+                if unit is not None:
+                    unit.record(collection.name, [UpdateOne({"_id": object_id}, {"$set": values_dict})], type(model))
+                    return model
                 await collection.update_one({"_id": object_id}, {"$set": values_dict})
+                self.count_cache.invalidate(collection.name)
                 return model
 
             # Case 2: Update multiple records by filter
@@ -483,7 +642,12 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
                     else filter_or_ops
                 )
 
+                unit = self._recording_unit()
+                if unit is not None:
+                    unit.record(collection.name, [UpdateMany(mongo_filter, {"$set": values})], model)
+                    return 0
                 result = await collection.update_many(mongo_filter, {"$set": values})
+                self.count_cache.invalidate(collection.name)
                 return result.modified_count
 
             # Case 3: Bulk operations
@@ -504,12 +668,21 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
                         operations.append(DeleteOne(op["filter"]))
                         stats["deleted"] += 1
 
-                if operations:
+                unit = self._recording_unit()
+                if unit is not None:
+                    unit.record(collection.name, operations, model)  # type: ignore[arg-type]
+                elif operations:
                     await collection.bulk_write(operations)  # type: ignore
+                    self.count_cache.invalidate(collection.name)
                 return stats
 
             raise ValueError("Invalid update parameters")
 
+        except (DuplicateKeyError, BulkWriteError) as e:
+            if is_duplicate_key_error(e):
+                raise duplicate_key_error(model if isinstance(model, type) else type(model), e) from e
+            self.logger.error(f"Failed to update records: {e}")
+            raise DatabaseError(message=f"Failed to update records: {e}", backend="mongodb") from e
         except Exception as e:
             self.logger.error(f"Failed to update records: {e}")
             raise DatabaseError(message=f"Failed to update records: {e}", backend="mongodb") from e
@@ -518,17 +691,18 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
     async def delete(self, model: ModelT) -> None: ...
 
     @overload
-    async def delete(self, model: type[ModelT], filter: dict[str, Any]) -> int: ...
+    async def delete(self, model: type[ModelT], filter: dict[str, Any] | DomainExpression) -> int: ...
 
     async def delete(
         self,
         model: ModelT | type[ModelT],
-        filter: dict[str, Any] | None = None,
+        filter: dict[str, Any] | DomainExpression | None = None,
     ) -> int | None:
         """Delete one or multiple records."""
         try:
+            unit = self._recording_unit()
             # Case 1: Delete single model instance
-            if isinstance(model, DatabaseModel):
+            if self.is_model_instance(model):
                 if not model.id:
                     raise ValueError("Model has no ID")
 
@@ -537,13 +711,24 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
                 if not object_id:
                     raise ValueError(f"Invalid MongoDB ObjectId: {model.id}")
 
+                if unit is not None:
+                    unit.record(collection.name, [DeleteOne({"_id": object_id})], type(model))
+                    return None
                 await collection.delete_one({"_id": object_id})
+                self.count_cache.invalidate(collection.name)
                 return None
 
             # Case 2: Delete multiple records by filter
             if filter:
                 collection = self._get_collection(model)
-                result = await collection.delete_many(filter)
+                mongo_filter = (
+                    MongoConverter().convert(filter.to_list()) if isinstance(filter, DomainExpression) else filter
+                )
+                if unit is not None:
+                    unit.record(collection.name, [DeleteMany(mongo_filter)], model)
+                    return 0
+                result = await collection.delete_many(mongo_filter)
+                self.count_cache.invalidate(collection.name)
                 return result.deleted_count
 
             raise ValueError("Invalid delete parameters")
@@ -643,7 +828,7 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
         This method handles conversion between Python types and MongoDB types:
         - ObjectId <-> str for IDs
         - datetime <-> str for dates
-        - Decimal <-> str for decimals
+        - Decimal <-> Decimal128 for decimals, decoded exactly
         - Enum <-> str for enums
         - dict <-> str for JSON
         - list <-> list for arrays
@@ -668,7 +853,7 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
             if isinstance(value, ObjectId):
                 return str(value)  # type: ignore
             if isinstance(value, Decimal128):
-                value = float(value.to_decimal())
+                value = value.to_decimal()
 
             # Handle relation fields
             if field_type in ["many2one", "one2one"]:
@@ -702,7 +887,7 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
             elif field_type == "float":
                 return float(value)  # type: ignore
             elif field_type == "decimal":
-                return Decimal(str(value))  # type: ignore
+                return value if isinstance(value, Decimal) else Decimal(str(value))  # type: ignore
             elif field_type == "boolean":
                 if isinstance(value, str):
                     return value.lower() in ("true", "1", "yes", "on")  # type: ignore
@@ -778,7 +963,7 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
                 if not object_id:
                     return None
 
-                collection = self._get_collection(collection_name)
+                collection = self._get_read_collection(source, collection_name)
                 # Filter out empty field names to prevent MongoDB projection errors
                 valid_fields = [f for f in fields if f and f.strip()] if fields else None
                 proj = dict.fromkeys(valid_fields, 1) if valid_fields else None
@@ -793,7 +978,7 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
             if not object_ids:
                 return []
 
-            collection = self._get_collection(collection_name)
+            collection = self._get_read_collection(source, collection_name)
             # Filter out empty field names to prevent MongoDB projection errors
             valid_fields = [f for f in fields if f and f.strip()] if fields else None
             proj = dict.fromkeys(valid_fields, 1) if valid_fields else None
@@ -815,7 +1000,7 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
         Returns:
             AggregateQuery: Aggregate query builder
         """
-        collection = self._get_collection(model_type)
+        collection = self._get_read_collection(model_type)
         return MongoAggregate[ModelT](collection, model_type)
 
     async def get_join_query(self, model_type: type[ModelT]) -> JoinQuery[ModelT, Any]:
@@ -827,9 +1012,380 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
         Returns:
             JoinQuery: Join query builder
         """
-        collection = self._get_collection(model_type)
+        collection = self._get_read_collection(model_type)
         return MongoJoin[ModelT, DatabaseModel](collection, model_type)
 
+    async def sync_schema(self, model_type: type[ModelT]) -> list[str]:
+        """Create collection objects declared by a model.
+
+        Creates the time-series collection of models declaring
+        ``_timeseries`` (or updates its expiry and granularity), one unique
+        index per field declared with ``unique=True``, and an index on the
+        watermark field of models declaring materialized views. Existing
+        indexes with the same definition are left as is, indexes created
+        under the same name with other options are dropped and recreated.
+
+        Args:
+            model_type: Model class
+
+        Returns:
+            list[str]: Names of the ensured indexes
+
+        Raises:
+            DatabaseError: If an index cannot be created, e.g. because stored
+                values are already duplicated, or the time-series collection
+                conflicts with an existing collection
+            ValueError: If the time-series declaration is invalid
+        """
+        indexes = unique_indexes(model_type) + watermark_indexes(model_type, self._get_collection(model_type).name)
+        spec = timeseries_spec(model_type)
+        if spec is not None:
+            if unique_indexes(model_type):
+                raise DatabaseError(
+                    message=f"Time-series model {model_type._name} cannot have unique fields",  # type: ignore
+                    backend="mongodb",
+                )
+            name = self._get_collection(model_type).name
+            if await ensure_timeseries_collection(self._sync_db, name, spec):
+                self.logger.info(f"Created time-series collection {name}")
+        if not indexes:
+            return []
+
+        collection = self._get_collection(model_type)
+        try:
+            for name in outdated_indexes(indexes, await collection.index_information()):
+                self.logger.info(f"Dropping index {name} of {collection.name} to recreate it")
+                await collection.drop_index(name)
+            names = await collection.create_indexes(indexes)
+        except Exception as e:
+            self.logger.error(f"Failed to create indexes of {collection.name}: {e}")
+            raise DatabaseError(message=f"Failed to create indexes: {e}", backend="mongodb") from e
+        self.logger.info(f"Ensured indexes of {collection.name}: {', '.join(names)}")
+        return list(names)
+
+    def materialized_view(self, model_type: type[ModelT], name: str) -> MaterializedView:
+        """Get materialized aggregate view declared by a model.
+
+        Args:
+            model_type: Model class declaring ``_materialized``
+            name: View name
+
+        Returns:
+            MaterializedView: View reading and refreshing the precomputed groups
+
+        Raises:
+            KeyError: If the model declares no such view
+            ValueError: If the view declaration is invalid
+        """
+        source = self._get_collection(model_type)
+        key = (source.name, name)
+        view = self._materialized_views.get(key)
+        if view is None:
+            specs = materialized_specs(model_type, source.name)
+            if name not in specs:
+                raise KeyError(f"Model {model_type._name} has no materialized view {name!r}")  # type: ignore
+            spec = specs[name]
+            view = MaterializedView(
+                spec,
+                source=source,
+                target=self._get_collection(spec.into),
+                state=self._get_collection(STATE_COLLECTION),
+            )
+            self._materialized_views[key] = view
+        return view
+
+    async def find_existing(
+        self,
+        model_type: type[ModelT],
+        field_name: str,
+        values: list[Any],
+        exclude_ids: list[str] | None = None,
+    ) -> list[Any]:
+        """Find which values of a field are already stored.
+
+        Runs a single ``$in`` query on the primary, compared with the
+        collation of the field's unique index.
+
+        Args:
+            model_type: Model class
+            field_name: Field name
+            values: Python values to look up
+            exclude_ids: IDs of records whose values are ignored (records being written)
+
+        Returns:
+            list[Any]: Stored database values matching any of the values
+
+        Raises:
+            DatabaseError: If the query fails
+        """
+        if not values:
+            return []
+
+        field = model_type.__fields__[field_name]  # type: ignore
+        query: dict[str, Any] = {field_name: {"$in": [field.to_query_value(value) for value in values]}}
+        if exclude_ids:
+            query["_id"] = {"$nin": [self._to_object_id(record_id) for record_id in exclude_ids]}
+
+        options: dict[str, Any] = {}
+        collation = unique_collation(field)
+        if collation is not None:
+            options["collation"] = collation
+
+        collection = self._get_collection(model_type)
+        try:
+            docs = await collection.find(query, projection={field_name: 1, "_id": 0}, **options).to_list(None)
+        except Exception as e:
+            raise DatabaseError(message=f"Failed to check {field_name} uniqueness: {e}", backend="mongodb") from e
+        return [doc[field_name] for doc in docs if field_name in doc]
+
+    async def apply_updates(
+        self,
+        model_type: type[ModelT],
+        filter_or_domain: dict[str, Any] | DomainExpression,
+        updates: Sequence[FieldUpdate],
+    ) -> int:
+        """Apply partial updates to matching records atomically.
+
+        All updates are sent as one ``update_many`` with ``$push``,
+        ``$addToSet``, ``$pull``, ``$set`` and ``$inc`` operators, so only
+        the changed parts of each document travel to the server.
+
+        Args:
+            model_type: Model class
+            filter_or_domain: MongoDB filter or domain expression
+            updates: Partial updates holding database values
+
+        Returns:
+            int: Number of modified records, 0 when recorded in a unit of work
+
+        Raises:
+            FieldValidationError: If a unique index rejects the update
+            DatabaseError: If the update fails
+        """
+        document = compile_updates(updates)
+        mongo_filter = (
+            MongoConverter().convert(filter_or_domain.to_list())
+            if isinstance(filter_or_domain, DomainExpression)
+            else filter_or_domain
+        )
+
+        collection = self._get_collection(model_type)
+        unit = self._recording_unit()
+        if unit is not None:
+            unit.record(collection.name, [UpdateMany(mongo_filter, document)], model_type)
+            return 0
+        try:
+            result = await collection.update_many(mongo_filter, document)
+        except DuplicateKeyError as e:
+            raise duplicate_key_error(model_type, e) from e
+        except Exception as e:
+            raise DatabaseError(message=f"Failed to update {model_type._name}: {e}", backend="mongodb") from e
+        self.count_cache.invalidate(collection.name)
+        return result.modified_count
+
+    def _write_filter(
+        self, model_type: type[ModelT], filter_or_domain: dict[str, Any] | DomainExpression
+    ) -> dict[str, Any]:
+        """Get MongoDB filter of a write.
+
+        Domain values are converted to their stored representation, so the
+        equality conditions the server copies into upserted documents are
+        stored like values written by the model.
+
+        Args:
+            model_type: Model class
+            filter_or_domain: MongoDB filter or domain expression
+
+        Returns:
+            Dict[str, Any]: MongoDB filter
+        """
+        if not isinstance(filter_or_domain, DomainExpression):
+            return filter_or_domain
+        query = MongoQuery(self._get_collection(model_type), model_type)
+        return query.filter(filter_or_domain.to_list()).conditions
+
+    @staticmethod
+    def _upsert_document(values: dict[str, Any], on_insert: dict[str, Any] | None) -> dict[str, Any]:
+        """Build update document of an upsert.
+
+        Args:
+            values: Values set in any case
+            on_insert: Values only set when inserting, skipped if also in values
+
+        Returns:
+            Dict[str, Any]: Update document with ``$set`` and ``$setOnInsert``
+        """
+        document: dict[str, Any] = {}
+        if values:
+            document["$set"] = values
+        insert_only = {name: value for name, value in (on_insert or {}).items() if name not in values}
+        if insert_only:
+            document["$setOnInsert"] = insert_only
+        return document
+
+    async def upsert(
+        self,
+        model_type: type[ModelT],
+        filter_or_domain: dict[str, Any] | DomainExpression,
+        values: dict[str, Any],
+        on_insert: dict[str, Any] | None = None,
+    ) -> tuple[str, bool]:
+        """Update the record matching a filter, or insert it, in one operation.
+
+        Runs one ``find_one_and_update`` with ``upsert=True``. Equality
+        conditions of the filter are copied into an inserted document by the
+        server, ``on_insert`` values are added with ``$setOnInsert``.
+
+        Args:
+            model_type: Model class
+            filter_or_domain: MongoDB filter or domain expression
+            values: Database values set in any case
+            on_insert: Database values only set when inserting
+
+        Returns:
+            Tuple[str, bool]: Record ID and whether it was inserted
+
+        Raises:
+            FieldValidationError: If a unique index rejects the record
+            DatabaseError: If called in a unit of work, whose writes run on
+                commit, or the upsert fails
+        """
+        collection = self._get_collection(model_type)
+        if self._recording_unit() is not None:
+            raise DatabaseError(
+                message=f"Cannot upsert {model_type._name} in a unit of work, the record ID is only known on commit",
+                backend="mongodb",
+            )
+        mongo_filter = self._write_filter(model_type, filter_or_domain)
+
+        # Pick the ID of an inserted record, unless the filter sets it
+        record_id = mongo_filter.get("_id")
+        if record_id is None or isinstance(record_id, dict):
+            record_id = ObjectId()
+            on_insert = {**(on_insert or {}), "_id": record_id}
+        document = self._upsert_document(values, on_insert) or {"$setOnInsert": {"_id": record_id}}
+
+        try:
+            before = await collection.find_one_and_update(
+                mongo_filter,
+                document,
+                projection={"_id": True},
+                upsert=True,
+                return_document=ReturnDocument.BEFORE,
+            )
+        except DuplicateKeyError as e:
+            raise duplicate_key_error(model_type, e) from e
+        except Exception as e:
+            raise DatabaseError(message=f"Failed to upsert {model_type._name}: {e}", backend="mongodb") from e
+        self.count_cache.invalidate(collection.name)
+        if before is None:
+            return str(record_id), True
+        return str(before["_id"]), False
+
+    async def upsert_many(
+        self,
+        model_type: type[ModelT],
+        rows: Sequence[tuple[dict[str, Any] | DomainExpression, dict[str, Any], dict[str, Any]]],
+    ) -> dict[str, int]:
+        """Upsert many records with one unordered ``bulk_write``.
+
+        Args:
+            model_type: Model class
+            rows: MongoDB filter or domain, values set in any case and values
+                only set when inserting, per record
+
+        Returns:
+            Dict[str, int]: Numbers of ``matched``, ``modified`` and ``inserted``
+            records, all 0 when recorded in a unit of work
+
+        Raises:
+            FieldValidationError: If a unique index rejects a record
+            DatabaseError: If the upserts fail
+        """
+        stats = {"matched": 0, "modified": 0, "inserted": 0}
+        if not rows:
+            return stats
+        operations = [
+            UpdateOne(
+                self._write_filter(model_type, filter_or_domain),
+                self._upsert_document(values, on_insert),
+                upsert=True,
+            )
+            for filter_or_domain, values, on_insert in rows
+        ]
+
+        collection = self._get_collection(model_type)
+        unit = self._recording_unit()
+        if unit is not None:
+            unit.record(collection.name, operations, model_type)  # type: ignore[arg-type]
+            return stats
+        try:
+            result = await collection.bulk_write(operations, ordered=False)  # type: ignore[arg-type]
+        except BulkWriteError as e:
+            if is_duplicate_key_error(e):
+                raise duplicate_key_error(model_type, e) from e
+            raise DatabaseError(message=f"Failed to upsert {model_type._name}: {e}", backend="mongodb") from e
+        except Exception as e:
+            raise DatabaseError(message=f"Failed to upsert {model_type._name}: {e}", backend="mongodb") from e
+        finally:
+            self.count_cache.invalidate(collection.name)
+        stats["matched"] = result.matched_count
+        stats["modified"] = result.modified_count
+        stats["inserted"] = result.upserted_count
+        return stats
+
+    async def find_and_modify(
+        self,
+        model_type: type[ModelT],
+        filter_or_domain: dict[str, Any] | DomainExpression,
+        values: dict[str, Any],
+        updates: Sequence[FieldUpdate] = (),
+        return_new: bool = True,
+    ) -> dict[str, Any] | None:
+        """Update the record matching a filter and return it with one ``find_one_and_update``.
+
+        Args:
+            model_type: Model class
+            filter_or_domain: MongoDB filter or domain expression
+            values: Database values to set
+            updates: Partial updates applied in the same operation
+            return_new: Return the record after the update instead of before
+
+        Returns:
+            Optional[Dict[str, Any]]: Stored record with string ``id``, None if
+            no record matches
+
+        Raises:
+            FieldValidationError: If a unique index rejects the update
+            DatabaseError: If called in a unit of work, or the update fails
+        """
+        collection = self._get_collection(model_type)
+        if self._recording_unit() is not None:
+            raise DatabaseError(
+                message=f"Cannot find and modify {model_type._name} in a unit of work, writes only run on commit",
+                backend="mongodb",
+            )
+        document: dict[str, Any] = compile_updates(updates) if updates else {}
+        if values:
+            document.setdefault("$set", {}).update(values)
+        if not document:
+            raise ValueError("No updates to apply")
+
+        try:
+            doc = await collection.find_one_and_update(
+                self._write_filter(model_type, filter_or_domain),
+                document,
+                return_document=ReturnDocument.AFTER if return_new else ReturnDocument.BEFORE,
+            )
+        except DuplicateKeyError as e:
+            raise duplicate_key_error(model_type, e) from e
+        except Exception as e:
+            raise DatabaseError(
+                message=f"Failed to find and modify {model_type._name}: {e}", backend="mongodb"
+            ) from e
+        self.count_cache.invalidate(collection.name)
+        return None if doc is None else await self._convert_document(doc)
+
     async def setup_relations(self, model: type[ModelT], relations: dict[str, RelationOptions]) -> None:
         """Set up database relations.
 
@@ -908,8 +1464,12 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
         try:
             # Get source ID
             source_id = instance.id
-            self.logger.info(
-                f"Getting related records for {instance._name}:{source_id}, field: {field_name}, type: {relation_type}"
+            _trace(
+                "Getting related records for %s:%s, field: %s, type: %s",
+                instance._name,
+                source_id,
+                field_name,
+                relation_type,
             )
 
             # Get target model
@@ -924,7 +1484,7 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
             collection = self._get_collection(target_model._name)  # type: ignore
 
             if relation_type == RelationType.ONE_TO_MANY:
-                self.logger.info(f"Handling ONE_TO_MANY relation, related_name: {options.related_name}")
+                _trace("Handling ONE_TO_MANY relation, related_name: %s", options.related_name)
                 # Use aggregation pipeline for better performance
                 pipeline = [
                     {"$match": {options.related_name: source_id}},
@@ -939,15 +1499,14 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
 
                 # Extract IDs from result
                 target_ids: list[str] = target_records[0]["ids"] if target_records else []
-                self.logger.info(f"Found {len(target_ids)} records using aggregation")
+                _trace("Found %d records using aggregation", len(target_ids))
 
                 # Always return recordset (may be empty)
                 result: ModelT = target_model._browse(target_model._env, target_ids)  # type: ignore
-                self.logger.info(f"Returning recordset: {result}")
                 return result  # type: ignore
 
             elif relation_type == RelationType.MANY_TO_ONE:
-                self.logger.info("Handling MANY_TO_ONE relation")
+                _trace("Handling MANY_TO_ONE relation")
 
                 source_record = await self.read(instance._name, source_id, fields=[field_name])
                 if not source_record:
@@ -959,34 +1518,32 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
                 target_record: dict[str, Any] = await self.read(  # type: ignore
                     target_model._name, target_id, fields=["id"]  # type: ignore
                 )  # type: ignore
-                self.logger.info(f"Found target record: {target_record}")
+                _trace("Found target record: %s", target_record)
                 if not target_record:
                     result = target_model._browse(target_model._env, [])  # type: ignore
-                    self.logger.info("No record found, returning empty recordset")
+                    _trace("No record found, returning empty recordset")
                     return result  # type: ignore
                 target_record_id: str = target_record["id"]
                 result = target_model._browse(target_model._env, [target_record_id])  # type: ignore
-                self.logger.info(f"Returning recordset with record: {result}")
                 return result  # type: ignore
 
             elif relation_type == RelationType.ONE_TO_ONE:
-                self.logger.info("Handling ONE_TO_ONE relation")
+                _trace("Handling ONE_TO_ONE relation")
                 # Similar to many-to-one but enforce uniqueness
                 target_record = await self.read(target_model._name, source_id)  # type: ignore
-                self.logger.info(f"Found target record: {target_record}")
+                _trace("Found target record: %s", target_record)
                 if not target_record:
                     result = target_model._browse(target_model._env, [])  # type: ignore
-                    self.logger.info("No record found, returning empty recordset")
+                    _trace("No record found, returning empty recordset")
                     return result  # type: ignore
                 result = target_model._browse(target_model._env, [target_record])  # type: ignore
-                self.logger.info(f"Returning recordset with record: {result}")
                 return result  # type: ignore
 
             elif relation_type == RelationType.MANY_TO_MANY:
-                self.logger.info("Handling MANY_TO_MANY relation")
+                _trace("Handling MANY_TO_MANY relation")
                 # Handle through model if specified
                 if options.through:
-                    self.logger.info(f"Using through model: {options.through}")
+                    _trace("Using through model: %s", options.through)
                     # Query through model first
                     through_collection = self._get_collection(options.through["model"]._name)  # type: ignore
                     if not options.through_fields or "fields" not in options.through_fields:
@@ -997,32 +1554,29 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
                     cursor = through_collection.find({options.through_fields["fields"][0]: source_id})
                     through_records: list[dict[str, Any]] = []
                     async for doc in cursor:
-                        self.logger.info(f"Found through document: {doc}")
                         converted = await self._convert_document(doc)
-                        self.logger.info(f"Converted through document: {converted}")
                         through_records.append(converted)
 
                     if not through_records:
                         result = target_model._browse(target_model._env, [])  # type: ignore
-                        self.logger.info("No through records found, returning empty recordset")
+                        _trace("No through records found, returning empty recordset")
                         return result  # type: ignore
 
                     # Then query target model
                     target_ids = [r[options.through_fields["fields"][1]] for r in through_records]
-                    self.logger.info(f"Found target IDs: {target_ids}")
+                    _trace("Found target IDs: %s", target_ids)
 
                     target_records = []
                     for target_id in target_ids:
                         record = await self.read(target_model._name, target_id)  # type: ignore
-                        self.logger.info(f"Found target record: {record}")
                         if record:
                             target_records.append(record)  # type: ignore
 
                     result = target_model._browse(target_model._env, target_records)  # type: ignore
-                    self.logger.info(f"Returning recordset with {len(target_records)} records")
+                    _trace("Returning recordset with %d records", len(target_records))
                     return result  # type: ignore
                 else:
-                    self.logger.info("Using default junction table for many-to-many relation")
+                    _trace("Using default junction table for many-to-many relation")
 
                     # For M2M, we need consistent junction table naming regardless of direction
                     # Use alphabetical order of model names to ensure consistency
@@ -1040,13 +1594,12 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
                         target_field = "source_id"  # Reversed
 
                     junction_collection = self._get_collection(junction_table_name)
-                    self.logger.info(f"Querying junction table: {junction_table_name} with {source_field}={source_id}")
+                    _trace("Querying junction table: %s with %s=%s", junction_table_name, source_field, source_id)
 
                     # Query junction table for related IDs
                     cursor = junction_collection.find({source_field: source_id})
                     target_ids = []
                     async for doc in cursor:
-                        self.logger.info(f"Found junction document: {doc}")
                         # Extract related ID (opposite of query field)
                         if source_field == "target_id":
                             # Queried with target_id, extract source_id
@@ -1061,23 +1614,22 @@ class MongoAdapter(DatabaseAdapter[ModelT]):
                         else:
                             self.logger.warning(f"Skipping junction record with empty related ID: {doc}")
 
-                    self.logger.info(f"Found target IDs: {target_ids}")
+                    _trace("Found target IDs: %s", target_ids)
 
                     if not target_ids:
                         result = target_model._browse(target_model._env, [])  # type: ignore
-                        self.logger.info("No junction records found, returning empty recordset")
+                        _trace("No junction records found, returning empty recordset")
                         return result  # type: ignore
 
                     # Query target records
                     target_records = []
                     for target_id in target_ids:
                         record = await self.read(target_model._name, target_id)  # type: ignore
-                        self.logger.info(f"Found target record: {record}")
                         if record:
                             target_records.append(record)  # type: ignore
 
                     result = target_model._browse(target_model._env, target_records)  # type: ignore
-                    self.logger.info(f"Returning recordset with {len(target_records)} records")  # type: ignore
+                    _trace("Returning recordset with %d records", len(target_records))
                     return result  # type: ignore
 
             self.logger.warning(f"Unknown relation type: {relation_type}")
@@ -0,0 +1,152 @@
+"""Short-lived cache of exact record counts.
+
+Exact counts of large collections scan every matching index entry, and list
+views ask for the same total on every page. ``CountCache`` keeps exact
+``search_count`` results for a few seconds, keyed by collection and
+normalized domain. Other results computed from all records matching a
+domain, such as facet counts, are cached under their own ``kind``. Writes
+made through the adapter drop the cached results of their collection;
+writes made by other processes show up once the entry expires.
+
+Examples:
+    >>> cache = CountCache(ttl=5.0)
+    >>> cache.set("sale_order", [("state", "=", "done")], 42)
+    >>> cache.get("sale_order", [("state", "=", "done")])
+    42
+    >>> cache.set("sale_order", [], {"state": [("done", 42)]}, kind="facets:state")
+    >>> cache.invalidate("sale_order")
+    >>> cache.get("sale_order", [("state", "=", "done")]) is None
+    True
+"""
+
+import time
+from collections.abc import Callable, Sequence
+from typing import Any, Literal
+
+CountMode = Literal["exact", "estimated", "capped"]
+
+COUNT_MODES: tuple[CountMode, ...] = ("exact", "estimated", "capped")
+"""Modes of ``search_count``."""
+
+DEFAULT_COUNT_CAP = 10000
+"""Matches after which capped counts stop."""
+
+DEFAULT_COUNT_TTL = 5.0
+"""Seconds an exact count is reused."""
+
+DEFAULT_MAX_ENTRIES = 1024
+"""Maximum number of cached counts."""
+
+
+def normalize_domain(domain: Sequence[Any] | None) -> str:
+    """Get cache key of a domain.
+
+    Lists and tuples compare equal, and ``in`` values are order-insensitive.
+
+    Args:
+        domain: Domain expression
+
+    Returns:
+        str: Key identical for equivalent domain spellings
+    """
+
+    def normalize(value: Any) -> Any:
+        if isinstance(value, (list, tuple)):
+            return tuple(normalize(item) for item in value)  # type: ignore
+        if isinstance(value, (set, frozenset)):
+            return tuple(sorted((normalize(item) for item in value), key=repr))  # type: ignore
+        if isinstance(value, dict):
+            return tuple(sorted((str(key), normalize(item)) for key, item in value.items()))  # type: ignore
+        return value
+
+    items: list[Any] = []
+    for item in domain or ():
+        if isinstance(item, (list, tuple)) and len(item) == 3 and item[1] in ("in", "not in"):  # type: ignore
+            field, operator, value = item  # type: ignore
+            if isinstance(value, (list, tuple, set, frozenset)):
+                value = set(value)  # type: ignore
+            items.append((field, operator, normalize(value)))
+        else:
+            items.append(normalize(item))
+    return repr(tuple(items))
+
+
+class CountCache:
+    """Cache of exact counts per collection, domain and kind.
+
+    Attributes:
+        ttl: Seconds an entry is reused
+        max_entries: Maximum number of entries, oldest dropped first
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_COUNT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize cache.
+
+        Args:
+            ttl: Seconds an entry is reused, 0 disables the cache
+            max_entries: Maximum number of entries
+            clock: Monotonic clock, replaceable in tests
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: dict[tuple[str, str, str], tuple[float, Any]] = {}
+
+    def __len__(self) -> int:
+        """Get number of entries, including expired ones not dropped yet."""
+        return len(self._entries)
+
+    def get(self, collection: str, domain: Sequence[Any] | None, kind: str = "count") -> Any:
+        """Get cached count.
+
+        Args:
+            collection: Collection name
+            domain: Domain expression
+            kind: Kind of cached result
+
+        Returns:
+            Any: Count or other result, None if missing or expired
+        """
+        key = (collection, kind, normalize_domain(domain))
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if self._clock() >= expires:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, collection: str, domain: Sequence[Any] | None, value: Any, kind: str = "count") -> None:
+        """Cache count.
+
+        Args:
+            collection: Collection name
+            domain: Domain expression
+            value: Exact count, or other result of the given kind
+            kind: Kind of cached result
+        """
+        if self.ttl <= 0:
+            return
+        key = (collection, kind, normalize_domain(domain))
+        self._entries.pop(key, None)
+        while len(self._entries) >= self.max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (self._clock() + self.ttl, value)
+
+    def invalidate(self, collection: str | None = None) -> None:
+        """Drop cached counts and other results.
+
+        Args:
+            collection: Collection whose results to drop, all when None
+        """
+        if collection is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == collection]:
+            del self._entries[key]
@@ -0,0 +1,618 @@
+"""Materialized aggregate views.
+
+A model declares aggregation pipelines whose results are persisted in a side
+collection, so dashboards read precomputed groups instead of running a
+full-collection ``$group`` on every request:
+
+    >>> class SaleOrder(BaseModel):
+    ...     _name = "sale.order"
+    ...     _materialized = {
+    ...         "sales_by_day": [
+    ...             {"$match": {"state": "done"}},
+    ...             {"$group": {
+    ...                 "_id": {"day": {"$dateTrunc": {"date": "$date", "unit": "day"}}},
+    ...                 "total": {"$sum": "$amount"},
+    ...             }},
+    ...         ],
+    ...     }
+
+    >>> view = SaleOrder.materialized("sales_by_day")
+    >>> await view.refresh()
+    >>> await view.get({"day": datetime(2024, 3, 1)})
+    {'day': datetime.datetime(2024, 3, 1, 0, 0), 'total': Decimal('1520.00')}
+
+A view is a pipeline with exactly one ``$group`` stage. Stages before it may
+filter and reshape source documents; stages after it may only reshape each
+group (``$project``, ``$addFields``, ``$set``, ``$unset``).
+
+Refreshes:
+- Full: the pipeline is run with ``$out``, atomically replacing the view
+- Incremental: the keys of the groups that source documents updated since
+  the last refresh belong to are read from the ``updated_at`` watermark, and
+  only these groups are recomputed and written with ``$merge``
+- Change stream: ``ChangeStreamTailer`` recomputes the groups of changed
+  documents as changes arrive; its event source can be replaced by any async
+  iterable of change events in tests
+
+Incremental refreshes only see the groups documents belong to now. Groups a
+document left, because it was deleted, its group key changed or it no longer
+matches the view's filter, are only corrected by a full refresh: schedule
+one periodically when using watermarks. The tailer detects these changes
+and runs a full refresh itself.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterable, Mapping, Sequence
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from earnorm.base.database.query.backends.mongo.operations.aggregate import _decode
+from earnorm.exceptions import DatabaseError
+from earnorm.types import JsonDict
+
+logger = logging.getLogger(__name__)
+
+STATE_COLLECTION = "earnorm_materialized"
+"""Collection storing the watermark of each view."""
+
+DEFAULT_WATERMARK = "updated_at"
+"""Source field tracking the last update of each document."""
+
+WATERMARK_OVERLAP = timedelta(seconds=5)
+"""Time before the watermark re-read by incremental refreshes.
+
+Writes in a unit of work stamp ``updated_at`` before they commit, and writes
+in the same millisecond share the watermark, so documents updated slightly
+before the watermark may still be missing from the view. Their groups are
+recomputed again, which leaves up-to-date groups unchanged.
+"""
+
+PRE_GROUP_STAGES = frozenset({"$match", "$addFields", "$set", "$project", "$unset", "$unwind"})
+"""Stages allowed before ``$group``: per-document filters and reshaping."""
+
+POST_GROUP_STAGES = frozenset({"$addFields", "$set", "$project", "$unset"})
+"""Stages allowed after ``$group``: per-group reshaping."""
+
+
+@dataclass(frozen=True)
+class MaterializedSpec:
+    """Declared materialized view.
+
+    Attributes:
+        name: View name, unique per model
+        pipeline: Aggregation pipeline with one ``$group`` stage
+        into: Collection holding the results
+        watermark: Source field with the last update time of each document
+    """
+
+    name: str
+    pipeline: tuple[JsonDict, ...]
+    into: str
+    watermark: str = DEFAULT_WATERMARK
+
+    @property
+    def group_index(self) -> int:
+        """Get position of the ``$group`` stage."""
+        return next(i for i, stage in enumerate(self.pipeline) if "$group" in stage)
+
+    @property
+    def key(self) -> Any:
+        """Get group key expression."""
+        return self.pipeline[self.group_index]["$group"]["_id"]
+
+    @property
+    def key_fields(self) -> frozenset[str]:
+        """Get source fields deciding which group a document counts in."""
+        fields = _field_refs(self.key)
+        for stage in self.pipeline[: self.group_index]:
+            if "$match" in stage:
+                fields |= _match_fields(stage["$match"])
+            else:
+                fields |= _field_refs(stage)
+                fields |= {path.lstrip("$").split(".")[0] for path in _unwind_paths(stage)}
+        return frozenset(fields)
+
+
+def _field_refs(expression: Any) -> set[str]:
+    """Get top-level fields referenced by an aggregation expression.
+
+    Args:
+        expression: Aggregation expression
+
+    Returns:
+        Set[str]: Names of referenced fields, variables excluded
+    """
+    if isinstance(expression, str):
+        if expression.startswith("$") and not expression.startswith("$$"):
+            return {expression[1:].split(".")[0]}
+        return set()
+    refs: set[str] = set()
+    if isinstance(expression, Mapping):
+        for value in expression.values():  # type: ignore
+            refs |= _field_refs(value)
+    elif isinstance(expression, (list, tuple)):
+        for value in expression:  # type: ignore
+            refs |= _field_refs(value)
+    return refs
+
+
+def _match_fields(query: Mapping[str, Any]) -> set[str]:
+    """Get top-level fields a query filters on.
+
+    Args:
+        query: MongoDB query
+
+    Returns:
+        Set[str]: Names of filtered fields
+    """
+    fields: set[str] = set()
+    for name, value in query.items():
+        if name in ("$and", "$or", "$nor"):
+            for condition in value:
+                fields |= _match_fields(condition)
+        elif name == "$expr":
+            fields |= _field_refs(value)
+        elif not name.startswith("$"):
+            fields.add(name.split(".")[0])
+    return fields
+
+
+def _unwind_paths(stage: JsonDict) -> list[str]:
+    """Get array paths unwound by a stage."""
+    unwind = stage.get("$unwind")
+    if isinstance(unwind, str):
+        return [unwind]
+    if isinstance(unwind, Mapping):
+        return [str(unwind["path"])]  # type: ignore
+    return []
+
+
+def materialized_specs(model: Any, collection: str) -> dict[str, MaterializedSpec]:
+    """Get materialized views declared by a model.
+
+    ``_materialized`` maps view names to a pipeline, or to a dictionary with
+    ``pipeline`` and optional ``into`` (default ``<collection>__<name>``) and
+    ``watermark`` (default ``updated_at``) keys.
+
+    Args:
+        model: Model class
+        collection: Name of the collection the adapter stores the model in
+
+    Returns:
+        Dict[str, MaterializedSpec]: Views by name
+
+    Raises:
+        ValueError: If a declaration is invalid
+    """
+    declared: Mapping[str, Any] = getattr(model, "_materialized", None) or {}
+    specs: dict[str, MaterializedSpec] = {}
+    for name, declaration in declared.items():
+        options: Mapping[str, Any] = declaration if isinstance(declaration, Mapping) else {"pipeline": declaration}
+        pipeline = tuple(options["pipeline"])
+        _check_pipeline(name, pipeline)
+        specs[name] = MaterializedSpec(
+            name=name,
+            pipeline=pipeline,
+            into=options.get("into") or f"{collection}__{name}",
+            watermark=options.get("watermark") or DEFAULT_WATERMARK,
+        )
+    return specs
+
+
+def _check_pipeline(name: str, pipeline: Sequence[JsonDict]) -> None:
+    """Check that a view pipeline can be refreshed per group.
+
+    Args:
+        name: View name
+        pipeline: Aggregation pipeline
+
+    Raises:
+        ValueError: If the pipeline has no single ``$group`` or unsupported stages
+    """
+    groups = [i for i, stage in enumerate(pipeline) if "$group" in stage]
+    if len(groups) != 1:
+        raise ValueError(f"Materialized view {name!r} must have exactly one $group stage")
+    for i, stage in enumerate(pipeline):
+        if i == groups[0]:
+            continue
+        allowed = PRE_GROUP_STAGES if i < groups[0] else POST_GROUP_STAGES
+        operator = next(iter(stage))
+        if operator not in allowed:
+            position = "before" if i < groups[0] else "after"
+            raise ValueError(f"Materialized view {name!r} cannot use {operator} {position} $group")
+
+
+def watermark_indexes(model: Any, collection: str) -> list[IndexModel]:
+    """Get source indexes making incremental refreshes of a model's views cheap.
+
+    Args:
+        model: Model class
+        collection: Name of the collection the adapter stores the model in
+
+    Returns:
+        List[IndexModel]: One index per watermark field
+    """
+    fields = sorted({spec.watermark for spec in materialized_specs(model, collection).values()})
+    return [IndexModel([(field, ASCENDING)], name=f"{field}_watermark") for field in fields]
+
+
+class MaterializedView:
+    """Materialized aggregate view of one model.
+
+    Attributes:
+        spec: View declaration
+    """
+
+    def __init__(
+        self,
+        spec: MaterializedSpec,
+        source: AsyncIOMotorCollection[JsonDict],  # type: ignore
+        target: AsyncIOMotorCollection[JsonDict],  # type: ignore
+        state: AsyncIOMotorCollection[JsonDict],  # type: ignore
+    ) -> None:
+        """Initialize view.
+
+        Args:
+            spec: View declaration
+            source: Aggregated collection
+            target: Collection holding the results
+            state: Collection storing watermarks
+        """
+        self.spec = spec
+        self._source = source
+        self._target = target
+        self._state = state
+        self._lock = asyncio.Lock()
+
+    @property
+    def state_id(self) -> str:
+        """Get ID of the view's watermark document."""
+        return f"{self._source.name}.{self.spec.name}"
+
+    async def get(self, key: Any) -> JsonDict | None:
+        """Read one precomputed group.
+
+        Args:
+            key: Group key, the ``_id`` of the ``$group`` stage
+
+        Returns:
+            Optional[JsonDict]: Group row, or None if there is no such group
+        """
+        doc = await self._target.find_one({"_id": key})
+        return self._row(doc) if doc is not None else None
+
+    async def rows(
+        self,
+        filter: JsonDict | None = None,
+        sort: list[tuple[str, int]] | None = None,
+        limit: int = 0,
+    ) -> list[JsonDict]:
+        """Read precomputed groups.
+
+        Args:
+            filter: MongoDB filter on the stored groups, keys under ``_id``
+            sort: Sort keys and directions
+            limit: Maximum number of groups, 0 for all
+
+        Returns:
+            List[JsonDict]: Group rows with their keys flattened
+        """
+        cursor = self._target.find(filter or {}, sort=sort, limit=limit)
+        return [self._row(doc) for doc in await cursor.to_list(None)]
+
+    async def watermark(self) -> datetime | None:
+        """Get update time up to which source changes are reflected.
+
+        Returns:
+            Optional[datetime]: Watermark, or None if never refreshed
+        """
+        doc = await self._state.find_one({"_id": self.state_id})
+        return doc.get("watermark") if doc else None
+
+    async def refresh(self, full: bool = False, ids: Sequence[Any] | None = None) -> int:
+        """Bring the view up to date.
+
+        Without arguments, refreshes incrementally from the watermark, or
+        fully when the view was never refreshed. Refreshing some ``ids``
+        leaves the watermark as is, since documents updated before them
+        may not be reflected yet.
+
+        Args:
+            full: Rebuild the whole view
+            ids: Only recompute the groups of these source documents
+
+        Returns:
+            int: Number of groups written
+
+        Raises:
+            DatabaseError: If the refresh fails
+        """
+        async with self._lock:
+            try:
+                if full:
+                    return await self._refresh_full()
+                if ids is not None:
+                    return await self._refresh_groups({"_id": {"$in": list(ids)}}, advance=False)
+                watermark = await self.watermark()
+                if watermark is None:
+                    return await self._refresh_full()
+                if isinstance(watermark, datetime):
+                    watermark -= WATERMARK_OVERLAP
+                return await self._refresh_groups({self.spec.watermark: {"$gte": watermark}}, advance=True)
+            except DatabaseError:
+                raise
+            except Exception as e:
+                raise DatabaseError(
+                    message=f"Failed to refresh materialized view {self.spec.name}: {e}",
+                    backend="mongodb",
+                ) from e
+
+    async def _refresh_full(self) -> int:
+        """Rebuild the view with ``$out``.
+
+        Returns:
+            int: Number of groups in the view
+        """
+        latest = await self._source.find_one(
+            {self.spec.watermark: {"$ne": None}},
+            projection={self.spec.watermark: 1},
+            sort=[(self.spec.watermark, DESCENDING)],
+        )
+        pipeline = [*self.spec.pipeline, {"$out": self._target.name}]
+        await self._source.aggregate(pipeline).to_list(None)
+        if latest is not None:
+            await self._save_watermark(latest[self.spec.watermark])
+        count = await self._target.count_documents({})
+        logger.info("Rebuilt materialized view %s: %d groups", self.spec.name, count)
+        return count
+
+    async def _refresh_groups(self, changed: JsonDict, advance: bool) -> int:
+        """Recompute the groups changed documents belong to.
+
+        Args:
+            changed: Filter selecting changed source documents
+            advance: Move the watermark to the latest update of the changed
+                documents, only when they are all documents updated since
+
+        Returns:
+            int: Number of groups written
+        """
+        index = self.spec.group_index
+        reshape = [stage for stage in self.spec.pipeline[:index] if "$match" not in stage]
+        affected = [
+            {"$match": changed},
+            *reshape,
+            {"$group": {"_id": self.spec.key, "watermark": {"$max": f"${self.spec.watermark}"}}},
+        ]
+        docs = await self._source.aggregate(affected).to_list(None)
+        if not docs:
+            return 0
+
+        keys = [doc["_id"] for doc in docs]
+        pipeline = [
+            *self._restrict(keys),
+            {"$merge": {"into": self._target.name, "on": "_id", "whenMatched": "replace", "whenNotMatched": "insert"}},
+        ]
+        await self._source.aggregate(pipeline).to_list(None)
+
+        watermarks = [doc["watermark"] for doc in docs if doc.get("watermark") is not None]
+        if advance and watermarks:
+            await self._save_watermark(max(watermarks))
+        logger.debug("Refreshed %d groups of materialized view %s", len(keys), self.spec.name)
+        return len(keys)
+
+    def _restrict(self, keys: list[Any]) -> list[JsonDict]:
+        """Get view pipeline computing only some groups.
+
+        Keys made of plain fields grouped without reshaping are matched by an
+        index-friendly query in front of the pipeline; other keys are
+        compared right before ``$group``.
+
+        Args:
+            keys: Group keys to compute
+
+        Returns:
+            List[JsonDict]: Pipeline stages
+        """
+        index = self.spec.group_index
+        pipeline = list(self.spec.pipeline)
+        key = self.spec.key
+        only_filters = all("$match" in stage for stage in pipeline[:index])
+
+        if only_filters and _is_path(key):
+            return [{"$match": {key[1:]: {"$in": keys}}}, *pipeline]
+        if only_filters and isinstance(key, Mapping) and key and all(_is_path(value) for value in key.values()):  # type: ignore
+            conditions = [{path[1:]: value.get(name) for name, path in key.items()} for value in keys]  # type: ignore
+            return [{"$match": {"$or": conditions}}, *pipeline]
+        return [*pipeline[:index], {"$match": {"$expr": {"$in": [key, keys]}}}, *pipeline[index:]]
+
+    async def _save_watermark(self, watermark: Any) -> None:
+        """Store watermark, never moving it back.
+
+        Args:
+            watermark: Latest source update time reflected in the view
+        """
+        current = await self.watermark()
+        if current is not None and current >= watermark:
+            return
+        await self._state.update_one(
+            {"_id": self.state_id},
+            {"$set": {"watermark": watermark, "refreshed_at": datetime.now(UTC)}},
+            upsert=True,
+        )
+
+    @staticmethod
+    def _row(doc: JsonDict) -> JsonDict:
+        """Flatten stored group into a row.
+
+        Args:
+            doc: Stored group
+
+        Returns:
+            JsonDict: Group keys and values, Decimal128 decoded
+        """
+        key = doc.pop("_id", None)
+        row: JsonDict = dict(key) if isinstance(key, dict) else {"_id": key}
+        row.update(doc)
+        return _decode(row)
+
+
+def _is_path(expression: Any) -> bool:
+    """Check whether an expression is a plain field path."""
+    return isinstance(expression, str) and expression.startswith("$") and not expression.startswith("$$")
+
+
+class ChangeStreamTailer:
+    """Refresh materialized views of one collection from its change stream.
+
+    Changes are batched: the groups of the changed documents are recomputed
+    once ``batch_size`` changes are pending or ``max_delay`` seconds after
+    the first pending change. Deletes, replacements and updates of fields the
+    group key depends on trigger a full refresh instead.
+
+    Examples:
+        >>> tailer = ChangeStreamTailer([SaleOrder.materialized("sales_by_day")])
+        >>> tailer.start()
+        >>> ...
+        >>> await tailer.stop()
+
+        >>> # In tests
+        >>> tailer = ChangeStreamTailer(views, source=fake_events())
+        >>> await tailer.run()
+    """
+
+    def __init__(
+        self,
+        views: Sequence[MaterializedView],
+        source: AsyncIterable[JsonDict] | None = None,
+        batch_size: int = 100,
+        max_delay: float = 1.0,
+    ) -> None:
+        """Initialize tailer.
+
+        Args:
+            views: Views of one source collection
+            source: Change events, defaults to ``watch()`` on the source collection
+            batch_size: Pending changes triggering a refresh
+            max_delay: Seconds a change may wait for its refresh
+
+        Raises:
+            ValueError: If no view is given or views have different sources
+        """
+        if not views:
+            raise ValueError("ChangeStreamTailer needs at least one view")
+        if len({view._source.name for view in views}) > 1:
+            raise ValueError("Views of a tailer must share their source collection")
+        self._views = list(views)
+        self._source = source
+        self._batch_size = batch_size
+        self._max_delay = max_delay
+        self._task: asyncio.Task[None] | None = None
+        self._ids: list[Any] = []
+        self._full = False
+
+    def start(self) -> "asyncio.Task[None]":
+        """Run tailer in the background.
+
+        Returns:
+            Task: Background task
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        """Stop background tailer."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def run(self) -> None:
+        """Consume change events until the source ends.
+
+        Pending changes are flushed before returning.
+        """
+        source = self._source if self._source is not None else self._watch()
+        queue: asyncio.Queue[JsonDict | None] = asyncio.Queue()
+
+        async def read() -> None:
+            try:
+                async for event in source:
+                    await queue.put(event)
+            finally:
+                await queue.put(None)
+
+        reader = asyncio.create_task(read())
+        try:
+            while True:
+                try:
+                    timeout = self._max_delay if self._pending else None
+                    event = await asyncio.wait_for(queue.get(), timeout)
+                except TimeoutError:
+                    await self.flush()
+                    continue
+                if event is None:
+                    break
+                self.add(event)
+                if len(self._ids) >= self._batch_size:
+                    await self.flush()
+            await self.flush()
+        finally:
+            reader.cancel()
+            with suppress(asyncio.CancelledError):
+                await reader
+
+    @property
+    def _pending(self) -> bool:
+        """Check whether changes wait for a refresh."""
+        return self._full or bool(self._ids)
+
+    def add(self, event: JsonDict) -> None:
+        """Record one change event.
+
+        Args:
+            event: Change stream event
+        """
+        operation = event.get("operationType")
+        if operation in ("insert", "update"):
+            if operation == "update" and self._changes_key(event):
+                self._full = True
+            else:
+                self._ids.append(event["documentKey"]["_id"])
+        else:
+            # delete, replace, drop, rename, invalidate
+            self._full = True
+
+    def _changes_key(self, event: JsonDict) -> bool:
+        """Check whether an update may move a document to another group."""
+        description = event.get("updateDescription") or {}
+        touched = {path.split(".")[0] for path in description.get("updatedFields", {})}
+        touched |= {path.split(".")[0] for path in description.get("removedFields", [])}
+        return any(touched & view.spec.key_fields for view in self._views)
+
+    async def flush(self) -> None:
+        """Refresh views for pending changes."""
+        if not self._pending:
+            return
+        full, ids = self._full, list(dict.fromkeys(self._ids))
+        self._full, self._ids = False, []
+        for view in self._views:
+            try:
+                await view.refresh(full=full, ids=None if full else ids)
+            except DatabaseError as e:
+                logger.error("Failed to refresh materialized view %s: %s", view.spec.name, e)
+
+    async def _watch(self) -> AsyncIterable[JsonDict]:
+        """Watch source collection."""
+        source = self._views[0]._source
+        async with source.watch() as stream:
+            async for event in stream:
+                yield event
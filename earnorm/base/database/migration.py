@@ -0,0 +1,288 @@
+"""Online data migrations.
+
+This module provides batch converters that rewrite stored values in place
+while the application keeps running:
+- Documents are scanned in ``_id`` order, one chunk at a time
+- Each chunk is written with a single unordered ``bulk_write``
+- Updates only apply if the stored value is still the one that was read, so
+  concurrent writes are never overwritten
+- An optional pause between chunks limits the load on the primary
+
+Examples:
+    >>> from earnorm.base.database.migration import convert_datetime_strings
+
+    >>> # Convert ISO string timestamps of every datetime field to BSON dates
+    >>> result = await convert_datetime_strings(Order, batch_size=1000, pause=0.1)
+    >>> print(result.to_dict())
+    {"scanned": 120000, "converted": 119998, "failed": 2, "batches": 120}
+
+    >>> # Convert string amounts of every decimal field to Decimal128
+    >>> result = await convert_decimal_strings(Order)
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from bson.decimal128 import Decimal128
+from pymongo import UpdateOne
+
+from earnorm.exceptions import DatabaseError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+@dataclass
+class MigrationResult:
+    """Batch conversion statistics."""
+
+    scanned: int = 0
+    """Number of documents read."""
+
+    converted: int = 0
+    """Number of documents rewritten."""
+
+    failed: int = 0
+    """Number of field values that could not be parsed and were left as is."""
+
+    batches: int = 0
+    """Number of chunks processed."""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert result to dictionary."""
+        return {
+            "scanned": self.scanned,
+            "converted": self.converted,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
+
+
+def _stored_fields(model: Any, fields: list[str] | None, field_type: type, storage: str) -> list[str]:
+    """Get names of fields of a type that use the given storage.
+
+    Args:
+        model: Model class
+        fields: Explicit field names, or None for all matching fields
+        field_type: Field class
+        storage: Storage format values are converted to
+
+    Returns:
+        list[str]: Field names to convert
+
+    Raises:
+        ValueError: If an explicit field is not of the type or uses another storage
+    """
+    model_fields = model.__fields__
+    if fields is None:
+        return [
+            name
+            for name, field in model_fields.items()
+            if isinstance(field, field_type) and field.storage == storage and field.store
+        ]
+
+    for name in fields:
+        field = model_fields.get(name)
+        if not isinstance(field, field_type):
+            raise ValueError(f"Field {name} of {model._name} is not a {field_type.__name__}")
+        if field.storage != storage:
+            raise ValueError(f"Field {name} of {model._name} uses {field.storage} storage")
+    return list(fields)
+
+
+def _parse_datetime(field: Any, value: str) -> datetime | None:
+    """Parse stored ISO string with the field's timezone handling.
+
+    Args:
+        field: Datetime field
+        value: Stored string
+
+    Returns:
+        Parsed datetime or None if the string is not ISO formatted
+    """
+    try:
+        return field._coerce(value)  # pylint: disable=protected-access
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_decimal(field: Any, value: str) -> Any:
+    """Parse stored decimal string into the field's Decimal128 value.
+
+    Args:
+        field: Decimal field
+        value: Stored string
+
+    Returns:
+        Decimal128 value or None if the string is not a finite number
+        Decimal128 can hold exactly
+    """
+    try:
+        decimal_value = Decimal(value)
+    except InvalidOperation:
+        return None
+    if not decimal_value.is_finite():
+        return None
+    parsed = field.to_query_value(decimal_value)
+    return parsed if isinstance(parsed, Decimal128) else None
+
+
+async def convert_datetime_strings(
+    model: Any,
+    fields: list[str] | None = None,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    pause: float = 0.0,
+) -> MigrationResult:
+    """Rewrite ISO string timestamps as native BSON dates.
+
+    Only documents that still hold a string in one of the fields are read.
+    Strings that are not ISO formatted are counted as failed and left in
+    place. Running the converter again only touches documents that still
+    hold strings.
+
+    Args:
+        model: Model class whose collection is converted
+        fields: Datetime fields to convert, defaults to all natively stored ones
+        batch_size: Number of documents per chunk
+        pause: Seconds to sleep between chunks
+
+    Returns:
+        MigrationResult: Conversion statistics
+
+    Raises:
+        ValueError: If batch_size is not positive or a field is not a datetime field
+        DatabaseError: If a chunk cannot be read or written
+    """
+    from earnorm.fields.primitive.datetime import DateTimeField
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    names = _stored_fields(model, fields, DateTimeField, "native")
+    return await _convert_strings(model, names, _parse_datetime, "datetime", batch_size, pause)
+
+
+async def convert_decimal_strings(
+    model: Any,
+    fields: list[str] | None = None,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    pause: float = 0.0,
+) -> MigrationResult:
+    """Rewrite decimal strings as BSON Decimal128 values.
+
+    Values are rounded to the field's decimal places exactly as new writes
+    are. Strings that are not numbers are counted as failed and left in place.
+
+    Args:
+        model: Model class whose collection is converted
+        fields: Decimal fields to convert, defaults to all Decimal128 stored ones
+        batch_size: Number of documents per chunk
+        pause: Seconds to sleep between chunks
+
+    Returns:
+        MigrationResult: Conversion statistics
+
+    Raises:
+        ValueError: If batch_size is not positive or a field is not a decimal field
+        DatabaseError: If a chunk cannot be read or written
+    """
+    from earnorm.fields.primitive.decimal import DecimalField
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    names = _stored_fields(model, fields, DecimalField, "decimal128")
+    return await _convert_strings(model, names, _parse_decimal, "decimal", batch_size, pause)
+
+
+async def _convert_strings(
+    model: Any,
+    names: list[str],
+    parse: Callable[[Any, str], Any],
+    label: str,
+    batch_size: int,
+    pause: float,
+) -> MigrationResult:
+    """Rewrite string values of fields in chunks.
+
+    Args:
+        model: Model class whose collection is converted
+        names: Fields to convert
+        parse: Converts a stored string with its field, returns None on failure
+        label: Value kind used in log messages
+        batch_size: Number of documents per chunk
+        pause: Seconds to sleep between chunks
+
+    Returns:
+        MigrationResult: Conversion statistics
+
+    Raises:
+        DatabaseError: If a chunk cannot be read or written
+    """
+    result = MigrationResult()
+    if not names:
+        return result
+
+    adapter = model._env.adapter
+    collection = adapter._get_collection(adapter._get_collection_name(model))  # pylint: disable=protected-access
+    model_fields = model.__fields__
+    has_string = {"$or": [{name: {"$type": "string"}} for name in names]}
+    projection = dict.fromkeys(names, 1)
+    last_id: Any = None
+
+    while True:
+        query = has_string if last_id is None else {"$and": [{"_id": {"$gt": last_id}}, has_string]}
+        try:
+            docs = await collection.find(query, projection=projection).sort("_id", 1).limit(batch_size).to_list(None)
+        except Exception as e:
+            raise DatabaseError(message=f"Failed to read {model._name} chunk: {e!s}", backend="mongodb") from e
+        if not docs:
+            break
+
+        operations: list[UpdateOne] = []
+        for doc in docs:
+            updates: dict[str, Any] = {}
+            expected: dict[str, Any] = {"_id": doc["_id"]}
+            for name in names:
+                value = doc.get(name)
+                if not isinstance(value, str):
+                    continue
+                parsed = parse(model_fields[name], value)
+                if parsed is None:
+                    result.failed += 1
+                    continue
+                updates[name] = parsed
+                expected[name] = value
+            if updates:
+                operations.append(UpdateOne(expected, {"$set": updates}))
+
+        if operations:
+            try:
+                write = await collection.bulk_write(operations, ordered=False)
+            except Exception as e:
+                raise DatabaseError(message=f"Failed to write {model._name} chunk: {e!s}", backend="mongodb") from e
+            result.converted += write.modified_count
+
+        result.scanned += len(docs)
+        result.batches += 1
+        last_id = docs[-1]["_id"]
+        logger.info(
+            "Converted %s strings of %s: %d documents scanned, %d rewritten",
+            label,
+            model._name,
+            result.scanned,
+            result.converted,
+        )
+
+        if len(docs) < batch_size:
+            break
+        if pause:
+            await asyncio.sleep(pause)
+
+    return result
@@ -20,6 +20,11 @@ This module provides MongoDB-specific query implementation including:
    - Date/time types
    - Decimal support
 
+4. Pipeline Optimizer (optimize_pipeline)
+   - Paging before joins
+   - Stage merging
+   - Projection pruning
+
 Examples:
     >>> from earnorm.base.database.query.backends.mongo import (
     ...     MongoQuery,
@@ -49,6 +54,7 @@ Examples:
 from .builder import MongoQueryBuilder
 from .converter import MongoConverter
 from .operations import MongoAggregate, MongoJoin, MongoWindow
+from .optimizer import optimize_pipeline
 from .query import MongoQuery
 
 __all__ = [
@@ -60,4 +66,6 @@ __all__ = [
     "MongoAggregate",
     "MongoJoin",
     "MongoWindow",
+    # Optimizer
+    "optimize_pipeline",
 ]
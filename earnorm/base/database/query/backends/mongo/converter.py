@@ -19,6 +19,7 @@ from earnorm.base.database.query.interfaces.domain import (
     DomainExpression,
     DomainLeaf,
     DomainNode,
+    like_pattern,
 )
 from earnorm.types import JsonDict
 
@@ -127,17 +128,16 @@ class MongoConverter:
         if operator == "=":
             return {field: value}
         elif operator == "is null":
-            return {field: {"$exists": False}}
+            # Matches missing values and explicit nulls
+            return {field: None}
         elif operator == "is not null":
-            return {field: {"$exists": True}}
+            return {field: {"$ne": None}}
         elif operator in ("like", "ilike"):
             flags = "i" if operator == "ilike" else ""
-            pattern = str(value).replace("%", ".*")
-            return {field: {"$regex": pattern, "$options": flags}}
+            return {field: {"$regex": like_pattern(value), "$options": flags}}
         elif operator in ("not like", "not ilike"):
             flags = "i" if operator == "not ilike" else ""
-            pattern = str(value).replace("%", ".*")
-            return {field: {"$not": {"$regex": pattern, "$options": flags}}}
+            return {field: {"$not": {"$regex": like_pattern(value), "$options": flags}}}
 
         # Handle normal operators
         mongo_op = self.OPERATOR_MAP.get(operator)
@@ -18,26 +18,60 @@ Examples:
     >>> query.aggregate().group_by(User.age).avg(User.salary)
     >>> query.aggregate().group_by(User.age).min(User.salary)
     >>> query.aggregate().group_by(User.age).max(User.salary)
+    >>> # Server-side revenue report, Decimal128 sums decoded exactly
+    >>> rows = await (
+    ...     (await Order.aggregate())
+    ...     .filter([("state", "=", "done")])
+    ...     .group_by("currency")
+    ...     .sum("amount", "revenue")
+    ...     .execute()
+    ... )
+    >>> rows
+    [{"currency": "EUR", "revenue": Decimal("10234.50")}, ...]
+    >>> # Monthly buckets, largest first
+    >>> aggregate.group_by_date("create_date", "month").sum("amount", "total").order_by("-total").limit(12)
 """
 
 from typing import Any, TypeVar
 
+from bson.decimal128 import Decimal128
 from motor.motor_asyncio import AsyncIOMotorCollection
 
 from earnorm.base.database.query.interfaces.domain import (
+    RAW_VALUE_OPERATORS,
     DomainExpression,
     DomainItem,
     DomainLeaf,
     DomainNode,
+    like_pattern,
 )
 from earnorm.base.database.query.interfaces.operations.aggregate import (
     AggregateProtocol,
 )
+from earnorm.exceptions import DatabaseError
 from earnorm.types import DatabaseModel, JsonDict
 
 ModelT = TypeVar("ModelT", bound=DatabaseModel)
 
 
+def _decode(value: Any) -> Any:
+    """Decode BSON result values to Python values.
+
+    Args:
+        value: Result value
+
+    Returns:
+        Any: Value with Decimal128 decoded to exact Decimal
+    """
+    if isinstance(value, Decimal128):
+        return value.to_decimal()
+    if isinstance(value, dict):
+        return {key: _decode(item) for key, item in value.items()}  # type: ignore
+    if isinstance(value, list):
+        return [_decode(item) for item in value]  # type: ignore
+    return value
+
+
 class MongoAggregate(AggregateProtocol[ModelT]):
     """MongoDB aggregate operation implementation.
 
@@ -61,6 +95,35 @@ class MongoAggregate(AggregateProtocol[ModelT]):
         self._group_fields: list[str] = []
         self._aggregations: list[dict[str, Any]] = []
         self._having_conditions: dict[str, Any] = {}
+        self._match: dict[str, Any] = {}
+        self._group_exprs: dict[str, Any] = {}
+        self._sizes: list[str] = []
+        self._sort: dict[str, int] = {}
+        self._skip = 0
+        self._limit: int | None = None
+
+    def filter(self, domain: list[DomainItem] | JsonDict) -> "MongoAggregate[ModelT]":
+        """Filter documents before grouping.
+
+        Domain values are converted to the stored representation of their
+        fields, e.g. decimals to Decimal128.
+
+        Args:
+            domain: Filter conditions in domain expression format or MongoDB query format
+
+        Returns:
+            Self for chaining
+        """
+        if isinstance(domain, dict):
+            self._match.update(domain)
+        else:
+            expr = DomainExpression(domain)
+            expr.validate()
+            model_fields = getattr(self._model_type, "__fields__", None)
+            if not isinstance(model_fields, dict):
+                model_fields = None
+            self._match.update(self._convert_domain_to_mongo(expr, model_fields))
+        return self
 
     def group_by(self, *fields: str) -> "MongoAggregate[ModelT]":
         """Group by fields.
@@ -74,6 +137,61 @@ class MongoAggregate(AggregateProtocol[ModelT]):
         self._group_fields.extend(fields)
         return self
 
+    def group_by_date(
+        self,
+        field: str,
+        unit: str,
+        alias: str | None = None,
+        iso: bool = False,
+    ) -> "MongoAggregate[ModelT]":
+        """Group by date truncated to a calendar unit.
+
+        Weeks start on Monday. Buckets are computed in UTC.
+
+        Args:
+            field: Date field to group by
+            unit: ``$dateTrunc`` unit, e.g. day, week, month, quarter or year
+            alias: Name of the group key, defaults to the field name
+            iso: Whether the field holds ISO strings instead of native dates
+
+        Returns:
+            Self for chaining
+        """
+        date: Any = {"$dateFromString": {"dateString": f"${field}"}} if iso else f"${field}"
+        trunc: JsonDict = {"date": date, "unit": unit}
+        if unit == "week":
+            trunc["startOfWeek"] = "monday"
+        self._group_exprs[alias or field] = {"$dateTrunc": trunc}
+        return self
+
+    def accumulate(self, alias: str, expression: JsonDict) -> "MongoAggregate[ModelT]":
+        """Add a raw ``$group`` accumulator.
+
+        Args:
+            alias: Result field name
+            expression: Accumulator expression, e.g. ``{"$push": "$name"}``
+
+        Returns:
+            Self for chaining
+        """
+        self._aggregations.append({alias: expression})
+        return self
+
+    def count_distinct(self, field: str, alias: str | None = None) -> "MongoAggregate[ModelT]":
+        """Count distinct field values.
+
+        Args:
+            field: Field to count values of
+            alias: Alias for count field
+
+        Returns:
+            Self for chaining
+        """
+        alias = alias or f"count_distinct_{field}"
+        self._aggregations.append({alias: {"$addToSet": f"${field}"}})
+        self._sizes.append(alias)
+        return self
+
     def count(self, field: str = "*", alias: str | None = None) -> "MongoAggregate[ModelT]":
         """Count records.
 
@@ -163,13 +281,65 @@ class MongoAggregate(AggregateProtocol[ModelT]):
             self._having_conditions.update(mongo_query)
         return self
 
+    def order_by(self, *fields: str) -> "MongoAggregate[ModelT]":
+        """Sort groups.
+
+        Args:
+            fields: Group keys or aggregate aliases, prefixed with "-" for descending order
+
+        Returns:
+            Self for chaining
+        """
+        for field in fields:
+            name = field.lstrip("-")
+            if name in self._group_fields or name in self._group_exprs:
+                name = f"_id.{name}"
+            self._sort[name] = -1 if field.startswith("-") else 1
+        return self
+
+    def offset(self, count: int) -> "MongoAggregate[ModelT]":
+        """Skip groups.
+
+        Args:
+            count: Number of groups to skip
+
+        Returns:
+            Self for chaining
+        """
+        self._skip = count
+        return self
+
+    def limit(self, count: int) -> "MongoAggregate[ModelT]":
+        """Limit number of groups.
+
+        Args:
+            count: Maximum number of groups
+
+        Returns:
+            Self for chaining
+        """
+        self._limit = count
+        return self
+
+    def _group_id(self) -> Any:
+        """Get ``_id`` expression of the ``$group`` stage.
+
+        Returns:
+            Any: Group key document, or None to aggregate all documents
+        """
+        if not self._group_fields and not self._group_exprs:
+            return None
+        # Key documents omit missing fields, $ifNull puts them in the null group
+        keys = {field: {"$ifNull": [f"${field}", None]} for field in self._group_fields}
+        return {**keys, **self._group_exprs}
+
     def validate(self) -> None:
         """Validate aggregate configuration.
 
         Raises:
             ValueError: If aggregate configuration is invalid
         """
-        if not self._group_fields and not self._aggregations:
+        if not self._group_fields and not self._group_exprs and not self._aggregations:
             raise ValueError("No grouping fields or aggregations specified")
 
     def get_pipeline_stages(self) -> list[JsonDict]:
@@ -180,16 +350,20 @@ class MongoAggregate(AggregateProtocol[ModelT]):
         """
         stages: list[JsonDict] = []
 
+        # Add $match stage for filter conditions
+        if self._match:
+            stages.append({"$match": self._match})
+
         # Build $group stage
-        group_stage: JsonDict = {
-            "$group": {"_id": ({field: f"${field}" for field in self._group_fields} if self._group_fields else None)}
-        }
+        group_stage: JsonDict = {"$group": {"_id": self._group_id()}}
 
         # Add aggregations
         for agg in self._aggregations:
             group_stage["$group"].update(agg)
 
         stages.append(group_stage)
+        if self._sizes:
+            stages.append({"$addFields": {alias: {"$size": f"${alias}"} for alias in self._sizes}})
 
         # Add $match stage for having conditions
         if self._having_conditions:
@@ -214,8 +388,43 @@ class MongoAggregate(AggregateProtocol[ModelT]):
 
             stages.append(having_stage)
 
+        if self._sort:
+            stages.append({"$sort": dict(self._sort)})
+        if self._skip:
+            stages.append({"$skip": self._skip})
+        if self._limit is not None:
+            stages.append({"$limit": self._limit})
+
         return stages
 
+    async def execute(self) -> list[JsonDict]:
+        """Execute aggregation on the server.
+
+        Group keys are flattened into each row and Decimal128 results
+        (e.g. ``$sum`` of decimal fields) are decoded to exact ``Decimal``.
+
+        Returns:
+            List[JsonDict]: One row per group
+
+        Raises:
+            ValueError: If aggregate configuration is invalid
+            DatabaseError: If aggregation fails
+        """
+        self.validate()
+        try:
+            cursor = self._collection.aggregate(self.get_pipeline_stages())
+            docs = await cursor.to_list(length=None)
+        except Exception as e:
+            raise DatabaseError(message=f"MongoDB aggregation failed: {e!s}", backend="mongodb") from e
+
+        rows: list[JsonDict] = []
+        for doc in docs:
+            key = doc.pop("_id", None)
+            row: JsonDict = dict(key) if isinstance(key, dict) else {}
+            row.update(doc)
+            rows.append(_decode(row))
+        return rows
+
     def to_pipeline(self) -> list[JsonDict]:
         """Convert aggregate operation to MongoDB pipeline.
 
@@ -232,9 +441,7 @@ class MongoAggregate(AggregateProtocol[ModelT]):
         stages: list[JsonDict] = []
 
         # Build $group stage
-        group_stage: JsonDict = {
-            "$group": {"_id": ({field: f"${field}" for field in self._group_fields} if self._group_fields else None)}
-        }
+        group_stage: JsonDict = {"$group": {"_id": self._group_id()}}
 
         # Add aggregations
         for agg in self._aggregations:
@@ -285,11 +492,12 @@ class MongoAggregate(AggregateProtocol[ModelT]):
         """
         return self._collection
 
-    def _convert_domain_to_mongo(self, expr: DomainExpression) -> JsonDict:
+    def _convert_domain_to_mongo(self, expr: DomainExpression, model_fields: dict[str, Any] | None = None) -> JsonDict:
         """Convert domain expression to MongoDB query.
 
         Args:
             expr: Domain expression
+            model_fields: Model fields used to convert values to their stored representation
 
         Returns:
             MongoDB query
@@ -301,6 +509,14 @@ class MongoAggregate(AggregateProtocol[ModelT]):
                 op = node.operator
                 value = node.value
 
+                # Compare against the field's stored representation
+                field_obj = model_fields.get(field) if model_fields else None
+                if field_obj is not None and op not in RAW_VALUE_OPERATORS:
+                    if op in ("in", "not in") and isinstance(value, (list, tuple)):
+                        value = [field_obj.to_query_value(v) for v in value]
+                    else:
+                        value = field_obj.to_query_value(value)
+
                 if op == "=":
                     return {field: value}
                 elif op == "!=":
@@ -318,13 +534,13 @@ class MongoAggregate(AggregateProtocol[ModelT]):
                 elif op == "not in":
                     return {field: {"$nin": value}}
                 elif op == "like":
-                    return {field: {"$regex": value}}
+                    return {field: {"$regex": like_pattern(value)}}
                 elif op == "ilike":
-                    return {field: {"$regex": value, "$options": "i"}}
+                    return {field: {"$regex": like_pattern(value), "$options": "i"}}
                 elif op == "not like":
-                    return {field: {"$not": {"$regex": value}}}
+                    return {field: {"$not": {"$regex": like_pattern(value)}}}
                 elif op == "not ilike":
-                    return {field: {"$not": {"$regex": value, "$options": "i"}}}
+                    return {field: {"$not": {"$regex": like_pattern(value), "$options": "i"}}}
                 elif op == "is null":
                     return {field: None}
                 elif op == "is not null":
@@ -1,15 +1,31 @@
 """MongoDB window operation implementation.
 
 This module provides MongoDB-specific implementation for window operations.
-It uses MongoDB's $setWindowFields stage for window functions.
+It uses MongoDB's $setWindowFields stage for window functions, so moving
+aggregates, running totals and lag/lead are computed by the server and only
+the resulting rows are returned.
+
+Windows are bounded by documents (positions relative to the current
+document) or by range (values of the single sort field relative to the
+current value, with a ``unit`` for dates). Fields in ``order_by`` prefixed
+with ``-`` are sorted in descending order.
 
 Examples:
-    >>> class User(DatabaseModel):
-    ...     name: str
-    ...     age: int
+    >>> class Reading(DatabaseModel):
+    ...     sensor: str
+    ...     at: datetime
+    ...     value: float
     ...
-    >>> query = MongoQuery[User]()
-    >>> query.window().over(partition_by=[User.age]).row_number()
+    >>> query = MongoQuery[Reading]()
+    >>> query.window().over(partition_by=["sensor"], order_by=["at"]).moving_avg(
+    ...     "value", 7, unit="day", alias="weekly_avg"
+    ... ).cumulative_sum("value").lag("value", alias="previous")
+
+    >>> # Rate of change per hour and smoothed values
+    >>> query.window().over(order_by=["at"]).derivative("value", unit="hour").exp_moving_avg("value", n=10)
+
+    >>> # Rank per sensor, newest first
+    >>> query.window().over(partition_by=["sensor"], order_by=["-value", "at"]).row_number()
 """
 
 from typing import Any, TypeVar
@@ -20,12 +36,27 @@ from earnorm.types import DatabaseModel, JsonDict
 
 ModelT = TypeVar("ModelT", bound=DatabaseModel)
 
+Bound = int | float | str
+"""Window bound: offset or value relative to the current document, "current" or "unbounded"."""
+
+TIME_UNITS = frozenset({"week", "day", "hour", "minute", "second", "millisecond"})
+"""Units of range windows and derivatives over date sort fields."""
+
+ORDERED_OPERATORS = frozenset(
+    {"$documentNumber", "$rank", "$denseRank", "$shift", "$derivative", "$integral", "$expMovingAvg"}
+)
+"""Window operators requiring a sort order."""
+
+SINGLE_SORT_OPERATORS = frozenset({"$rank", "$denseRank", "$derivative", "$integral"})
+"""Window operators requiring exactly one sort field."""
+
 
 class MongoWindow(BaseWindow[ModelT], WindowProtocol[ModelT]):
     """MongoDB window operation implementation.
 
     This class provides MongoDB-specific implementation for window operations.
-    It uses MongoDB's $setWindowFields stage for window functions.
+    It uses MongoDB's $setWindowFields stage for window functions. Every
+    function adds one output field to a single $setWindowFields stage.
 
     Args:
         ModelT: Type of model being queried
@@ -47,7 +78,7 @@ class MongoWindow(BaseWindow[ModelT], WindowProtocol[ModelT]):
 
         Args:
             partition_by: Fields to partition by
-            order_by: Fields to order by
+            order_by: Fields to order by, prefixed with "-" for descending order
 
         Returns:
             Self for chaining
@@ -57,7 +88,7 @@ class MongoWindow(BaseWindow[ModelT], WindowProtocol[ModelT]):
         return self
 
     def row_number(self, alias: str = "row_number") -> "MongoWindow[ModelT]":
-        """Add row number.
+        """Add row number, starting at 1 in each partition.
 
         Args:
             alias: Alias for row number field
@@ -65,21 +96,10 @@ class MongoWindow(BaseWindow[ModelT], WindowProtocol[ModelT]):
         Returns:
             Self for chaining
         """
-        self._window_functions.append(
-            {
-                alias: {
-                    "$function": {
-                        "body": "function(partition_values, sort_values) { return partition_values.indexOf(sort_values) + 1; }",
-                        "args": ["$partition_values", "$sort_values"],
-                        "lang": "js",
-                    }
-                }
-            }
-        )
-        return self
+        return self._add(alias, {"$documentNumber": {}})
 
     def rank(self, alias: str = "rank") -> "MongoWindow[ModelT]":
-        """Add rank.
+        """Add rank, with gaps after ties.
 
         Args:
             alias: Alias for rank field
@@ -87,21 +107,10 @@ class MongoWindow(BaseWindow[ModelT], WindowProtocol[ModelT]):
         Returns:
             Self for chaining
         """
-        self._window_functions.append(
-            {
-                alias: {
-                    "$function": {
-                        "body": "function(partition_values, sort_values) { return partition_values.filter(v => v < sort_values).length + 1; }",
-                        "args": ["$partition_values", "$sort_values"],
-                        "lang": "js",
-                    }
-                }
-            }
-        )
-        return self
+        return self._add(alias, {"$rank": {}})
 
     def dense_rank(self, alias: str = "dense_rank") -> "MongoWindow[ModelT]":
-        """Add dense rank.
+        """Add dense rank, without gaps after ties.
 
         Args:
             alias: Alias for dense rank field
@@ -109,17 +118,301 @@ class MongoWindow(BaseWindow[ModelT], WindowProtocol[ModelT]):
         Returns:
             Self for chaining
         """
-        self._window_functions.append(
-            {
-                alias: {
-                    "$function": {
-                        "body": "function(partition_values, sort_values) { return new Set(partition_values.filter(v => v <= sort_values)).size; }",
-                        "args": ["$partition_values", "$sort_values"],
-                        "lang": "js",
-                    }
-                }
-            }
-        )
+        return self._add(alias, {"$denseRank": {}})
+
+    def first_value(self, field: str, alias: str | None = None) -> "MongoWindow[ModelT]":
+        """Add first value of the partition.
+
+        Args:
+            field: Field to get first value of
+            alias: Output field, defaults to ``<field>_first``
+
+        Returns:
+            Self for chaining
+        """
+        return self._accumulate("$first", field, alias or f"{field}_first", ("unbounded", "unbounded"), None, None)
+
+    def last_value(self, field: str, alias: str | None = None) -> "MongoWindow[ModelT]":
+        """Add last value of the partition.
+
+        Args:
+            field: Field to get last value of
+            alias: Output field, defaults to ``<field>_last``
+
+        Returns:
+            Self for chaining
+        """
+        return self._accumulate("$last", field, alias or f"{field}_last", ("unbounded", "unbounded"), None, None)
+
+    def lag(
+        self, field: str, offset: int = 1, default: Any = None, alias: str | None = None
+    ) -> "MongoWindow[ModelT]":
+        """Add value of a previous document.
+
+        Args:
+            field: Field to lag
+            offset: Number of documents before the current one
+            default: Value when no such document exists
+            alias: Output field, defaults to ``<field>_lag``
+
+        Returns:
+            Self for chaining
+        """
+        expr: JsonDict = {"output": _ref(field), "by": -offset, "default": default}
+        return self._add(alias or f"{field}_lag", {"$shift": expr})
+
+    def lead(
+        self, field: str, offset: int = 1, default: Any = None, alias: str | None = None
+    ) -> "MongoWindow[ModelT]":
+        """Add value of a following document.
+
+        Args:
+            field: Field to lead
+            offset: Number of documents after the current one
+            default: Value when no such document exists
+            alias: Output field, defaults to ``<field>_lead``
+
+        Returns:
+            Self for chaining
+        """
+        expr: JsonDict = {"output": _ref(field), "by": offset, "default": default}
+        return self._add(alias or f"{field}_lead", {"$shift": expr})
+
+    def sum(
+        self,
+        field: str,
+        alias: str | None = None,
+        documents: tuple[Bound, Bound] | None = None,
+        range: tuple[Bound, Bound] | None = None,
+        unit: str | None = None,
+    ) -> "MongoWindow[ModelT]":
+        """Add sum over a window, the whole partition when unbounded.
+
+        Args:
+            field: Field to sum
+            alias: Output field, defaults to ``<field>_sum``
+            documents: Window bounds in documents, e.g. (-2, "current")
+            range: Window bounds in sort field values, e.g. (-7, 0)
+            unit: Time unit of ``range`` bounds when sorting by a date
+
+        Returns:
+            Self for chaining
+
+        Raises:
+            ValueError: If the bounds are invalid
+        """
+        return self._accumulate("$sum", field, alias or f"{field}_sum", documents, range, unit)
+
+    def avg(
+        self,
+        field: str,
+        alias: str | None = None,
+        documents: tuple[Bound, Bound] | None = None,
+        range: tuple[Bound, Bound] | None = None,
+        unit: str | None = None,
+    ) -> "MongoWindow[ModelT]":
+        """Add average over a window, see ``sum``.
+
+        Returns:
+            Self for chaining
+        """
+        return self._accumulate("$avg", field, alias or f"{field}_avg", documents, range, unit)
+
+    def min(
+        self,
+        field: str,
+        alias: str | None = None,
+        documents: tuple[Bound, Bound] | None = None,
+        range: tuple[Bound, Bound] | None = None,
+        unit: str | None = None,
+    ) -> "MongoWindow[ModelT]":
+        """Add minimum over a window, see ``sum``.
+
+        Returns:
+            Self for chaining
+        """
+        return self._accumulate("$min", field, alias or f"{field}_min", documents, range, unit)
+
+    def max(
+        self,
+        field: str,
+        alias: str | None = None,
+        documents: tuple[Bound, Bound] | None = None,
+        range: tuple[Bound, Bound] | None = None,
+        unit: str | None = None,
+    ) -> "MongoWindow[ModelT]":
+        """Add maximum over a window, see ``sum``.
+
+        Returns:
+            Self for chaining
+        """
+        return self._accumulate("$max", field, alias or f"{field}_max", documents, range, unit)
+
+    def count(
+        self,
+        alias: str = "count",
+        documents: tuple[Bound, Bound] | None = None,
+        range: tuple[Bound, Bound] | None = None,
+        unit: str | None = None,
+    ) -> "MongoWindow[ModelT]":
+        """Add number of documents in a window, see ``sum``.
+
+        Returns:
+            Self for chaining
+        """
+        return self._add(alias, {"$count": {}, **_bounds(documents, range, unit)})
+
+    def cumulative_sum(self, field: str, alias: str | None = None) -> "MongoWindow[ModelT]":
+        """Add running total from the first document of the partition.
+
+        Args:
+            field: Field to sum
+            alias: Output field, defaults to ``<field>_cumulative_sum``
+
+        Returns:
+            Self for chaining
+        """
+        return self.sum(field, alias or f"{field}_cumulative_sum", documents=("unbounded", "current"))
+
+    def cumulative_avg(self, field: str, alias: str | None = None) -> "MongoWindow[ModelT]":
+        """Add running average from the first document of the partition.
+
+        Args:
+            field: Field to average
+            alias: Output field, defaults to ``<field>_cumulative_avg``
+
+        Returns:
+            Self for chaining
+        """
+        return self.avg(field, alias or f"{field}_cumulative_avg", documents=("unbounded", "current"))
+
+    def moving_sum(
+        self, field: str, size: int | float, alias: str | None = None, unit: str | None = None
+    ) -> "MongoWindow[ModelT]":
+        """Add sum of the trailing window ending at the current document.
+
+        Args:
+            field: Field to sum
+            size: Number of documents, or sort field span when ``unit`` is set
+            alias: Output field, defaults to ``<field>_moving_sum``
+            unit: Time unit of ``size``, e.g. 7 "day" for a weekly window
+
+        Returns:
+            Self for chaining
+
+        Raises:
+            ValueError: If size is not positive
+        """
+        return self._accumulate("$sum", field, alias or f"{field}_moving_sum", *_trailing(size, unit))
+
+    def moving_avg(
+        self, field: str, size: int | float, alias: str | None = None, unit: str | None = None
+    ) -> "MongoWindow[ModelT]":
+        """Add average of the trailing window ending at the current document, see ``moving_sum``.
+
+        Returns:
+            Self for chaining
+        """
+        return self._accumulate("$avg", field, alias or f"{field}_moving_avg", *_trailing(size, unit))
+
+    def derivative(
+        self,
+        field: str,
+        alias: str | None = None,
+        unit: str | None = None,
+        documents: tuple[Bound, Bound] | None = None,
+        range: tuple[Bound, Bound] | None = None,
+    ) -> "MongoWindow[ModelT]":
+        """Add average rate of change over a window.
+
+        Args:
+            field: Field whose rate of change is computed
+            alias: Output field, defaults to ``<field>_derivative``
+            unit: Time unit of the rate when sorting by a date, e.g. "hour"
+            documents: Window bounds in documents, defaults to the previous
+                and the current document
+            range: Window bounds in sort field values
+
+        Returns:
+            Self for chaining
+
+        Raises:
+            ValueError: If the unit or bounds are invalid
+        """
+        if documents is None and range is None:
+            documents = (-1, "current")
+        expr: JsonDict = {"input": _ref(field)}
+        if unit is not None:
+            expr["unit"] = _unit(unit)
+        window = _bounds(documents, range, unit if range is not None else None)
+        return self._add(alias or f"{field}_derivative", {"$derivative": expr, **window})
+
+    def exp_moving_avg(
+        self, field: str, n: int | None = None, alpha: float | None = None, alias: str | None = None
+    ) -> "MongoWindow[ModelT]":
+        """Add exponential moving average.
+
+        Args:
+            field: Field to average
+            n: Number of documents with significant weight, alpha being 2 / (n + 1)
+            alpha: Weight of the current document, between 0 and 1 excluded
+            alias: Output field, defaults to ``<field>_exp_moving_avg``
+
+        Returns:
+            Self for chaining
+
+        Raises:
+            ValueError: If not exactly one of n and alpha is valid
+        """
+        if (n is None) == (alpha is None):
+            raise ValueError("Exactly one of n and alpha must be set")
+        if n is not None and n < 1:
+            raise ValueError(f"n must be positive: {n}")
+        if alpha is not None and not 0 < alpha < 1:
+            raise ValueError(f"alpha must be between 0 and 1: {alpha}")
+        weight: JsonDict = {"N": n} if n is not None else {"alpha": alpha}
+        return self._add(alias or f"{field}_exp_moving_avg", {"$expMovingAvg": {"input": _ref(field), **weight}})
+
+    def _accumulate(
+        self,
+        operator: str,
+        field: str,
+        alias: str,
+        documents: tuple[Bound, Bound] | None,
+        range: tuple[Bound, Bound] | None,
+        unit: str | None,
+    ) -> "MongoWindow[ModelT]":
+        """Add accumulator over a window.
+
+        Args:
+            operator: Accumulator operator, e.g. "$sum"
+            field: Input field
+            alias: Output field
+            documents: Window bounds in documents
+            range: Window bounds in sort field values
+            unit: Time unit of range bounds
+
+        Returns:
+            Self for chaining
+        """
+        return self._add(alias, {operator: _ref(field), **_bounds(documents, range, unit)})
+
+    def _add(self, alias: str, expr: JsonDict) -> "MongoWindow[ModelT]":
+        """Add output field.
+
+        Args:
+            alias: Output field
+            expr: Window function expression
+
+        Returns:
+            Self for chaining
+
+        Raises:
+            ValueError: If the alias is already used
+        """
+        if any(alias in func for func in self._window_functions):
+            raise ValueError(f"Window output {alias} is defined twice")
+        self._window_functions.append({alias: expr})
         return self
 
     def validate(self) -> None:
@@ -130,34 +423,44 @@ class MongoWindow(BaseWindow[ModelT], WindowProtocol[ModelT]):
         """
         if not self._window_functions:
             raise ValueError("No window functions specified")
+        sort_fields = len(self._order_by or ())
+        for func in self._window_functions:
+            for alias, expr in func.items():
+                if sort_fields == 0 and not _unordered(expr):
+                    raise ValueError(f"Window output {alias} requires order_by")
+                if sort_fields > 1 and (SINGLE_SORT_OPERATORS & expr.keys() or "range" in expr.get("window", {})):
+                    raise ValueError(f"Window output {alias} requires exactly one order_by field")
 
     def get_pipeline_stages(self) -> list[JsonDict]:
         """Get MongoDB aggregation pipeline stages for this window function.
 
         Returns:
             List[JsonDict]: List of pipeline stages
+
+        Raises:
+            ValueError: If window configuration is invalid
         """
         if not self._window_functions:
             return []
-
-        stages: list[JsonDict] = []
+        self.validate()
 
         # Build $setWindowFields stage
-        window_stage: JsonDict = {
-            "$setWindowFields": {
-                "partitionBy": ({field: f"${field}" for field in self._partition_by} if self._partition_by else None),
-                "sortBy": (dict.fromkeys(self._order_by, 1) if self._order_by else None),
-                "output": {},
-            }
-        }
+        spec: JsonDict = {}
+        if self._partition_by:
+            spec["partitionBy"] = (
+                f"${self._partition_by[0]}"
+                if len(self._partition_by) == 1
+                else {field: f"${field}" for field in self._partition_by}
+            )
+        if self._order_by:
+            spec["sortBy"] = {field.lstrip("-"): -1 if field.startswith("-") else 1 for field in self._order_by}
 
         # Add window functions
+        spec["output"] = {}
         for func in self._window_functions:
-            window_stage["$setWindowFields"]["output"].update(func)
+            spec["output"].update(func)
 
-        stages.append(window_stage)
-
-        return stages
+        return [{"$setWindowFields": spec}]
 
     def to_pipeline(self) -> list[JsonDict]:
         """Convert window operation to MongoDB pipeline.
@@ -168,32 +471,98 @@ class MongoWindow(BaseWindow[ModelT], WindowProtocol[ModelT]):
         Raises:
             ValueError: If window function is not supported by MongoDB
         """
-        if not self._window_expr:
+        if not self._window_functions:
             raise ValueError("Window function not specified")
+        return self.get_pipeline_stages()
 
-        # Build window stage
-        window_stage = {
-            "$setWindowFields": {
-                "partitionBy": ({field: f"${field}" for field in self._partition_by} if self._partition_by else None),
-                "sortBy": (dict.fromkeys(self._order_by, 1) if self._order_by else None),
-                "output": {
-                    self._alias
-                    or "window_result": {
-                        **self._window_expr,
-                        "window": (
-                            {"documents": ["unbounded", "current"]}
-                            if "window" not in self._window_expr
-                            else self._window_expr["window"]
-                        ),
-                    }
-                },
-            }
-        }
-
-        # Remove None values
-        if not window_stage["$setWindowFields"]["partitionBy"]:
-            del window_stage["$setWindowFields"]["partitionBy"]
-        if not window_stage["$setWindowFields"]["sortBy"]:
-            del window_stage["$setWindowFields"]["sortBy"]
-
-        return [window_stage]
+
+def _ref(field: str) -> str:
+    """Get field path expression."""
+    return field if field.startswith("$") else f"${field}"
+
+
+def _unit(unit: str) -> str:
+    """Validate time unit.
+
+    Raises:
+        ValueError: If the unit is unknown
+    """
+    if unit not in TIME_UNITS:
+        raise ValueError(f"Invalid time unit: {unit}, expected one of {sorted(TIME_UNITS)}")
+    return unit
+
+
+def _bounds(
+    documents: tuple[Bound, Bound] | None,
+    range: tuple[Bound, Bound] | None,
+    unit: str | None,
+) -> JsonDict:
+    """Build window bounds of a function.
+
+    Args:
+        documents: Bounds in documents relative to the current one
+        range: Bounds in sort field values relative to the current one
+        unit: Time unit of range bounds
+
+    Returns:
+        JsonDict: ``window`` entry, empty for the whole partition
+
+    Raises:
+        ValueError: If the bounds are invalid
+    """
+    if documents is not None and range is not None:
+        raise ValueError("Window bounds are either documents or range")
+    if unit is not None and range is None:
+        raise ValueError("Time unit requires range bounds")
+    bounds = documents if documents is not None else range
+    if bounds is None:
+        return {}
+    if len(bounds) != 2:
+        raise ValueError(f"Window bounds need a lower and an upper bound: {bounds}")
+    for bound in bounds:
+        if isinstance(bound, str):
+            if bound not in ("current", "unbounded"):
+                raise ValueError(f"Invalid window bound: {bound}")
+        elif isinstance(bound, bool) or not isinstance(bound, (int, float)):
+            raise ValueError(f"Invalid window bound: {bound}")
+        elif documents is not None and not isinstance(bound, int):
+            raise ValueError(f"Document bounds must be integers: {bound}")
+    lower, upper = (0 if bound == "current" else bound for bound in bounds)
+    if not isinstance(lower, str) and not isinstance(upper, str) and lower > upper:
+        raise ValueError(f"Window lower bound is after upper bound: {bounds}")
+    window: JsonDict = {"documents" if documents is not None else "range": list(bounds)}
+    if unit is not None:
+        window["unit"] = _unit(unit)
+    return {"window": window}
+
+
+def _trailing(
+    size: int | float, unit: str | None
+) -> tuple[tuple[Bound, Bound] | None, tuple[Bound, Bound] | None, str | None]:
+    """Build bounds of a trailing window ending at the current document.
+
+    Args:
+        size: Number of documents, or sort field span with a unit
+        unit: Time unit of the span
+
+    Returns:
+        Tuple: Document bounds, range bounds and unit
+
+    Raises:
+        ValueError: If size is not positive or not an integer number of documents
+    """
+    if size <= 0:
+        raise ValueError(f"Window size must be positive: {size}")
+    if unit is not None:
+        return None, (-size, "current"), unit
+    if not isinstance(size, int):
+        raise ValueError(f"Window size in documents must be an integer: {size}")
+    return (-(size - 1), "current"), None, None
+
+
+def _unordered(expr: JsonDict) -> bool:
+    """Check whether a window function works without sort order.
+
+    Accumulators over the whole partition do not depend on document order.
+    """
+    return "window" not in expr and not ORDERED_OPERATORS & expr.keys()
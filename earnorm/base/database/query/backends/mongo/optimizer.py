@@ -0,0 +1,440 @@
+"""MongoDB aggregation pipeline optimizer.
+
+This module rewrites the pipelines built by ``MongoQuery`` so that joined
+lists do less work, without changing their results:
+
+1. Stage merging
+   - Adjacent ``$match`` stages become one filter
+   - Adjacent inclusion ``$project`` stages become one projection
+
+2. Projection pruning
+   - Walking the pipeline backwards, inclusion projections keep only the
+     fields consumed by later stages
+   - ``$lookup`` stages whose output no later stage consumes are removed when
+     they cannot change the number of documents
+
+3. Page hoisting
+   - ``$sort`` moves ahead of ``$lookup``/``$unwind`` when it does not sort by
+     joined fields
+   - ``$skip`` and ``$limit`` follow it when the join keeps exactly one
+     document per input document: a lookup without ``$unwind``, or a lookup on
+     ``_id`` unwound with ``preserveNullAndEmptyArrays``
+
+Inner joins may drop or repeat documents, so paging stays after them.
+Stages the optimizer does not know (``$group``, ``$setWindowFields``, ...)
+are never moved or pruned across.
+
+Examples:
+    >>> optimize_pipeline([
+    ...     {"$match": {"state": "open"}},
+    ...     {"$lookup": {"from": "user", "localField": "user_id",
+    ...                  "foreignField": "_id", "as": "user"}},
+    ...     {"$sort": {"date": -1}},
+    ...     {"$limit": 20},
+    ... ])
+    [{'$match': {'state': 'open'}}, {'$sort': {'date': -1}}, {'$limit': 20},
+     {'$lookup': {...}}]
+"""
+
+from typing import Any
+
+from earnorm.types import JsonDict
+
+PAGE_STAGES = ("$sort", "$skip", "$limit")
+"""Stages selecting the page of documents."""
+
+
+def optimize_pipeline(pipeline: list[JsonDict]) -> list[JsonDict]:
+    """Optimize aggregation pipeline.
+
+    Args:
+        pipeline: Pipeline stages; they are not modified
+
+    Returns:
+        List[JsonDict]: Equivalent pipeline
+    """
+    stages = _merge_adjacent(list(pipeline))
+    stages = _prune(stages)
+    stages = _hoist_pages(stages)
+    return _merge_adjacent(stages)
+
+
+def _stage_name(stage: JsonDict) -> str:
+    """Get operator of a pipeline stage.
+
+    Args:
+        stage: Pipeline stage
+
+    Returns:
+        str: Stage operator, empty for malformed stages
+    """
+    return next(iter(stage)) if len(stage) == 1 else ""
+
+
+def _overlaps(path: str, fields: set[str]) -> bool:
+    """Check whether a path shares data with any of the fields.
+
+    Args:
+        path: Dotted field path
+        fields: Dotted field paths
+
+    Returns:
+        bool: True if a field equals, contains or is contained in the path
+    """
+    return any(
+        field == path or field.startswith(f"{path}.") or path.startswith(f"{field}.") for field in fields
+    )
+
+
+# Lookups
+
+
+def _lookup_unit(stages: list[JsonDict], index: int) -> int:
+    """Get length of the join starting at a ``$lookup`` stage.
+
+    Args:
+        stages: Pipeline stages
+        index: Index of the ``$lookup`` stage
+
+    Returns:
+        int: 2 if the next stage unwinds the joined array, else 1
+    """
+    if index + 1 < len(stages) and _stage_name(stages[index + 1]) == "$unwind":
+        if _unwind_path(stages[index + 1]["$unwind"]) == stages[index]["$lookup"].get("as"):
+            return 2
+    return 1
+
+
+def _unwind_path(spec: Any) -> str | None:
+    """Get field unwound by an ``$unwind`` stage.
+
+    Args:
+        spec: Stage specification
+
+    Returns:
+        Optional[str]: Field path without ``$``
+    """
+    path = spec.get("path") if isinstance(spec, dict) else spec
+    return path[1:] if isinstance(path, str) and path.startswith("$") else None
+
+
+def _joins_unique(lookup: JsonDict) -> bool:
+    """Check whether a lookup matches at most one document.
+
+    Args:
+        lookup: ``$lookup`` specification
+
+    Returns:
+        bool: True if the lookup compares the foreign ``_id`` for equality
+    """
+    if "foreignField" in lookup:
+        return lookup["foreignField"] == "_id"
+    sub_pipeline = lookup.get("pipeline") or []
+    if len(sub_pipeline) != 1 or _stage_name(sub_pipeline[0]) != "$match":
+        return False
+    expr = sub_pipeline[0]["$match"].get("$expr")
+    if not isinstance(expr, dict):
+        return False
+    conditions = expr.get("$and", [expr])
+    return any(
+        isinstance(condition, dict) and "$_id" in (condition.get("$eq") or []) for condition in conditions
+    )
+
+
+def _keeps_count(stages: list[JsonDict]) -> bool:
+    """Check whether a join returns exactly one document per input document.
+
+    Args:
+        stages: ``$lookup`` stage, optionally followed by its ``$unwind``
+
+    Returns:
+        bool: True if documents are neither dropped nor repeated
+    """
+    if len(stages) == 1:
+        return True
+    unwind = stages[1]["$unwind"]
+    return (
+        isinstance(unwind, dict)
+        and unwind.get("preserveNullAndEmptyArrays") is True
+        and "includeArrayIndex" not in unwind
+        and _joins_unique(stages[0]["$lookup"])
+    )
+
+
+def _lookup_inputs(lookup: JsonDict) -> set[str] | None:
+    """Get local fields read by a lookup.
+
+    Args:
+        lookup: ``$lookup`` specification
+
+    Returns:
+        Optional[Set[str]]: Field paths, or None if they cannot be determined
+    """
+    if "localField" in lookup:
+        return {lookup["localField"]}
+    fields: set[str] = set()
+    for value in (lookup.get("let") or {}).values():
+        if not isinstance(value, str) or not value.startswith("$") or value.startswith("$$"):
+            return None
+        fields.add(value[1:])
+    return fields
+
+
+# Merging
+
+
+def _is_inclusion(projection: Any) -> bool:
+    """Check whether a projection only includes fields.
+
+    Args:
+        projection: ``$project`` specification
+
+    Returns:
+        bool: True for ``{field: 1, ...}`` projections, optionally excluding ``_id``
+    """
+    if not isinstance(projection, dict):
+        return False
+    included = False
+    for field, value in projection.items():
+        if not isinstance(value, (bool, int)) or value not in (0, 1):
+            return False
+        if field == "_id":
+            continue
+        if not value:
+            return False
+        included = True
+    return included
+
+
+def _keeps_id(projection: JsonDict) -> bool:
+    """Check whether an inclusion projection keeps ``_id``.
+
+    Args:
+        projection: Inclusion projection
+
+    Returns:
+        bool: True unless ``_id`` is excluded
+    """
+    return bool(projection.get("_id", 1))
+
+
+def _compose_projections(first: JsonDict, second: JsonDict) -> JsonDict | None:
+    """Compose two inclusion projections applied one after another.
+
+    Args:
+        first: Projection applied first
+        second: Projection applied to the output of the first
+
+    Returns:
+        Optional[JsonDict]: Single projection, or None if no field would remain
+    """
+    kept = [field for field in first if field != "_id"]
+    fields: dict[str, int] = {}
+    for field in second:
+        if field == "_id":
+            continue
+        if any(field == path or field.startswith(f"{path}.") for path in kept):
+            fields[field] = 1
+        else:
+            fields.update((path, 1) for path in kept if path.startswith(f"{field}."))
+    if not fields:
+        return None
+    if not (_keeps_id(first) and _keeps_id(second)):
+        fields["_id"] = 0
+    return fields
+
+
+def _merge_pair(first: JsonDict, second: JsonDict) -> JsonDict | None:
+    """Merge two adjacent stages.
+
+    Args:
+        first: Earlier stage
+        second: Later stage
+
+    Returns:
+        Optional[JsonDict]: Merged stage, or None if the stages cannot be merged
+    """
+    name = _stage_name(first)
+    if name != _stage_name(second):
+        return None
+    if name == "$match":
+        left, right = first["$match"], second["$match"]
+        if not left or not right:
+            return {"$match": left or right}
+        if left.keys().isdisjoint(right.keys()):
+            return {"$match": {**left, **right}}
+        return {"$match": {"$and": [left, right]}}
+    if name == "$project" and _is_inclusion(first["$project"]) and _is_inclusion(second["$project"]):
+        projection = _compose_projections(first["$project"], second["$project"])
+        return {"$project": projection} if projection else None
+    return None
+
+
+def _merge_adjacent(stages: list[JsonDict]) -> list[JsonDict]:
+    """Merge adjacent ``$match`` and ``$project`` stages.
+
+    Args:
+        stages: Pipeline stages
+
+    Returns:
+        List[JsonDict]: Merged stages
+    """
+    merged: list[JsonDict] = []
+    for stage in stages:
+        combined = _merge_pair(merged[-1], stage) if merged else None
+        if combined is None:
+            merged.append(stage)
+        else:
+            merged[-1] = combined
+    return merged
+
+
+# Pruning
+
+
+def _match_fields(spec: Any) -> set[str] | None:
+    """Get fields read by a ``$match`` filter.
+
+    Args:
+        spec: Filter document
+
+    Returns:
+        Optional[Set[str]]: Field paths, or None if they cannot be determined
+    """
+    if not isinstance(spec, dict):
+        return None
+    fields: set[str] = set()
+    for key, value in spec.items():
+        if key in ("$and", "$or", "$nor"):
+            for condition in value:
+                nested = _match_fields(condition)
+                if nested is None:
+                    return None
+                fields |= nested
+        elif key.startswith("$"):
+            return None
+        else:
+            fields.add(key)
+    return fields
+
+
+def _prune(stages: list[JsonDict]) -> list[JsonDict]:
+    """Prune projections and joins to the fields consumed downstream.
+
+    Args:
+        stages: Pipeline stages
+
+    Returns:
+        List[JsonDict]: Pruned stages
+    """
+    # Fields read by later stages; None means the whole document
+    needed: set[str] | None = None
+    pruned: list[JsonDict] = []
+    index = len(stages) - 1
+    while index >= 0:
+        stage = stages[index]
+        name = _stage_name(stage)
+
+        if name == "$unwind" and index > 0 and _stage_name(stages[index - 1]) == "$lookup":
+            if _lookup_unit(stages, index - 1) == 2:
+                index -= 1
+                stage, name = stages[index], "$lookup"
+
+        if name == "$lookup":
+            unit = stages[index : index + _lookup_unit(stages, index)]
+            lookup = stage["$lookup"]
+            target = lookup.get("as", "")
+            if needed is not None and not _overlaps(target, needed) and _keeps_count(unit):
+                index -= 1
+                continue
+            pruned[:0] = unit
+            inputs = _lookup_inputs(lookup)
+            if needed is not None and inputs is not None:
+                needed = {field for field in needed if field != target and not field.startswith(f"{target}.")}
+                needed |= inputs
+            else:
+                needed = None
+            index -= 1
+            continue
+
+        if name == "$project" and _is_inclusion(stage["$project"]):
+            projection = stage["$project"]
+            if needed is not None:
+                fields = {field: 1 for field in projection if field != "_id" and _overlaps(field, needed)}
+                if fields:
+                    if "_id" in projection:
+                        fields["_id"] = projection["_id"]
+                    projection = fields
+                    stage = {"$project": projection}
+            needed = {field for field in projection if field != "_id"}
+            if _keeps_id(projection):
+                needed.add("_id")
+        elif name == "$match":
+            fields = _match_fields(stage["$match"])
+            needed = needed | fields if needed is not None and fields is not None else None
+        elif name == "$sort":
+            if needed is not None:
+                needed |= set(stage["$sort"])
+        elif name == "$unwind":
+            path = _unwind_path(stage["$unwind"])
+            if needed is not None and path is not None:
+                needed.add(path)
+            else:
+                needed = None
+        elif name not in ("$skip", "$limit"):
+            needed = None
+
+        pruned.insert(0, stage)
+        index -= 1
+    return pruned
+
+
+# Hoisting
+
+
+def _can_hoist(stage: JsonDict, unit: list[JsonDict]) -> bool:
+    """Check whether a page stage can run before a join.
+
+    Args:
+        stage: ``$sort``, ``$skip`` or ``$limit`` stage
+        unit: ``$lookup`` stage, optionally followed by its ``$unwind``
+
+    Returns:
+        bool: True if moving the stage ahead of the join keeps the results
+    """
+    if _stage_name(stage) == "$sort":
+        return not _overlaps(unit[0]["$lookup"].get("as", ""), set(stage["$sort"]))
+    return _keeps_count(unit)
+
+
+def _hoist_pages(stages: list[JsonDict]) -> list[JsonDict]:
+    """Move ``$sort``/``$skip``/``$limit`` ahead of joins where safe.
+
+    Page stages only move across joins, never across each other, so their
+    relative order is kept.
+
+    Args:
+        stages: Pipeline stages
+
+    Returns:
+        List[JsonDict]: Reordered stages
+    """
+    stages = list(stages)
+    moved = True
+    while moved:
+        moved = False
+        index = 0
+        while index < len(stages):
+            if _stage_name(stages[index]) != "$lookup":
+                index += 1
+                continue
+            size = _lookup_unit(stages, index)
+            after = index + size
+            if after < len(stages) and _stage_name(stages[after]) in PAGE_STAGES:
+                if _can_hoist(stages[after], stages[index:after]):
+                    stages.insert(index, stages.pop(after))
+                    moved = True
+                    index += 1
+                    continue
+            index = after
+    return stages
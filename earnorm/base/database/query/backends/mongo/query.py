@@ -22,7 +22,7 @@ Examples:
 
 import asyncio
 import logging
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Sequence
 from typing import (
     Any,
     Protocol,
@@ -36,10 +36,12 @@ from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorCommandCurso
 
 from earnorm.base.database.query.core.query import BaseQuery
 from earnorm.base.database.query.interfaces.domain import (
+    RAW_VALUE_OPERATORS,
     DomainExpression,
     DomainItem,
     DomainLeaf,
     DomainNode,
+    like_pattern,
 )
 from earnorm.base.database.query.interfaces.operations.aggregate import (
     AggregateProtocol,
@@ -47,12 +49,14 @@ from earnorm.base.database.query.interfaces.operations.aggregate import (
 from earnorm.base.database.query.interfaces.operations.join import JoinProtocol
 from earnorm.base.database.query.interfaces.operations.window import WindowProtocol
 from earnorm.base.database.query.interfaces.query import QueryProtocol
+from earnorm.base.database.timeseries import bucket_filter, model_timeseries_spec
 from earnorm.exceptions import DatabaseError
 from earnorm.types import DatabaseModel, JsonDict
 
 from .operations.aggregate import MongoAggregate
 from .operations.join import MongoJoin
 from .operations.window import MongoWindow
+from .optimizer import optimize_pipeline
 
 ModelT = TypeVar("ModelT", bound=DatabaseModel)
 JoinT = TypeVar("JoinT", bound=DatabaseModel)
@@ -117,12 +121,13 @@ class MongoQuery(BaseQuery[ModelT]):
         super().__init__(model_type)
         self._collection = collection
         self._model_type = model_type
-        self._filter = filter
-        self._projection = projection
-        self._sort = sort
+        # Copy mutable arguments so queries never share the default instances
+        self._filter = dict(filter)
+        self._projection = dict(projection)
+        self._sort = list(sort)
         self._skip = skip
         self._limit = limit
-        self._pipeline = pipeline
+        self._pipeline = list(pipeline)
         self._allow_disk_use = allow_disk_use
         self._hint = hint
         self._operation = operation
@@ -187,19 +192,8 @@ class MongoQuery(BaseQuery[ModelT]):
             DatabaseError: If query execution fails
         """
         try:
-            # Build pipeline
-            pipeline = self._build_pipeline()
-
-            # If no fields specified, select all fields from model
-            if not self._fields:
-                # Get all fields from model
-                model_fields = list(self._model_type.__fields__.keys())
-                # Map id to _id for MongoDB
-                if "id" in model_fields:
-                    model_fields.remove("id")
-                    model_fields.append("_id")
-                # Add field selection
-                pipeline.append({"$project": dict.fromkeys(model_fields, 1)})
+            # Build pipeline, selecting all model fields by default
+            pipeline = self._build_pipeline(default_fields=list(self._model_type.__fields__.keys()))
 
             # Execute aggregation
             cursor = self._collection.aggregate(pipeline=pipeline, allowDiskUse=self._allow_disk_use)
@@ -297,9 +291,17 @@ class MongoQuery(BaseQuery[ModelT]):
             expr = DomainExpression(cast(list[DomainItem], domain))
             expr.validate()
             mongo_query = self._convert_domain_to_mongo(expr)
+            spec = model_timeseries_spec(self._model_type)
+            if spec is not None:
+                mongo_query = bucket_filter(spec, mongo_query)
             self._filter.update(mongo_query)
         return self
 
+    @property
+    def conditions(self) -> JsonDict:
+        """Get MongoDB filter built from the query conditions."""
+        return self._filter
+
     def _convert_domain_to_mongo(self, expr: DomainExpression) -> JsonDict:
         """Convert domain expression to MongoDB query.
 
@@ -310,12 +312,24 @@ class MongoQuery(BaseQuery[ModelT]):
             MongoDB query
         """
 
+        model_fields = getattr(self._model_type, "__fields__", None)
+        if not isinstance(model_fields, dict):
+            model_fields = {}
+
         def convert_node(node: DomainNode | DomainLeaf) -> JsonDict:
             if isinstance(node, DomainLeaf):
                 field = node.field
                 op = node.operator
                 value: str | int | list[str | int | ObjectId] | Any = node.value
 
+                # Compare against the field's stored representation
+                field_obj = model_fields.get(field)
+                if field_obj is not None and op not in RAW_VALUE_OPERATORS:
+                    if op in ("in", "not in") and isinstance(value, (list, tuple)):
+                        value = [field_obj.to_query_value(v) for v in value]
+                    else:
+                        value = field_obj.to_query_value(value)
+
                 # Convert id field and value
                 if field == "id":
                     field = "_id"
@@ -345,13 +359,13 @@ class MongoQuery(BaseQuery[ModelT]):
                 elif op == "not in":
                     return {field: {"$nin": value}}
                 elif op == "like":
-                    return {field: {"$regex": value}}
+                    return {field: {"$regex": like_pattern(value)}}
                 elif op == "ilike":
-                    return {field: {"$regex": value, "$options": "i"}}
+                    return {field: {"$regex": like_pattern(value), "$options": "i"}}
                 elif op == "not like":
-                    return {field: {"$not": {"$regex": value}}}
+                    return {field: {"$not": {"$regex": like_pattern(value)}}}
                 elif op == "not ilike":
-                    return {field: {"$not": {"$regex": value, "$options": "i"}}}
+                    return {field: {"$not": {"$regex": like_pattern(value), "$options": "i"}}}
                 elif op == "is null":
                     return {field: None}
                 elif op == "is not null":
@@ -412,17 +426,22 @@ class MongoQuery(BaseQuery[ModelT]):
         self._skip = offset
         return self
 
-    async def count(self) -> int:
+    async def count(self, limit: int | None = None) -> int:
         """Count documents.
 
+        Args:
+            limit: Stop counting after this many documents
+
         Returns:
-            Number of documents
+            Number of documents, at most limit
         """
         pipeline: list[JsonDict] = []
 
         # Add filter stage
         if self._filter:
             pipeline.append({"$match": self._filter})
+        if limit is not None:
+            pipeline.append({"$limit": limit})
 
         # Add count stage
         pipeline.append({"$count": "count"})
@@ -432,13 +451,71 @@ class MongoQuery(BaseQuery[ModelT]):
         result = [doc async for doc in cursor]
         return result[0]["count"] if result else 0
 
+    async def estimated_count(self) -> int:
+        """Estimate number of documents in the collection from its metadata.
+
+        The filter is ignored. The estimate comes from collection metadata
+        and does not scan any index.
+
+        Returns:
+            Estimated number of documents
+        """
+        return await self._collection.estimated_document_count()
+
+    async def value_counts(
+        self, fields: Sequence[str], limit: int | None = None, unwind: Sequence[str] = ()
+    ) -> dict[str, list[tuple[Any, int]]]:
+        """Count documents per stored value of several fields in one round trip.
+
+        The filter runs once and each field is grouped in its own branch of a
+        single ``$facet`` stage, instead of one scan per field.
+
+        Args:
+            fields: Field names
+            limit: Maximum number of values per field, most frequent first
+            unwind: Array fields whose elements are counted instead of whole arrays
+
+        Returns:
+            Dict[str, List[Tuple[Any, int]]]: Stored values and their counts by
+            field, most frequent first, then by value
+
+        Raises:
+            DatabaseError: If aggregation fails
+        """
+        facets: dict[str, list[JsonDict]] = {}
+        for index, field in enumerate(fields):
+            path = "$_id" if field == "id" else f"${field}"
+            stages: list[JsonDict] = [{"$unwind": path}] if field in unwind else []
+            stages.append({"$group": {"_id": path, "count": {"$sum": 1}}})
+            stages.append({"$sort": {"count": -1, "_id": 1}})
+            if limit is not None:
+                stages.append({"$limit": limit})
+            # Facet names cannot hold dots, so branches are named by position
+            facets[str(index)] = stages
+        if not facets:
+            return {}
+
+        pipeline: list[JsonDict] = []
+        if self._filter:
+            pipeline.append({"$match": self._filter})
+        pipeline.append({"$facet": facets})
+        try:
+            cursor: AsyncIOMotorCommandCursor[JsonDict] = self._collection.aggregate(pipeline)
+            [result] = await cursor.to_list(length=None)
+        except Exception as e:
+            raise DatabaseError(message=f"Failed to count values of {list(fields)}: {e!s}", backend="mongodb") from e
+        return {
+            field: [(row["_id"], row["count"]) for row in result.get(str(index), [])]
+            for index, field in enumerate(fields)
+        }
+
     async def exists(self) -> bool:
         """Check if any results exist.
 
         Returns:
             True if results exist
         """
-        return await self.count() > 0
+        return await self.count(limit=1) > 0
 
     async def first(self) -> ModelT | None:
         """Get first result or None.
@@ -547,7 +624,7 @@ class MongoQuery(BaseQuery[ModelT]):
         self._prefetch_fields = fields
         return self
 
-    def _build_pipeline(self) -> list[JsonDict]:
+    def _build_pipeline(self, default_fields: list[str] | None = None) -> list[JsonDict]:
         """Build MongoDB aggregation pipeline.
 
         This method builds a MongoDB aggregation pipeline based on:
@@ -560,27 +637,36 @@ class MongoQuery(BaseQuery[ModelT]):
         - Aggregations (_aggregates)
         - Window functions (_windows)
 
+        Field selection is applied last, keeping joined documents, unless
+        aggregates or window functions reshape the documents, in which case
+        it selects their input. The pipeline then goes through
+        ``optimize_pipeline``, which pages before joins and prunes unused
+        joins and fields where that keeps the results.
+
+        Args:
+            default_fields: Fields to select when no fields were selected,
+                applied after all other stages
+
         Returns:
             List[JsonDict]: MongoDB aggregation pipeline stages
         """
         pipeline: list[JsonDict] = []
+        reshaped = bool(self._aggregates or self._windows)
 
         # Add filter stage if exists
         if self._filter:
             pipeline.append({"$match": self._filter})
 
-        # Add field selection if specified
-        if self._fields:
-            # Map id to _id for MongoDB
-            fields = self._fields.copy()
-            if "id" in fields:
-                fields.remove("id")
-                fields.append("_id")
-            pipeline.append({"$project": dict.fromkeys(fields, 1)})
+        # Select input fields of aggregates and windows
+        if self._fields and reshaped:
+            pipeline.append(self._selection_stage(self._fields))
 
         # Add join stages
+        joined: list[str] = []
         for join in self._joins:
-            pipeline.extend(join.get_pipeline_stages())
+            stages = join.get_pipeline_stages()
+            joined.extend(stage["$lookup"]["as"] for stage in stages if "$lookup" in stage)
+            pipeline.extend(stages)
 
         # Add aggregate stages
         for aggregate in self._aggregates:
@@ -603,7 +689,24 @@ class MongoQuery(BaseQuery[ModelT]):
         if self._limit:
             pipeline.append({"$limit": self._limit})
 
-        return pipeline
+        # Select output fields, keeping joined documents
+        fields = self._fields or default_fields
+        if fields and not (self._fields and reshaped):
+            pipeline.append(self._selection_stage([*fields, *joined]))
+
+        return optimize_pipeline(pipeline)
+
+    @staticmethod
+    def _selection_stage(fields: list[str]) -> JsonDict:
+        """Build field selection stage.
+
+        Args:
+            fields: Field names, ``id`` is mapped to ``_id``
+
+        Returns:
+            JsonDict: ``$project`` stage
+        """
+        return {"$project": dict.fromkeys(("_id" if field == "id" else field for field in fields), 1)}
 
     def reset(self) -> "MongoQuery[ModelT]":
         self._filter = {}
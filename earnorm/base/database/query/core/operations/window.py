@@ -171,13 +171,16 @@ class BaseWindow(BaseOperation[ModelT], WindowProtocol[ModelT]):
         }
         return self
 
-    def lag(self, field: str, offset: int = 1, default: Any = None) -> "BaseWindow[ModelT]":
+    def lag(
+        self, field: str, offset: int = 1, default: Any = None, alias: str | None = None
+    ) -> "BaseWindow[ModelT]":
         """LAG() window function.
 
         Args:
             field: Field to lag
             offset: Number of rows to lag
             default: Default value if no row exists
+            alias: Output field
 
         Returns:
             Window expression
@@ -185,19 +188,23 @@ class BaseWindow(BaseOperation[ModelT], WindowProtocol[ModelT]):
         self._window_expr = {
             "$shift": {
                 "output": "$" + field,
-                "by": offset,
+                "by": -offset,
                 "default": default,
             }
         }
+        self._alias = alias or self._alias
         return self
 
-    def lead(self, field: str, offset: int = 1, default: Any = None) -> "BaseWindow[ModelT]":
+    def lead(
+        self, field: str, offset: int = 1, default: Any = None, alias: str | None = None
+    ) -> "BaseWindow[ModelT]":
         """LEAD() window function.
 
         Args:
             field: Field to lead
             offset: Number of rows to lead
             default: Default value if no row exists
+            alias: Output field
 
         Returns:
             Window expression
@@ -205,10 +212,11 @@ class BaseWindow(BaseOperation[ModelT], WindowProtocol[ModelT]):
         self._window_expr = {
             "$shift": {
                 "output": "$" + field,
-                "by": -offset,
+                "by": offset,
                 "default": default,
             }
         }
+        self._alias = alias or self._alias
         return self
 
     def validate(self) -> None:
@@ -16,6 +16,7 @@ Examples:
     >>> expr = DomainExpression.from_node(root)
 """
 
+import re
 from typing import Any, Literal, TypeVar, Union
 
 from earnorm.types import JsonDict
@@ -41,6 +42,28 @@ DomainOperator = Literal[
 
 LogicalOperator = Literal["&", "|", "!"]
 
+RAW_VALUE_OPERATORS: frozenset[str] = frozenset({"like", "ilike", "not like", "not ilike", "is null", "is not null"})
+"""Operators whose value is a pattern or flag rather than a field value."""
+
+
+def like_pattern(value: Any) -> str:
+    """Translate the pattern of a ``like`` operator to a regular expression.
+
+    ``%`` matches any characters and everything else matches literally. The
+    expression is not anchored, so values containing the pattern match.
+
+    Args:
+        value: Pattern
+
+    Returns:
+        str: Regular expression
+
+    Examples:
+        >>> like_pattern("Jo%n.")
+        'Jo.*n\\.'
+    """
+    return ".*".join(re.escape(part) for part in str(value).split("%"))
+
 DomainTuple = tuple[str, DomainOperator, Any]
 DomainItem = Union[DomainTuple, LogicalOperator]
 
@@ -166,7 +189,7 @@ class DomainExpression:
             return
 
         # Handle single condition
-        if len(self.domain) == 3 and isinstance(self.domain[1], str):
+        if len(self.domain) == 3 and isinstance(self.domain[0], str) and isinstance(self.domain[1], str):
             domain_tuple = tuple(self.domain)
             self.root = DomainLeaf(
                 str(domain_tuple[0]),
@@ -228,26 +251,20 @@ class DomainExpression:
             self.root = stack[0]
             return
 
-        # Process operators in order of precedence
+        # Process operators in order of precedence, "&" binding tighter than "|"
         for op in ("&", "|"):
             new_stack: list[DomainNode | DomainLeaf] = []
             curr_ops: list[LogicalOperator] = []
-            operands: list[DomainNode | DomainLeaf] = []
+            operands: list[DomainNode | DomainLeaf] = [stack[0]]
 
-            for i, item in enumerate(stack):
-                if i < len(operators) and operators[i] == op:
+            for operator, item in zip(operators, stack[1:], strict=True):
+                if operator == op:
                     operands.append(item)
                 else:
-                    if operands:
-                        operands.append(item)
-                        node = DomainNode(validate_logical_operator(op), operands)
-                        new_stack.append(node)
-                        operands = []
-                    else:
-                        new_stack.append(item)
-
-                if i < len(operators):
-                    curr_ops.append(operators[i])
+                    new_stack.append(operands[0] if len(operands) == 1 else DomainNode(op, operands))
+                    curr_ops.append(operator)
+                    operands = [item]
+            new_stack.append(operands[0] if len(operands) == 1 else DomainNode(op, operands))
 
             stack = new_stack
             operators = curr_ops
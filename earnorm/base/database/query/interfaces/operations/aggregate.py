@@ -114,6 +114,25 @@ class AggregateProtocol(OperationProtocol[ModelT]):
         """
         ...
 
+    def filter(self, domain: list[Any] | JsonDict) -> "AggregateProtocol[ModelT]":
+        """Filter documents before grouping.
+
+        Args:
+            domain: Filter conditions
+
+        Returns:
+            Self for chaining
+        """
+        ...
+
+    async def execute(self) -> list[JsonDict]:
+        """Execute aggregation.
+
+        Returns:
+            List[JsonDict]: One row per group
+        """
+        ...
+
     def validate(self) -> None:
         """Validate aggregate configuration.
 
@@ -114,13 +114,16 @@ class WindowProtocol(OperationProtocol[ModelT]):
         ...
 
     @abstractmethod
-    def lag(self, field: str, offset: int = 1, default: Any = None) -> "WindowProtocol[ModelT]":
+    def lag(
+        self, field: str, offset: int = 1, default: Any = None, alias: str | None = None
+    ) -> "WindowProtocol[ModelT]":
         """LAG() window function.
 
         Args:
             field: Field to lag
             offset: Number of rows to lag
             default: Default value if no row exists
+            alias: Output field
 
         Returns:
             Window expression
@@ -128,19 +131,131 @@ class WindowProtocol(OperationProtocol[ModelT]):
         ...
 
     @abstractmethod
-    def lead(self, field: str, offset: int = 1, default: Any = None) -> "WindowProtocol[ModelT]":
+    def lead(
+        self, field: str, offset: int = 1, default: Any = None, alias: str | None = None
+    ) -> "WindowProtocol[ModelT]":
         """LEAD() window function.
 
         Args:
             field: Field to lead
             offset: Number of rows to lead
             default: Default value if no row exists
+            alias: Output field
 
         Returns:
             Window expression
         """
         ...
 
+    @abstractmethod
+    def sum(
+        self,
+        field: str,
+        alias: str | None = None,
+        documents: tuple[Any, Any] | None = None,
+        range: tuple[Any, Any] | None = None,
+        unit: str | None = None,
+    ) -> "WindowProtocol[ModelT]":
+        """SUM() over a window frame.
+
+        Args:
+            field: Field to sum
+            alias: Output field
+            documents: Frame bounds in rows relative to the current row
+            range: Frame bounds in order-by values relative to the current row
+            unit: Time unit of range bounds
+
+        Returns:
+            Self for chaining
+        """
+        ...
+
+    @abstractmethod
+    def avg(
+        self,
+        field: str,
+        alias: str | None = None,
+        documents: tuple[Any, Any] | None = None,
+        range: tuple[Any, Any] | None = None,
+        unit: str | None = None,
+    ) -> "WindowProtocol[ModelT]":
+        """AVG() over a window frame, see ``sum``.
+
+        Returns:
+            Self for chaining
+        """
+        ...
+
+    @abstractmethod
+    def cumulative_sum(self, field: str, alias: str | None = None) -> "WindowProtocol[ModelT]":
+        """Running total from the first row of the partition.
+
+        Args:
+            field: Field to sum
+            alias: Output field
+
+        Returns:
+            Self for chaining
+        """
+        ...
+
+    @abstractmethod
+    def moving_avg(
+        self, field: str, size: int | float, alias: str | None = None, unit: str | None = None
+    ) -> "WindowProtocol[ModelT]":
+        """Average of the trailing frame ending at the current row.
+
+        Args:
+            field: Field to average
+            size: Number of rows, or order-by span when ``unit`` is set
+            alias: Output field
+            unit: Time unit of ``size``
+
+        Returns:
+            Self for chaining
+        """
+        ...
+
+    @abstractmethod
+    def derivative(
+        self,
+        field: str,
+        alias: str | None = None,
+        unit: str | None = None,
+        documents: tuple[Any, Any] | None = None,
+        range: tuple[Any, Any] | None = None,
+    ) -> "WindowProtocol[ModelT]":
+        """Average rate of change over a window frame.
+
+        Args:
+            field: Field whose rate of change is computed
+            alias: Output field
+            unit: Time unit of the rate
+            documents: Frame bounds in rows
+            range: Frame bounds in order-by values
+
+        Returns:
+            Self for chaining
+        """
+        ...
+
+    @abstractmethod
+    def exp_moving_avg(
+        self, field: str, n: int | None = None, alpha: float | None = None, alias: str | None = None
+    ) -> "WindowProtocol[ModelT]":
+        """Exponential moving average.
+
+        Args:
+            field: Field to average
+            n: Number of rows with significant weight
+            alpha: Weight of the current row
+            alias: Output field
+
+        Returns:
+            Self for chaining
+        """
+        ...
+
     def validate(self) -> None:
         """Validate window configuration.
 
@@ -13,6 +13,7 @@ Examples:
 """
 
 from abc import abstractmethod
+from collections.abc import Sequence
 from typing import Any, Protocol, TypeVar
 
 from earnorm.types import DatabaseModel, JsonDict
@@ -112,11 +113,41 @@ class QueryProtocol(Protocol[ModelT]):
         ...
 
     @abstractmethod
-    async def count(self) -> int:
+    async def count(self, limit: int | None = None) -> int:
         """Count results without fetching them.
 
+        Args:
+            limit: Stop counting after this many results
+
+        Returns:
+            Number of results, at most limit
+        """
+        ...
+
+    @abstractmethod
+    async def estimated_count(self) -> int:
+        """Estimate number of records in the collection from its metadata.
+
+        Filters are ignored.
+
+        Returns:
+            Estimated number of records
+        """
+        ...
+
+    @abstractmethod
+    async def value_counts(
+        self, fields: Sequence[str], limit: int | None = None, unwind: Sequence[str] = ()
+    ) -> dict[str, list[tuple[Any, int]]]:
+        """Count results per stored value of several fields in one round trip.
+
+        Args:
+            fields: Field names
+            limit: Maximum number of values per field, most frequent first
+            unwind: Array fields whose elements are counted instead of whole values
+
         Returns:
-            Number of results
+            Dict[str, List[Tuple[Any, int]]]: Stored values and their counts by field
         """
         ...
 
@@ -0,0 +1,164 @@
+"""Read preference and read concern options.
+
+This module defines how read-only ORM operations (``search``, ``search_count``,
+``read`` and the aggregation helpers) choose which replica set members serve
+them and which read concern they use.
+
+Options are resolved from the most to the least specific source:
+    1. Per call: ``Model.with_context(read="secondaryPreferred").search(...)``
+    2. Per model: ``_read_preference`` / ``_read_concern`` class attributes
+    3. Per environment: ``read_preference`` / ``read_concern_level`` database
+       options, applied to the client
+
+Writes always go to the primary regardless of these options.
+
+Examples:
+    >>> class SaleReport(BaseModel):
+    ...     _name = "sale.report"
+    ...     _read_preference = "secondaryPreferred"
+    ...     _read_concern = "majority"
+
+    >>> # Override for one call
+    >>> orders = await Order.with_context(read="nearest").search([("state", "=", "done")])
+
+    >>> # Override for a block of code
+    >>> with use_read_options(ReadOptions(preference="secondary")):
+    ...     total = await Order.search_count()
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+READ_PREFERENCES = (
+    "primary",
+    "primaryPreferred",
+    "secondary",
+    "secondaryPreferred",
+    "nearest",
+)
+"""Supported read preference modes."""
+
+READ_CONCERNS = (
+    "local",
+    "available",
+    "majority",
+    "linearizable",
+    "snapshot",
+)
+"""Supported read concern levels."""
+
+_PREFERENCE_ALIASES = {name.lower(): name for name in READ_PREFERENCES} | {
+    "primary_preferred": "primaryPreferred",
+    "secondary_preferred": "secondaryPreferred",
+}
+
+
+def normalize_read_preference(name: str) -> str:
+    """Normalize read preference name.
+
+    Args:
+        name: Read preference in camelCase or snake_case
+
+    Returns:
+        str: Canonical camelCase read preference
+
+    Raises:
+        ValueError: If read preference is unknown
+    """
+    mode = _PREFERENCE_ALIASES.get(name.replace("-", "_").lower())
+    if mode is None:
+        raise ValueError(f"Unknown read preference: {name}. Expected one of {', '.join(READ_PREFERENCES)}")
+    return mode
+
+
+def normalize_read_concern(level: str) -> str:
+    """Normalize read concern level.
+
+    Args:
+        level: Read concern level
+
+    Returns:
+        str: Lowercase read concern level
+
+    Raises:
+        ValueError: If read concern level is unknown
+    """
+    normalized = level.lower()
+    if normalized not in READ_CONCERNS:
+        raise ValueError(f"Unknown read concern: {level}. Expected one of {', '.join(READ_CONCERNS)}")
+    return normalized
+
+
+@dataclass(frozen=True)
+class ReadOptions:
+    """Read preference and read concern for read-only operations.
+
+    ``None`` means "not set at this level".
+    """
+
+    preference: str | None = None
+    """Read preference mode (e.g. ``secondaryPreferred``)."""
+
+    concern: str | None = None
+    """Read concern level (e.g. ``majority``)."""
+
+    def __post_init__(self) -> None:
+        """Normalize option names."""
+        if self.preference is not None:
+            object.__setattr__(self, "preference", normalize_read_preference(self.preference))
+        if self.concern is not None:
+            object.__setattr__(self, "concern", normalize_read_concern(self.concern))
+
+    def __bool__(self) -> bool:
+        """Check if any option is set."""
+        return self.preference is not None or self.concern is not None
+
+    def merge(self, fallback: "ReadOptions") -> "ReadOptions":
+        """Fill unset options from a less specific level.
+
+        Args:
+            fallback: Options of the less specific level
+
+        Returns:
+            ReadOptions: Merged options
+        """
+        return ReadOptions(
+            preference=self.preference if self.preference is not None else fallback.preference,
+            concern=self.concern if self.concern is not None else fallback.concern,
+        )
+
+
+DEFAULT_READ_OPTIONS = ReadOptions()
+
+_current: ContextVar[ReadOptions] = ContextVar("earnorm_read_options", default=DEFAULT_READ_OPTIONS)
+
+
+def current_read_options() -> ReadOptions:
+    """Get read options set for the current call context.
+
+    Returns:
+        ReadOptions: Per-call options, empty if none are set
+    """
+    return _current.get()
+
+
+@contextmanager
+def use_read_options(options: ReadOptions) -> Iterator[ReadOptions]:
+    """Apply read options to reads awaited inside the block.
+
+    Nested blocks only override the options they set.
+
+    Args:
+        options: Read options
+
+    Yields:
+        ReadOptions: Effective options inside the block
+    """
+    effective = options.merge(_current.get())
+    token = _current.set(effective)
+    try:
+        yield effective
+    finally:
+        _current.reset(token)
@@ -0,0 +1,353 @@
+"""Time-series collections.
+
+Append-only models with a timestamp, such as metrics and events, can be
+stored in a MongoDB time-series collection, which groups the documents of
+one series (same meta field value) and time span into compressed buckets:
+- ``_timeseries`` declares the time field, the optional meta field and the
+  bucket granularity (or custom bucket span and rounding in seconds)
+- ``_expire_after`` drops documents older than a number of seconds (or a
+  ``timedelta``)
+- ``MongoAdapter.sync_schema`` creates the collection with these options,
+  which cannot be added to an existing regular collection, and updates the
+  expiry and granularity of existing time-series collections
+- Domains on the time field are turned into one bounding range on the time
+  field, which the server maps onto bucket time bounds, so ``in`` lists and
+  ``|`` of ranges skip the buckets outside the queried period
+
+Examples:
+    >>> class Reading(BaseModel):
+    ...     _name = "sensor.reading"
+    ...     _timeseries = {"timeField": "at", "metaField": "sensor", "granularity": "minutes"}
+    ...     _expire_after = timedelta(days=30)
+    ...
+    ...     at = DateTimeField(required=True)
+    ...     sensor = StringField()
+    ...     value = FloatField()
+
+    >>> await env.sync_schema()  # creates the sensor_reading time-series collection
+    >>> await Reading.search([("at", ">=", "2024-03-01"), "&", ("at", "<", "2024-03-02")])
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any
+
+from earnorm.exceptions import DatabaseError
+from earnorm.types import JsonDict
+
+GRANULARITIES = ("seconds", "minutes", "hours")
+"""Bucket granularities of time-series collections."""
+
+_LOWER = {"$gt": False, "$gte": True}
+_UPPER = {"$lt": False, "$lte": True}
+
+Bound = tuple[Any, bool] | None
+"""Time bound and whether it is inclusive, None when unbounded."""
+
+
+@dataclass(frozen=True)
+class TimeseriesSpec:
+    """Time-series options of a model.
+
+    Attributes:
+        time_field: Field holding the measurement time
+        meta_field: Field identifying the series, e.g. a device ID
+        granularity: Bucket granularity
+        bucket_max_span: Custom maximum bucket span in seconds
+        bucket_rounding: Custom bucket start rounding in seconds
+        expire_after: Seconds after which documents are deleted
+    """
+
+    time_field: str
+    meta_field: str | None = None
+    granularity: str | None = None
+    bucket_max_span: int | None = None
+    bucket_rounding: int | None = None
+    expire_after: int | None = None
+
+    @property
+    def timeseries(self) -> JsonDict:
+        """Get ``timeseries`` collection option."""
+        options: JsonDict = {"timeField": self.time_field}
+        if self.meta_field:
+            options["metaField"] = self.meta_field
+        if self.granularity:
+            options["granularity"] = self.granularity
+        if self.bucket_max_span is not None:
+            options["bucketMaxSpanSeconds"] = self.bucket_max_span
+            options["bucketRoundingSeconds"] = self.bucket_rounding
+        return options
+
+    def create_options(self) -> JsonDict:
+        """Get options of ``create_collection``.
+
+        Returns:
+            JsonDict: Time-series and expiry options
+        """
+        options: JsonDict = {"timeseries": self.timeseries}
+        if self.expire_after is not None:
+            options["expireAfterSeconds"] = self.expire_after
+        return options
+
+
+def timeseries_spec(model: Any) -> TimeseriesSpec | None:
+    """Get time-series options declared by a model.
+
+    Args:
+        model: Model class
+
+    Returns:
+        Optional[TimeseriesSpec]: Options, None for regular collections
+
+    Raises:
+        ValueError: If the declaration is invalid
+    """
+    options: dict[str, Any] | None = getattr(model, "_timeseries", None)
+    expire_after = getattr(model, "_expire_after", None)
+    name = getattr(model, "_name", model)
+    if not options:
+        if expire_after is not None:
+            raise ValueError(f"Model {name} declares _expire_after without _timeseries")
+        return None
+
+    unknown = set(options) - {"timeField", "metaField", "granularity", "bucketMaxSpanSeconds", "bucketRoundingSeconds"}
+    if unknown:
+        raise ValueError(f"Unknown time-series options of {name}: {sorted(unknown)}")
+    time_field = options.get("timeField")
+    if not time_field:
+        raise ValueError(f"Time-series model {name} must declare timeField")
+    meta_field = options.get("metaField")
+    if meta_field in (time_field, "_id", "id"):
+        raise ValueError(f"Invalid metaField of {name}: {meta_field}")
+
+    fields: dict[str, Any] = getattr(model, "__fields__", None) or {}
+    if fields:
+        from earnorm.fields.primitive.datetime import DateTimeField
+
+        field = fields.get(time_field)
+        if not isinstance(field, DateTimeField) or field.storage != "native":
+            raise ValueError(f"timeField {time_field} of {name} must be a DateTimeField stored natively")
+        if meta_field and meta_field not in fields:
+            raise ValueError(f"metaField {meta_field} of {name} is not a field")
+
+    granularity = options.get("granularity")
+    span = options.get("bucketMaxSpanSeconds")
+    rounding = options.get("bucketRoundingSeconds")
+    if granularity is not None and granularity not in GRANULARITIES:
+        raise ValueError(f"Invalid granularity of {name}: {granularity}, expected one of {GRANULARITIES}")
+    if (span is None) != (rounding is None) or (span is not None and span != rounding):
+        raise ValueError(f"bucketMaxSpanSeconds and bucketRoundingSeconds of {name} must be set and equal")
+    if span is not None and granularity is not None:
+        raise ValueError(f"Time-series model {name} declares both granularity and custom buckets")
+
+    if isinstance(expire_after, timedelta):
+        expire_after = int(expire_after.total_seconds())
+    if expire_after is not None and (not isinstance(expire_after, int) or expire_after <= 0):
+        raise ValueError(f"_expire_after of {name} must be a positive number of seconds")
+
+    return TimeseriesSpec(
+        time_field=time_field,
+        meta_field=meta_field,
+        granularity=granularity,
+        bucket_max_span=span,
+        bucket_rounding=rounding,
+        expire_after=expire_after,
+    )
+
+
+def model_timeseries_spec(model: type) -> TimeseriesSpec | None:
+    """Get time-series options of a model class, validated once per class.
+
+    Args:
+        model: Model class
+
+    Returns:
+        Optional[TimeseriesSpec]: Options cached on the class, None for regular collections
+    """
+    if "__timeseries_spec__" not in model.__dict__:
+        model.__timeseries_spec__ = timeseries_spec(model)  # type: ignore[attr-defined]
+    return model.__dict__["__timeseries_spec__"]
+
+
+async def ensure_timeseries_collection(database: Any, name: str, spec: TimeseriesSpec) -> bool:
+    """Create a time-series collection or update its mutable options.
+
+    Args:
+        database: Motor database
+        name: Collection name
+        spec: Time-series options
+
+    Returns:
+        bool: True if the collection was created
+
+    Raises:
+        DatabaseError: If a regular collection or a time-series collection
+            with other time or meta fields already exists, or the server
+            rejects the options
+    """
+    try:
+        cursor = await database.list_collections(filter={"name": name})
+        infos = await cursor.to_list(None)
+        if not infos:
+            await database.create_collection(name, **spec.create_options())
+            return True
+
+        info = infos[0]
+        options = info.get("options", {})
+        current = options.get("timeseries")
+        if info.get("type") != "timeseries" or not current:
+            raise DatabaseError(
+                message=f"Collection {name} exists as a regular collection, copy its documents into a "
+                "new time-series collection to convert it",
+                backend="mongodb",
+            )
+        if (current.get("timeField"), current.get("metaField")) != (spec.time_field, spec.meta_field):
+            raise DatabaseError(
+                message=f"Time-series collection {name} uses timeField {current.get('timeField')} and "
+                f"metaField {current.get('metaField')}, which cannot be changed",
+                backend="mongodb",
+            )
+
+        changes: JsonDict = {}
+        if options.get("expireAfterSeconds") != spec.expire_after:
+            changes["expireAfterSeconds"] = "off" if spec.expire_after is None else spec.expire_after
+        if spec.granularity and current.get("granularity") != spec.granularity:
+            changes["timeseries"] = {"granularity": spec.granularity}
+        elif spec.bucket_max_span is not None and current.get("bucketMaxSpanSeconds") != spec.bucket_max_span:
+            changes["timeseries"] = {
+                "bucketMaxSpanSeconds": spec.bucket_max_span,
+                "bucketRoundingSeconds": spec.bucket_rounding,
+            }
+        if changes:
+            await database.command({"collMod": name, **changes})
+        return False
+    except DatabaseError:
+        raise
+    except Exception as e:
+        raise DatabaseError(message=f"Failed to sync time-series collection {name}: {e}", backend="mongodb") from e
+
+
+def time_bounds(query: JsonDict, field: str) -> tuple[Bound, Bound]:
+    """Get the period a filter restricts a date field to.
+
+    Bounds are conservative: every matching document lies within them, but
+    not every document within them matches.
+
+    Args:
+        query: MongoDB filter
+        field: Date field
+
+    Returns:
+        Tuple[Bound, Bound]: Lower and upper bounds
+    """
+    lower: Bound = None
+    upper: Bound = None
+    for key, value in query.items():
+        if key == "$and":
+            for item in value:
+                item_lower, item_upper = time_bounds(item, field)
+                lower = _tightest(lower, item_lower, _LOWER)
+                upper = _tightest(upper, item_upper, _UPPER)
+        elif key == "$or" and value:
+            branches = [time_bounds(item, field) for item in value]
+            lower = _tightest(lower, _loosest([branch[0] for branch in branches], _LOWER), _LOWER)
+            upper = _tightest(upper, _loosest([branch[1] for branch in branches], _UPPER), _UPPER)
+        elif key == field:
+            item_lower, item_upper = _field_bounds(value)
+            lower = _tightest(lower, item_lower, _LOWER)
+            upper = _tightest(upper, item_upper, _UPPER)
+    return lower, upper
+
+
+def bucket_filter(spec: TimeseriesSpec, query: JsonDict) -> JsonDict:
+    """Add the period a filter covers as a range on the time field.
+
+    The server only maps plain range conditions on the time field onto the
+    time bounds of buckets. Periods implied by ``$in`` lists or ``$or`` of
+    ranges are added as such a range so buckets outside of them are skipped.
+
+    Args:
+        spec: Time-series options
+        query: MongoDB filter
+
+    Returns:
+        JsonDict: Equivalent filter
+    """
+    field = spec.time_field
+    current = query.get(field)
+    if current is not None and (not isinstance(current, dict) or set(current) <= {*_LOWER, *_UPPER}):  # type: ignore
+        return query
+    lower, upper = time_bounds(query, field)
+    if lower is None and upper is None:
+        return query
+
+    condition: JsonDict = {}
+    if lower is not None:
+        condition["$gte" if lower[1] else "$gt"] = lower[0]
+    if upper is not None:
+        condition["$lte" if upper[1] else "$lt"] = upper[0]
+    result = dict(query)
+    if current is None:
+        result[field] = condition
+    elif isinstance(current, dict) and not any(key in current for key in condition):  # type: ignore
+        result[field] = {**current, **condition}  # type: ignore
+    else:
+        result = {"$and": [query, {field: condition}]}
+    return result
+
+
+def _field_bounds(condition: Any) -> tuple[Bound, Bound]:
+    """Get bounds of one condition on the time field."""
+    if not isinstance(condition, dict):
+        return (condition, True), (condition, True)
+    lower: Bound = None
+    upper: Bound = None
+    for operator, value in condition.items():  # type: ignore
+        if operator == "$eq":
+            lower = _tightest(lower, (value, True), _LOWER)
+            upper = _tightest(upper, (value, True), _UPPER)
+        elif operator in _LOWER:
+            lower = _tightest(lower, (value, _LOWER[operator]), _LOWER)
+        elif operator in _UPPER:
+            upper = _tightest(upper, (value, _UPPER[operator]), _UPPER)
+        elif operator == "$in" and value and all(isinstance(item, date) for item in value):
+            try:
+                lower = _tightest(lower, (min(value), True), _LOWER)
+                upper = _tightest(upper, (max(value), True), _UPPER)
+            except TypeError:
+                continue
+    return lower, upper
+
+
+def _tightest(current: Bound, other: Bound, side: dict[str, bool]) -> Bound:
+    """Get the more restrictive of two bounds on the same side."""
+    if other is None or not isinstance(other[0], date):
+        return current
+    if current is None:
+        return other
+    try:
+        if current[0] == other[0]:
+            return current if not current[1] else other
+        higher = other[0] > current[0]
+    except TypeError:
+        return current
+    return other if higher == (side is _LOWER) else current
+
+
+def _loosest(bounds: list[Bound], side: dict[str, bool]) -> Bound:
+    """Get the least restrictive of bounds on the same side, None if any is unbounded."""
+    result: Bound = None
+    for bound in bounds:
+        if bound is None or not isinstance(bound[0], date):
+            return None
+        if result is None:
+            result = bound
+            continue
+        try:
+            if bound[0] == result[0]:
+                result = result if result[1] else bound
+            elif (bound[0] < result[0]) == (side is _LOWER):
+                result = bound
+        except TypeError:
+            return None
+    return result
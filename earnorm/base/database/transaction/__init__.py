@@ -29,6 +29,10 @@ Examples:
     ...     user.age = 26
     ...     await tx.update(user)
     ...     await tx.commit()
+    >>> # Unit of work across models, flushed in one transaction
+    >>> async with env.transaction() as tx:
+    ...     order = await Order.create({"partner_id": partner.id})
+    ...     await order_lines.write({"order_id": order.id})
 """
 
 import logging
@@ -40,8 +44,15 @@ from .backends.mongo import (
     MongoTransaction,
     MongoTransactionError,
     MongoTransactionManager,
+    MongoUnitOfWork,
+)
+from .base import (
+    Transaction,
+    TransactionError,
+    TransactionManager,
+    UnitOfWork,
+    current_unit_of_work,
 )
-from .base import Transaction, TransactionError, TransactionManager
 
 logger = logging.getLogger(__name__)
 
@@ -52,8 +63,11 @@ __all__ = [
     "Transaction",
     "TransactionError",
     "TransactionManager",
+    "UnitOfWork",
+    "current_unit_of_work",
     # MongoDB implementations
     "MongoTransaction",
     "MongoTransactionError",
     "MongoTransactionManager",
+    "MongoUnitOfWork",
 ]
@@ -16,5 +16,6 @@ from .transaction import (
     MongoTransactionError,
     MongoTransactionManager,
 )
+from .unit_of_work import MongoUnitOfWork
 
-__all__ = ["MongoTransaction", "MongoTransactionError", "MongoTransactionManager"]
+__all__ = ["MongoTransaction", "MongoTransactionError", "MongoTransactionManager", "MongoUnitOfWork"]
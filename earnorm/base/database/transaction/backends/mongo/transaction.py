@@ -21,6 +21,7 @@ from motor.motor_asyncio import (
     AsyncIOMotorDatabase,
 )
 from pymongo.errors import PyMongoError
+from pymongo.operations import UpdateOne
 from pymongo.read_concern import ReadConcern
 from pymongo.read_preferences import ReadPreference
 from pymongo.write_concern import WriteConcern
@@ -167,11 +168,14 @@ class MongoTransaction(Transaction[ModelT]):
             MongoTransactionError: If models cannot be updated
         """
         try:
+            operations: list[UpdateOne] = []
             for model in models:
                 if not model.id:
                     raise ValueError("Model has no ID")
                 values = await model.to_dict()
-                await self._collection.update_one({"_id": model.id}, {"$set": values}, session=self._session)
+                operations.append(UpdateOne({"_id": model.id}, {"$set": values}))
+            if operations:
+                await self._collection.bulk_write(operations, ordered=True, session=self._session)
             return models
         except PyMongoError as e:
             raise MongoTransactionError(f"Failed to update models: {e}") from e
@@ -248,14 +252,17 @@ class MongoTransactionManager(TransactionManager[ModelT]):
         super().__init__()
         self._db = db
         self._model_type: type[ModelT] | None = None
+        self._collection_name: str | None = None
 
-    def set_model_type(self, model_type: type[ModelT]) -> None:
+    def set_model_type(self, model_type: type[ModelT], collection_name: str | None = None) -> None:
         """Set model type for transaction.
 
         Args:
             model_type: Model type to use
+            collection_name: Collection the adapter stores the model in, defaults to the model name
         """
         self._model_type = model_type
+        self._collection_name = collection_name
 
     async def _begin_transaction(self) -> Transaction[ModelT]:
         """Begin new transaction.
@@ -270,16 +277,14 @@ class MongoTransactionManager(TransactionManager[ModelT]):
             raise MongoTransactionError("Model type not set")
 
         try:
-            # Ignore type error for __collection__ access
-            collection_name = getattr(self._model_type, "__collection__", None)
+            collection_name = self._collection_name or getattr(self._model_type, "_name", None)
             if not collection_name:
                 raise MongoTransactionError("Model has no collection name")
 
             collection = self._db[collection_name]
             session = await self._db.client.start_session()
 
-            # Ignore type error for start_transaction
-            await session.start_transaction(  # type: ignore
+            session.start_transaction(
                 read_concern=ReadConcern("majority"),
                 write_concern=WriteConcern("majority"),
                 read_preference=ReadPreference.PRIMARY,
@@ -0,0 +1,231 @@
+"""MongoDB unit of work.
+
+This module records ORM writes per collection and flushes them as one
+``bulk_write`` per collection inside a single session and transaction, so a
+flow touching several models costs one round-trip per collection plus the
+commit instead of one per write.
+
+The transaction is only opened when the block exits, which keeps it short
+and makes it safe to replay: on ``TransientTransactionError`` the whole
+transaction is retried, on ``UnknownTransactionCommitResult`` the commit is.
+
+Examples:
+    >>> async with env.transaction() as tx:
+    ...     order = await Order.create({"partner_id": partner.id})
+    ...     await Line.create([{"order_id": order.id, "sku": sku} for sku in skus])
+    ...     await stock.write({"reserved": True})
+    >>> tx.results["sale_order"].inserted_count
+    1
+"""
+
+import logging
+from collections.abc import Callable
+from contextlib import suppress
+from typing import Any, Union
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClientSession, AsyncIOMotorDatabase
+from pymongo.errors import PyMongoError
+from pymongo.operations import DeleteMany, DeleteOne, InsertOne, UpdateMany, UpdateOne
+from pymongo.read_concern import ReadConcern
+from pymongo.read_preferences import ReadPreference
+from pymongo.results import BulkWriteResult
+from pymongo.write_concern import WriteConcern
+
+from earnorm.base.database.transaction.base import UnitOfWork
+from earnorm.base.database.unique import duplicate_key_error, is_duplicate_key_error
+
+from .transaction import MongoTransactionError
+
+logger = logging.getLogger(__name__)
+
+WriteOperation = Union[InsertOne[dict[str, Any]], UpdateOne, UpdateMany, DeleteOne, DeleteMany]
+
+TRANSIENT_ERROR = "TransientTransactionError"
+UNKNOWN_COMMIT_RESULT = "UnknownTransactionCommitResult"
+
+
+class MongoUnitOfWork(UnitOfWork):
+    """MongoDB unit of work.
+
+    Attributes:
+        results: Bulk write result per collection after commit
+        attempts: Number of transaction attempts made by the last commit
+    """
+
+    def __init__(
+        self,
+        database: AsyncIOMotorDatabase[dict[str, Any]],
+        max_retries: int = 3,
+        on_commit: Callable[[str], None] | None = None,
+    ) -> None:
+        """Initialize unit of work.
+
+        Args:
+            database: Database written to
+            max_retries: Maximum attempts for the transaction and for its commit
+            on_commit: Called with the name of each written collection after commit
+
+        Raises:
+            ValueError: If max_retries is not positive
+        """
+        if max_retries < 1:
+            raise ValueError("max_retries must be at least 1")
+        super().__init__()
+        self._database = database
+        self._max_retries = max_retries
+        self._on_commit = on_commit
+        self._operations: dict[str, list[WriteOperation]] = {}
+        self._models: dict[str, Any] = {}
+        self._inserted: dict[str, set[str]] = {}
+        self._failed: str | None = None
+        self.results: dict[str, BulkWriteResult] = {}
+        self.attempts = 0
+
+    @property
+    def database(self) -> AsyncIOMotorDatabase[dict[str, Any]]:
+        """Get database written to."""
+        return self._database
+
+    @property
+    def pending(self) -> int:
+        """Get number of recorded write operations."""
+        return sum(len(operations) for operations in self._operations.values())
+
+    def inserted_ids(self, collection: str) -> frozenset[str]:
+        """Get IDs of records created in the unit of work.
+
+        Args:
+            collection: Collection name
+
+        Returns:
+            FrozenSet[str]: IDs of recorded inserts, not in the database yet
+        """
+        return frozenset(self._inserted.get(collection, ()))
+
+    def record(self, collection: str, operations: list[WriteOperation], model: Any = None) -> None:
+        """Record write operations.
+
+        Args:
+            collection: Collection name
+            operations: Operations, run in order
+            model: Model class written to, used to report unique violations
+        """
+        self._operations.setdefault(collection, []).extend(operations)
+        if model is not None:
+            self._models.setdefault(collection, model)
+
+    def insert(self, collection: str, documents: list[dict[str, Any]], model: Any = None) -> list[ObjectId]:
+        """Record inserts, assigning IDs up front.
+
+        Args:
+            collection: Collection name
+            documents: Documents to insert; they are not modified
+            model: Model class written to
+
+        Returns:
+            List[ObjectId]: IDs the documents will be stored with
+        """
+        ids: list[ObjectId] = []
+        operations: list[WriteOperation] = []
+        for document in documents:
+            document = {"_id": ObjectId(), **document}
+            ids.append(document["_id"])
+            operations.append(InsertOne(document))
+        self.record(collection, operations, model)
+        self._inserted.setdefault(collection, set()).update(str(id_) for id_ in ids)
+        return ids
+
+    async def commit(self) -> None:
+        """Flush recorded writes in one transaction.
+
+        Raises:
+            FieldValidationError: If a write violates a unique index
+            MongoTransactionError: If the transaction fails
+        """
+        if not self._operations:
+            return
+
+        for attempt in range(1, self._max_retries + 1):
+            self.attempts = attempt
+            session = await self._database.client.start_session()
+            try:
+                session.start_transaction(
+                    read_concern=ReadConcern("majority"),
+                    write_concern=WriteConcern("majority"),
+                    read_preference=ReadPreference.PRIMARY,
+                )
+                try:
+                    results = await self._flush(session)
+                except PyMongoError:
+                    with suppress(PyMongoError):
+                        await session.abort_transaction()
+                    raise
+                await self._commit_transaction(session)
+            except PyMongoError as e:
+                if e.has_error_label(TRANSIENT_ERROR) and attempt < self._max_retries:
+                    logger.warning("Retrying transaction after transient error (attempt %d): %s", attempt, e)
+                    continue
+                raise self._error(e) from e
+            finally:
+                await session.end_session()
+
+            self.results = results
+            self._clear()
+            if self._on_commit is not None:
+                for collection in results:
+                    self._on_commit(collection)
+            return
+
+    async def _flush(self, session: AsyncIOMotorClientSession) -> dict[str, BulkWriteResult]:
+        """Run recorded operations, one bulk write per collection.
+
+        Args:
+            session: Session with a started transaction
+
+        Returns:
+            Dict[str, BulkWriteResult]: Result per collection
+        """
+        results: dict[str, BulkWriteResult] = {}
+        for collection, operations in self._operations.items():
+            self._failed = collection
+            results[collection] = await self._database[collection].bulk_write(
+                operations, ordered=True, session=session
+            )
+        self._failed = None
+        return results
+
+    async def _commit_transaction(self, session: AsyncIOMotorClientSession) -> None:
+        """Commit transaction, retrying when the outcome is unknown.
+
+        Args:
+            session: Session with a started transaction
+        """
+        for attempt in range(1, self._max_retries + 1):
+            try:
+                await session.commit_transaction()
+                return
+            except PyMongoError as e:
+                if not e.has_error_label(UNKNOWN_COMMIT_RESULT) or attempt == self._max_retries:
+                    raise
+                logger.warning("Retrying commit with unknown result (attempt %d): %s", attempt, e)
+
+    def _error(self, error: PyMongoError) -> Exception:
+        """Map failed transaction to ORM error.
+
+        Args:
+            error: Raised error
+
+        Returns:
+            Exception: Unique violation error or transaction error
+        """
+        model = self._models.get(self._failed) if self._failed else None
+        if model is not None and is_duplicate_key_error(error):
+            return duplicate_key_error(model, error)  # type: ignore[arg-type]
+        return MongoTransactionError(f"Failed to commit unit of work: {error}")
+
+    def _clear(self) -> None:
+        """Forget recorded writes."""
+        self._operations.clear()
+        self._models.clear()
+        self._inserted.clear()
@@ -1,6 +1,7 @@
 """Base transaction implementation."""
 
 from abc import ABC, abstractmethod
+from contextvars import ContextVar, Token
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
@@ -222,3 +223,112 @@ class TransactionManager(AsyncContextManager[Transaction[ModelT]]):
             ValueError: If model type is not set
         """
         raise NotImplementedError
+
+
+_current_unit: ContextVar["UnitOfWork | None"] = ContextVar("earnorm_unit_of_work", default=None)
+
+
+def current_unit_of_work() -> "UnitOfWork | None":
+    """Get unit of work recording writes in the current context.
+
+    Returns:
+        Optional[UnitOfWork]: Active unit of work, None outside ``env.transaction()``
+    """
+    return _current_unit.get()
+
+
+class UnitOfWork(ABC):
+    """Environment-scoped unit of work.
+
+    Writes made by the ORM inside ``async with env.transaction()`` are recorded
+    instead of executed, across all models. When the block exits without error
+    they are flushed in one database transaction; on error they are discarded.
+
+    The unit of work follows the current context, so tasks started inside the
+    block record into it as well. Reads inside the block run outside the
+    transaction and do not see recorded writes.
+
+    Examples:
+        >>> async with env.transaction() as tx:
+        ...     order = await Order.create({"partner_id": partner.id})
+        ...     await lines.write({"order_id": order.id})
+        ...     await cart.unlink()
+        ...     print(tx.pending)
+        3
+    """
+
+    def __init__(self) -> None:
+        """Initialize unit of work."""
+        self._token: Token[UnitOfWork | None] | None = None
+        self._discarded = False
+
+    async def __aenter__(self) -> "UnitOfWork":
+        """Start recording writes.
+
+        Returns:
+            Self
+
+        Raises:
+            TransactionError: If a unit of work is already active
+        """
+        if current_unit_of_work() is not None:
+            raise TransactionError("Units of work cannot be nested")
+        self._token = _current_unit.set(self)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop recording, then commit or discard recorded writes.
+
+        Args:
+            exc_type: Exception type
+            exc_val: Exception value
+            exc_tb: Exception traceback
+        """
+        if self._token is not None:
+            _current_unit.reset(self._token)
+            self._token = None
+        if exc_type is None and not self._discarded:
+            await self.commit()
+        else:
+            self.rollback()
+
+    @property
+    @abstractmethod
+    def pending(self) -> int:
+        """Get number of recorded write operations."""
+
+    @abstractmethod
+    def inserted_ids(self, collection: str) -> frozenset[str]:
+        """Get IDs of records created in the unit of work.
+
+        Args:
+            collection: Collection or table name
+
+        Returns:
+            FrozenSet[str]: IDs of recorded inserts, not in the database yet
+        """
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Flush recorded writes in one transaction.
+
+        Raises:
+            TransactionError: If the transaction fails
+        """
+
+    def rollback(self) -> None:
+        """Discard recorded writes.
+
+        Called inside the block, nothing is written when it exits.
+        """
+        self._discarded = True
+        self._clear()
+
+    @abstractmethod
+    def _clear(self) -> None:
+        """Forget recorded writes."""
@@ -0,0 +1,263 @@
+"""Unique constraints.
+
+Fields declared with ``unique=True`` are enforced by unique indexes created
+when the model schema is synced, so two concurrent writers cannot both insert
+the same value between a check and the insert:
+- String fields with ``case_sensitive=False`` get a case-insensitive
+  collation (strength 2) on their index
+- Duplicate-key errors raised by the server are mapped back to
+  ``FieldValidationError`` with code ``unique``
+- ``BaseModel.validate_batch(rows, check_unique=True)`` pre-checks a whole
+  batch with one ``$in`` query per unique field instead of one query per value
+
+Examples:
+    >>> class Partner(BaseModel):
+    ...     _name = "res.partner"
+    ...     email = StringField(unique=True, case_sensitive=False)
+    ...     ref = StringField(unique=True)
+
+    >>> await env.sync_schema()  # creates email_unique and ref_unique indexes
+
+    >>> # Report taken values before importing
+    >>> errors = await Partner.validate_batch(rows, check_unique=True)
+"""
+
+import re
+from collections.abc import Mapping
+from typing import Any
+
+from bson.decimal128 import Decimal128
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from earnorm.exceptions import FieldValidationError
+
+UNIQUE_CODE = "unique"
+"""Error code of unique constraint violations."""
+
+DUPLICATE_KEY_CODE = 11000
+"""Server error code of duplicate-key errors."""
+
+CASE_INSENSITIVE_COLLATION: Mapping[str, Any] = {"locale": "en", "strength": 2}
+"""Collation comparing strings without case, used by unique indexes and pre-checks."""
+
+NON_NULL_TYPES: tuple[str, ...] = (
+    "double",
+    "string",
+    "object",
+    "array",
+    "binData",
+    "objectId",
+    "bool",
+    "date",
+    "regex",
+    "javascript",
+    "int",
+    "timestamp",
+    "long",
+    "decimal",
+)
+"""BSON types of stored values, partial unique indexes only cover these.
+
+The server does not accept ``$ne`` in partial filter expressions, so
+non-null values are selected by type.
+"""
+
+_INDEX_NAME = re.compile(r"index: (\S+)")
+
+
+def unique_fields(model: Any) -> dict[str, Any]:
+    """Get stored fields of a model declared unique.
+
+    ``ListField(unique=True)`` only requires unique elements within one list
+    and is not enforced across records.
+
+    Args:
+        model: Model class
+
+    Returns:
+        Dict[str, BaseField]: Unique fields by name
+    """
+    from earnorm.fields.composite.list import ListField
+
+    return {
+        name: field
+        for name, field in model.__fields__.items()
+        if getattr(field, "unique", False) and field.store and not isinstance(field, ListField)
+    }
+
+
+def index_name(field_name: str) -> str:
+    """Get name of the unique index of a field.
+
+    Args:
+        field_name: Field name
+
+    Returns:
+        str: Index name
+    """
+    return f"{field_name}_unique"
+
+
+def unique_collation(field: Any) -> dict[str, Any] | None:
+    """Get collation the field's uniqueness is compared with.
+
+    Args:
+        field: Unique field
+
+    Returns:
+        Collation document or None for binary comparison
+    """
+    if getattr(field, "case_sensitive", True):
+        return None
+    return dict(CASE_INSENSITIVE_COLLATION)
+
+
+def unique_key(field: Any, value: Any) -> Any:
+    """Get key comparing values the way the field's unique index does.
+
+    Args:
+        field: Unique field
+        value: Field value in database format
+
+    Returns:
+        Hashable comparison key
+    """
+    if isinstance(value, str) and not getattr(field, "case_sensitive", True):
+        return value.casefold()
+    if isinstance(value, Decimal128):
+        return value.to_decimal()
+    return value
+
+
+def non_null_filter(field_name: str) -> dict[str, Any]:
+    """Get filter matching records where a field holds a non-null value.
+
+    Args:
+        field_name: Field name
+
+    Returns:
+        Filter usable as partial index expression
+    """
+    return {field_name: {"$type": list(NON_NULL_TYPES)}}
+
+
+def unique_indexes(model: Any) -> list[IndexModel]:
+    """Build unique index definitions of a model.
+
+    Indexes of optional fields are partial and only cover records holding a
+    value, so records where the field is missing or null do not conflict with
+    each other. A sparse index would not do: it still indexes explicit nulls.
+
+    Args:
+        model: Model class
+
+    Returns:
+        list[IndexModel]: One index per unique field
+    """
+    indexes: list[IndexModel] = []
+    for name, field in unique_fields(model).items():
+        options: dict[str, Any] = {"name": index_name(name), "unique": True}
+        if not field.required:
+            options["partialFilterExpression"] = non_null_filter(name)
+        collation = unique_collation(field)
+        if collation is not None:
+            options["collation"] = collation
+        indexes.append(IndexModel([(name, ASCENDING)], **options))
+    return indexes
+
+
+def outdated_indexes(indexes: list[IndexModel], existing: Mapping[str, Mapping[str, Any]]) -> list[str]:
+    """Get names of existing indexes whose options differ from their definition.
+
+    The server refuses to recreate an index under the same name with other
+    options, e.g. unique indexes created sparse by earlier versions, so these
+    are dropped before the indexes are created again.
+
+    Args:
+        indexes: Index definitions
+        existing: Index information of the collection by index name
+
+    Returns:
+        list[str]: Names of indexes to drop
+    """
+    outdated: list[str] = []
+    for index in indexes:
+        document = index.document
+        info = existing.get(document["name"])
+        if info is None:
+            continue
+        if bool(info.get("sparse")) != bool(document.get("sparse")) or info.get(
+            "partialFilterExpression"
+        ) != document.get("partialFilterExpression"):
+            outdated.append(document["name"])
+    return outdated
+
+
+def is_duplicate_key_error(error: BaseException) -> bool:
+    """Check if a write failed because of a unique index.
+
+    Args:
+        error: Raised error
+
+    Returns:
+        bool: True for duplicate-key errors, including inside bulk writes
+    """
+    if isinstance(error, DuplicateKeyError):
+        return True
+    if isinstance(error, BulkWriteError):
+        return any(item.get("code") == DUPLICATE_KEY_CODE for item in error.details.get("writeErrors", []))
+    return False
+
+
+def duplicate_key_error(model: Any, error: DuplicateKeyError | BulkWriteError) -> FieldValidationError:
+    """Map duplicate-key error to field validation error.
+
+    Args:
+        model: Model class written to
+        error: Duplicate-key error raised by the server
+
+    Returns:
+        FieldValidationError: Error with code ``unique`` naming the conflicting field
+    """
+    details: Mapping[str, Any] = error.details or {}
+    if isinstance(error, BulkWriteError):
+        details = next(item for item in details.get("writeErrors", []) if item.get("code") == DUPLICATE_KEY_CODE)
+
+    field_name = _duplicate_field(model, details)
+    value = (details.get("keyValue") or {}).get(field_name)
+    if value is not None:
+        message = f"Value '{value}' already exists for field '{field_name}'"
+    else:
+        message = f"Value already exists for field '{field_name}'"
+    return FieldValidationError(
+        message=message,
+        field_name=field_name,
+        code=UNIQUE_CODE,
+        context={"model": getattr(model, "_name", None), "value": value},
+    )
+
+
+def _duplicate_field(model: Any, details: Mapping[str, Any]) -> str:
+    """Get field whose unique index rejected a write.
+
+    Args:
+        model: Model class written to
+        details: Server error details
+
+    Returns:
+        str: Field name, ``unknown`` if it cannot be determined
+    """
+    key_pattern = details.get("keyPattern")
+    if key_pattern:
+        return next(iter(key_pattern))
+
+    fields = unique_fields(model)
+    match = _INDEX_NAME.search(details.get("errmsg", ""))
+    if match:
+        for name in fields:
+            if index_name(name) == match.group(1):
+                return name
+    if len(fields) == 1:
+        return next(iter(fields))
+    return "unknown"
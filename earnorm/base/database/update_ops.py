@@ -0,0 +1,106 @@
+"""Partial update operators.
+
+This module describes in-place changes to parts of stored values, so
+changing one element of a large array or one key of a document does not
+rewrite the whole value:
+- ``push``: Append elements to an array
+- ``add_to_set``: Append elements that are not in the array yet
+- ``pull``: Remove all occurrences of elements from an array
+- ``set``: Set a value at a dotted path inside a document
+- ``inc``: Add a number to a numeric value
+
+Updates hold database values; ``BaseModel`` validates and converts the new
+elements before building them. ``compile_updates`` turns a list of updates
+into one MongoDB update document, so all of them apply atomically.
+
+Examples:
+    >>> compile_updates([
+    ...     FieldUpdate("push", "events", ({"type": "login"},)),
+    ...     FieldUpdate("set", "settings.theme", ("dark",)),
+    ...     FieldUpdate("inc", "visits", (1,)),
+    ... ])
+    {'$push': {'events': {'$each': [{'type': 'login'}]}},
+     '$set': {'settings.theme': 'dark'},
+     '$inc': {'visits': 1}}
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Final, Literal
+
+UpdateOperator = Literal["push", "add_to_set", "pull", "set", "inc"]
+
+ARRAY_OPERATORS: Final[frozenset[str]] = frozenset({"push", "add_to_set", "pull"})
+"""Operators changing array elements."""
+
+MONGO_OPERATORS: Final[dict[str, str]] = {
+    "push": "$push",
+    "add_to_set": "$addToSet",
+    "pull": "$pull",
+    "set": "$set",
+    "inc": "$inc",
+}
+"""MongoDB update operator of each operator."""
+
+
+@dataclass(frozen=True)
+class FieldUpdate:
+    """Partial update of one stored value.
+
+    Attributes:
+        operator: Update operator
+        path: Field name, or dotted path inside a document field
+        values: Database values; elements for array operators, a single
+            value for ``set`` and ``inc``
+    """
+
+    operator: UpdateOperator
+    path: str
+    values: tuple[Any, ...]
+
+    @property
+    def field_name(self) -> str:
+        """Get name of the model field the update changes."""
+        return self.path.split(".", 1)[0]
+
+    def to_mongo(self) -> Any:
+        """Get operand of the MongoDB update operator.
+
+        Returns:
+            Any: ``$each`` list for push/add_to_set, element or ``$in`` list
+            for pull, the value for set/inc
+        """
+        if self.operator in ("push", "add_to_set"):
+            return {"$each": list(self.values)}
+        if self.operator == "pull":
+            return self.values[0] if len(self.values) == 1 else {"$in": list(self.values)}
+        return self.values[0]
+
+
+def compile_updates(updates: Sequence[FieldUpdate]) -> dict[str, dict[str, Any]]:
+    """Build MongoDB update document.
+
+    Args:
+        updates: Partial updates
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Update document
+
+    Raises:
+        ValueError: If there are no updates, an operator is unknown or two
+            updates change the same path
+    """
+    if not updates:
+        raise ValueError("No updates to apply")
+
+    document: dict[str, dict[str, Any]] = {}
+    paths: set[str] = set()
+    for update in updates:
+        operator = MONGO_OPERATORS.get(update.operator)
+        if operator is None:
+            raise ValueError(f"Unknown update operator: {update.operator}")
+        if update.path in paths:
+            raise ValueError(f"Path '{update.path}' is updated more than once")
+        paths.add(update.path)
+        document.setdefault(operator, {})[update.path] = update.to_mongo()
+    return document
@@ -0,0 +1,571 @@
+"""Change stream watcher.
+
+The watcher tails the change stream of every model collection and turns
+each change into a ``ChangeEvent`` that is:
+- Published as an invalidation to the adapter's query caches (e.g. the
+  ``search_count`` cache), so writes made by other services are seen
+  immediately instead of after a TTL
+- Passed to listeners registered with ``add_listener``, e.g. record caches
+- Delivered to ``Model.subscribe(domain)`` iterators whose domain the
+  changed document matches
+
+Each stream remembers the resume token of the last event it handled and
+resumes after it when the connection drops, so no change is missed or seen
+twice. When the server no longer has the history to resume, the caches of
+the collection are dropped as a whole and tailing restarts from now. Tokens
+are kept in memory only: caches start empty in a new process anyway.
+
+Change streams need a replica set or sharded cluster. The watcher is started
+by ``Environment.init`` when ``change_streams_enabled`` is set in the
+configuration and stopped by ``Environment.destroy``.
+
+Examples:
+    >>> async for change in Order.subscribe([("state", "=", "done")]):
+    ...     print(change.operation, change.id)
+    insert 65f0c6a2e4b0a1b2c3d4e5f6
+
+    >>> # In tests, feed events from a local source
+    >>> source = LocalEventSource()
+    >>> watcher = ChangeWatcher(adapter, [Order], source=source)
+    >>> await watcher.start()
+    >>> source.push("sale_order", "insert", {"_id": order_id, "state": "done"})
+"""
+
+import asyncio
+import logging
+import re
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Any
+
+from pymongo.errors import OperationFailure
+
+from earnorm.base.database.query.interfaces.domain import DomainExpression, DomainLeaf, DomainNode, like_pattern
+from earnorm.types import JsonDict
+
+logger = logging.getLogger(__name__)
+
+ChangeSource = Callable[[str, Any], AsyncIterator[JsonDict]]
+"""Opens the change stream of a collection, resuming after a token when not None."""
+
+ChangeListener = Callable[["ChangeEvent"], Awaitable[None] | None]
+"""Called with every change event."""
+
+HISTORY_LOST_CODES = frozenset({136, 280, 286})
+"""Server error codes of change streams that cannot resume from their token."""
+
+INVALIDATE = "invalidate"
+"""Operation of events telling that every cached value of a collection is stale."""
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """Change of one document, or of a whole collection.
+
+    Attributes:
+        operation: insert, update, replace, delete, or invalidate when the
+            whole collection may have changed (drop, rename, lost history)
+        collection: Collection name
+        id: Changed record ID, None for collection-wide events
+        document: Document after the change, when the stream provides it
+        updated_fields: Top-level fields set or removed by an update
+        token: Resume token of the event
+    """
+
+    operation: str
+    collection: str
+    id: str | None = None
+    document: JsonDict | None = None
+    updated_fields: frozenset[str] = frozenset()
+    token: Any = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_raw(cls, collection: str, raw: JsonDict) -> "ChangeEvent":
+        """Build event from a change stream document.
+
+        Args:
+            collection: Watched collection
+            raw: Change stream document
+
+        Returns:
+            ChangeEvent: Parsed event
+        """
+        operation = raw.get("operationType", INVALIDATE)
+        if operation not in ("insert", "update", "replace", "delete"):
+            operation = INVALIDATE
+        key = raw.get("documentKey") or {}
+        description = raw.get("updateDescription") or {}
+        paths = [*description.get("updatedFields", {}), *description.get("removedFields", [])]
+        return cls(
+            operation=operation,
+            collection=collection,
+            id=str(key["_id"]) if "_id" in key else None,
+            document=raw.get("fullDocument"),
+            updated_fields=frozenset(path.split(".")[0] for path in paths),
+            token=raw.get("_id"),
+        )
+
+
+class Subscription:
+    """Async iterator of the changes matching a domain.
+
+    Deletes carry no document and are delivered to every subscription of
+    the collection, as are collection-wide invalidations. When a subscriber
+    falls ``maxsize`` events behind, the oldest pending events are dropped.
+    """
+
+    def __init__(self, watcher: "ChangeWatcher", collection: str, matches: Callable[[JsonDict], bool], maxsize: int):
+        """Initialize subscription.
+
+        Args:
+            watcher: Watcher delivering events
+            collection: Watched collection
+            matches: Check whether a changed document matches the domain
+            maxsize: Maximum number of pending events
+        """
+        self.collection = collection
+        self._watcher = watcher
+        self._matches = matches
+        self._queue: asyncio.Queue[ChangeEvent | None] = asyncio.Queue(maxsize)
+        self._closed = False
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> ChangeEvent:
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+        event = await self._queue.get()
+        if event is None:
+            self._closed = True
+            raise StopAsyncIteration
+        return event
+
+    async def __aenter__(self) -> "Subscription":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        if not self._closed:
+            self._watcher._unsubscribe(self)
+            self._end()
+
+    def _deliver(self, event: ChangeEvent) -> None:
+        """Queue event if it concerns the subscription.
+
+        Args:
+            event: Change event
+        """
+        if self._closed:
+            return
+        if event.operation in ("insert", "update", "replace"):
+            if event.document is None or not self._matches(event.document):
+                return
+        if self._queue.full():
+            self._queue.get_nowait()
+            logger.warning("Subscription to %s is falling behind, dropped oldest change", self.collection)
+        self._queue.put_nowait(event)
+
+    def _end(self) -> None:
+        """End iteration once pending events are consumed."""
+        self._closed = True
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+
+class ChangeWatcher:
+    """Tail change streams of model collections.
+
+    Attributes:
+        tokens: Resume token of the last handled event per collection
+    """
+
+    def __init__(
+        self,
+        adapter: Any,
+        models: Sequence[type[Any]],
+        source: ChangeSource | None = None,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 30.0,
+        queue_size: int = 1000,
+    ) -> None:
+        """Initialize watcher.
+
+        Args:
+            adapter: Database adapter whose caches are invalidated
+            models: Models whose collections are watched
+            source: Change stream opener, defaults to ``watch()`` on the collections
+            retry_delay: Seconds before reopening a failed stream, doubled per failure
+            max_retry_delay: Maximum seconds between attempts
+            queue_size: Maximum pending events per subscription
+        """
+        self._adapter = adapter
+        self._collections = sorted({adapter.cache_name(model) for model in models})
+        self._source = source or self._watch
+        self._retry_delay = retry_delay
+        self._max_retry_delay = max_retry_delay
+        self._queue_size = queue_size
+        self._listeners: list[ChangeListener] = []
+        self._subscriptions: dict[str, list[Subscription]] = {}
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self.tokens: dict[str, Any] = {}
+
+    @property
+    def running(self) -> bool:
+        """Check whether streams are being tailed."""
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        """Start tailing one stream per collection."""
+        for collection in self._collections:
+            if collection not in self._tasks:
+                self._tasks[collection] = asyncio.create_task(self._tail(collection))
+        logger.info("Watching changes of %d collections", len(self._tasks))
+
+    async def stop(self) -> None:
+        """Stop tailing and end all subscriptions."""
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                subscription._end()
+        self._subscriptions.clear()
+
+    def add_listener(self, listener: ChangeListener) -> Callable[[], None]:
+        """Call a function with every change event.
+
+        Args:
+            listener: Sync or async callable
+
+        Returns:
+            Callable: Function removing the listener
+        """
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def subscribe(self, model: type[Any], domain: list[Any] | None = None) -> Subscription:
+        """Subscribe to changes of the records of a model matching a domain.
+
+        Args:
+            model: Model class
+            domain: Domain the changed documents must match, all when empty
+
+        Returns:
+            Subscription: Async iterator of change events
+
+        Raises:
+            ValueError: If the model's collection is not watched or the domain is invalid
+        """
+        collection = self._adapter.cache_name(model)
+        if collection not in self._collections:
+            raise ValueError(f"Changes of {collection} are not watched")
+        subscription = Subscription(self, collection, compile_matcher(model, domain), self._queue_size)
+        self._subscriptions.setdefault(collection, []).append(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        """Forget subscription."""
+        subscriptions = self._subscriptions.get(subscription.collection, [])
+        if subscription in subscriptions:
+            subscriptions.remove(subscription)
+
+    async def publish(self, event: ChangeEvent) -> None:
+        """Invalidate caches and notify listeners and subscriptions of a change.
+
+        Args:
+            event: Change event
+        """
+        count_cache = getattr(self._adapter, "count_cache", None)
+        if count_cache is not None:
+            count_cache.invalidate(event.collection)
+        for listener in list(self._listeners):
+            try:
+                result = listener(event)
+                if result is not None:
+                    await result
+            except Exception as e:
+                logger.error("Change listener failed on %s: %s", event.collection, e, exc_info=True)
+        for subscription in list(self._subscriptions.get(event.collection, ())):
+            subscription._deliver(event)
+
+    async def _tail(self, collection: str) -> None:
+        """Tail one collection, reopening the stream after failures.
+
+        A stream also ends after an invalidate event, e.g. when the
+        collection is dropped or renamed. It cannot resume past that event,
+        so it is reopened from now.
+
+        Args:
+            collection: Collection name
+        """
+        delay = self._retry_delay
+        while True:
+            try:
+                async for raw in self._source(collection, self.tokens.get(collection)):
+                    await self.publish(ChangeEvent.from_raw(collection, raw))
+                    if raw.get("operationType") == INVALIDATE:
+                        self.tokens.pop(collection, None)
+                    else:
+                        self.tokens[collection] = raw.get("_id")
+                    delay = self._retry_delay
+                logger.warning("Change stream of %s ended, reopening in %.1fs", collection, delay)
+            except asyncio.CancelledError:
+                raise
+            except OperationFailure as e:
+                if e.code not in HISTORY_LOST_CODES:
+                    logger.warning("Change stream of %s failed, retrying in %.1fs: %s", collection, delay, e)
+                else:
+                    logger.warning("Change stream of %s cannot resume, restarting from now: %s", collection, e)
+                    self.tokens.pop(collection, None)
+                    await self.publish(ChangeEvent(INVALIDATE, collection))
+                    continue
+            except Exception as e:
+                logger.warning("Change stream of %s failed, retrying in %.1fs: %s", collection, delay, e)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._max_retry_delay)
+
+    async def _watch(self, collection: str, token: Any) -> AsyncIterator[JsonDict]:
+        """Open the change stream of a collection.
+
+        Args:
+            collection: Collection name
+            token: Resume token, or None to start from now
+
+        Yields:
+            JsonDict: Change stream documents, with the document after updates
+        """
+        target = self._adapter._get_collection(collection)
+        async with target.watch(full_document="updateLookup", resume_after=token) as stream:
+            async for raw in stream:
+                yield raw
+
+
+def compile_matcher(model: Any, domain: list[Any] | None) -> Callable[[JsonDict], bool]:
+    """Compile a domain into a check of stored documents.
+
+    Domain values are converted to the stored representation of their
+    fields, as in queries.
+
+    Args:
+        model: Model class
+        domain: Domain expression
+
+    Returns:
+        Callable: Check whether a stored document matches the domain
+
+    Raises:
+        ValueError: If the domain is invalid
+    """
+    if not domain:
+        return lambda document: True
+    expr = DomainExpression(list(domain))
+    expr.validate()
+    fields: dict[str, Any] = getattr(model, "__fields__", None) or {}
+
+    def compile_node(node: DomainNode | DomainLeaf) -> Callable[[JsonDict], bool]:
+        if isinstance(node, DomainLeaf):
+            return _compile_leaf(node, fields.get(node.field))
+        operands = [compile_node(operand) for operand in node.operands]
+        if node.operator == "&":
+            return lambda document: all(check(document) for check in operands)
+        if node.operator == "|":
+            return lambda document: any(check(document) for check in operands)
+        return lambda document: not operands[0](document)
+
+    return compile_node(expr.root) if expr.root is not None else lambda document: True
+
+
+def _compile_leaf(leaf: DomainLeaf, field_obj: Any) -> Callable[[JsonDict], bool]:
+    """Compile one domain condition.
+
+    Args:
+        leaf: Domain condition
+        field_obj: Field compared, if known
+
+    Returns:
+        Callable: Check of a stored document
+    """
+    name, operator, value = leaf.field, leaf.operator, leaf.value
+    path = ["_id"] if name == "id" else name.split(".")
+
+    def stored(item: Any) -> Any:
+        if name == "id":
+            return str(item)
+        return field_obj.to_query_value(item) if field_obj is not None else item
+
+    if operator in ("like", "ilike", "not like", "not ilike"):
+        pattern = re.compile(like_pattern(value), re.IGNORECASE if "ilike" in operator else 0)
+        negate = operator.startswith("not")
+        return lambda document: negate != any(
+            isinstance(item, str) and pattern.search(item) is not None for item in _values(document, path)
+        )
+    if operator in ("is null", "is not null"):
+        # Like {field: None}: missing values, nulls and arrays holding null
+        negate = operator == "is not null"
+        return lambda document: negate != any(item is None for item in _values(document, path))
+    if operator in ("in", "not in"):
+        targets = [stored(item) for item in value]
+        negate = operator == "not in"
+        return lambda document: negate != any(_key(item, name) in targets for item in _values(document, path))
+
+    target = stored(value)
+    if operator in ("=", "!="):
+        negate = operator == "!="
+        return lambda document: negate != any(_key(item, name) == target for item in _values(document, path))
+    compare: Callable[[Any, Any], bool] = {
+        ">": lambda a, b: a > b,
+        ">=": lambda a, b: a >= b,
+        "<": lambda a, b: a < b,
+        "<=": lambda a, b: a <= b,
+    }[operator]
+
+    def check(document: JsonDict) -> bool:
+        for item in _values(document, path):
+            try:
+                if item is not None and compare(_key(item, name), target):
+                    return True
+            except TypeError:
+                continue
+        return False
+
+    return check
+
+
+def _key(item: Any, name: str) -> Any:
+    """Get comparable form of a stored value."""
+    return str(item) if name == "id" else item
+
+
+def _values(document: JsonDict, path: list[str]) -> list[Any]:
+    """Get values at a path, array elements matching like in queries.
+
+    Args:
+        document: Stored document
+        path: Field path
+
+    Returns:
+        List[Any]: Candidate values, [None] when missing
+    """
+    current: list[Any] = [document]
+    for key in path:
+        found: list[Any] = []
+        for item in current:
+            if isinstance(item, dict):
+                value = item.get(key)  # type: ignore
+                if isinstance(value, list):
+                    found.extend(value)  # type: ignore
+                    found.append(value)
+                else:
+                    found.append(value)
+        current = found
+    return current or [None]
+
+
+class LocalEventSource:
+    """In-process change source.
+
+    Events pushed to the source are delivered to the watcher like server
+    change events, with increasing resume tokens. Used in tests and by
+    single-process setups without a replica set.
+
+    Examples:
+        >>> source = LocalEventSource()
+        >>> source.push("sale_order", "update", {"_id": oid, "state": "done"}, updated_fields=["state"])
+        >>> source.interrupt("sale_order")  # drop the stream, watcher resumes
+    """
+
+    def __init__(self) -> None:
+        """Initialize source."""
+        self._log: dict[str, list[JsonDict]] = {}
+        self._changed: dict[str, asyncio.Event] = {}
+        self._errors: dict[str, list[Exception]] = {}
+        self.opened: list[tuple[str, Any]] = []
+
+    def push(
+        self,
+        collection: str,
+        operation: str,
+        document: JsonDict | None = None,
+        id: Any = None,
+        updated_fields: Sequence[str] = (),
+    ) -> int:
+        """Record a change.
+
+        Args:
+            collection: Collection name
+            operation: Change operation, e.g. insert, update, delete or drop;
+                invalidate ends the open stream
+            document: Document after the change
+            id: Document ID, defaults to the document's ``_id``
+            updated_fields: Fields set by an update
+
+        Returns:
+            int: Resume token of the change
+        """
+        log = self._log.setdefault(collection, [])
+        token = len(log) + 1
+        raw: JsonDict = {"_id": token, "operationType": operation}
+        key = id if id is not None else (document or {}).get("_id")
+        if key is not None:
+            raw["documentKey"] = {"_id": key}
+        if document is not None and operation != "delete":
+            raw["fullDocument"] = document
+        if operation == "update":
+            raw["updateDescription"] = {"updatedFields": dict.fromkeys(updated_fields), "removedFields": []}
+        log.append(raw)
+        self._event(collection).set()
+        return token
+
+    def interrupt(self, collection: str, error: Exception | None = None) -> None:
+        """Make the open stream of a collection fail.
+
+        Args:
+            collection: Collection name
+            error: Raised error, defaults to a connection error
+        """
+        self._errors.setdefault(collection, []).append(error or ConnectionError("change stream interrupted"))
+        self._event(collection).set()
+
+    def _event(self, collection: str) -> asyncio.Event:
+        """Get event signalling new changes of a collection."""
+        return self._changed.setdefault(collection, asyncio.Event())
+
+    async def __call__(self, collection: str, token: Any) -> AsyncIterator[JsonDict]:
+        """Stream changes of a collection after a token.
+
+        Args:
+            collection: Collection name
+            token: Resume token, or None to start from now
+
+        Yields:
+            JsonDict: Change stream documents
+        """
+        self.opened.append((collection, token))
+        position = int(token) if token is not None else len(self._log.get(collection, []))
+        if position > len(self._log.get(collection, [])):
+            raise OperationFailure("resume token not found", code=286)
+        while True:
+            errors = self._errors.get(collection)
+            if errors:
+                raise errors.pop(0)
+            log = self._log.get(collection, [])
+            if position < len(log):
+                position += 1
+                yield log[position - 1]
+                if log[position - 1]["operationType"] == INVALIDATE:
+                    # The server closes streams after invalidating them
+                    return
+                continue
+            changed = self._event(collection)
+            changed.clear()
+            await changed.wait()
@@ -47,6 +47,15 @@ Examples:
     >>> events = await env.get_service('event_bus')
     >>> await events.publish('user.created', user)
 
+    >>> # Write several models in one transaction
+    >>> async with env.transaction():
+    ...     order = await Order.create({"partner_id": partner.id})
+    ...     await cart.unlink()
+
+    >>> # Follow changes made by other services (change_streams_enabled)
+    >>> async for change in Order.subscribe([("state", "=", "done")]):
+    ...     print(change.operation, change.id)
+
     >>> # Cleanup on shutdown
     >>> await env.destroy()
 
@@ -59,12 +68,15 @@ Classes:
 
         Instance Methods:
             init: Initialize environment
+            sync_schema: Create indexes declared by models
+            transaction: Record ORM writes and flush them in one transaction
             destroy: Cleanup resources
             get_service: Get service from DI container
             get_model: Get model by name
 
         Properties:
             adapter: Get database adapter
+            watcher: Get change stream watcher, if enabled
             initialized: Check if initialized
 
 Implementation Notes:
@@ -95,10 +107,14 @@ See Also:
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
 from earnorm.base.database.adapter import DatabaseAdapter
+from earnorm.base.database.transaction.base import UnitOfWork
+from earnorm.base.database.watcher import ChangeWatcher
 from earnorm.di import container
+from earnorm.tracing import set_trace_enabled
 from earnorm.types.models import DatabaseModel, ModelProtocol
 
 if TYPE_CHECKING:
@@ -113,6 +129,7 @@ class Environment:
     _instance: Environment | None = None
     _initialized: bool = False
     _adapter: DatabaseAdapter[DatabaseModel] | None = None
+    _watcher: ChangeWatcher | None = None
     logger = logging.getLogger(__name__)
 
     def __init__(self) -> None:
@@ -148,6 +165,8 @@ class Environment:
         2. Sets up services
         3. Initializes database
         4. Registers models
+        5. Creates indexes declared by models
+        6. Starts the change stream watcher, if enabled
 
         Args:
             config: System configuration data
@@ -161,6 +180,13 @@ class Environment:
         # Register config in container
         container.register("config", config)
 
+        # Switch ORM trace points on/off (None keeps EARNORM_TRACE setting)
+        trace_enabled = getattr(config, "trace_enabled", None)
+        if isinstance(trace_enabled, str):
+            trace_enabled = trace_enabled.strip().lower() in ("1", "true", "yes", "on")
+        if trace_enabled is not None:
+            set_trace_enabled(bool(trace_enabled))
+
         # Get adapter from container
         self._adapter = await container.get("database_adapter")
         if self._adapter is None:
@@ -184,14 +210,79 @@ class Environment:
         except Exception as e:
             self.logger.warning(f"Failed to register deferred models: {e}")
 
+        # Create unique indexes and other schema objects declared by models
+        await self.sync_schema()
+
+        # Invalidate caches on changes made by other processes
+        change_streams_enabled = getattr(config, "change_streams_enabled", False)
+        if isinstance(change_streams_enabled, str):
+            change_streams_enabled = change_streams_enabled.strip().lower() in ("1", "true", "yes", "on")
+        if change_streams_enabled:
+            from earnorm.base.model.meta import ModelMeta
+
+            models = [model for model in ModelMeta.registered_models() if not getattr(model, "_abstract", False)]
+            self._watcher = ChangeWatcher(self._adapter, models)
+            await self._watcher.start()
+
+    async def sync_schema(self, models: Sequence[type[Any]] | None = None) -> dict[str, list[str]]:
+        """Create schema objects declared by models.
+
+        Failures are logged per model so one model with inconsistent data
+        (e.g. duplicates preventing a unique index) does not block the others.
+
+        Args:
+            models: Model classes to sync, defaults to all registered models
+
+        Returns:
+            Dict[str, list[str]]: Ensured object names by model name
+        """
+        if models is None:
+            from earnorm.base.model.meta import ModelMeta
+
+            models = ModelMeta.registered_models()
+
+        synced: dict[str, list[str]] = {}
+        for model in models:
+            if getattr(model, "_abstract", False):
+                continue
+            try:
+                names = await self.adapter.sync_schema(model)
+            except Exception as e:
+                self.logger.warning(f"Failed to sync schema of {model._name}: {e}")
+                continue
+            if names:
+                synced[model._name] = names
+        return synced
+
+    def transaction(self, max_retries: int = 3) -> UnitOfWork:
+        """Create unit of work for ORM writes.
+
+        ``create``, ``write``, ``unlink`` and partial updates of any model
+        inside ``async with env.transaction()`` are recorded and flushed in one
+        database transaction when the block exits, grouped into one bulk
+        write per collection. Transient transaction errors and commits with
+        unknown result are retried up to ``max_retries`` times.
+
+        Args:
+            max_retries: Maximum attempts for the transaction and for its commit
+
+        Returns:
+            UnitOfWork: Unit of work context manager
+
+        Raises:
+            RuntimeError: If environment is not initialized
+        """
+        return self.adapter.unit_of_work(max_retries=max_retries)
+
     async def destroy(self) -> None:
         """Cleanup environment resources.
 
         This method:
-        1. Closes database connections
-        2. Stops event bus
-        3. Cleans up resources
-        4. Resets state
+        1. Stops the change stream watcher
+        2. Closes database connections
+        3. Stops event bus
+        4. Cleans up resources
+        5. Resets state
 
         Raises:
             RuntimeError: If cleanup fails
@@ -200,6 +291,11 @@ class Environment:
             return
 
         try:
+            # Stop tailing change streams before closing connections
+            if self._watcher is not None:
+                await self._watcher.stop()
+                self._watcher = None
+
             # Cleanup database
             if container.has("database_adapter"):
                 adapter = await container.get("database_adapter")
@@ -261,6 +357,15 @@ class Environment:
 
         return self._adapter
 
+    @property
+    def watcher(self) -> ChangeWatcher | None:
+        """Get change stream watcher.
+
+        Returns:
+            Optional[ChangeWatcher]: Running watcher, None if change streams are disabled
+        """
+        return self._watcher
+
     async def get_model(self, name: str) -> type[ModelProtocol]:
         """Get model class by name.
 
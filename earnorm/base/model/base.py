@@ -81,6 +81,10 @@ Examples:
     ...     "status": "active"
     ... })
 
+    >>> # Partial updates, only the new elements are validated and sent
+    >>> await adults.add_to_set("tags", "verified")
+    >>> await adults.increment("login_count")
+
     >>> # Delete records
     >>> deleted_count = await adults.unlink()
     >>> print(f"Deleted {deleted_count} records")
@@ -111,6 +115,8 @@ Classes:
             create: Create records
             search: Search records
             write: Update records
+            append/extend/remove/add_to_set: Change list and set elements
+            dict_set/increment: Change values inside documents and counters
             unlink: Delete records
 
 Implementation Notes:
@@ -129,6 +135,8 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Sequence
+from datetime import timedelta
+from decimal import Decimal
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -142,6 +150,7 @@ from typing import (
 )
 
 from earnorm import api
+from earnorm.base.database.count_cache import COUNT_MODES, DEFAULT_COUNT_CAP, CountMode
 from earnorm.base.database.query.core.query import BaseQuery
 from earnorm.base.database.query.interfaces.domain import (
     DomainExpression,
@@ -154,13 +163,22 @@ from earnorm.base.database.query.interfaces.operations.aggregate import (
 from earnorm.base.database.query.interfaces.operations.join import (
     JoinProtocol as JoinQuery,
 )
-from earnorm.base.database.transaction.base import Transaction
+from earnorm.base.database.read_options import ReadOptions
+from earnorm.base.database.transaction.base import Transaction, current_unit_of_work
+from earnorm.base.database.unique import UNIQUE_CODE, unique_fields, unique_key
+from earnorm.base.database.update_ops import FieldUpdate, UpdateOperator
 from earnorm.base.env import Environment
+from earnorm.base.model.codec import ModelCodec
+from earnorm.base.model.context import ModelContext
+from earnorm.base.model.facets import distinct as _distinct, facets as _facets
 from earnorm.base.model.meta import ModelMeta
+from earnorm.base.model.partial import prepare_update
+from earnorm.base.model.read_group import Group, read_group as _read_group
 from earnorm.constants import FIELD_MAPPING
 from earnorm.di import Container
 from earnorm.exceptions import DatabaseError, FieldValidationError, ModelNotFoundError
 from earnorm.fields import BaseField, RelationField
+from earnorm.tracing import get_tracer
 from earnorm.types import ValueType
 from earnorm.types.models import ModelProtocol
 
@@ -168,6 +186,7 @@ if TYPE_CHECKING:
     pass
 
 logger = logging.getLogger(__name__)
+_trace = get_tracer(__name__)
 
 # Define type variables
 T = TypeVar("T")
@@ -277,12 +296,20 @@ class BaseModel(metaclass=ModelMeta):
     _sequence: ClassVar[str | None] = None
     _skip_default_fields: ClassVar[bool] = False
     _abstract: ClassVar[bool] = False
+    _read_preference: ClassVar[str | None] = None  # Read preference for read-only operations
+    _read_concern: ClassVar[str | None] = None  # Read concern for read-only operations
+    _materialized: ClassVar[dict[str, Any]] = {}  # Materialized aggregate views by name
+    _timeseries: ClassVar[dict[str, Any] | None] = None  # Time-series collection options (timeField, metaField, ...)
+    _expire_after: ClassVar[int | timedelta | None] = None  # Seconds before time-series documents expire
     _env: Environment  # Environment instance
     logger: LoggerProtocol = logging.getLogger(__name__)
 
     # Model fields (will be set by metaclass)
     __fields__ = FieldsDescriptor()
 
+    # Document codec compiled from __fields__ (will be set by metaclass)
+    __codec__: ClassVar[ModelCodec]
+
     def __init__(self, env: Environment | None = None) -> None:
         """Initialize model instance.
 
@@ -334,60 +361,48 @@ class BaseModel(metaclass=ModelMeta):
         Returns:
             Attribute value
         """
-        self.logger.info(f"Getting attribute {name} for {self._name}")
+        _trace("Getting attribute %s for %s", name, self._name)
 
         # Get field
         field = self.__fields__.get(name)
         if not field:
-            self.logger.warning(f"Field {name} not found")
             raise AttributeError(f"'{self.__class__.__name__}' has no attribute '{name}'")
 
-        self.logger.info(f"Found field {name} of type {type(field)}")
-
         # Get record ID
         record_id = self.id
-        self.logger.info(f"Getting attribute {name} for {self._name}:{record_id}")
 
         # Get from cache first
         cache = getattr(self, "_cache", None)
-        self.logger.info(f"Cache object: {cache}")
-
         if cache is not None:
             cached = cache.get(name)
-            self.logger.info(f"Cached value for {name}: {cached}")
             if cached is not None:
-                self.logger.info(f"Returning cached value for {name}")
+                _trace("Cache hit for %s:%s.%s", self._name, record_id, name)
                 return cached
 
         # For relation fields, get related records
         if isinstance(field, RelationField):
-            self.logger.info(f"Getting related records for {name} using get_related()")
+            _trace("Loading relation %s:%s.%s", self._name, record_id, name)
             value = await field.get_related(self)
-            self.logger.info(f"Got related records: {value}")
 
             # Cache the value
             if isinstance(cache, dict):
                 cache[name] = value
-                self.logger.info(f"Cached relation value for {name}")
             return value
 
         # Direct database fetch using read method
-        self.logger.info(f"Fetching from database for {name}")
+        _trace("Fetching %s:%s.%s from database", self._name, record_id, name)
         result = await self.env.adapter.read(self._name, record_id, [name])
-        self.logger.info(f"Database result: {result}")
 
         if not result:
-            self.logger.info(f"No result found for {name}")
+            _trace("No result found for %s:%s.%s", self._name, record_id, name)
             return None
 
         # Convert value using field object
         value = await field.from_db(result.get(name), self.env.adapter.backend_type)
-        self.logger.info(f"Converted value: {value}")
 
         # Cache and return the value
         if isinstance(cache, dict):
             cache[name] = value
-            self.logger.info(f"Cached value for {name}")
 
         return value
 
@@ -408,41 +423,29 @@ class BaseModel(metaclass=ModelMeta):
             AttributeError: If field not found
             ValueError: If field access fails
         """
-        self.logger.info(f"Getting field value internally for {field_name}")
-
         # Get field
         field = self.__fields__.get(field_name)
         if not field:
-            self.logger.warning(f"Field {field_name} not found")
             raise AttributeError(f"'{self.__class__.__name__}' has no attribute '{field_name}'")
 
-        self.logger.info(f"Found field {field_name} of type {type(field)}")
-
         # Get record ID
         record_id = self.id
-        self.logger.info(f"Getting field value for {self._name}:{record_id}")
 
         # For relation fields, get related records
         if isinstance(field, RelationField):
-            self.logger.info(f"Getting related records for {field_name} using get_related()")
-            value = await field.get_related(self)
-            self.logger.info(f"Got related records: {value}")
-            return value
+            _trace("Loading relation %s:%s.%s", self._name, record_id, field_name)
+            return await field.get_related(self)
 
         # Direct database fetch using read method
-        self.logger.info(f"Fetching from database for {field_name}")
+        _trace("Fetching %s:%s.%s from database", self._name, record_id, field_name)
         result = await self.env.adapter.read(self._name, record_id, [field_name])
-        self.logger.info(f"Database result: {result}")
 
         if not result:
-            self.logger.info(f"No result found for {field_name}")
+            _trace("No result found for %s:%s.%s", self._name, record_id, field_name)
             return None
 
         # Convert value using field object
-        value = await field.from_db(result.get(field_name), self.env.adapter.backend_type)
-        self.logger.info(f"Converted value: {value}")
-
-        return value
+        return await field.from_db(result.get(field_name), self.env.adapter.backend_type)
 
     @classmethod
     def _browse(
@@ -506,6 +509,32 @@ class BaseModel(metaclass=ModelMeta):
 
         return recordset
 
+    @classmethod
+    def with_context(cls, read: str | None = None, read_concern: str | None = None) -> ModelContext:
+        """Get model proxy with per-call read options.
+
+        Read-only operations awaited through the proxy (``search``,
+        ``search_count``, ``read``, ``aggregate``, ``join``) use the given
+        read preference and read concern instead of the model's
+        ``_read_preference`` / ``_read_concern`` or the environment defaults.
+
+        Args:
+            read: Read preference mode (primary, primaryPreferred, secondary,
+                secondaryPreferred, nearest)
+            read_concern: Read concern level (local, available, majority,
+                linearizable, snapshot)
+
+        Returns:
+            ModelContext: Proxy forwarding to this model
+
+        Raises:
+            ValueError: If read preference or read concern is unknown
+
+        Examples:
+            >>> users = await User.with_context(read="secondaryPreferred").search([("active", "=", True)])
+        """
+        return ModelContext(cls, ReadOptions(preference=read, concern=read_concern))
+
     @classmethod
     async def browse(cls, ids: str | list[str]) -> Self:
         """Browse records by IDs.
@@ -552,8 +581,7 @@ class BaseModel(metaclass=ModelMeta):
             DatabaseError: If search operation fails
         """
         try:
-            # Log search parameters
-            logger.info(
+            _trace(
                 "Searching %s with domain=%s, offset=%s, limit=%s, order=%s",
                 cls._name,
                 domain,
@@ -564,7 +592,6 @@ class BaseModel(metaclass=ModelMeta):
 
             # Calculate where clause
             query = await cls._where_calc(domain or [])
-            logger.info("Generated query: %s", query)
 
             # Add options
             if offset:
@@ -577,18 +604,12 @@ class BaseModel(metaclass=ModelMeta):
             # Get backend type and field mapping
             backend_type = cls._env.adapter.backend_type
             id_field = FIELD_MAPPING.get(backend_type, {}).get("id", "id")
-            logger.info(
-                "Using backend %s with id_field %s",
-                backend_type,
-                id_field,
-            )
 
             # Select ID field based on backend
             query.select(id_field)
 
             # Execute query and get raw data
             result = await query.to_raw_data()
-            logger.info("Query raw result: %s", result)
 
             # Extract IDs using both id and _id fields
             ids = []
@@ -597,7 +618,7 @@ class BaseModel(metaclass=ModelMeta):
                     ids.append(str(doc[id_field]))  # type: ignore
                 elif "id" in doc:
                     ids.append(str(doc["id"]))  # type: ignore
-            logger.info("Extracted IDs: %s", ids)  # type: ignore
+            _trace("Search %s matched %d records", cls._name, len(ids))
 
             return cls._browse(cls._env, tuple(ids))  # type: ignore
 
@@ -612,18 +633,50 @@ class BaseModel(metaclass=ModelMeta):
     async def search_count(
         cls,
         domain: list[tuple[str, Operator, ValueType] | LogicalOp] | None = None,
+        mode: CountMode = "exact",
+        cap: int = DEFAULT_COUNT_CAP,
     ) -> int:
         """Count records matching domain.
 
+        Modes trade accuracy for speed on large collections:
+        - ``exact``: counts every match; the result is reused for a few
+          seconds by the adapter's count cache, and dropped when the adapter
+          writes to the collection
+        - ``estimated``: without a domain, reads the collection size from
+          its metadata without scanning; with a domain, counts exactly
+        - ``capped``: stops counting after ``cap + 1`` matches, so a result
+          above ``cap`` means "more than cap"
+
         Args:
             domain: Search domain expression
+            mode: Count mode, exact, estimated or capped
+            cap: Number of matches after which capped mode stops counting
 
         Returns:
             int: Number of records matching the domain
 
         Raises:
+            ValueError: If mode or cap is invalid
             DatabaseError: If count operation fails
+
+        Examples:
+            >>> total = await Order.search_count([("state", "=", "done")], mode="capped", cap=10000)
+            >>> label = "10000+" if total > 10000 else str(total)
         """
+        if mode not in COUNT_MODES:
+            raise ValueError(f"Invalid count mode: {mode}. Expected one of {', '.join(COUNT_MODES)}")
+        if cap < 0:
+            raise ValueError("cap must not be negative")
+
+        cache = cls._env.adapter.count_cache
+        collection = cls._env.adapter.cache_name(cls)
+        exact = mode == "exact" or (mode == "estimated" and domain)
+        if exact:
+            cached = cache.get(collection, domain)
+            if cached is not None:
+                _trace("Count cache hit for %s: %s records", cls._name, cached)
+                return cached
+
         try:
             # Build query (same logic as search method)
             query = await cls._env.adapter.query(cast(type[ModelProtocol], cls))
@@ -633,9 +686,15 @@ class BaseModel(metaclass=ModelMeta):
                 query = query.filter(expr.to_list())
 
             # Execute count query
-            count = await query.count()
+            if mode == "capped":
+                count = await query.count(limit=cap + 1)
+            elif not exact:
+                count = await query.estimated_count()
+            else:
+                count = await query.count()
+                cache.set(collection, domain, count)
 
-            logger.info("Count result for %s: %s records", cls._name, count)
+            _trace("Count result for %s: %s records (%s)", cls._name, count, mode)
             return count
 
         except Exception as e:
@@ -694,6 +753,8 @@ class BaseModel(metaclass=ModelMeta):
 
             return self
 
+        except FieldValidationError:
+            raise
         except Exception as e:
             logger.error(f"Failed to write values: {e!s}", exc_info=True)
             raise DatabaseError(message=str(e), backend=self._env.adapter.backend_type) from e
@@ -715,58 +776,414 @@ class BaseModel(metaclass=ModelMeta):
                     ValidationError: If custom validation fails
                     ValueError: If records don't exist
         """
-        logger.info("Validating write values: %s", vals)
+        _trace("Validating write values for %s: %s", self._name, vals)
 
         try:
             if not self._ids:
                 raise ValueError("No records to update")
 
-            # Check if records exist in database
-            domain_tuple = cast(
-                tuple[str, Operator, ValueType],
-                ("id", "in", list(self._ids)),
+            # Check if records exist in database, except those created in
+            # the active unit of work, which are not written yet
+            unit = current_unit_of_work()
+            pending = unit.inserted_ids(self._name) if unit is not None else frozenset()
+            stored_ids = [record_id for record_id in self._ids if record_id not in pending]
+            if stored_ids:
+                domain_tuple = cast(
+                    tuple[str, Operator, ValueType],
+                    ("id", "in", stored_ids),
+                )
+                query = await self._where_calc([domain_tuple])
+                count = await query.count()
+                if count != len(stored_ids):
+                    raise ValueError("Some records do not exist")
+
+            errors = await self.validate_batch([vals], operation="write", model=self)
+            if errors:
+                row_errors = errors[0]
+                raise next(row_errors[name] for name in vals if name in row_errors)
+
+        except Exception as e:
+            logger.error("Validation failed: %s", str(e))
+            raise
+
+    @api.multi
+    async def append(self, field_name: str, value: Any) -> Self:
+        """Append element to a list or set field of the records.
+
+        Only the new element is validated and sent to the database
+        (``$push``, ``$addToSet`` for set fields).
+
+        Args:
+            field_name: List or set field
+            value: Element to append
+
+        Returns:
+            Self: Updated recordset
+
+        Raises:
+            FieldValidationError: If the field is no list or set, or the element is invalid
+            DatabaseError: If update fails
+
+        Examples:
+            >>> await order.append("events", {"type": "paid", "at": now})
+        """
+        return await self._apply_update("push", field_name, (value,))
+
+    @api.multi
+    async def extend(self, field_name: str, values: Sequence[Any]) -> Self:
+        """Append elements to a list or set field of the records.
+
+        Args:
+            field_name: List or set field
+            values: Elements to append, in order
+
+        Returns:
+            Self: Updated recordset
+
+        Raises:
+            FieldValidationError: If the field is no list or set, or an element is invalid
+            DatabaseError: If update fails
+        """
+        if not values:
+            return self
+        return await self._apply_update("push", field_name, tuple(values))
+
+    @api.multi
+    async def remove(self, field_name: str, *values: Any) -> Self:
+        """Remove all occurrences of elements from a list or set field (``$pull``).
+
+        Args:
+            field_name: List or set field
+            *values: Elements to remove
+
+        Returns:
+            Self: Updated recordset
+
+        Raises:
+            FieldValidationError: If the field is no list or set
+            DatabaseError: If update fails
+        """
+        if not values:
+            return self
+        return await self._apply_update("pull", field_name, values)
+
+    @api.multi
+    async def add_to_set(self, field_name: str, *values: Any) -> Self:
+        """Append elements missing from a list or set field (``$addToSet``).
+
+        Args:
+            field_name: List or set field
+            *values: Elements to add
+
+        Returns:
+            Self: Updated recordset
+
+        Raises:
+            FieldValidationError: If the field is no list or set, or an element is invalid
+            DatabaseError: If update fails
+
+        Examples:
+            >>> await users.add_to_set("tags", "beta", "early-adopter")
+        """
+        if not values:
+            return self
+        return await self._apply_update("add_to_set", field_name, values)
+
+    @api.multi
+    async def dict_set(self, path: str, value: Any) -> Self:
+        """Set value at a dotted path inside a dictionary or JSON field (``$set``).
+
+        Args:
+            path: Field name followed by keys, e.g. ``settings.theme``
+            value: Value to set, validated by the dictionary's value field
+
+        Returns:
+            Self: Updated recordset
+
+        Raises:
+            FieldValidationError: If the path cannot exist or the value is invalid
+            DatabaseError: If update fails
+
+        Examples:
+            >>> await user.dict_set("settings.notifications.email", False)
+        """
+        return await self._apply_update("set", path, (value,))
+
+    @api.multi
+    async def increment(self, path: str, amount: int | float | Decimal = 1) -> Self:
+        """Add a number to a numeric field or a number inside a document (``$inc``).
+
+        Args:
+            path: Numeric field, or dotted path inside a dictionary or JSON field
+            amount: Number to add, may be negative
+
+        Returns:
+            Self: Updated recordset
+
+        Raises:
+            FieldValidationError: If the value is not numeric or amount does not fit its type
+            DatabaseError: If update fails
+
+        Examples:
+            >>> await post.increment("views")
+            >>> await post.increment("reactions.like", 2)
+        """
+        return await self._apply_update("inc", path, (amount,))
+
+    async def _apply_update(self, operator: UpdateOperator, path: str, values: tuple[Any, ...]) -> Self:
+        """Validate and apply one partial update to the records.
+
+        ``auto_now`` fields are set in the same update, as on ``write``.
+
+        Args:
+            operator: Update operator
+            path: Field name or dotted path
+            values: Update values
+
+        Returns:
+            Self: Updated recordset
+
+        Raises:
+            FieldValidationError: If validation fails
+            DatabaseError: If update fails
+        """
+        if not self._ids:
+            return self
+
+        adapter = self._env.adapter
+        update = await prepare_update(self, operator, path, values, adapter.backend_type)
+        touched, _ = await self._prepare_upsert({}, {})
+        updates = [update] + [
+            FieldUpdate("set", name, (value,)) for name, value in touched.items() if name != update.field_name
+        ]
+        try:
+            await adapter.apply_updates(
+                cast(type[ModelProtocol], type(self)),
+                DomainExpression([("id", "in", list(self._ids))]),
+                updates,
             )
-            query = await self._where_calc([domain_tuple])
-            count = await query.count()
-            if count != len(self._ids):
-                raise ValueError("Some records do not exist")
-
-            # Create validation context
-            context = {
-                "model": self,
-                "env": self._env,
-                "operation": "write",
-                "values": vals,
-            }
-
-            # Validate field values
-            for name, value in vals.items():
-                if name not in self.__fields__:
-                    raise FieldValidationError(
+        except (FieldValidationError, DatabaseError):
+            raise
+        except Exception as e:
+            logger.error("Failed to update %s of %s: %s", path, self._name, str(e), exc_info=True)
+            raise DatabaseError(message=str(e), backend=adapter.backend_type) from e
+
+        for name in (update.field_name, *touched):
+            self._clear_cache(name)
+        return self
+
+    @api.one
+    async def find_and_modify(
+        self,
+        update: dict[str, Any] | None = None,
+        return_new: bool = True,
+        increment: dict[str, int | float | Decimal] | None = None,
+    ) -> dict[str, Any] | None:
+        """Update the record and read it in one atomic operation.
+
+        Field values are set and numbers incremented by a single
+        ``find_one_and_update``, so no other write can happen between the
+        update and the read, e.g. when taking the next value of a counter.
+
+        Args:
+            update: Field values to set
+            return_new: Return the values after the update instead of before
+            increment: Numbers to add by field name or dotted path
+
+        Returns:
+            Optional[Dict[str, Any]]: Stored values with ``id``, None if the
+            record no longer exists
+
+        Raises:
+            ValueError: If the recordset does not hold exactly one record, or
+                nothing is updated
+            FieldValidationError: If validation fails
+            DatabaseError: If update fails
+
+        Examples:
+            >>> values = await sequence.find_and_modify(increment={"next": 1}, return_new=False)
+            >>> number = values["next"]
+        """
+        update = update or {}
+        if not update and not increment:
+            raise ValueError("No updates to apply")
+
+        adapter = self._env.adapter
+        backend = adapter.backend_type
+        if update:
+            errors = await self.validate_batch([update], operation="write", model=self)
+            if errors:
+                raise next(iter(errors[0].values()))
+        values, _ = await self._prepare_upsert(update, {})
+        updates = [
+            await prepare_update(self, "inc", path, (amount,), backend) for path, amount in (increment or {}).items()
+        ]
+
+        try:
+            doc = await adapter.find_and_modify(
+                cast(type[ModelProtocol], type(self)),
+                DomainExpression([("id", "=", self._ids[0])]),
+                values,
+                updates,
+                return_new=return_new,
+            )
+        except (FieldValidationError, DatabaseError):
+            raise
+        except Exception as e:
+            logger.error("Failed to find and modify %s: %s", self._name, str(e), exc_info=True)
+            raise DatabaseError(message=str(e), backend=backend) from e
+        finally:
+            self._clear_cache()
+
+        if doc is None:
+            return None
+        result = await self._get_codec(backend).decode({name: doc[name] for name in self.__fields__ if name in doc})
+        result["id"] = doc.get("id")
+        return result
+
+    @classmethod
+    async def validate_batch(
+        cls,
+        rows: Sequence[dict[str, Any]],
+        operation: str = "create",
+        *,
+        model: Any = None,
+        check_unique: bool = False,
+    ) -> dict[int, dict[str, FieldValidationError]]:
+        """Validate many rows of values column by column.
+
+        Every field is validated once for all rows that set it, using
+        ``BaseField.validate_many``, instead of once per row and value. On
+        create, required fields missing from a row are reported as well.
+
+        Unique fields are enforced by their unique index on write. With
+        ``check_unique`` taken values are reported up front, using one ``$in``
+        query per unique field for the whole batch.
+
+        Args:
+            rows: Field values of each row
+            operation: Operation the rows are validated for (create/write)
+            model: Model instance or recordset passed to validators, defaults to the model class
+            check_unique: Whether to report values of unique fields that are already
+                stored or repeated within the batch
+
+        Returns:
+            Dict[int, Dict[str, FieldValidationError]]: Errors by row index and field name,
+            rows without errors are omitted
+
+        Examples:
+            >>> errors = await User.validate_batch([
+            ...     {"name": "Alice", "age": 30},
+            ...     {"name": "", "age": "thirty"},
+            ... ])
+            >>> {index: list(fields) for index, fields in errors.items()}
+            {1: ['age']}
+        """
+        fields = cls.__fields__
+        errors: dict[int, dict[str, FieldValidationError]] = {}
+        columns: dict[str, tuple[list[int], list[Any]]] = {}
+
+        for index, row in enumerate(rows):
+            for name, value in row.items():
+                field = fields.get(name)
+                if field is None:
+                    errors.setdefault(index, {})[name] = FieldValidationError(
                         message=f"Field '{name}' does not exist",
                         field_name=name,
                         code="field_not_found",
                     )
-                field = self.__fields__[name]
-                if field.readonly:
-                    raise FieldValidationError(
+                elif field.readonly:
+                    errors.setdefault(index, {})[name] = FieldValidationError(
                         message=f"Field '{name}' is readonly",
                         field_name=name,
                         code="field_readonly",
                     )
-                try:
-                    field_context = {**context, "field_name": name}
-                    await field.validate(value, context=field_context)
-                except ValueError as e:
-                    raise FieldValidationError(
-                        message=str(e),
+                else:
+                    indexes, values = columns.setdefault(name, ([], []))
+                    indexes.append(index)
+                    values.append(value)
+
+        if operation == "create":
+            required = [name for name, field in fields.items() if field.required and not field.system]
+            for index, row in enumerate(rows):
+                for name in required:
+                    if row.get(name) is None:
+                        errors.setdefault(index, {})[name] = FieldValidationError(
+                            message=f"Field '{name}' is required",
+                            field_name=name,
+                            code="required",
+                        )
+
+        context: dict[str, Any] = {
+            "model": model if model is not None else cls,
+            "env": getattr(cls, "_env", None),
+            "operation": operation,
+        }
+        for name, (indexes, values) in columns.items():
+            column_errors = await fields[name].validate_many(
+                values,
+                {**context, "field_name": name},
+                rows=[rows[index] for index in indexes],
+            )
+            for position, error in column_errors.items():
+                errors.setdefault(indexes[position], {}).setdefault(name, error)
+
+        if check_unique:
+            exclude_ids = list(model.ids) if operation == "write" and isinstance(model, BaseModel) else None
+            await cls._check_unique(columns, errors, exclude_ids)
+
+        return errors
+
+    @classmethod
+    async def _check_unique(
+        cls,
+        columns: dict[str, tuple[list[int], list[Any]]],
+        errors: dict[int, dict[str, FieldValidationError]],
+        exclude_ids: list[str] | None,
+    ) -> None:
+        """Report values of unique fields that are taken.
+
+        Args:
+            columns: Row indexes and values by field name
+            errors: Errors by row index and field name, updated in place
+            exclude_ids: IDs of records being written, their own values are not conflicts
+        """
+        for name, field in unique_fields(cls).items():
+            if name not in columns:
+                continue
+
+            candidates: dict[Any, tuple[int, Any]] = {}
+            for index, value in zip(*columns[name], strict=True):
+                if value is None or name in errors.get(index, {}):
+                    continue
+                key = unique_key(field, field.to_query_value(value))
+                if key in candidates:
+                    errors.setdefault(index, {})[name] = FieldValidationError(
+                        message=f"Value '{value}' is repeated in the batch for field '{name}'",
                         field_name=name,
-                        code="field_validation_error",
-                    ) from e
+                        code=UNIQUE_CODE,
+                    )
+                else:
+                    candidates[key] = (index, value)
+            if not candidates:
+                continue
 
-        except Exception as e:
-            logger.error("Validation failed: %s", str(e))
-            raise
+            existing = await cls._env.adapter.find_existing(
+                cast(type[ModelProtocol], cls),
+                name,
+                [value for _, value in candidates.values()],
+                exclude_ids,
+            )
+            for stored in existing:
+                match = candidates.get(unique_key(field, stored))
+                if match is None:
+                    continue
+                index, value = match
+                errors.setdefault(index, {})[name] = FieldValidationError(
+                    message=f"Value '{value}' already exists for field '{name}'",
+                    field_name=name,
+                    code=UNIQUE_CODE,
+                )
 
     @property
     def id(self) -> str:
@@ -816,6 +1233,153 @@ class BaseModel(metaclass=ModelMeta):
         query = await cls._env.adapter.get_aggregate_query(cast(type[ModelProtocol], cls))
         return query
 
+    @classmethod
+    def materialized(cls, name: str) -> Any:
+        """Get materialized aggregate view declared in ``_materialized``.
+
+        Args:
+            name: View name
+
+        Returns:
+            MaterializedView: View reading and refreshing the precomputed groups
+
+        Raises:
+            KeyError: If the model declares no such view
+
+        Examples:
+            >>> view = SaleOrder.materialized("sales_by_day")
+            >>> await view.refresh()
+            >>> rows = await view.rows(sort=[("_id.day", -1)], limit=30)
+        """
+        return cls._env.adapter.materialized_view(cast(type[ModelProtocol], cls), name)
+
+    @classmethod
+    def subscribe(cls, domain: list[tuple[str, Operator, ValueType] | LogicalOp] | None = None) -> Any:
+        """Subscribe to changes of records matching a domain.
+
+        Changes come from the change stream watcher, so they include writes
+        made by other processes. Deletes are delivered to every subscription
+        of the model since deleted documents can no longer be matched.
+
+        Args:
+            domain: Domain the changed records must match, all records when empty
+
+        Returns:
+            Subscription: Async iterator of ``ChangeEvent``
+
+        Raises:
+            RuntimeError: If change streams are not enabled
+            ValueError: If the domain is invalid
+
+        Examples:
+            >>> async with SaleOrder.subscribe([("state", "=", "done")]) as changes:
+            ...     async for change in changes:
+            ...         print(change.operation, change.id)
+        """
+        watcher = getattr(cls._env, "watcher", None)
+        if watcher is None or not watcher.running:
+            raise RuntimeError("Change streams are not enabled, set change_streams_enabled in the configuration")
+        return watcher.subscribe(cls, domain)
+
+    @classmethod
+    async def read_group(
+        cls,
+        domain: list[tuple[str, Operator, ValueType] | LogicalOp] | None,
+        groupby: list[str],
+        aggregates: list[str] | None = None,
+        orderby: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        lazy: bool = True,
+    ) -> list[Group]:
+        """Group and aggregate records on the server.
+
+        Args:
+            domain: Search domain expression
+            groupby: Group specs, ``field`` or ``date_field:granularity``
+                with granularity hour, day, week, month (default), quarter or year
+            aggregates: Aggregate specs ``field:function`` with function
+                sum, avg, min, max, count or count_distinct
+            orderby: Comma separated group or aggregate specs (or ``__count``)
+                with optional asc/desc
+            limit: Maximum number of groups
+            offset: Number of groups to skip
+            lazy: Group on the first spec only, sub-groups are read by ``Group.expand``
+
+        Returns:
+            List[Group]: Groups with their keys, aggregates, count and domain
+
+        Raises:
+            ValueError: If a spec is invalid
+            DatabaseError: If aggregation fails
+
+        Examples:
+            >>> groups = await Order.read_group(
+            ...     [("state", "!=", "cancel")],
+            ...     groupby=["state", "create_date:month"],
+            ...     aggregates=["amount:sum", "id:count"],
+            ... )
+            >>> [(group["state"], group["amount:sum"]) for group in groups]
+            [('done', Decimal('10234.50')), ('draft', Decimal('310.00'))]
+        """
+        return await _read_group(cls, domain, groupby, aggregates, orderby, limit, offset, lazy)
+
+    @classmethod
+    async def distinct(
+        cls,
+        field: str,
+        domain: list[tuple[str, Operator, ValueType] | LogicalOp] | None = None,
+    ) -> list[Any]:
+        """Get distinct values of a field among records matching a domain.
+
+        Args:
+            field: Field name, list and set fields give their distinct elements
+            domain: Search domain expression
+
+        Returns:
+            List[Any]: Values, most frequent first, without None
+
+        Raises:
+            ValueError: If the field is unknown
+            DatabaseError: If aggregation fails
+
+        Examples:
+            >>> await Product.distinct("brand", [("active", "=", True)])
+            ['acme', 'globex']
+        """
+        return await _distinct(cls, field, domain)
+
+    @classmethod
+    async def facets(
+        cls,
+        domain: list[tuple[str, Operator, ValueType] | LogicalOp] | None,
+        fields: list[str],
+        limit_per_facet: int | None = None,
+    ) -> dict[str, list[tuple[Any, int]]]:
+        """Count records matching a domain per value of several fields.
+
+        All fields are counted by one ``$facet`` pipeline. Results are reused
+        for a few seconds by the adapter's count cache, and dropped when the
+        adapter writes to the collection.
+
+        Args:
+            domain: Search domain expression
+            fields: Field names, list and set fields count their elements
+            limit_per_facet: Maximum number of values per field, most frequent first
+
+        Returns:
+            Dict[str, List[Tuple[Any, int]]]: Values and record counts by field
+
+        Raises:
+            ValueError: If no field is given, a field is unknown or the limit is not positive
+            DatabaseError: If aggregation fails
+
+        Examples:
+            >>> await Product.facets([("active", "=", True)], fields=["brand", "tags"], limit_per_facet=10)
+            {'brand': [('acme', 120), ('globex', 37)], 'tags': [('sale', 80), ('new', 12)]}
+        """
+        return await _facets(cls, domain, fields, limit_per_facet)
+
     @classmethod
     async def join(
         cls,
@@ -833,7 +1397,7 @@ class BaseModel(metaclass=ModelMeta):
         Returns:
             Join query builder
         """
-        logger.info(
+        _trace(
             "Creating join query for model %s with %s",
             cls._name,
             model,
@@ -934,40 +1498,234 @@ class BaseModel(metaclass=ModelMeta):
                 )
                 return cls._browse(env, [str(record_id)])
 
+        except FieldValidationError:
+            raise
         except Exception as e:
             logger.error("Failed to create records: %s", str(e), exc_info=True)
             raise DatabaseError(message=str(e), backend=cls._env.adapter.backend_type) from e
 
+    @classmethod
+    async def upsert(
+        cls,
+        domain: list[tuple[str, Operator, ValueType] | LogicalOp],
+        values: dict[str, Any],
+        on_insert: dict[str, Any] | None = None,
+    ) -> Self:
+        """Update the record matching a domain, or create it, in one atomic operation.
+
+        Equality conditions of the domain are copied into a created record.
+        ``created_at`` and the ``on_insert`` values are only set when the
+        record is created (``$setOnInsert``), ``updated_at`` is set in any case.
+        Concurrent upserts of the same record need a unique index on the
+        domain fields, otherwise each of them may create a record.
+
+        Args:
+            domain: Domain matching at most one record
+            values: Field values set in any case
+            on_insert: Field values only set when the record is created
+
+        Returns:
+            Self: Updated or created record
+
+        Raises:
+            ValueError: If the domain is empty
+            FieldValidationError: If validation fails or a unique index rejects the record
+            DatabaseError: If upsert fails
+
+        Examples:
+            >>> stats = await DailyStats.upsert(
+            ...     [("day", "=", "2024-03-01"), "&", ("page", "=", "/")],
+            ...     {"last_visit": now},
+            ...     on_insert={"first_visit": now},
+            ... )
+        """
+        record, _ = await cls._upsert(domain, values, on_insert or {})
+        return record
+
+    @classmethod
+    async def get_or_create(
+        cls,
+        domain: list[tuple[str, Operator, ValueType] | LogicalOp],
+        defaults: dict[str, Any] | None = None,
+    ) -> tuple[Self, bool]:
+        """Get the record matching a domain, or create it, in one atomic operation.
+
+        A matching record is left untouched; a created record gets the
+        equality conditions of the domain and the default values.
+
+        Args:
+            domain: Domain matching at most one record
+            defaults: Field values of a created record
+
+        Returns:
+            Tuple[Self, bool]: Record and whether it was created
+
+        Raises:
+            ValueError: If the domain is empty
+            FieldValidationError: If validation fails or a unique index rejects the record
+            DatabaseError: If upsert fails
+
+        Examples:
+            >>> tag, created = await Tag.get_or_create([("name", "=", "python")], {"color": "blue"})
+        """
+        return await cls._upsert(domain, {}, defaults or {}, touch=False)
+
+    @classmethod
+    async def upsert_many(
+        cls,
+        rows: Sequence[dict[str, Any]],
+        keys: Sequence[str],
+        on_insert: dict[str, Any] | None = None,
+    ) -> dict[str, int]:
+        """Update or create many records with one bulk write.
+
+        Each row updates the record whose ``keys`` fields equal the row's
+        values, or creates it. Rows are written unordered, in one round trip.
+
+        Args:
+            rows: Field values of each record, including the key fields
+            keys: Fields identifying a record
+            on_insert: Field values only set when a record is created
+
+        Returns:
+            Dict[str, int]: Numbers of ``matched``, ``modified`` and ``inserted`` records
+
+        Raises:
+            ValueError: If no keys are given or a row misses a key field
+            FieldValidationError: If validation fails or a unique index rejects a record
+            DatabaseError: If upsert fails
+
+        Examples:
+            >>> await Product.upsert_many(feed, keys=["sku"], on_insert={"active": True})
+        """
+        if not keys:
+            raise ValueError("Upsert requires key fields")
+        errors = await cls.validate_batch([{**(on_insert or {}), **row} for row in rows], operation="write")
+        if errors:
+            index, row_errors = next(iter(errors.items()))
+            logger.debug("Upsert row %d of %s is invalid", index, cls._name)
+            raise next(iter(row_errors.values()))
+
+        adapter_rows: list[tuple[DomainExpression, dict[str, Any], dict[str, Any]]] = []
+        for row in rows:
+            missing = [key for key in keys if key not in row]
+            if missing:
+                raise ValueError(f"Upsert row misses key fields {missing}")
+            domain: list[Any] = []
+            for key in keys:
+                domain += ["&", (key, "=", row[key])] if domain else [(key, "=", row[key])]
+            values, insert_values = await cls._prepare_upsert(row, on_insert or {})
+            adapter_rows.append((DomainExpression(domain), values, insert_values))
+
+        adapter = cls._env.adapter
+        try:
+            return await adapter.upsert_many(cast(type[ModelProtocol], cls), adapter_rows)
+        except (FieldValidationError, DatabaseError):
+            raise
+        except Exception as e:
+            logger.error("Failed to upsert %s records: %s", cls._name, str(e), exc_info=True)
+            raise DatabaseError(message=str(e), backend=adapter.backend_type) from e
+
+    @classmethod
+    async def _upsert(
+        cls,
+        domain: list[tuple[str, Operator, ValueType] | LogicalOp],
+        values: dict[str, Any],
+        on_insert: dict[str, Any],
+        touch: bool = True,
+    ) -> tuple[Self, bool]:
+        """Validate values and upsert one record.
+
+        Args:
+            domain: Domain matching at most one record
+            values: Field values set in any case
+            on_insert: Field values only set when the record is created
+            touch: Whether ``updated_at`` is set on a matching record
+
+        Returns:
+            Tuple[Self, bool]: Record and whether it was created
+        """
+        if not domain:
+            raise ValueError("Upsert requires a domain")
+        errors = await cls.validate_batch([{**on_insert, **values}], operation="write")
+        if errors:
+            raise next(iter(errors[0].values()))
+
+        env = await cls._get_env()
+        set_values, insert_values = await cls._prepare_upsert(values, on_insert, touch)
+        try:
+            record_id, created = await cls._env.adapter.upsert(
+                cast(type[ModelProtocol], cls),
+                DomainExpression(cast(list[Any], list(domain))),
+                set_values,
+                insert_values,
+            )
+        except (FieldValidationError, DatabaseError):
+            raise
+        except Exception as e:
+            logger.error("Failed to upsert %s: %s", cls._name, str(e), exc_info=True)
+            raise DatabaseError(message=str(e), backend=cls._env.adapter.backend_type) from e
+        return cls._browse(env, [record_id]), created
+
+    @classmethod
+    async def _prepare_upsert(
+        cls, values: dict[str, Any], on_insert: dict[str, Any], touch: bool = True
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Convert values of an upsert and split them by when they are set.
+
+        Args:
+            values: Field values set in any case
+            on_insert: Field values only set when the record is created
+            touch: Whether ``auto_now`` fields are set in any case
+
+        Returns:
+            Tuple[Dict[str, Any], Dict[str, Any]]: Database values set in any
+            case and database values only set on creation, such as ``created_at``
+        """
+        db_vals = await cls._convert_to_db({**on_insert, **values})
+        always = set(values)
+        if touch:
+            always.update(name for name, field in cls.__fields__.items() if getattr(field, "auto_now", False))
+        return (
+            {name: value for name, value in db_vals.items() if name in always},
+            {name: value for name, value in db_vals.items() if name not in always},
+        )
+
     @api.one
     async def to_dict(self, fields: list[str] | None = None, exclude: list[str] | None = None) -> dict[str, Any]:
-        """Convert model to dictionary."""
-        result: dict[str, Any] = {}
+        """Convert model to dictionary.
 
+        The record is read with a single query and decoded by the model codec.
+        Fields that cannot be read or converted are set to None.
+        """
         if not fields:
             fields = list(self.__fields__.keys())
 
-        logger.info(f"Getting fields: {self.__fields__}")
-
-        for field in fields:
-            try:
-                # Direct database fetch for each field
-                if self._ids:
-                    record_id = self._ids[0]
-                    db_result = await self._env.adapter.read(cast(type[ModelProtocol], type(self)), record_id, [field])
-                    if db_result:
-                        field_obj = self.__fields__[field]
-                        value = await field_obj.from_db(db_result.get(field), self._env.adapter.backend_type)
-                        result[field] = value
-                    else:
-                        result[field] = None
-                else:
-                    result[field] = None
+        if not self._ids:
+            return dict.fromkeys(fields)
 
-            except Exception as e:
-                logger.error(f"Error converting field {field}: {e!s}")
-                result[field] = None
+        backend = self._env.adapter.backend_type
+        try:
+            db_result = await self._env.adapter.read(cast(type[ModelProtocol], type(self)), self._ids[0], fields)
+        except Exception as e:
+            logger.error("Error reading %s:%s: %s", self._name, self._ids[0], str(e))
+            return dict.fromkeys(fields)
+        if not db_result:
+            return dict.fromkeys(fields)
 
-        return result
+        doc = {name: db_result.get(name) for name in fields if name in self.__fields__}
+        try:
+            values = await self._get_codec(backend).decode(doc)
+        except Exception:
+            # Isolate the failing fields
+            values = {}
+            for name, value in doc.items():
+                try:
+                    values[name] = await self.__fields__[name].from_db(value, backend)
+                except Exception as e:
+                    logger.error("Error converting field %s: %s", name, str(e))
+
+        return {name: values.get(name) for name in fields}
 
     def from_dict(self, data: dict[str, Any]) -> None:
         """Update model from dictionary."""
@@ -1028,6 +1786,22 @@ class BaseModel(metaclass=ModelMeta):
         """
         object.__setattr__(self, "_name", name)
 
+    @classmethod
+    def _get_codec(cls, backend: str) -> ModelCodec:
+        """Get model codec for a database backend.
+
+        Args:
+            backend: Database backend type
+
+        Returns:
+            ModelCodec: Codec compiled by the metaclass, recompiled if it targets another backend
+        """
+        codec = cls.__dict__.get("__codec__")
+        if codec is None or codec.backend != backend:
+            codec = ModelCodec(cls.__fields__, backend)
+            cls.__codec__ = codec
+        return codec
+
     @classmethod
     async def _convert_to_db(cls, vals: dict[str, Any]) -> dict[str, Any]:
         """Convert values to database format.
@@ -1046,33 +1820,34 @@ class BaseModel(metaclass=ModelMeta):
         Returns:
             Dict with converted values
 
+        Values are converted by the model codec, which converts primitive
+        fields synchronously in one loop.
+
         Examples:
             >>> user = User()
             >>> db_vals = await user._convert_to_db({"age": 25})
             >>> print(db_vals)  # {"age": 25, "updated_at": "2024-02-06T05:17:43.715Z"}
         """
-        db_vals: dict[str, Any] = {}
         backend = cls._env.adapter.backend_type
+        fields = cls.__fields__
 
-        # Convert fields that are in vals
-        for name, value in vals.items():
-            if name in cls.__fields__:
-                field = cls.__fields__[name]
-                # Skip readonly and system fields unless explicitly allowed
-                if not field.readonly or getattr(field, "system", False):
-                    db_vals[name] = await field.to_db(value, backend)
-
-        # Handle system fields and auto fields
-        for name, field in cls.__fields__.items():
-            if name not in db_vals and getattr(field, "system", False):
-                # Handle auto timestamp fields
-                if getattr(field, "auto_now_add", False) or getattr(field, "auto_now", False):
-                    from earnorm.fields.primitive import DateTimeField
+        # Convert fields that are in vals, skipping readonly fields unless they are system fields
+        values = {
+            name: value
+            for name, value in vals.items()
+            if name in fields and (not fields[name].readonly or getattr(fields[name], "system", False))
+        }
+
+        # Handle auto timestamp system fields missing from vals
+        from earnorm.fields.primitive import DateTimeField
 
+        for name, field in fields.items():
+            if name not in values and getattr(field, "system", False):
+                if getattr(field, "auto_now_add", False) or getattr(field, "auto_now", False):
                     if isinstance(field, DateTimeField):
-                        db_vals[name] = await field.to_db(None, backend)
+                        values[name] = None
 
-        return db_vals
+        return await cls._get_codec(backend).encode(values)
 
     async def _create(self, vals: dict[str, Any]) -> None:
         """Create record in database.
@@ -1109,14 +1884,14 @@ class BaseModel(metaclass=ModelMeta):
             Number of records deleted
         """
         try:
-            # Build delete query
-            query = await self._where_calc([("id", "in", list(self._ids))])
-
             # Execute delete
-            result = cast(dict[str, int], await query.delete())
-            deleted_count = result.get("deleted_count", 0)
+            domain_expr = DomainExpression([("id", "in", list(self._ids))])
+            deleted_count = await self._env.adapter.delete(cast(type[ModelProtocol], type(self)), domain_expr)
 
-            if deleted_count != len(self._ids):
+            if current_unit_of_work() is not None:
+                # Deletion is recorded and runs when the unit of work commits
+                deleted_count = len(self._ids)
+            elif deleted_count != len(self._ids):
                 self.logger.warning(f"Deleted {deleted_count} records out of {len(self._ids)}")
 
             # Clear cache before clearing recordset data
@@ -0,0 +1,158 @@
+"""Precompiled model codecs.
+
+This module provides the per-model codec built by ``ModelMeta`` when a model
+class is created. The codec converts whole documents between Python values
+and database values:
+- Primitive fields (string, numbers, boolean, datetime, ObjectId, decimal,
+  enum) are converted by synchronous converters in one loop, without a
+  coroutine per value
+- Fields that need I/O (relations, files, ...) still go through their
+  awaited ``to_db``/``from_db``
+
+Examples:
+    >>> codec = User.__codec__
+    >>> codec.sync_fields
+    ('id', 'name', 'age', 'created_at', 'updated_at')
+
+    >>> db_vals = await codec.encode({"name": "John", "age": 30})
+    >>> values = await codec.decode({"name": "John", "age": 30, "created_at": now})
+
+    >>> # Models with only primitive fields can skip the event loop entirely
+    >>> if codec.is_sync:
+    ...     values = codec.decode_sync(doc)
+"""
+
+from collections.abc import Callable, Mapping
+from functools import partial
+from typing import Any
+
+from earnorm.fields.base import BaseField
+
+Converter = Callable[[Any], Any]
+
+DEFAULT_BACKEND = "mongodb"
+
+
+def _has_sync_codec(field: BaseField[Any]) -> bool:
+    """Check if field can be converted synchronously.
+
+    Fields that override the awaited ``to_db``/``from_db`` keep their own
+    conversion even if a base class provides synchronous converters.
+
+    Args:
+        field: Field to check
+
+    Returns:
+        bool: True if to_db_sync/from_db_sync are equivalent to to_db/from_db
+    """
+    field_type = type(field)
+    return field.sync_codec and field_type.to_db is BaseField.to_db and field_type.from_db is BaseField.from_db
+
+
+class ModelCodec:
+    """Document encoder/decoder for one model.
+
+    Args:
+        fields: Model fields by name
+        backend: Database backend the converters target
+    """
+
+    __slots__ = ("_async_fields", "_decoders", "_encoders", "backend", "entries")
+
+    def __init__(self, fields: Mapping[str, BaseField[Any]], backend: str = DEFAULT_BACKEND) -> None:
+        """Compile converters for model fields.
+
+        Args:
+            fields: Model fields by name
+            backend: Database backend the converters target
+        """
+        self.backend = backend
+        self.entries: list[tuple[str, Converter, Converter]] = []
+        self._async_fields: dict[str, BaseField[Any]] = {}
+
+        for name, field in fields.items():
+            if _has_sync_codec(field):
+                encoder = partial(field.to_db_sync, backend=backend)
+                decoder = partial(field.from_db_sync, backend=backend)
+                self.entries.append((name, encoder, decoder))
+            else:
+                self._async_fields[name] = field
+
+        self._encoders = {name: encoder for name, encoder, _ in self.entries}
+        self._decoders = {name: decoder for name, _, decoder in self.entries}
+
+    @property
+    def sync_fields(self) -> tuple[str, ...]:
+        """Get names of fields converted synchronously."""
+        return tuple(name for name, _, _ in self.entries)
+
+    @property
+    def async_fields(self) -> tuple[str, ...]:
+        """Get names of fields converted by awaiting the field."""
+        return tuple(self._async_fields)
+
+    @property
+    def is_sync(self) -> bool:
+        """Check if every field is converted synchronously."""
+        return not self._async_fields
+
+    def encode_sync(self, values: Mapping[str, Any]) -> dict[str, Any]:
+        """Encode values of synchronously converted fields.
+
+        Values of other fields and unknown names are skipped.
+
+        Args:
+            values: Python values by field name
+
+        Returns:
+            Dict[str, Any]: Database values
+        """
+        encoders = self._encoders
+        return {name: encoders[name](value) for name, value in values.items() if name in encoders}
+
+    def decode_sync(self, doc: Mapping[str, Any]) -> dict[str, Any]:
+        """Decode values of synchronously converted fields.
+
+        Fields missing from the document are skipped.
+
+        Args:
+            doc: Database document
+
+        Returns:
+            Dict[str, Any]: Python values
+        """
+        return {name: decoder(doc[name]) for name, _, decoder in self.entries if name in doc}
+
+    async def encode(self, values: Mapping[str, Any]) -> dict[str, Any]:
+        """Encode values to database format.
+
+        Args:
+            values: Python values by field name, unknown names are skipped
+
+        Returns:
+            Dict[str, Any]: Database values
+        """
+        result = self.encode_sync(values)
+        for name, field in self._async_fields.items():
+            if name in values:
+                result[name] = await field.to_db(values[name], self.backend)
+        return result
+
+    async def decode(self, doc: Mapping[str, Any]) -> dict[str, Any]:
+        """Decode database document to Python values.
+
+        Args:
+            doc: Database document, fields missing from it are skipped
+
+        Returns:
+            Dict[str, Any]: Python values
+        """
+        result = self.decode_sync(doc)
+        for name, field in self._async_fields.items():
+            if name in doc:
+                result[name] = await field.from_db(doc[name], self.backend)
+        return result
+
+    def __repr__(self) -> str:
+        """Get string representation."""
+        return f"ModelCodec(backend={self.backend!r}, sync={len(self.entries)}, async={len(self._async_fields)})"
@@ -0,0 +1,77 @@
+"""Per-call model context.
+
+This module provides the proxy returned by ``BaseModel.with_context``. The
+proxy forwards attribute access to the model class and applies its read
+options to every coroutine method awaited through it.
+
+Examples:
+    >>> reports = User.with_context(read="secondaryPreferred", read_concern="majority")
+    >>> users = await reports.search([("active", "=", True)])
+    >>> total = await reports.search_count()
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from typing import Any
+
+from earnorm.base.database.read_options import ReadOptions, use_read_options
+
+
+class ModelContext:
+    """Model proxy applying read options to awaited model methods.
+
+    Args:
+        model: Model class or recordset
+        read_options: Read options applied while methods run
+    """
+
+    __slots__ = ("_model", "_read_options")
+
+    def __init__(self, model: Any, read_options: ReadOptions) -> None:
+        """Initialize model context.
+
+        Args:
+            model: Model class or recordset
+            read_options: Read options applied while methods run
+        """
+        self._model = model
+        self._read_options = read_options
+
+    @property
+    def read_options(self) -> ReadOptions:
+        """Get read options of this context."""
+        return self._read_options
+
+    def with_context(self, read: str | None = None, read_concern: str | None = None) -> ModelContext:
+        """Derive context with additional read options.
+
+        Args:
+            read: Read preference mode
+            read_concern: Read concern level
+
+        Returns:
+            ModelContext: New context, unset options inherited from this one
+        """
+        options = ReadOptions(preference=read, concern=read_concern).merge(self._read_options)
+        return ModelContext(self._model, options)
+
+    def __getattr__(self, name: str) -> Any:
+        """Get model attribute, binding coroutine methods to the read options."""
+        attr = getattr(self._model, name)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+
+        options = self._read_options
+
+        @functools.wraps(attr)
+        async def bound(*args: Any, **kwargs: Any) -> Any:
+            with use_read_options(options):
+                return await attr(*args, **kwargs)
+
+        return bound
+
+    def __repr__(self) -> str:
+        """Get string representation."""
+        return f"ModelContext({self._model!r}, {self._read_options})"
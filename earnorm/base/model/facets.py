@@ -0,0 +1,139 @@
+"""Distinct values and faceted counts.
+
+This module implements ``BaseModel.distinct`` and ``BaseModel.facets``:
+filter sidebars show the values of several fields with the number of
+records matching the current domain for each value. All fields are counted
+by a single ``$match`` / ``$facet`` pipeline, so the domain is evaluated
+once however many facets are shown. Values are decoded by their field
+codecs, and elements of list and set fields are counted one by one.
+
+Results are kept in the adapter's count cache, keyed by collection,
+normalized domain and facet spec, and dropped when the adapter writes to
+the collection.
+
+Examples:
+    >>> await Product.facets([("active", "=", True)], fields=["brand", "tags"], limit_per_facet=10)
+    {'brand': [('acme', 120), ('globex', 37)], 'tags': [('sale', 80), ('new', 12)]}
+    >>> await Product.distinct("brand", [("active", "=", True)])
+    ['acme', 'globex']
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from earnorm.fields.composite.list import ListField
+from earnorm.fields.composite.set import SetField
+
+
+def _field(model: type[Any], name: str) -> Any:
+    """Get stored model field.
+
+    Args:
+        model: Model class
+        name: Field name
+
+    Returns:
+        Field instance
+
+    Raises:
+        ValueError: If the model has no such stored field
+    """
+    field_obj = getattr(model, "__fields__", {}).get(name)
+    if field_obj is None or not getattr(field_obj, "store", True):
+        raise ValueError(f"Unknown stored field {name!r} on model {model._name}")
+    return field_obj
+
+
+async def _decode(field_obj: Any, value: Any, backend: str) -> Any:
+    """Decode stored value with its field codec.
+
+    Args:
+        field_obj: Field, or None for the record ID
+        value: Stored value
+        backend: Database backend type
+
+    Returns:
+        Any: Python value
+    """
+    if value is None:
+        return None
+    if field_obj is None:
+        return str(value)
+    return await field_obj.from_db(value, backend)
+
+
+async def facets(
+    model: type[Any],
+    domain: list[Any] | None,
+    fields: list[str],
+    limit_per_facet: int | None = None,
+) -> dict[str, list[tuple[Any, int]]]:
+    """Count records matching a domain per value of several fields.
+
+    Args:
+        model: Model class
+        domain: Domain selecting the counted records
+        fields: Field names, list and set fields count their elements
+        limit_per_facet: Maximum number of values per field
+
+    Returns:
+        Dict[str, List[Tuple[Any, int]]]: Values and record counts by field,
+        most frequent first, then by stored value; None counts records
+        without a value
+
+    Raises:
+        ValueError: If no field is given, a field is unknown or the limit is not positive
+        DatabaseError: If aggregation fails
+    """
+    if not fields:
+        raise ValueError("facets requires at least one field")
+    if limit_per_facet is not None and limit_per_facet <= 0:
+        raise ValueError("limit_per_facet must be positive")
+    fields = list(dict.fromkeys(fields))
+    field_objs = {name: _field(model, name) for name in fields}
+    unwind = [name for name, field_obj in field_objs.items() if isinstance(field_obj, (ListField, SetField))]
+    domain = list(domain or [])
+
+    adapter = model._env.adapter
+    cache = adapter.count_cache
+    collection = adapter.cache_name(model)
+    kind = f"facets:{','.join(fields)}:{limit_per_facet}"
+    result: dict[str, list[tuple[Any, int]]] | None = cache.get(collection, domain, kind)
+    if result is None:
+        query = await adapter.query(model)
+        query.reset()
+        if domain:
+            query = query.filter(domain)
+        counts = await query.value_counts(fields, limit_per_facet, unwind)
+
+        backend = adapter.backend_type
+        result = {}
+        for name in fields:
+            field_obj = None if name == "id" else field_objs[name]
+            if name in unwind:
+                field_obj = field_objs[name].element_field
+            result[name] = [(await _decode(field_obj, value, backend), count) for value, count in counts[name]]
+        cache.set(collection, domain, result, kind)
+
+    # Callers get their own lists, the cached result stays unchanged
+    return {name: list(values) for name, values in result.items()}
+
+
+async def distinct(model: type[Any], field: str, domain: list[Any] | None = None) -> list[Any]:
+    """Get distinct values of a field among records matching a domain.
+
+    Args:
+        model: Model class
+        field: Field name, list and set fields give their distinct elements
+        domain: Domain selecting the records
+
+    Returns:
+        List[Any]: Values, most frequent first, without None
+
+    Raises:
+        ValueError: If the field is unknown
+        DatabaseError: If aggregation fails
+    """
+    counts = await facets(model, domain, [field])
+    return [value for value, _ in counts[field] if value is not None]
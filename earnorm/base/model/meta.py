@@ -16,13 +16,17 @@ Key Features:
        - Dependency tracking
        - Name generation
 
-    3. Slot Creation
+    3. Codec Compilation
+       - Synchronous converters for primitive fields
+       - One document conversion loop per record
+
+    4. Slot Creation
        - Memory optimization
        - Attribute access control
        - Performance improvement
        - Type safety
 
-    4. Inheritance Tracking
+    5. Inheritance Tracking
        - Base class tracking
        - Mixin support
        - Abstract class handling
@@ -91,6 +95,7 @@ from typing import (
 )
 
 from earnorm.base.database.transaction.base import Transaction
+from earnorm.base.model.codec import ModelCodec
 from earnorm.base.model.descriptors import AsyncFieldDescriptor
 from earnorm.fields import BaseField
 from earnorm.fields.relations.base import RelationField
@@ -189,6 +194,7 @@ def process_pending_reverse_relationships() -> None:
                 # Add to __fields__ if it exists
                 if hasattr(target_class, '__fields__'):
                     target_class.__fields__[related_name] = reverse_field
+                    target_class.__codec__ = ModelCodec(target_class.__fields__)
 
                 logger.info(f"Created reverse relationship: {target_model}.{related_name} -> {source_model}")
                 processed.append((source_model, target_model, field_name, related_name, field_options))
@@ -285,6 +291,9 @@ class BaseModel(ModelProtocol):
     __fields__: ClassVar[dict[str, BaseField[Any]]]
     """Model fields dictionary."""
 
+    __codec__: ClassVar[ModelCodec]
+    """Document codec compiled from model fields."""
+
     fields: dict[str, BaseField[Any]]
     """Model fields dictionary (alias for __fields__)."""
 
@@ -657,8 +666,9 @@ class ModelMeta(type):
                 fields_dict["id"] = id_field
                 attrs["id"] = AsyncFieldDescriptor(id_field)
 
-        # Set __fields__ class variable
+        # Set __fields__ class variable and compile document codec
         attrs["__fields__"] = fields_dict
+        attrs["__codec__"] = ModelCodec(fields_dict)
 
         # Create class
         cls = cast(type[BaseModel], super().__new__(mcs, name, bases, attrs))
@@ -797,6 +807,15 @@ class ModelMeta(type):
         except Exception as e:
             logger.warning(f"Failed to cleanup registration for {model_name}: {e}")
 
+    @classmethod
+    def registered_models(mcs) -> list[type[BaseModel]]:
+        """Get all registered model classes.
+
+        Returns:
+            list[type[BaseModel]]: Model classes in registration order
+        """
+        return list(_model_registry.values())
+
     @classmethod
     def register_deferred_models(mcs) -> None:
         """Register models that were deferred due to uninitialized environment.
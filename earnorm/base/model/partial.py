@@ -0,0 +1,261 @@
+"""Partial update preparation.
+
+This module validates and converts the values of partial updates made
+through ``BaseModel.append``, ``extend``, ``remove``, ``add_to_set``,
+``dict_set`` and ``increment``. Only the new values are checked:
+- Array elements are validated by the element field of the list or set
+- Values set at a dotted path are validated by the value field of the
+  dictionary, or normalized like a JSON value inside ``JSONField`` documents
+- Increments must be numbers of the field's type
+
+Constraints on the whole value (list length, element uniqueness of lists,
+number ranges, JSON schemas) cannot be checked without reading the stored
+value and are left to the caller.
+
+Examples:
+    >>> update = await prepare_update(orders, "push", "lines", [{"sku": "A1", "qty": 2}])
+    >>> update.to_mongo()
+    {'$each': [{'sku': 'A1', 'qty': 2}]}
+"""
+
+from collections.abc import Sequence
+from decimal import Decimal
+from typing import Any
+
+from earnorm.base.database.update_ops import ARRAY_OPERATORS, FieldUpdate, UpdateOperator
+from earnorm.exceptions import FieldValidationError
+from earnorm.fields.base import BaseField
+from earnorm.fields.composite.dict import DictField
+from earnorm.fields.composite.list import ListField
+from earnorm.fields.composite.set import SetField
+from earnorm.fields.primitive.decimal import DecimalField
+from earnorm.fields.primitive.json import JSONField
+from earnorm.fields.primitive.number import DecimalField as NumberDecimalField, FloatField, IntegerField
+
+_VALUE_ERRORS = (FieldValidationError, ValueError, TypeError)
+
+
+def _error(field_name: str, message: str, code: str) -> FieldValidationError:
+    """Build partial update error.
+
+    Args:
+        field_name: Name of the updated field
+        message: Error message
+        code: Error code
+
+    Returns:
+        FieldValidationError: Error to raise
+    """
+    return FieldValidationError(message=message, field_name=field_name, code=code)
+
+
+def _resolve(field: BaseField[Any], keys: Sequence[str]) -> tuple[BaseField[Any], bool]:
+    """Get field describing the value at a path below a field.
+
+    Args:
+        field: Document field the path starts in
+        keys: Path keys below the field
+
+    Returns:
+        The describing field, and whether the path points inside a schemaless
+        JSON value of that field
+
+    Raises:
+        ValueError: If the path cannot exist in values of the field
+    """
+    for key in keys:
+        if isinstance(field, JSONField):
+            return field, True
+        if not isinstance(field, DictField):
+            raise ValueError(f"'{key}' is below a field that is not a dictionary")
+        field = field.get_value_field()
+    return field, False
+
+
+async def _convert(field: BaseField[Any], value: Any, context: dict[str, Any], backend: str) -> Any:
+    """Validate value with a field and convert it to database format.
+
+    Args:
+        field: Field describing the value
+        value: Python value
+        context: Validation context
+        backend: Database backend type
+
+    Returns:
+        Any: Database value
+    """
+    validated = await field.validate(value, context)
+    return await field.to_db(validated, backend)
+
+
+def _convert_json(field: JSONField, value: Any, backend: str) -> Any:
+    """Convert value stored inside a JSON document.
+
+    Args:
+        field: JSON field holding the document
+        value: Python value
+        backend: Database backend type
+
+    Returns:
+        Any: Database value
+
+    Raises:
+        ValueError: If the field does not store documents on the backend
+    """
+    if not field._is_native(backend):  # pylint: disable=protected-access
+        raise ValueError("values stored as JSON strings cannot be updated by path")
+    return field.to_db_sync(value, backend)
+
+
+async def prepare_update(
+    model: Any,
+    operator: UpdateOperator,
+    path: str,
+    values: Sequence[Any],
+    backend: str = "mongodb",
+) -> FieldUpdate:
+    """Validate and convert the values of a partial update.
+
+    Args:
+        model: Recordset or model class being updated
+        operator: Update operator
+        path: Field name, or dotted path for ``set`` and ``inc``
+        values: Elements for array operators, a single value for ``set`` and ``inc``
+        backend: Database backend type
+
+    Returns:
+        FieldUpdate: Update holding database values
+
+    Raises:
+        FieldValidationError: With codes:
+            - field_not_found: Field does not exist or is not stored
+            - field_readonly: Field is readonly
+            - invalid_path: Path cannot exist in values of the field
+            - invalid_operator: Operator does not apply to the field
+            - invalid_element: An array element is invalid
+            - invalid_value: A value set at a path is invalid
+            - invalid_type: An increment is not a number of the field's type
+    """
+    keys = path.split(".")
+    name = keys[0]
+    field = model.__fields__.get(name)
+    if field is None or not field.store:
+        raise _error(name, f"Field '{name}' does not exist", "field_not_found")
+    if field.readonly:
+        raise _error(name, f"Field '{name}' is readonly", "field_readonly")
+    if any(not key or key.startswith("$") for key in keys):
+        raise _error(name, f"Invalid path '{path}'", "invalid_path")
+
+    context: dict[str, Any] = {
+        "model": model,
+        "env": getattr(model, "_env", None),
+        "operation": "write",
+        "field_name": name,
+    }
+
+    if operator in ARRAY_OPERATORS:
+        return await _prepare_elements(field, operator, path, values, context, backend)
+
+    if len(keys) == 1 and operator == "set":
+        raise _error(name, f"Use write() to replace field '{name}'", "invalid_path")
+    try:
+        target, inside = _resolve(field, keys[1:])
+    except ValueError as e:
+        raise _error(name, f"Invalid path '{path}': {e!s}", "invalid_path") from e
+
+    (value,) = values
+    if operator == "inc":
+        return FieldUpdate("inc", path, (await _prepare_amount(target, inside, name, value, backend),))
+
+    try:
+        if inside:
+            db_value = _convert_json(target, value, backend)  # type: ignore[arg-type]
+        else:
+            db_value = await _convert(target, value, context, backend)
+    except _VALUE_ERRORS as e:
+        raise _error(name, f"Invalid value for '{path}': {e!s}", "invalid_value") from e
+    return FieldUpdate("set", path, (db_value,))
+
+
+async def _prepare_elements(
+    field: BaseField[Any],
+    operator: UpdateOperator,
+    path: str,
+    values: Sequence[Any],
+    context: dict[str, Any],
+    backend: str,
+) -> FieldUpdate:
+    """Validate and convert array elements.
+
+    Appending to a set field adds missing elements only. Removed elements are
+    converted but not validated.
+
+    Args:
+        field: List or set field
+        operator: Array update operator
+        path: Field name
+        values: New or removed elements
+        context: Validation context
+        backend: Database backend type
+
+    Returns:
+        FieldUpdate: Update holding database elements
+
+    Raises:
+        FieldValidationError: If the field is no list or set, or an element is invalid
+    """
+    if "." in path or not isinstance(field, (ListField, SetField)):
+        raise _error(field.name, f"'{path}' is not a list or set field", "invalid_operator")
+    if operator == "push" and isinstance(field, SetField):
+        operator = "add_to_set"
+
+    element_field = field.element_field
+    elements: list[Any] = []
+    for index, value in enumerate(values):
+        try:
+            if operator == "pull":
+                elements.append(await element_field.to_db(value, backend))
+            else:
+                elements.append(await _convert(element_field, value, {**context, "index": index}, backend))
+        except _VALUE_ERRORS as e:
+            raise _error(field.name, f"Invalid element at index {index}: {e!s}", "invalid_element") from e
+    return FieldUpdate(operator, path, tuple(elements))
+
+
+async def _prepare_amount(target: BaseField[Any], inside: bool, name: str, amount: Any, backend: str) -> Any:
+    """Check and convert an increment.
+
+    Args:
+        target: Field describing the incremented value
+        inside: Whether the value is inside a schemaless JSON document
+        name: Name of the updated field
+        amount: Increment
+        backend: Database backend type
+
+    Returns:
+        Any: Database value of the increment
+
+    Raises:
+        FieldValidationError: If the value is not numeric or the amount does not fit it
+    """
+    if isinstance(amount, bool) or not isinstance(amount, (int, float, Decimal)):
+        raise _error(name, f"Increment must be a number, got {type(amount).__name__}", "invalid_type")
+
+    try:
+        if inside:
+            return _convert_json(target, amount, backend)  # type: ignore[arg-type]
+        if isinstance(target, IntegerField):
+            if not isinstance(amount, int):
+                raise _error(name, f"Increment of integer field '{name}' must be an integer", "invalid_type")
+            return await target.to_db(amount, backend)
+        if isinstance(target, FloatField):
+            if isinstance(amount, Decimal):
+                raise _error(name, f"Increment of float field '{name}' must be an int or float", "invalid_type")
+            return await target.to_db(float(amount), backend)
+        if isinstance(target, (DecimalField, NumberDecimalField)):
+            return await target.to_db(Decimal(str(amount)), backend)
+    except FieldValidationError:
+        raise
+    except (ValueError, TypeError) as e:
+        raise _error(name, f"Invalid increment: {e!s}", "invalid_type") from e
+    raise _error(name, f"Field '{name}' is not numeric", "invalid_operator")
@@ -0,0 +1,434 @@
+"""Grouped reads.
+
+This module implements ``BaseModel.read_group``: records matching a domain
+are grouped and aggregated on the server in a single ``$match`` /
+``$group`` / ``$sort`` pipeline. Group specs are field names, optionally
+with a date granularity (``create_date:month``); aggregate specs are
+``field:function`` pairs (``amount:sum``, ``id:count``).
+
+Group keys and ``min``/``max`` results are decoded by their field codecs,
+and each group carries the domain selecting its records. With ``lazy=True``
+only the first group spec is grouped on and the remaining ones are applied
+when a group is expanded.
+
+Examples:
+    >>> groups = await Order.read_group(
+    ...     [("state", "!=", "cancel")],
+    ...     groupby=["state", "create_date:month"],
+    ...     aggregates=["amount:sum", "id:count"],
+    ...     orderby="amount:sum desc",
+    ... )
+    >>> groups[0].values
+    {'state': 'done', 'amount:sum': Decimal('10234.50'), 'id:count': 42}
+    >>> months = await groups[0].expand()
+    >>> months[0].values["create_date:month"]
+    datetime.datetime(2024, 1, 1, 0, 0)
+    >>> orders = await months[0].records()
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+from earnorm.base.database.query.backends.mongo.operations.aggregate import MongoAggregate
+from earnorm.fields.primitive.datetime import DateTimeField
+
+GRANULARITIES = ("hour", "day", "week", "month", "quarter", "year")
+"""Date granularities supported in group specs."""
+
+DEFAULT_GRANULARITY = "month"
+
+AGGREGATE_FUNCTIONS = ("sum", "avg", "min", "max", "count", "count_distinct")
+"""Functions supported in aggregate specs."""
+
+COUNT_KEY = "__count"
+"""Name of the record count of each group, usable in ``orderby``."""
+
+
+@dataclass(frozen=True)
+class GroupSpec:
+    """Parsed group spec.
+
+    Attributes:
+        key: Spec as given, used as result key
+        field: Grouped field name
+        granularity: Date granularity, or None for plain values
+    """
+
+    key: str
+    field: str
+    granularity: str | None = None
+
+
+@dataclass(frozen=True)
+class AggregateSpec:
+    """Parsed aggregate spec.
+
+    Attributes:
+        key: Spec as given, used as result key
+        field: Aggregated field name
+        function: Aggregate function
+    """
+
+    key: str
+    field: str
+    function: str
+
+
+@dataclass
+class Group:
+    """One group returned by ``read_group``.
+
+    Attributes:
+        values: Group keys and aggregates by spec
+        count: Number of records in the group
+        domain: Domain selecting the records of the group
+        groupby: Group specs left to expand
+    """
+
+    model: Any = field(repr=False)
+    values: dict[str, Any]
+    count: int
+    domain: list[Any]
+    groupby: list[str]
+    aggregates: list[str] = field(default_factory=list, repr=False)
+    orderby: str | None = field(default=None, repr=False)
+
+    def __getitem__(self, key: str) -> Any:
+        """Get group key or aggregate value.
+
+        Args:
+            key: Group or aggregate spec
+
+        Returns:
+            Any: Value of the group
+        """
+        return self.values[key]
+
+    async def expand(self, limit: int | None = None, lazy: bool = True) -> list[Group]:
+        """Group records of this group by the remaining group specs.
+
+        Args:
+            limit: Maximum number of sub-groups
+            lazy: Whether to group on the next spec only
+
+        Returns:
+            List[Group]: Sub-groups, empty when no group spec is left
+        """
+        if not self.groupby:
+            return []
+        return await read_group(
+            self.model,
+            self.domain,
+            self.groupby,
+            self.aggregates,
+            orderby=self.orderby,
+            limit=limit,
+            lazy=lazy,
+        )
+
+    async def records(self) -> Any:
+        """Get records of this group.
+
+        Returns:
+            Recordset of the records in the group
+        """
+        return await self.model.search(self.domain)
+
+
+def parse_groupby(model: type[Any], spec: str) -> GroupSpec:
+    """Parse group spec.
+
+    Args:
+        model: Grouped model
+        spec: Field name, with optional date granularity
+
+    Returns:
+        GroupSpec: Parsed spec
+
+    Raises:
+        ValueError: If the field is unknown or the granularity is invalid
+    """
+    name, _, granularity = spec.partition(":")
+    field_obj = _field(model, name)
+    if isinstance(field_obj, DateTimeField):
+        granularity = granularity or DEFAULT_GRANULARITY
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Invalid granularity {granularity!r} in group spec {spec!r}")
+        return GroupSpec(spec, name, granularity)
+    if granularity:
+        raise ValueError(f"Granularity given for non-date field in group spec {spec!r}")
+    return GroupSpec(spec, name)
+
+
+def parse_aggregate(model: type[Any], spec: str) -> AggregateSpec:
+    """Parse aggregate spec.
+
+    Args:
+        model: Grouped model
+        spec: ``field:function`` pair
+
+    Returns:
+        AggregateSpec: Parsed spec
+
+    Raises:
+        ValueError: If the field is unknown or the function is invalid
+    """
+    name, _, function = spec.partition(":")
+    if function not in AGGREGATE_FUNCTIONS:
+        raise ValueError(f"Invalid aggregate spec {spec!r}, expected field:{'|'.join(AGGREGATE_FUNCTIONS)}")
+    if name != "id":
+        _field(model, name)
+    return AggregateSpec(spec, name, function)
+
+
+def _field(model: type[Any], name: str) -> Any:
+    """Get model field.
+
+    Args:
+        model: Model class
+        name: Field name
+
+    Returns:
+        Field instance
+
+    Raises:
+        ValueError: If the model has no such field
+    """
+    field_obj = getattr(model, "__fields__", {}).get(name)
+    if field_obj is None:
+        raise ValueError(f"Unknown field {name!r} on model {model._name}")
+    return field_obj
+
+
+def _path(name: str) -> str:
+    """Get document path of a field."""
+    return "_id" if name == "id" else name
+
+
+def _accumulator(spec: AggregateSpec) -> dict[str, Any]:
+    """Build ``$group`` accumulator of an aggregate spec.
+
+    Args:
+        spec: Aggregate spec
+
+    Returns:
+        Dict[str, Any]: Accumulator expression
+    """
+    path = f"${_path(spec.field)}"
+    if spec.function == "count":
+        if spec.field == "id":
+            return {"$sum": 1}
+        return {"$sum": {"$cond": [{"$gt": [path, None]}, 1, 0]}}
+    return {f"${spec.function}": path}
+
+
+def _parse_orderby(orderby: str | None) -> list[tuple[str, bool]]:
+    """Parse order spec.
+
+    Args:
+        orderby: Comma separated specs, each optionally followed by asc or desc
+
+    Returns:
+        List[Tuple[str, bool]]: Spec and whether it is descending
+
+    Raises:
+        ValueError: If a direction is invalid
+    """
+    terms: list[tuple[str, bool]] = []
+    for term in (orderby or "").split(","):
+        parts = term.split()
+        if not parts:
+            continue
+        direction = parts[1].lower() if len(parts) > 1 else "asc"
+        if len(parts) > 2 or direction not in ("asc", "desc"):
+            raise ValueError(f"Invalid order spec {term.strip()!r}")
+        terms.append((parts[0], direction == "desc"))
+    return terms
+
+
+def _next_bucket(start: datetime, granularity: str) -> datetime:
+    """Get start of the date bucket following another.
+
+    Args:
+        start: Bucket start
+        granularity: Date granularity
+
+    Returns:
+        datetime: Start of the next bucket
+    """
+    if granularity == "hour":
+        return start + timedelta(hours=1)
+    if granularity == "day":
+        return start + timedelta(days=1)
+    if granularity == "week":
+        return start + timedelta(weeks=1)
+    months = {"month": 1, "quarter": 3, "year": 12}[granularity]
+    month = start.month - 1 + months
+    return start.replace(year=start.year + month // 12, month=month % 12 + 1)
+
+
+def _key_domain(spec: GroupSpec, value: Any) -> list[Any]:
+    """Build domain matching the records of a group key.
+
+    Args:
+        spec: Group spec
+        value: Decoded key value
+
+    Returns:
+        List[Any]: Domain items
+    """
+    if value is None:
+        # $group puts missing values and explicit nulls in the same group
+        return [(spec.field, "=", None)]
+    if spec.granularity:
+        return [(spec.field, ">=", value), "&", (spec.field, "<", _next_bucket(value, spec.granularity))]
+    return [(spec.field, "=", value)]
+
+
+def combine(domain: list[Any], conditions: list[Any]) -> list[Any]:
+    """AND conditions into a domain.
+
+    Domains have no parentheses and ``&`` binds tighter than ``|``, so the
+    conditions are added to every ``|`` branch of the domain.
+
+    Args:
+        domain: Domain items
+        conditions: Domain items to add, combined with ``&``
+
+    Returns:
+        List[Any]: Combined domain
+    """
+    if not domain:
+        return list(conditions)
+    branches: list[list[Any]] = [[]]
+    for item in domain:
+        if isinstance(item, str) and item == "|":
+            branches.append([])
+        else:
+            branches[-1].append(item)
+    result: list[Any] = []
+    for branch in branches:
+        if result:
+            result.append("|")
+        result.extend([*branch, "&", *conditions])
+    return result
+
+
+async def _decode(field_obj: Any, value: Any, backend: str) -> Any:
+    """Decode stored value with its field codec.
+
+    Args:
+        field_obj: Field, or None for the record ID
+        value: Stored value
+        backend: Database backend type
+
+    Returns:
+        Any: Python value
+    """
+    if value is None:
+        return None
+    if field_obj is None:
+        return str(value)
+    return await field_obj.from_db(value, backend)
+
+
+async def read_group(
+    model: type[Any],
+    domain: list[Any] | None,
+    groupby: list[str],
+    aggregates: list[str] | None = None,
+    orderby: str | None = None,
+    limit: int | None = None,
+    offset: int = 0,
+    lazy: bool = True,
+) -> list[Group]:
+    """Group and aggregate records of a model.
+
+    Args:
+        model: Model class
+        domain: Domain selecting the grouped records
+        groupby: Group specs, ``field`` or ``date_field:granularity``
+        aggregates: Aggregate specs, ``field:function``
+        orderby: Comma separated group or aggregate specs (or ``__count``)
+            with optional asc/desc; defaults to the group keys ascending
+        limit: Maximum number of groups
+        offset: Number of groups to skip
+        lazy: Whether to group on the first spec only
+
+    Returns:
+        List[Group]: Groups in order
+
+    Raises:
+        ValueError: If a spec is invalid
+        DatabaseError: If aggregation fails
+    """
+    if not groupby:
+        raise ValueError("read_group requires at least one group spec")
+    domain = list(domain or [])
+    aggregates = list(aggregates or [])
+    group_specs = [parse_groupby(model, spec) for spec in groupby]
+    grouped = group_specs[:1] if lazy else group_specs
+    aggregate_specs = [parse_aggregate(model, spec) for spec in aggregates]
+
+    query: MongoAggregate[Any] = await model.aggregate()
+    if domain:
+        query.filter(domain)
+    for spec in grouped:
+        if spec.granularity:
+            field_obj = model.__fields__[spec.field]
+            query.group_by_date(spec.field, spec.granularity, spec.key, iso=field_obj.storage == "iso")
+        else:
+            query.group_by(spec.field)
+    for spec in aggregate_specs:
+        if spec.function == "count_distinct":
+            query.count_distinct(_path(spec.field), spec.key)
+        else:
+            query.accumulate(spec.key, _accumulator(spec))
+    query.count(alias=COUNT_KEY)
+
+    sortable = {spec.key for spec in grouped} | {spec.key for spec in aggregate_specs} | {COUNT_KEY}
+    order: list[str] = []
+    for key, descending in _parse_orderby(orderby):
+        if key in sortable:
+            order.append(f"-{key}" if descending else key)
+        elif key not in groupby:
+            raise ValueError(f"Cannot order groups by {key!r}")
+    order.extend(spec.key for spec in grouped if spec.key not in {term.lstrip("-") for term in order})
+    query.order_by(*order)
+    if offset:
+        query.offset(offset)
+    if limit is not None:
+        query.limit(limit)
+
+    backend = model._env.adapter.backend_type
+    fields = model.__fields__
+    groups: list[Group] = []
+    for row in await query.execute():
+        values: dict[str, Any] = {}
+        conditions: list[Any] = []
+        for spec in grouped:
+            value = await _decode(fields[spec.field], row.get(spec.key), backend)
+            values[spec.key] = value
+            if conditions:
+                conditions.append("&")
+            conditions.extend(_key_domain(spec, value))
+        for spec in aggregate_specs:
+            value = row.get(spec.key)
+            if spec.function in ("min", "max"):
+                value = await _decode(fields.get(spec.field), value, backend)
+            values[spec.key] = value
+        groups.append(
+            Group(
+                model=model,
+                values=values,
+                count=row[COUNT_KEY],
+                domain=combine(domain, conditions),
+                groupby=list(groupby[len(grouped) :]),
+                aggregates=aggregates,
+                orderby=orderby,
+            )
+        )
+    return groups
@@ -252,6 +252,16 @@ class SystemConfigData:
         description="Event batch size",
     )
 
+    # Diagnostics Configuration
+    trace_enabled = BooleanField(
+        default=False,
+        description="Whether to evaluate ORM trace points (see earnorm.tracing)",
+    )
+    change_streams_enabled = BooleanField(
+        default=False,
+        description="Whether to invalidate caches from MongoDB change streams (needs a replica set)",
+    )
+
     def __init__(self, data: ConfigData | None = None) -> None:
         """Initialize configuration data.
 
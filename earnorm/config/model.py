@@ -170,6 +170,10 @@ class SystemConfig(BaseModel):
         # Events
         event_backend (str): Event backend type
         event_prefix (str): Event key prefix
+
+        # Diagnostics
+        trace_enabled (bool): Evaluate ORM trace points
+        change_streams_enabled (bool): Invalidate caches from change streams
     """
 
     # Version and timestamps
@@ -217,6 +221,10 @@ class SystemConfig(BaseModel):
     event_backend: str = Field(default="redis")
     event_prefix: str = Field(default="earnorm")
 
+    # Diagnostics Configuration
+    trace_enabled: bool = Field(default=False)
+    change_streams_enabled: bool = Field(default=False)
+
     @field_validator("database_uri")
     @classmethod
     def validate_database_uri(cls, v: str) -> str:
@@ -450,6 +450,37 @@ class QueryError(DatabaseError):
         super().__init__(f"{message} (query={query})", backend=backend)
 
 
+class BatchQueryError(QueryError):
+    """Error raised when one or more commands of a batch fail.
+
+    The batch itself was sent; ``results`` holds the reply of every command in
+    order, with the failed positions holding their exception. ``errors`` maps
+    command index to exception.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        backend: str,
+        query: str,
+        results: list[Any],
+        errors: dict[int, Exception],
+    ) -> None:
+        """Initialize batch query error.
+
+        Args:
+            message: Error message
+            backend: Database backend name
+            query: Failed batch description
+            results: Per-command results in order
+            errors: Failed command index to exception
+        """
+        self.results = results
+        self.errors = errors
+        super().__init__(message, backend=backend, query=query)
+
+
 class PoolError(DatabaseError):
     """Base class for pool-related errors."""
 
@@ -104,6 +104,7 @@ from earnorm.fields.validators.base import (
     RangeValidator,
     RegexValidator,
     RequiredValidator,
+    SyncValidator,
     TypeValidator,
     Validator,
     ValidatorChain,
@@ -156,6 +157,7 @@ __all__ = [
     "RelationField",
     # Validators
     "Validator",
+    "SyncValidator",
     "ValidatorChain",
     "RequiredValidator",
     "TypeValidator",
@@ -10,7 +10,7 @@ It handles:
 """
 
 import logging
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Sequence
 from re import Pattern
 from typing import (
     TYPE_CHECKING,
@@ -22,7 +22,7 @@ from typing import (
     cast,
 )
 
-from earnorm.exceptions import DatabaseError
+from earnorm.exceptions import DatabaseError, FieldValidationError
 from earnorm.fields.types import ValidationContext
 from earnorm.types.fields import ComparisonOperator, DatabaseValue
 
@@ -470,6 +470,7 @@ class BaseField(Generic[T]):
     readonly: bool
     store: bool
     index: bool
+    unique: bool
     help: str
     compute: Callable[..., Coroutine[Any, Any, T]] | None
     depends: list[str]
@@ -487,6 +488,9 @@ class BaseField(Generic[T]):
     field_type: str = ""  # Database field type (e.g. "string", "integer", etc.)
     python_type: type[T] = cast(type[T], Any)  # Python type for the field
 
+    # Fields converting values without I/O implement to_db_sync/from_db_sync
+    sync_codec: bool = False
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize field with options.
 
@@ -496,6 +500,7 @@ class BaseField(Generic[T]):
                 readonly (bool): Whether field is readonly
                 store (bool): Whether to store in database
                 index (bool): Whether to index field
+                unique (bool): Whether values must be unique across records
                 help (str): Help text for field
                 compute (Callable): Compute function
                 depends (List[str]): Dependencies for compute
@@ -514,6 +519,7 @@ class BaseField(Generic[T]):
         self.readonly = kwargs.get("readonly", False)
         self.store = kwargs.get("store", True)
         self.index = kwargs.get("index", False)
+        self.unique = kwargs.get("unique", False)
         self.help = kwargs.get("help", "")
         self.compute = kwargs.get("compute")
         self.depends = kwargs.get("depends", [])
@@ -591,7 +597,118 @@ class BaseField(Generic[T]):
             FieldValidationError: If validation fails
         """
         context = context or {}
-        validation_context = ValidationContext(
+        validation_context = self._validation_context(context, value)
+
+        # Validate system field constraints
+        self._check_system(value, context)
+
+        # Run validators
+        for validator in self.validators:
+            await validator(value, validation_context)
+
+        return self.check(value, context)
+
+    def check(self, value: Any, context: dict[str, Any] | None = None) -> Any:
+        """Check field specific constraints.
+
+        Called by ``validate`` after the validators ran. Subclasses override
+        this instead of ``validate`` when their checks need no I/O, so batch
+        validation can run them without awaiting.
+
+        Args:
+            value: Value to check
+            context: Validation context, same keys as in ``validate``
+
+        Returns:
+            Any: The checked value
+
+        Raises:
+            FieldValidationError: If a constraint is not met
+            ValueError: If a constraint is not met
+        """
+        return value
+
+    async def validate_many(
+        self,
+        values: Sequence[Any],
+        context: dict[str, Any] | None = None,
+        *,
+        rows: Sequence[dict[str, Any]] | None = None,
+    ) -> dict[int, FieldValidationError]:
+        """Validate a column of values.
+
+        The validation context is built once for the whole column and
+        synchronous validators are called directly, so validating many rows
+        does not create a coroutine per value. Asynchronous validators only
+        run for values that passed the synchronous checks. Fields overriding
+        ``validate`` are validated value by value.
+
+        Args:
+            values: Values to validate
+            context: Validation context shared by all values, same keys as in ``validate``
+            rows: Values of the record each value belongs to, passed to validators
+                that run per value as ``values``
+
+        Returns:
+            Dict[int, FieldValidationError]: Errors by value index, empty if all values are valid
+
+        Examples:
+            >>> errors = await User.email.validate_many(["a@example.com", "invalid"])
+            >>> list(errors)
+            [1]
+        """
+        context = context or {}
+        errors: dict[int, FieldValidationError] = {}
+
+        if type(self).validate is not BaseField.validate:
+            for index, value in enumerate(values):
+                try:
+                    await self.validate(value, self._row_context(context, rows, index))
+                except (FieldValidationError, ValueError, TypeError) as e:
+                    errors[index] = self._validation_error(e)
+            return errors
+
+        sync_validators = [validator for validator in self.validators if getattr(validator, "is_sync", False)]
+        async_validators = [validator for validator in self.validators if not getattr(validator, "is_sync", False)]
+        shared_context = self._validation_context(context)
+        check_system = self.system
+        check = self.check
+
+        for index, value in enumerate(values):
+            try:
+                if check_system:
+                    self._check_system(value, context)
+                shared_context.value = value
+                for validator in sync_validators:
+                    validator.validate_sync(value, shared_context)  # type: ignore[attr-defined]
+                check(value, context)
+            except (FieldValidationError, ValueError, TypeError) as e:
+                errors[index] = self._validation_error(e)
+
+        if async_validators:
+            for index, value in enumerate(values):
+                if index in errors:
+                    continue
+                validation_context = self._validation_context(self._row_context(context, rows, index), value)
+                try:
+                    for validator in async_validators:
+                        await validator(value, validation_context)
+                except (FieldValidationError, ValueError, TypeError) as e:
+                    errors[index] = self._validation_error(e)
+
+        return errors
+
+    def _validation_context(self, context: dict[str, Any], value: Any = None) -> ValidationContext:
+        """Build validator context from validation context dict.
+
+        Args:
+            context: Validation context dict
+            value: Value being validated
+
+        Returns:
+            ValidationContext: Context passed to validators
+        """
+        return ValidationContext(
             field=self,
             value=value,
             model=context.get("model"),
@@ -600,7 +717,32 @@ class BaseField(Generic[T]):
             values=context.get("values", dict()),
         )
 
-        # Validate system field constraints
+    @staticmethod
+    def _row_context(context: dict[str, Any], rows: Sequence[dict[str, Any]] | None, index: int) -> dict[str, Any]:
+        """Get validation context dict of one row.
+
+        Args:
+            context: Validation context shared by all rows
+            rows: Values of each row
+            index: Row index
+
+        Returns:
+            Dict[str, Any]: Context with the row's values
+        """
+        if rows is None:
+            return context
+        return {**context, "values": rows[index]}
+
+    def _check_system(self, value: Any, context: dict[str, Any]) -> None:
+        """Check system field constraints.
+
+        Args:
+            value: Value to check
+            context: Validation context dict
+
+        Raises:
+            ValueError: If an immutable or internal field is written
+        """
         if self.system:
             # Check immutable constraint
             if self.immutable and context.get("operation") == "write" and value is not None:
@@ -610,11 +752,20 @@ class BaseField(Generic[T]):
             if self.internal and context.get("operation") in ("create", "write") and not context.get("internal", False):
                 raise ValueError(f"Field {self.name} is internal")
 
-        # Run validators
-        for validator in self.validators:
-            await validator(value, validation_context)
+    def _validation_error(self, error: Exception) -> FieldValidationError:
+        """Convert validation failure to field validation error.
 
-        return value
+        Args:
+            error: Raised error
+
+        Returns:
+            FieldValidationError: The error itself or a wrapping field validation error
+        """
+        if isinstance(error, FieldValidationError):
+            return error
+        wrapped = FieldValidationError(message=str(error), field_name=self.name, code="field_validation_error")
+        wrapped.__cause__ = error
+        return wrapped
 
     async def __get__(self, instance: Any, owner: type[Any] | None = None) -> Union["BaseField[T]", T | None]:
         """Get field value from instance.
@@ -771,6 +922,9 @@ class BaseField(Generic[T]):
         Raises:
             DatabaseError: If conversion fails
         """
+        if self.sync_codec:
+            return self.to_db_sync(value, backend)
+
         try:
             if not hasattr(self, "env"):
                 raise ValueError("Field has no environment")
@@ -792,6 +946,9 @@ class BaseField(Generic[T]):
         Raises:
             DatabaseError: If conversion fails
         """
+        if self.sync_codec:
+            return self.from_db_sync(value, backend)
+
         try:
             if not hasattr(self, "env"):
                 raise ValueError("Field has no environment")
@@ -800,6 +957,55 @@ class BaseField(Generic[T]):
         except Exception as e:
             raise DatabaseError(message=str(e), backend=backend) from e
 
+    def to_db_sync(self, value: T | None, backend: str) -> DatabaseValue:
+        """Convert Python value to database format without awaiting.
+
+        Implemented by fields that set ``sync_codec``, whose conversion needs
+        no I/O. Model codecs call it directly instead of awaiting ``to_db``.
+
+        Args:
+            value: Value to convert
+            backend: Database backend type
+
+        Returns:
+            DatabaseValue: Converted value for database
+
+        Raises:
+            NotImplementedError: If field has no synchronous conversion
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no synchronous to_db conversion")
+
+    def from_db_sync(self, value: DatabaseValue, backend: str) -> T | None:
+        """Convert database value to Python format without awaiting.
+
+        Args:
+            value: Value to convert
+            backend: Database backend type
+
+        Returns:
+            Optional[T]: Converted value
+
+        Raises:
+            NotImplementedError: If field has no synchronous conversion
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no synchronous from_db conversion")
+
+    def to_query_value(self, value: Any) -> Any:
+        """Convert domain value to the representation stored in the database.
+
+        Called by the query layer when it compiles comparisons on this field,
+        so that values compare against stored values of the same type. This
+        method should be overridden by fields whose storage format differs
+        from their Python type.
+
+        Args:
+            value: Domain value
+
+        Returns:
+            Any: Value to compare with
+        """
+        return value
+
     def get_backend_options(self, backend: str) -> dict[str, Any]:
         """Get database-specific options.
 
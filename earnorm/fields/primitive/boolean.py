@@ -54,6 +54,8 @@ class BooleanField(BaseField[bool], FieldComparisonMixin):
     false_values: set[str]
     backend_options: dict[str, Any]
 
+    sync_codec = True
+
     def __init__(
         self,
         *,
@@ -152,8 +154,8 @@ class BooleanField(BaseField[bool], FieldComparisonMixin):
         """
         return ComparisonOperator(self.name, "negate", None)
 
-    async def validate(self, value: Any, context: dict[str, Any] | None = None) -> Any:
-        """Validate boolean value.
+    def check(self, value: Any, context: dict[str, Any] | None = None) -> Any:
+        """Check boolean value.
 
         This method validates:
         - Value is boolean type
@@ -174,8 +176,6 @@ class BooleanField(BaseField[bool], FieldComparisonMixin):
         Raises:
             FieldValidationError: If validation fails
         """
-        value = await super().validate(value, context)
-
         if value is not None and not isinstance(value, bool):
             raise FieldValidationError(
                 message=f"Value must be a boolean, got {type(value).__name__}",
@@ -231,7 +231,7 @@ class BooleanField(BaseField[bool], FieldComparisonMixin):
             code="conversion_error",
         )
 
-    async def to_db(self, value: bool | None, backend: str) -> DatabaseValue:
+    def to_db_sync(self, value: bool | None, backend: str) -> DatabaseValue:
         """Convert boolean to database format.
 
         Args:
@@ -243,7 +243,7 @@ class BooleanField(BaseField[bool], FieldComparisonMixin):
         """
         return value
 
-    async def from_db(self, value: DatabaseValue, backend: str) -> bool | None:
+    def from_db_sync(self, value: DatabaseValue, backend: str) -> bool | None:
         """Convert database value to boolean.
 
         Args:
@@ -8,6 +8,11 @@ It supports:
 - Range validation
 - Auto now and auto now add
 - DateTime comparison operations
+- Native (BSON date) or ISO string storage
+
+Values are stored as native database dates by default. Models whose
+collections still hold ISO strings can keep ``storage="iso"`` until the data
+is converted with ``earnorm.base.database.migration.convert_datetime_strings``.
 
 Examples:
     >>> class Post(Model):
@@ -25,7 +30,7 @@ Examples:
 """
 
 from datetime import UTC, date, datetime, time
-from typing import Any, Final
+from typing import Any, Final, Literal
 
 from earnorm.exceptions import FieldValidationError
 from earnorm.fields.base import BaseField
@@ -37,6 +42,9 @@ DEFAULT_AUTO_NOW: Final[bool] = False
 DEFAULT_AUTO_NOW_ADD: Final[bool] = False
 DEFAULT_USE_TZ: Final[bool] = True
 DEFAULT_TIME_FORMAT: Final[str] = "%H:%M:%S"
+DEFAULT_STORAGE: Final[Literal["native", "iso"]] = "native"
+
+DatetimeStorage = Literal["native", "iso"]
 
 
 class DateTimeField(BaseField[datetime], FieldComparisonMixin):
@@ -54,20 +62,25 @@ class DateTimeField(BaseField[datetime], FieldComparisonMixin):
         auto_now: Update value on every save
         auto_now_add: Set value on creation
         use_tz: Whether to use timezone-aware datetimes
+        storage: Storage format, ``native`` dates or ``iso`` strings
         backend_options: Database backend options
     """
 
     auto_now: bool
     auto_now_add: bool
     use_tz: bool
+    storage: DatetimeStorage
     backend_options: dict[str, Any]
 
+    sync_codec = True
+
     def __init__(
         self,
         *,
         auto_now: bool = DEFAULT_AUTO_NOW,
         auto_now_add: bool = DEFAULT_AUTO_NOW_ADD,
         use_tz: bool = DEFAULT_USE_TZ,
+        storage: DatetimeStorage = DEFAULT_STORAGE,
         **options: Any,
     ) -> None:
         """Initialize datetime field.
@@ -76,14 +89,22 @@ class DateTimeField(BaseField[datetime], FieldComparisonMixin):
             auto_now: Update value on every save
             auto_now_add: Set value on creation
             use_tz: Whether to use timezone-aware datetimes
+            storage: Store native database dates (default) or ISO strings
             **options: Additional field options
+
+        Raises:
+            ValueError: If storage is unknown
         """
+        if storage not in ("native", "iso"):
+            raise ValueError(f"Unknown datetime storage: {storage}. Expected 'native' or 'iso'")
+
         field_validators: list[Validator[Any]] = [TypeValidator(datetime)]
         super().__init__(validators=field_validators, **options)
 
         self.auto_now = auto_now
         self.auto_now_add = auto_now_add
         self.use_tz = use_tz
+        self.storage = storage
 
         # Initialize backend options
         self.backend_options = {
@@ -92,6 +113,66 @@ class DateTimeField(BaseField[datetime], FieldComparisonMixin):
             "mysql": {"type": "DATETIME"},
         }
 
+    def _coerce(self, value: Any) -> datetime:
+        """Coerce comparison value to datetime with this field's timezone handling.
+
+        Args:
+            value: Datetime, date, ISO string or Unix timestamp
+
+        Returns:
+            datetime: Coerced value
+
+        Raises:
+            TypeError: If value type is not supported
+            ValueError: If string is not ISO formatted
+        """
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        elif isinstance(value, (int, float)):
+            value = datetime.fromtimestamp(value, UTC)
+        elif isinstance(value, date) and not isinstance(value, datetime):
+            value = datetime.combine(value, time())
+        elif not isinstance(value, datetime):
+            raise TypeError(f"Cannot compare datetime with {type(value).__name__}")
+
+        if self.use_tz and value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        elif not self.use_tz and value.tzinfo is not None:
+            value = value.replace(tzinfo=None)
+        return value
+
+    def _stored(self, value: datetime) -> DatabaseValue:
+        """Get stored representation of datetime.
+
+        Args:
+            value: Datetime value
+
+        Returns:
+            Native datetime or ISO string depending on storage
+        """
+        return value if self.storage == "native" else value.isoformat()
+
+    def to_query_value(self, value: Any) -> Any:
+        """Convert domain value to the stored datetime representation.
+
+        Strings, dates and timestamps compared against a natively stored
+        field become datetimes; datetimes compared against an ISO-stored
+        field become strings. Values that cannot be converted are passed
+        through unchanged.
+
+        Args:
+            value: Domain value
+
+        Returns:
+            Any: Value to compare with
+        """
+        if value is None:
+            return None
+        try:
+            return self._stored(self._coerce(value))
+        except (TypeError, ValueError):
+            return value
+
     def _prepare_value(self, value: Any) -> DatabaseValue:
         """Prepare datetime value for comparison.
 
@@ -101,7 +182,7 @@ class DateTimeField(BaseField[datetime], FieldComparisonMixin):
             value: Value to prepare
 
         Returns:
-            Prepared datetime value as ISO format string
+            Prepared datetime value in the field's storage format
         """
         if value is None:
             return None
@@ -119,7 +200,7 @@ class DateTimeField(BaseField[datetime], FieldComparisonMixin):
             elif not self.use_tz and value.tzinfo is not None:
                 value = value.replace(tzinfo=None)
 
-            return value.isoformat()
+            return self._stored(value)
         except (TypeError, ValueError):
             return None
 
@@ -352,8 +433,8 @@ class DateTimeField(BaseField[datetime], FieldComparisonMixin):
         prepared_values = [self._prepare_value(value) for value in values]
         return ComparisonOperator(self.name, "not_in", prepared_values)
 
-    async def validate(self, value: Any, context: dict[str, Any] | None = None) -> Any:
-        """Validate datetime value.
+    def check(self, value: Any, context: dict[str, Any] | None = None) -> Any:
+        """Check datetime value.
 
         This method validates:
         - Value is datetime type
@@ -375,8 +456,6 @@ class DateTimeField(BaseField[datetime], FieldComparisonMixin):
         Raises:
             FieldValidationError: If validation fails
         """
-        value = await super().validate(value, context)
-
         if value is not None:
             if not isinstance(value, datetime):
                 raise FieldValidationError(
@@ -410,6 +489,20 @@ class DateTimeField(BaseField[datetime], FieldComparisonMixin):
         - String values (ISO format)
         - Integer/float values (Unix timestamps)
 
+        Args:
+            value: Value to convert
+
+        Returns:
+            Converted datetime value or None
+
+        Raises:
+            FieldValidationError: If value cannot be converted
+        """
+        return self._parse(value)
+
+    def _parse(self, value: Any) -> datetime | None:
+        """Parse value to datetime synchronously.
+
         Args:
             value: Value to convert
 
@@ -448,7 +541,7 @@ class DateTimeField(BaseField[datetime], FieldComparisonMixin):
                 code="conversion_error",
             ) from e
 
-    async def to_db(self, value: datetime | None, backend: str) -> DatabaseValue:
+    def to_db_sync(self, value: datetime | None, backend: str) -> DatabaseValue:
         """Convert datetime to database format.
 
         Args:
@@ -456,7 +549,7 @@ class DateTimeField(BaseField[datetime], FieldComparisonMixin):
             backend: Database backend type
 
         Returns:
-            Converted datetime value or None
+            Native datetime (BSON date) or ISO string depending on storage, or None
         """
         # Handle auto_now and auto_now_add
         now = datetime.now(UTC if self.use_tz else None)
@@ -476,8 +569,7 @@ class DateTimeField(BaseField[datetime], FieldComparisonMixin):
         # Convert string to datetime if needed
         if isinstance(value, str):
             try:
-                # Use the convert method to parse the string
-                value = await self.convert(value)
+                value = self._parse(value)
             except Exception as e:
                 from earnorm.exceptions import ValidationError
                 raise ValidationError(
@@ -507,9 +599,9 @@ class DateTimeField(BaseField[datetime], FieldComparisonMixin):
             if value.tzinfo is not None:
                 value = value.replace(tzinfo=None)
 
-        return value.isoformat()
+        return self._stored(value)
 
-    async def from_db(self, value: DatabaseValue, backend: str) -> datetime | None:
+    def from_db_sync(self, value: DatabaseValue, backend: str) -> datetime | None:
         """Convert database value to datetime.
 
         Args:
@@ -593,8 +685,8 @@ class DateField(DateTimeField):
             "mysql": {"type": "DATE"},
         }
 
-    async def convert(self, value: Any) -> datetime | None:
-        """Convert value to date.
+    def _parse(self, value: Any) -> datetime | None:
+        """Parse value to date synchronously.
 
         Handles:
         - None values
@@ -692,8 +784,8 @@ class TimeField(BaseField[time]):
             "mysql": {"type": "TIME"},
         }
 
-    async def validate(self, value: Any, context: dict[str, Any] | None = None) -> Any:
-        """Validate time value.
+    def check(self, value: Any, context: dict[str, Any] | None = None) -> Any:
+        """Check time value.
 
         This method validates:
         - Value is time type
@@ -714,8 +806,6 @@ class TimeField(BaseField[time]):
         Raises:
             FieldValidationError: If validation fails
         """
-        value = await super().validate(value, context)
-
         if value is not None:
             if not isinstance(value, time):
                 raise FieldValidationError(
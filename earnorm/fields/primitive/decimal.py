@@ -8,6 +8,15 @@ It supports:
 - Rounding control
 - Database type mapping
 - Decimal comparison operations
+- Decimal128 (default) or string storage
+
+Values are stored as BSON ``Decimal128`` on MongoDB by default, so they keep
+their exact value and can be summed and averaged server-side. Decimal128 holds
+34 significant digits, so ``max_digits`` defaults to 34 with this storage and
+cannot be set higher; values that cannot be stored exactly are rejected
+rather than rounded. Models whose
+collections still hold strings can keep ``storage="string"`` until the data is
+converted with ``earnorm.base.database.migration.convert_decimal_strings``.
 
 Examples:
     >>> class Product(Model):
@@ -21,8 +30,10 @@ Examples:
     ...     top_rated = Product.find(Product.rating.greater_than_or_equal(4.5))
 """
 
-from decimal import ROUND_HALF_EVEN, Decimal, InvalidOperation
-from typing import Any, Final
+from decimal import ROUND_HALF_EVEN, Context, Decimal, Inexact, InvalidOperation, Overflow
+from typing import Any, Final, Literal
+
+from bson.decimal128 import Decimal128, create_decimal128_context
 
 from earnorm.exceptions import FieldValidationError
 from earnorm.fields.base import BaseField
@@ -31,8 +42,17 @@ from earnorm.types.fields import ComparisonOperator, DatabaseValue, FieldCompari
 
 # Constants
 DEFAULT_MAX_DIGITS: Final[int] = 65
+DECIMAL128_MAX_DIGITS: Final[int] = 34
 DEFAULT_DECIMAL_PLACES: Final[int] = 30
 DEFAULT_ROUNDING: Final[str] = ROUND_HALF_EVEN
+DEFAULT_STORAGE: Final[Literal["decimal128", "string"]] = "decimal128"
+
+DecimalStorage = Literal["decimal128", "string"]
+
+_DECIMAL128_CONTEXT: Final[Context] = create_decimal128_context()
+# Raise instead of silently rounding values Decimal128 cannot hold
+_DECIMAL128_CONTEXT.traps[Inexact] = True
+_DECIMAL128_CONTEXT.traps[Overflow] = True
 
 
 class DecimalField(BaseField[Decimal], FieldComparisonMixin):
@@ -52,6 +72,7 @@ class DecimalField(BaseField[Decimal], FieldComparisonMixin):
         min_value: Minimum allowed value
         max_value: Maximum allowed value
         rounding: Rounding mode for decimal operations
+        storage: MongoDB storage format, ``decimal128`` or ``string``
         backend_options: Database backend options
     """
 
@@ -60,37 +81,52 @@ class DecimalField(BaseField[Decimal], FieldComparisonMixin):
     min_value: Decimal | None
     max_value: Decimal | None
     rounding: str
+    storage: DecimalStorage
     backend_options: dict[str, Any]
 
+    sync_codec = True
+
     def __init__(
         self,
         *,
-        max_digits: int = DEFAULT_MAX_DIGITS,
+        max_digits: int | None = None,
         decimal_places: int = DEFAULT_DECIMAL_PLACES,
         min_value: Decimal | float | str | int | None = None,
         max_value: Decimal | float | str | int | None = None,
         rounding: str = DEFAULT_ROUNDING,
+        storage: DecimalStorage = DEFAULT_STORAGE,
         **options: Any,
     ) -> None:
         """Initialize decimal field.
 
         Args:
-            max_digits: Maximum number of digits (precision)
+            max_digits: Maximum number of digits (precision), 34 by default
+                with decimal128 storage and 65 with string storage
             decimal_places: Number of decimal places (scale)
             min_value: Minimum allowed value
             max_value: Maximum allowed value
             rounding: Rounding mode for decimal operations
+            storage: Store Decimal128 values (default) or strings on MongoDB
             **options: Additional field options
 
         Raises:
-            ValueError: If max_digits or decimal_places are invalid
+            ValueError: If max_digits, decimal_places or storage are invalid,
+                e.g. more than 34 digits with decimal128 storage
         """
+        if storage not in ("decimal128", "string"):
+            raise ValueError(f"Unknown decimal storage: {storage}. Expected 'decimal128' or 'string'")
+        if max_digits is None:
+            max_digits = DECIMAL128_MAX_DIGITS if storage == "decimal128" else DEFAULT_MAX_DIGITS
         if max_digits < 1:
             raise ValueError("max_digits must be positive")
         if decimal_places < 0:
             raise ValueError("decimal_places must be non-negative")
         if decimal_places > max_digits:
             raise ValueError("decimal_places cannot be greater than max_digits")
+        if storage == "decimal128" and max_digits > DECIMAL128_MAX_DIGITS:
+            raise ValueError(
+                f"max_digits cannot exceed {DECIMAL128_MAX_DIGITS} with decimal128 storage, use storage='string'"
+            )
 
         # Create validators
         field_validators: list[Validator[Any]] = [TypeValidator(Decimal)]
@@ -110,6 +146,7 @@ class DecimalField(BaseField[Decimal], FieldComparisonMixin):
         self.min_value = Decimal(str(min_value)) if min_value is not None else None
         self.max_value = Decimal(str(max_value)) if max_value is not None else None
         self.rounding = rounding
+        self.storage = storage
 
         # Initialize backend options
         self.backend_options = {
@@ -118,8 +155,8 @@ class DecimalField(BaseField[Decimal], FieldComparisonMixin):
             "mysql": {"type": f"DECIMAL({max_digits}, {decimal_places})"},
         }
 
-    async def validate(self, value: Any, context: dict[str, Any] | None = None) -> Any:
-        """Validate decimal value.
+    def check(self, value: Any, context: dict[str, Any] | None = None) -> Any:
+        """Check decimal value.
 
         This method validates:
         - Value is decimal type
@@ -141,8 +178,6 @@ class DecimalField(BaseField[Decimal], FieldComparisonMixin):
         Raises:
             FieldValidationError: If validation fails
         """
-        value = await super().validate(value, context)
-
         if value is not None:
             if not isinstance(value, Decimal):
                 raise FieldValidationError(
@@ -229,7 +264,7 @@ class DecimalField(BaseField[Decimal], FieldComparisonMixin):
             value: Value to prepare
 
         Returns:
-            Prepared decimal value as string
+            Prepared decimal value in the field's storage format
         """
         if value is None:
             return None
@@ -242,16 +277,70 @@ class DecimalField(BaseField[Decimal], FieldComparisonMixin):
             else:
                 raise TypeError(f"Cannot convert {type(value).__name__} to decimal")
 
-            if self.decimal_places > 0:
-                decimal_value = decimal_value.quantize(
-                    Decimal(f"0.{'0' * self.decimal_places}"),
-                    rounding=self.rounding,
-                )
-
-            return str(decimal_value)
-        except (TypeError, ValueError, InvalidOperation):
+            return self._stored(self._round(decimal_value), "mongodb")
+        except (TypeError, ValueError, InvalidOperation, FieldValidationError):
             return None
 
+    def _round(self, value: Decimal) -> Decimal:
+        """Round value to decimal_places.
+
+        Values with fewer decimal places are kept as is rather than padded
+        with zeros, so the result never needs more digits than the input.
+
+        Args:
+            value: Decimal value
+
+        Returns:
+            Decimal: Rounded value
+        """
+        exponent = value.as_tuple().exponent
+        if not isinstance(exponent, int) or exponent >= -self.decimal_places:
+            return value
+        digits = len(value.as_tuple().digits) + self.decimal_places
+        return value.quantize(
+            Decimal(1).scaleb(-self.decimal_places),
+            rounding=self.rounding,
+            context=Context(prec=digits),
+        )
+
+    def _stored(self, value: Decimal, backend: str) -> DatabaseValue:
+        """Get stored representation of decimal.
+
+        Args:
+            value: Rounded decimal value
+            backend: Database backend type
+
+        Returns:
+            Decimal128 on MongoDB with decimal128 storage, string otherwise
+
+        Raises:
+            FieldValidationError: If Decimal128 cannot hold the value exactly
+        """
+        if backend != "mongodb" or self.storage != "decimal128":
+            return str(value)
+        try:
+            return Decimal128(_DECIMAL128_CONTEXT.create_decimal(value))
+        except (Inexact, Overflow, InvalidOperation) as e:
+            raise FieldValidationError(
+                message=f"Value {value} cannot be stored exactly as Decimal128",
+                field_name=self.name,
+                code="not_representable",
+            ) from e
+
+    def to_query_value(self, value: Any) -> Any:
+        """Convert domain value to the stored decimal representation.
+
+        Args:
+            value: Domain value
+
+        Returns:
+            Any: Value to compare with, unchanged if it is not a number
+        """
+        if value is None or isinstance(value, bool):
+            return value
+        prepared = self._prepare_value(value)
+        return value if prepared is None else prepared
+
     def less_than(self, value: Decimal | float | str | int) -> ComparisonOperator:
         """Check if value is less than other value.
 
@@ -388,7 +477,7 @@ class DecimalField(BaseField[Decimal], FieldComparisonMixin):
         """
         return ComparisonOperator(self.name, "is_zero", None)
 
-    async def to_db(self, value: Decimal | None, backend: str) -> DatabaseValue:
+    def to_db_sync(self, value: Decimal | None, backend: str) -> DatabaseValue:
         """Convert decimal to database format.
 
         Args:
@@ -397,20 +486,16 @@ class DecimalField(BaseField[Decimal], FieldComparisonMixin):
 
         Returns:
             Converted decimal value or None
+
+        Raises:
+            FieldValidationError: If the value cannot be stored exactly
         """
         if value is None:
             return None
 
-        # Round value if needed
-        if self.decimal_places > 0:
-            value = value.quantize(
-                Decimal(f"0.{'0' * self.decimal_places}"),
-                rounding=self.rounding,
-            )
+        return self._stored(self._round(value), backend)
 
-        return str(value)  # Convert to string for database storage
-
-    async def from_db(self, value: DatabaseValue, backend: str) -> Decimal | None:
+    def from_db_sync(self, value: DatabaseValue, backend: str) -> Decimal | None:
         """Convert database value to decimal.
 
         Args:
@@ -427,7 +512,9 @@ class DecimalField(BaseField[Decimal], FieldComparisonMixin):
             return None
 
         try:
-            if isinstance(value, Decimal):
+            if isinstance(value, Decimal128):
+                return value.to_decimal()
+            elif isinstance(value, Decimal):
                 return value
             elif isinstance(value, (float, str, int)):
                 return Decimal(str(value))
@@ -60,6 +60,8 @@ class EnumField(BaseField[E], FieldComparisonMixin, Generic[E]):
     case_sensitive: bool
     backend_options: dict[str, Any]
 
+    sync_codec = True
+
     def __init__(
         self,
         enum_class: type[E],
@@ -111,8 +113,8 @@ class EnumField(BaseField[E], FieldComparisonMixin, Generic[E]):
                 "mysql": {"type": "TEXT"},
             }
 
-    async def validate(self, value: Any, context: dict[str, Any] | None = None) -> Any:
-        """Validate enum value.
+    def check(self, value: Any, context: dict[str, Any] | None = None) -> Any:
+        """Check enum value.
 
         This method validates:
         - Value is an instance of enum_class
@@ -133,8 +135,6 @@ class EnumField(BaseField[E], FieldComparisonMixin, Generic[E]):
         Raises:
             FieldValidationError: If validation fails
         """
-        value = await super().validate(value, context)
-
         if value is not None:
             if not isinstance(value, self.enum_class):
                 raise FieldValidationError(
@@ -222,7 +222,7 @@ class EnumField(BaseField[E], FieldComparisonMixin, Generic[E]):
                 code="conversion_error",
             ) from e
 
-    async def to_db(self, value: E | None, backend: str) -> DatabaseValue:
+    def to_db_sync(self, value: E | None, backend: str) -> DatabaseValue:
         """Convert enum to database format.
 
         Args:
@@ -237,7 +237,7 @@ class EnumField(BaseField[E], FieldComparisonMixin, Generic[E]):
 
         return value.value
 
-    async def from_db(self, value: DatabaseValue, backend: str) -> E | None:
+    def from_db_sync(self, value: DatabaseValue, backend: str) -> E | None:
         """Convert database value to enum.
 
         Args:
@@ -254,6 +254,9 @@ class EnumField(BaseField[E], FieldComparisonMixin, Generic[E]):
             return None
 
         try:
+            member = self.enum_class._value2member_map_.get(value)
+            if member is not None:
+                return member  # type: ignore
             for member in self.enum_class.__members__.values():
                 if member.value == value:
                     return member
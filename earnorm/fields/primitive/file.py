@@ -4,6 +4,9 @@ This module provides file field type for handling file uploads and storage.
 It supports:
 - File validation
 - Size limits
+- Chunked streaming uploads and downloads
+- Byte range reads
+- Content hashing and deduplication of identical uploads
 - MIME type validation
 - Storage backends
 - Database type mapping
@@ -24,25 +27,51 @@ Examples:
     ...     large_files = Document.find(Document.file.size_greater_than(5 * 1024 * 1024))
     ...     pdfs = Document.find(Document.file.has_type("application/pdf"))
     ...     recent = Document.find(Document.file.created_after(datetime(2024, 1, 1)))
+
+    >>> # Stream an upload and a download without buffering the file
+    >>> path = await Document.file.save(upload_file, filename="report.pdf")
+    >>> async for chunk in document.file.stream():
+    ...     await response.write(chunk)
+
+    >>> # Serve an HTTP range (inclusive end) without reading earlier data
+    >>> body = await document.file.read_range(first, last + 1)
+
+    >>> # Identical uploads share one stored blob
+    >>> class Media(Model):
+    ...     video = FileField(storage="gridfs", dedup=True)
 """
 
-import io
+import asyncio
+import hashlib
 import mimetypes
 import os
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, BinaryIO, Union, cast
+from typing import Any, Union, cast
 
 from bson import ObjectId
-from motor.motor_asyncio import AsyncIOMotorGridFSBucket
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorGridFSBucket
 
 from earnorm.exceptions import FieldValidationError
 from earnorm.fields.base import BaseField
+from earnorm.fields.primitive.file_storage import (
+    DEFAULT_CHUNK_SIZE,
+    FileSource,
+    FileTooLargeError,
+    GridFSStorage,
+    Hasher,
+    LocalStorage,
+    iter_chunks,
+    limit_size,
+)
 from earnorm.fields.validators.base import TypeValidator, Validator
 from earnorm.types.fields import ComparisonOperator, DatabaseValue, FieldComparisonMixin
 
+HASH_ALGORITHMS = frozenset(name for name in hashlib.algorithms_guaranteed if not name.startswith("shake_"))
+"""Digest algorithms available on every host, with fixed-length hex digests."""
+
 
 class StorageType(str, Enum):
     """Storage backend types."""
@@ -61,6 +90,7 @@ class FileInfo:
         size: File size in bytes
         created_at: Creation timestamp
         metadata: Additional metadata
+        content_hash: Hex digest of the content, if recorded
     """
 
     def __init__(
@@ -71,6 +101,7 @@ class FileInfo:
         size: int | None = None,
         created_at: datetime | None = None,
         metadata: dict[str, Any] | None = None,
+        content_hash: str | None = None,
     ) -> None:
         self.filename = filename
         self.path = path
@@ -78,6 +109,7 @@ class FileInfo:
         self.size = size
         self.created_at = created_at or datetime.now()
         self.metadata = metadata or {}
+        self.content_hash = content_hash
 
 
 class FileField(BaseField[Union[Path, str, ObjectId]], FieldComparisonMixin):
@@ -88,6 +120,8 @@ class FileField(BaseField[Union[Path, str, ObjectId]], FieldComparisonMixin):
     - Size limits
     - MIME type validation
     - Storage backends
+    - Byte range reads
+    - Content hashing and deduplication
     - Database type mapping
     - File comparison operations
 
@@ -95,19 +129,27 @@ class FileField(BaseField[Union[Path, str, ObjectId]], FieldComparisonMixin):
         max_size: Maximum file size in bytes
         allowed_types: List of allowed MIME types (with wildcards)
         upload_to: Upload directory path
+        chunk_size: Size of chunks streamed to and from storage
+        hash_algorithm: hashlib algorithm of content digests
+        dedup: Whether identical uploads share one stored blob
         backend_options: Database backend options
         storage: Storage backend type
         _value: Current file value
         _fs: GridFS bucket instance
+        _files: GridFS files collection
     """
 
     max_size: int
     allowed_types: tuple[str, ...]
     upload_to: str
+    chunk_size: int
+    hash_algorithm: str | None
+    dedup: bool
     backend_options: dict[str, Any]
     storage: StorageType
     _value: Path | str | ObjectId | None
     _fs: AsyncIOMotorGridFSBucket | None
+    _files: AsyncIOMotorCollection | None
 
     def __init__(
         self,
@@ -116,6 +158,9 @@ class FileField(BaseField[Union[Path, str, ObjectId]], FieldComparisonMixin):
         max_size: int = 100 * 1024 * 1024,  # 100MB
         allowed_types: Sequence[str] | None = None,
         upload_to: str = "uploads",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        hash_algorithm: str | None = "sha256",
+        dedup: bool = False,
         **options: Any,
     ) -> None:
         """Initialize file field.
@@ -125,13 +170,26 @@ class FileField(BaseField[Union[Path, str, ObjectId]], FieldComparisonMixin):
             max_size: Maximum file size in bytes
             allowed_types: List of allowed MIME types (with wildcards)
             upload_to: Upload directory path
+            chunk_size: Size of chunks streamed to and from storage
+            hash_algorithm: hashlib algorithm of content digests, one of
+                ``HASH_ALGORITHMS``, None to disable hashing. GridFS files store the digest in their metadata;
+                local files are only hashed for deduplication
+            dedup: Whether identical uploads share one stored blob
             **options: Additional field options
 
         Raises:
-            ValueError: If max_size is negative or allowed_types is invalid
+            ValueError: If max_size is negative, chunk_size is not positive,
+                hash_algorithm is not supported, dedup has no hash_algorithm or
+                allowed_types is invalid
         """
         if max_size < 0:
             raise ValueError("max_size must be non-negative")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        if hash_algorithm is not None and hash_algorithm not in HASH_ALGORITHMS:
+            raise ValueError(f"Unsupported hash algorithm: {hash_algorithm}, expected one of {sorted(HASH_ALGORITHMS)}")
+        if dedup and hash_algorithm is None:
+            raise ValueError("dedup requires a hash_algorithm")
 
         field_validators: list[Validator[Any]] = [TypeValidator(Path)]
         super().__init__(validators=field_validators, **options)
@@ -140,8 +198,14 @@ class FileField(BaseField[Union[Path, str, ObjectId]], FieldComparisonMixin):
         self.max_size = max_size
         self.allowed_types = tuple(allowed_types or ("*/*",))
         self.upload_to = upload_to
+        self.chunk_size = chunk_size
+        self.hash_algorithm = hash_algorithm
+        self.dedup = dedup
         self._value = None
         self._fs = None
+        self._files = None
+        self._local = LocalStorage(upload_to)
+        self._gridfs = GridFSStorage(self._get_fs, self._get_files if dedup else None)
 
         # Create upload directory if it doesn't exist
         if self.storage == StorageType.LOCAL:
@@ -338,15 +402,20 @@ class FileField(BaseField[Union[Path, str, ObjectId]], FieldComparisonMixin):
 
     async def save(
         self,
-        file: BinaryIO | bytes | str | Path,
+        file: FileSource,
         filename: str | None = None,
         content_type: str | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> str | ObjectId:
         """Save file to storage.
 
+        The content is streamed to the storage backend chunk by chunk and the
+        size limit is enforced while streaming, so oversized uploads are
+        aborted without being buffered.
+
         Args:
-            file: File to save (file object, bytes, string path or Path object)
+            file: File to save (bytes, string path or Path object, sync or async
+                file object, or async iterable of chunks)
             filename: Original filename
             content_type: MIME type of file
             metadata: Additional metadata
@@ -356,53 +425,56 @@ class FileField(BaseField[Union[Path, str, ObjectId]], FieldComparisonMixin):
 
         Raises:
             FieldValidationError: With codes:
-                - invalid_size: File exceeds maximum size
+                - file_too_large: File exceeds maximum size
+                - file_not_found: Source path does not exist
                 - invalid_content_type: File type not allowed
                 - storage_error: Storage backend error
         """
-        # Convert file to bytes and validate
-        data = await self._read_file(file)
         filename = filename or self._get_filename(file)
         content_type = content_type or self._guess_content_type(filename)
 
-        # Validate size
-        if self.max_size and len(data) > self.max_size:
-            raise FieldValidationError(
-                message=f"File size {len(data)} bytes exceeds maximum {self.max_size} bytes",
-                field_name=self.name,
-                code="file_too_large",
-            )
-
         # Validate content type
-        allowed = self.allowed_types
-        if content_type and allowed and content_type not in allowed:  # pylint: disable=unsupported-membership-test
+        if content_type and not self._is_mime_type_allowed(content_type):
             raise FieldValidationError(
                 message=f"Content type {content_type} not allowed. Allowed \
-                types: {', '.join(sorted(allowed))}",
+                types: {', '.join(sorted(self.allowed_types))}",
                 field_name=self.name,
                 code="invalid_content_type",
             )
 
+        chunks = limit_size(iter_chunks(file, self.chunk_size), self.max_size)
         try:
             if self.storage == StorageType.LOCAL:
-                # Save to local filesystem
-                path = self._get_upload_path(filename)
-                os.makedirs(path.parent, exist_ok=True)
-                with open(path, "wb") as f:
-                    f.write(data)
-                return str(path)
-            else:
-                # Save to GridFS
-                fs = await self._get_fs()
-                file_id = await fs.upload_from_stream(
-                    filename=filename,
-                    source=data,
-                    metadata={
-                        "content_type": content_type,
-                        **(metadata or {}),
-                    },
+                path, _ = await self._local.write(
+                    chunks,
+                    filename,
+                    hasher=self._new_hasher() if self.dedup else None,
+                    dedup=self.dedup,
                 )
-                return file_id
+                return path
+            file_id, _ = await self._gridfs.write(
+                chunks,
+                filename,
+                metadata={
+                    "content_type": content_type,
+                    **(metadata or {}),
+                },
+                hasher=self._new_hasher(),
+                dedup=self.dedup,
+            )
+            return file_id
+        except FileTooLargeError as e:
+            raise FieldValidationError(
+                message=f"File size exceeds maximum {self.max_size} bytes",
+                field_name=self.name,
+                code="file_too_large",
+            ) from e
+        except FileNotFoundError as e:
+            raise FieldValidationError(
+                message=f"File {file} does not exist",
+                field_name=self.name,
+                code="file_not_found",
+            ) from e
         except Exception as e:
             raise FieldValidationError(
                 message=f"Storage error: {e!s}",
@@ -410,27 +482,42 @@ class FileField(BaseField[Union[Path, str, ObjectId]], FieldComparisonMixin):
                 code="storage_error",
             ) from e
 
-    async def read(self) -> bytes | None:
-        """Read file from storage.
+    async def stream(
+        self,
+        chunk_size: int | None = None,
+        start: int = 0,
+        end: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream file from storage.
 
-        Returns:
-            File contents as bytes or None if file not found
+        Reading starts directly at ``start``: local files are memory-mapped
+        at the offset and GridFS reads begin at the chunk holding it.
+
+        Args:
+            chunk_size: Maximum size of produced chunks, defaults to the field's chunk size
+            start: Offset of the first byte
+            end: Offset after the last byte, defaults to the end of the file
+
+        Yields:
+            bytes: Next chunk of file content
 
         Raises:
-            FieldValidationError: With code "storage_error" if read fails
+            FieldValidationError: With codes:
+                - invalid_range: start is negative or end is before start
+                - storage_error: Read fails
         """
+        if start < 0 or (end is not None and end < start):
+            raise FieldValidationError(
+                message=f"Invalid byte range {start}-{end}",
+                field_name=self.name,
+                code="invalid_range",
+            )
         if self._value is None:
-            return None
+            return
 
         try:
-            if self.storage == StorageType.LOCAL:
-                with open(str(self._value), "rb") as f:
-                    return f.read()
-            else:
-                fs = await self._get_fs()
-                buffer = io.BytesIO()
-                await fs.download_to_stream(cast(str | ObjectId | bytes, self._value), buffer)
-                return buffer.getvalue()
+            async for chunk in self._storage_stream(chunk_size or self.chunk_size, start, end):
+                yield chunk
         except Exception as e:
             raise FieldValidationError(
                 message=f"Storage error: {e!s}",
@@ -438,6 +525,58 @@ class FileField(BaseField[Union[Path, str, ObjectId]], FieldComparisonMixin):
                 code="storage_error",
             ) from e
 
+    async def read(self) -> bytes | None:
+        """Read whole file from storage.
+
+        Prefer ``stream()`` for large files.
+
+        Returns:
+            File contents as bytes or None if file not found
+
+        Raises:
+            FieldValidationError: With code "storage_error" if read fails
+        """
+        if self._value is None:
+            return None
+        return b"".join([chunk async for chunk in self.stream()])
+
+    async def read_range(self, start: int, end: int | None = None) -> bytes | None:
+        """Read byte range of file from storage.
+
+        Data before ``start`` is never read. The range is clamped to the
+        file size, like a slice.
+
+        Args:
+            start: Offset of the first byte
+            end: Offset after the last byte, defaults to the end of the file
+
+        Returns:
+            Bytes in range or None if there is no file
+
+        Raises:
+            FieldValidationError: With codes:
+                - invalid_range: start is negative or end is before start
+                - storage_error: Read fails
+        """
+        if self._value is None:
+            return None
+        return b"".join([chunk async for chunk in self.stream(start=start, end=end)])
+
+    def _storage_stream(self, chunk_size: int, start: int = 0, end: int | None = None) -> AsyncIterator[bytes]:
+        """Open chunk stream of current file on its storage backend.
+
+        Args:
+            chunk_size: Maximum size of produced chunks
+            start: Offset of the first byte
+            end: Offset after the last byte
+
+        Returns:
+            AsyncIterator[bytes]: Chunk stream
+        """
+        if self.storage == StorageType.LOCAL:
+            return self._local.stream(str(self._value), chunk_size, start, end)
+        return self._gridfs.stream(cast(str | ObjectId | bytes, self._value), chunk_size, start, end)
+
     async def delete(self) -> None:
         """Delete file from storage.
 
@@ -449,10 +588,9 @@ class FileField(BaseField[Union[Path, str, ObjectId]], FieldComparisonMixin):
 
         try:
             if self.storage == StorageType.LOCAL:
-                os.unlink(str(self._value))
+                await self._local.delete(str(self._value))
             else:
-                fs = await self._get_fs()
-                await fs.delete(cast(str | ObjectId | bytes, self._value))
+                await self._gridfs.delete(cast(str | ObjectId | bytes, self._value))
         except Exception as e:
             raise FieldValidationError(
                 message=f"Storage error: {e!s}",
@@ -476,12 +614,13 @@ class FileField(BaseField[Union[Path, str, ObjectId]], FieldComparisonMixin):
             if self.storage == StorageType.LOCAL:
                 path = Path(str(self._value))
                 mime_type, _ = mimetypes.guess_type(str(path))
+                stat = await asyncio.to_thread(path.stat)
                 return FileInfo(
                     filename=path.name,
                     path=str(path),
                     content_type=mime_type,
-                    size=path.stat().st_size,
-                    created_at=datetime.fromtimestamp(path.stat().st_ctime),
+                    size=stat.st_size,
+                    created_at=datetime.fromtimestamp(stat.st_ctime),
                 )
             else:
                 fs = await self._get_fs()
@@ -500,6 +639,7 @@ class FileField(BaseField[Union[Path, str, ObjectId]], FieldComparisonMixin):
                     size=grid_out.length,
                     created_at=grid_out.upload_date,
                     metadata=dict(metadata),
+                    content_hash=metadata.get(self.hash_algorithm) if self.hash_algorithm else None,
                 )
         except Exception as e:
             raise FieldValidationError(
@@ -515,30 +655,30 @@ class FileField(BaseField[Union[Path, str, ObjectId]], FieldComparisonMixin):
 
             db = await container.get("db")
             self._fs = AsyncIOMotorGridFSBucket(db)
+            self._files = db["fs.files"]
         return self._fs
 
-    async def _read_file(self, file: BinaryIO | bytes | str | Path) -> bytes:
-        """Read file content to bytes."""
-        if isinstance(file, (str, Path)):
-            path = Path(file)
-            if not path.exists():
-                raise FieldValidationError(
-                    message=f"File {path} does not exist",
-                    field_name=self.name,
-                    code="file_not_found",
-                )
-            with open(path, "rb") as f:
-                return f.read()
-        elif isinstance(file, bytes):
-            return file
-        else:
-            return file.read()
-
-    def _get_filename(self, file: BinaryIO | bytes | str | Path) -> str:
+    async def _get_files(self) -> AsyncIOMotorCollection:
+        """Get files collection of the GridFS bucket."""
+        if self._files is None:
+            await self._get_fs()
+        return cast(AsyncIOMotorCollection, self._files)
+
+    def _new_hasher(self) -> Hasher | None:
+        """Create hash object of the field's algorithm.
+
+        Returns:
+            Hash object or None if hashing is disabled
+        """
+        if self.hash_algorithm is None:
+            return None
+        return hashlib.new(self.hash_algorithm)
+
+    def _get_filename(self, file: FileSource) -> str:
         """Get original filename from file object."""
         if isinstance(file, (str, Path)):
             return Path(file).name
-        elif isinstance(file, bytes):
+        elif isinstance(file, (bytes, bytearray, memoryview)):
             return "unnamed"
         elif hasattr(file, "name"):
             name = getattr(file, "name", None)
@@ -560,12 +700,7 @@ class FileField(BaseField[Union[Path, str, ObjectId]], FieldComparisonMixin):
 
     def _get_upload_path(self, filename: str) -> Path:
         """Get upload path for local storage."""
-        if not self.upload_to:
-            return Path(filename)
-
-        # Format upload path with date placeholders
-        upload_path = datetime.now().strftime(self.upload_to)
-        return Path(upload_path) / filename
+        return self._local.path_for(filename)
 
     def _prepare_value(self, value: Any) -> DatabaseValue:
         """Prepare file value for comparison.
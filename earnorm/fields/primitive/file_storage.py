@@ -0,0 +1,526 @@
+"""Streaming file storage backends.
+
+This module provides the storage backends used by ``FileField``. Files are
+moved as async iterators of chunks, so uploads and downloads never hold a
+whole file in memory:
+- ``LocalStorage`` writes through a temporary file and reads memory-mapped
+  chunks; all blocking file system calls run in the default thread pool
+- ``GridFSStorage`` writes GridFS chunks as they arrive and reads them back
+  one chunk at a time
+- ``iter_chunks`` turns bytes, paths, sync/async file objects and async
+  iterables into chunk iterators
+- ``limit_size`` aborts a stream as soon as it exceeds a size limit
+
+Both backends can hash content while it is written and deduplicate identical
+uploads, so they share one stored blob:
+- Local files are hard links to a content-addressed blob under
+  ``<upload root>/.blobs``; ``LocalStorage.prune`` removes blobs no file
+  links to anymore
+- GridFS files record the digest in their metadata; a new upload matching an
+  older file is dropped and the older file gains a reference instead
+
+Examples:
+    >>> storage = LocalStorage("uploads/%Y/%m")
+    >>> path, size = await storage.write(iter_chunks(request.stream()), "report.pdf")
+    >>> async for chunk in storage.stream(path):
+    ...     await response.write(chunk)
+
+    >>> # Serve bytes 1000-1999 without reading the rest of the file
+    >>> async for chunk in storage.stream(path, start=1000, end=2000):
+    ...     await response.write(chunk)
+"""
+
+import asyncio
+import mmap
+import os
+import tempfile
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from datetime import datetime
+from itertools import takewhile
+from pathlib import Path
+from typing import Any, BinaryIO, Protocol, Union
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorGridFSBucket
+
+DEFAULT_CHUNK_SIZE = 255 * 1024
+"""Chunk size in bytes, the GridFS default so streamed chunks map to stored chunks."""
+
+FileSource = Union[bytes, bytearray, memoryview, str, Path, BinaryIO, AsyncIterable[bytes]]
+"""Values accepted as file content."""
+
+BLOB_DIR = ".blobs"
+"""Directory of content-addressed blobs under the local upload root."""
+
+REFS_KEY = "refs"
+"""GridFS metadata key counting additional references to a deduplicated file."""
+
+
+class Hasher(Protocol):
+    """Incremental hash object, as returned by ``hashlib.new``."""
+
+    @property
+    def name(self) -> str:
+        """Get hash algorithm name."""
+        ...
+
+    def update(self, data: bytes, /) -> None:
+        """Add data to the hash."""
+        ...
+
+    def hexdigest(self) -> str:
+        """Get hex digest of the data added so far."""
+        ...
+
+
+class FileTooLargeError(ValueError):
+    """Raised when a stream exceeds its size limit."""
+
+    def __init__(self, limit: int) -> None:
+        """Initialize error.
+
+        Args:
+            limit: Maximum size in bytes
+        """
+        super().__init__(f"File exceeds maximum size of {limit} bytes")
+        self.limit = limit
+
+
+async def iter_chunks(source: FileSource, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Iterate over file content in chunks.
+
+    Paths and synchronous file objects are read in the thread pool. Objects
+    with an awaitable ``read(size)`` (e.g. ``UploadFile``) and async
+    iterables are consumed as they are.
+
+    Args:
+        source: File content
+        chunk_size: Maximum size of produced chunks
+
+    Yields:
+        bytes: Next chunk
+
+    Raises:
+        FileNotFoundError: If a path does not exist
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for offset in range(0, len(view), chunk_size):
+            yield bytes(view[offset : offset + chunk_size])
+        return
+
+    if isinstance(source, (str, Path)):
+        file = await asyncio.to_thread(open, source, "rb")
+        try:
+            while chunk := await asyncio.to_thread(file.read, chunk_size):
+                yield chunk
+        finally:
+            await asyncio.to_thread(file.close)
+        return
+
+    if isinstance(source, AsyncIterable):
+        async for chunk in source:
+            if chunk:
+                yield bytes(chunk)
+        return
+
+    read: Callable[[int], Any] = source.read
+    if asyncio.iscoroutinefunction(read):
+        while chunk := await read(chunk_size):
+            yield chunk
+    else:
+        while chunk := await asyncio.to_thread(read, chunk_size):
+            yield chunk
+
+
+async def limit_size(chunks: AsyncIterable[bytes], max_size: int | None) -> AsyncIterator[bytes]:
+    """Pass chunks through until a size limit is exceeded.
+
+    Args:
+        chunks: Chunk stream
+        max_size: Maximum total size in bytes, None or 0 for no limit
+
+    Yields:
+        bytes: Next chunk
+
+    Raises:
+        FileTooLargeError: As soon as the total size exceeds the limit
+    """
+    size = 0
+    async for chunk in chunks:
+        size += len(chunk)
+        if max_size and size > max_size:
+            raise FileTooLargeError(max_size)
+        yield chunk
+
+
+class LocalStorage:
+    """File system storage.
+
+    Files are written to a temporary file next to their destination and
+    renamed once complete, so readers never see partial files and aborted
+    uploads leave nothing behind. Deduplicated files are hard links to a
+    blob named after their digest, which must be on the same file system.
+
+    Args:
+        upload_to: Upload directory, may contain ``strftime`` placeholders
+    """
+
+    def __init__(self, upload_to: str) -> None:
+        """Initialize storage.
+
+        Args:
+            upload_to: Upload directory, may contain ``strftime`` placeholders
+        """
+        self.upload_to = upload_to
+
+    def path_for(self, filename: str) -> Path:
+        """Get destination path of a new file.
+
+        Args:
+            filename: Original filename
+
+        Returns:
+            Path: Destination path
+        """
+        if not self.upload_to:
+            return Path(filename)
+        return Path(datetime.now().strftime(self.upload_to)) / filename
+
+    @property
+    def blob_root(self) -> Path:
+        """Get directory of content-addressed blobs.
+
+        It lives under the static part of ``upload_to``, so files uploaded
+        under different dates share blobs.
+        """
+        static = list(takewhile(lambda part: "%" not in part, Path(self.upload_to or ".").parts))
+        return Path(*static, BLOB_DIR) if static else Path(BLOB_DIR)
+
+    def blob_path(self, digest: str, filename: str) -> Path:
+        """Get path of the blob holding content with a digest.
+
+        Args:
+            digest: Hex digest of the content
+            filename: Original filename, its suffix is kept
+
+        Returns:
+            Path: Blob path
+        """
+        return self.blob_root / digest[:2] / f"{digest}{Path(filename).suffix}"
+
+    async def write(
+        self,
+        chunks: AsyncIterable[bytes],
+        filename: str,
+        *,
+        hasher: Hasher | None = None,
+        dedup: bool = False,
+    ) -> tuple[str, int]:
+        """Write chunk stream to a new file.
+
+        Args:
+            chunks: File content
+            filename: Original filename
+            hasher: Hash object updated with every chunk
+            dedup: Link the file to an existing blob with the same digest,
+                requires hasher
+
+        Returns:
+            Stored path and number of bytes written
+        """
+        path = self.path_for(filename)
+        await asyncio.to_thread(os.makedirs, path.parent, exist_ok=True)
+        fd, tmp_name = await asyncio.to_thread(tempfile.mkstemp, dir=path.parent, prefix=f".{path.name}.")
+        file = os.fdopen(fd, "wb")
+        size = 0
+        try:
+            async for chunk in chunks:
+                if hasher is not None:
+                    hasher.update(chunk)
+                await asyncio.to_thread(file.write, chunk)
+                size += len(chunk)
+            await asyncio.to_thread(file.close)
+            if dedup and hasher is not None:
+                await asyncio.to_thread(_link_blob, tmp_name, self.blob_path(hasher.hexdigest(), filename))
+            await asyncio.to_thread(os.replace, tmp_name, path)
+        except BaseException:
+            await asyncio.to_thread(file.close)
+            await asyncio.to_thread(_remove, tmp_name)
+            raise
+        return str(path), size
+
+    async def stream(
+        self,
+        path: str | Path,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        start: int = 0,
+        end: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Read file in chunks.
+
+        The file is memory-mapped; chunks are copied out of the mapping in
+        the thread pool, so page faults never block the event loop.
+
+        Args:
+            path: Stored path
+            chunk_size: Maximum size of produced chunks
+            start: Offset of the first byte
+            end: Offset after the last byte, defaults to the end of the file
+
+        Yields:
+            bytes: Next chunk
+        """
+        file = await asyncio.to_thread(open, path, "rb")
+        try:
+            size = await asyncio.to_thread(lambda: os.fstat(file.fileno()).st_size)
+            end = size if end is None else min(end, size)
+            if start >= end:
+                return
+            mapping = await asyncio.to_thread(mmap.mmap, file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                for offset in range(start, end, chunk_size):
+                    yield await asyncio.to_thread(mapping.__getitem__, slice(offset, min(offset + chunk_size, end)))
+            finally:
+                mapping.close()
+        finally:
+            await asyncio.to_thread(file.close)
+
+    async def size(self, path: str | Path) -> int:
+        """Get stored file size.
+
+        Args:
+            path: Stored path
+
+        Returns:
+            int: Size in bytes
+        """
+        return (await asyncio.to_thread(os.stat, path)).st_size
+
+    async def delete(self, path: str | Path) -> None:
+        """Delete stored file.
+
+        The blob of a deduplicated file is kept until ``prune`` runs.
+
+        Args:
+            path: Stored path
+        """
+        await asyncio.to_thread(os.unlink, path)
+
+    async def prune(self) -> int:
+        """Remove blobs no stored file links to.
+
+        Returns:
+            int: Number of blobs removed
+        """
+        return await asyncio.to_thread(_prune_blobs, self.blob_root)
+
+
+class GridFSStorage:
+    """MongoDB GridFS storage.
+
+    Deduplication keeps the oldest of identical files. Concurrent identical
+    uploads may both be kept, but never both dropped.
+
+    Args:
+        get_bucket: Coroutine function returning the GridFS bucket
+        get_files: Coroutine function returning the bucket's files collection,
+            required for deduplication
+    """
+
+    def __init__(
+        self,
+        get_bucket: Callable[[], Awaitable[AsyncIOMotorGridFSBucket]],
+        get_files: Callable[[], Awaitable[AsyncIOMotorCollection]] | None = None,
+    ) -> None:
+        """Initialize storage.
+
+        Args:
+            get_bucket: Coroutine function returning the GridFS bucket
+            get_files: Coroutine function returning the bucket's files collection,
+                required for deduplication
+        """
+        self._get_bucket = get_bucket
+        self._get_files = get_files
+
+    async def write(
+        self,
+        chunks: AsyncIterable[bytes],
+        filename: str,
+        metadata: dict[str, Any] | None = None,
+        *,
+        hasher: Hasher | None = None,
+        dedup: bool = False,
+    ) -> tuple[ObjectId, int]:
+        """Write chunk stream to a new GridFS file.
+
+        Chunks are flushed to the server as they fill up. If the stream
+        fails, the chunks written so far are removed. The digest is stored
+        in the metadata under the hash algorithm's name.
+
+        Args:
+            chunks: File content
+            filename: Original filename
+            metadata: File metadata
+            hasher: Hash object updated with every chunk
+            dedup: Return an older file with the same digest instead of the
+                new one, requires hasher
+
+        Returns:
+            File ID and number of bytes written
+
+        Raises:
+            ValueError: If dedup is requested without a files collection
+        """
+        if dedup and self._get_files is None:
+            raise ValueError("GridFS deduplication requires the files collection")
+
+        bucket = await self._get_bucket()
+        grid_in = bucket.open_upload_stream(filename, metadata=metadata)
+        size = 0
+        try:
+            async for chunk in chunks:
+                if hasher is not None:
+                    hasher.update(chunk)
+                await grid_in.write(chunk)
+                size += len(chunk)
+            if hasher is not None:
+                await grid_in.set("metadata", {**(metadata or {}), hasher.name: hasher.hexdigest()})
+        except BaseException:
+            await grid_in.abort()
+            raise
+        await grid_in.close()
+        file_id: ObjectId = grid_in._id  # pylint: disable=protected-access
+
+        if dedup and hasher is not None:
+            existing = await self._reference(hasher.name, hasher.hexdigest(), file_id)
+            if existing is not None:
+                await bucket.delete(file_id)
+                return existing, size
+        return file_id, size
+
+    async def _reference(self, algorithm: str, digest: str, file_id: ObjectId) -> ObjectId | None:
+        """Add reference to the oldest file with a digest.
+
+        Only files older than the new one are considered, so two concurrent
+        identical uploads cannot drop each other.
+
+        Args:
+            algorithm: Hash algorithm name
+            digest: Hex digest of the content
+            file_id: ID of the new file
+
+        Returns:
+            ID of the referenced file or None if there is none
+        """
+        assert self._get_files is not None
+        files = await self._get_files()
+        doc = await files.find_one_and_update(
+            {f"metadata.{algorithm}": digest, "_id": {"$lt": file_id}},
+            {"$inc": {f"metadata.{REFS_KEY}": 1}},
+            projection={"_id": 1},
+            sort=[("_id", 1)],
+        )
+        return doc["_id"] if doc else None
+
+    async def stream(
+        self,
+        file_id: Any,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        start: int = 0,
+        end: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Read GridFS file in chunks.
+
+        Args:
+            file_id: File ID
+            chunk_size: Maximum size of produced chunks
+            start: Offset of the first byte
+            end: Offset after the last byte, defaults to the end of the file
+
+        Yields:
+            bytes: Next chunk
+        """
+        bucket = await self._get_bucket()
+        grid_out = await bucket.open_download_stream(file_id)
+        end = grid_out.length if end is None else min(end, grid_out.length)
+        if start >= end:
+            return
+        if start:
+            grid_out.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = await grid_out.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+    async def delete(self, file_id: Any) -> None:
+        """Delete GridFS file and its chunks.
+
+        A deduplicated file that is still referenced only loses a reference.
+
+        Args:
+            file_id: File ID
+        """
+        if self._get_files is not None:
+            files = await self._get_files()
+            released = await files.find_one_and_update(
+                {"_id": file_id, f"metadata.{REFS_KEY}": {"$gt": 0}},
+                {"$inc": {f"metadata.{REFS_KEY}": -1}},
+                projection={"_id": 1},
+            )
+            if released is not None:
+                return
+        bucket = await self._get_bucket()
+        await bucket.delete(file_id)
+
+
+def _link_blob(tmp_name: str, blob: Path) -> None:
+    """Make a temporary file share the blob with the same content.
+
+    The temporary file becomes the blob if there is none yet, otherwise it is
+    replaced by a hard link to the existing blob.
+
+    Args:
+        tmp_name: Completely written temporary file
+        blob: Blob path
+    """
+    os.makedirs(blob.parent, exist_ok=True)
+    try:
+        os.link(tmp_name, blob)
+    except FileExistsError:
+        os.unlink(tmp_name)
+        os.link(blob, tmp_name)
+
+
+def _prune_blobs(root: Path) -> int:
+    """Remove blobs with no other hard link.
+
+    Args:
+        root: Blob directory
+
+    Returns:
+        int: Number of blobs removed
+    """
+    removed = 0
+    if not root.is_dir():
+        return removed
+    for blob in root.glob("*/*"):
+        if blob.is_file() and blob.stat().st_nlink == 1:
+            _remove(str(blob))
+            removed += 1
+    return removed
+
+
+def _remove(path: str) -> None:
+    """Remove file if it exists.
+
+    Args:
+        path: File path
+    """
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
@@ -5,9 +5,23 @@ It supports:
 - JSON validation
 - Schema validation
 - Type conversion
+- Native document or JSON string storage
+- Pluggable JSON codecs (json, orjson, msgspec)
 - Database type mapping
 - JSON comparison operations
 
+On MongoDB, values are stored as embedded documents by default, so they can
+be queried by path and are never encoded to or decoded from strings. Values
+made of plain JSON types (dict with string keys, list, str, int, float, bool,
+None) are stored as they are; other values are normalized through the codec
+once. With ``storage="string"``, and on backends without native documents,
+values are serialized by the field's codec.
+
+Serializability is checked by the conversion itself, so every value is
+serialized at most once per write. Schemas are checked and compiled into a
+validator once, when the field is created; fields with equal schemas share
+the compiled validator.
+
 Examples:
     >>> class Product(Model):
     ...     metadata = JSONField(default={})
@@ -18,6 +32,7 @@ Examples:
     ...             "theme": {"type": "string", "enum": ["light", "dark"]},
     ...         },
     ...     })
+    ...     raw = JSONField(storage="string", codec="orjson")
     ...
     ...     # Query examples
     ...     has_tags = Product.find(Product.metadata.has_key("tags"))
@@ -26,18 +41,84 @@ Examples:
 """
 
 import json
-from typing import Any, Final
+from typing import Any, Final, Literal
 
-from jsonschema import Draft202012Validator, ValidationError, validate
+from jsonschema import Draft202012Validator, SchemaError
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator as SchemaValidator
+from jsonschema.validators import validator_for
 
 from earnorm.exceptions import FieldValidationError
 from earnorm.fields.base import BaseField
+from earnorm.fields.primitive.json_codec import JSONCodec, StdlibJSONCodec, get_codec
 from earnorm.fields.validators.base import Validator
 from earnorm.types.fields import ComparisonOperator, DatabaseValue, FieldComparisonMixin
 
 # Constants
 DEFAULT_ENCODER: Final[type[json.JSONEncoder]] = json.JSONEncoder
 DEFAULT_DECODER: Final[type[json.JSONDecoder]] = json.JSONDecoder
+DEFAULT_STORAGE: Final[Literal["native", "string"]] = "native"
+NATIVE_BACKENDS: Final[frozenset[str]] = frozenset({"mongodb"})
+
+JSONStorage = Literal["native", "string"]
+
+_SCALAR_TYPES: Final[frozenset[type]] = frozenset({str, int, float, bool, type(None)})
+
+_schema_validators: dict[str, SchemaValidator] = {}
+"""Compiled schema validators by canonical schema JSON."""
+
+
+def compile_schema(schema: dict[str, Any]) -> SchemaValidator:
+    """Get compiled validator of a JSON schema.
+
+    The schema is checked against its meta-schema once; equal schemas share
+    one validator. The draft is taken from ``$schema``, defaulting to 2020-12.
+
+    Args:
+        schema: JSON schema
+
+    Returns:
+        Validator: Compiled schema validator
+
+    Raises:
+        SchemaError: If the schema is invalid
+    """
+    key = json.dumps(schema, sort_keys=True, default=str)
+    validator = _schema_validators.get(key)
+    if validator is None:
+        cls = validator_for(schema, default=Draft202012Validator)
+        cls.check_schema(schema)
+        validator = cls(schema)
+        _schema_validators[key] = validator
+    return validator
+
+
+def is_native_json(value: Any) -> bool:
+    """Check if value only consists of plain JSON types.
+
+    Such values can be stored as documents without conversion. Subclasses
+    (enums, ...) and tuples are not plain and need normalizing.
+
+    Args:
+        value: Value to check
+
+    Returns:
+        bool: True if value is a plain JSON value
+    """
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        item_type = type(item)
+        if item_type is dict:
+            for key, child in item.items():
+                if type(key) is not str:
+                    return False
+                stack.append(child)
+        elif item_type is list:
+            stack.extend(item)
+        elif item_type not in _SCALAR_TYPES:
+            return False
+    return True
 
 
 class JSONField(BaseField[Any], FieldComparisonMixin):
@@ -47,68 +128,110 @@ class JSONField(BaseField[Any], FieldComparisonMixin):
     - JSON validation
     - Schema validation
     - Type conversion
+    - Native document or JSON string storage
+    - Pluggable JSON codecs
     - Database type mapping
     - JSON comparison operations
 
     Attributes:
         schema: JSON schema for validation
+        schema_validator: Compiled validator of the schema
         encoder: JSON encoder class
         decoder: JSON decoder class
+        storage: Storage format, ``native`` documents or JSON ``string``
+        codec: Codec serializing values
         backend_options: Database backend options
     """
 
     schema: dict[str, Any] | None
+    schema_validator: SchemaValidator | None
     encoder: type[json.JSONEncoder]
     decoder: type[json.JSONDecoder]
+    storage: JSONStorage
+    codec: JSONCodec
     backend_options: dict[str, Any]
 
+    sync_codec = True
+
     def __init__(
         self,
         *,
         schema: dict[str, Any] | None = None,
         encoder: type[json.JSONEncoder] | None = None,
         decoder: type[json.JSONDecoder] | None = None,
+        storage: JSONStorage = DEFAULT_STORAGE,
+        codec: str | JSONCodec = "json",
         **options: Any,
     ) -> None:
         """Initialize JSON field.
 
         Args:
             schema: JSON schema for validation
-            encoder: JSON encoder class
-            decoder: JSON decoder class
+            encoder: JSON encoder class, only used by the ``json`` codec
+            decoder: JSON decoder class, only used by the ``json`` codec
+            storage: Store native documents where the backend supports them
+                (default) or JSON strings
+            codec: Codec instance or name (``json``, ``orjson``, ``msgspec``, ``auto``)
             **options: Additional field options
 
         Raises:
-            ValueError: If schema is invalid
+            ValueError: If schema, storage or codec is invalid, or encoder/decoder
+                are combined with another codec than ``json``
+            ImportError: If the codec's package is not installed
         """
+        if storage not in ("native", "string"):
+            raise ValueError(f"Unknown JSON storage: {storage}. Expected 'native' or 'string'")
+
         field_validators: list[Validator[Any]] = []
         super().__init__(validators=field_validators, **options)
 
         self.schema = schema
         self.encoder = encoder or DEFAULT_ENCODER
         self.decoder = decoder or DEFAULT_DECODER
+        self.storage = storage
+
+        if encoder is not None or decoder is not None:
+            if codec != "json":
+                raise ValueError("encoder and decoder can only be used with the json codec")
+            self.codec = StdlibJSONCodec(self.encoder, self.decoder)
+        else:
+            self.codec = get_codec(codec)
 
-        # Validate schema if provided
+        # Check and compile schema if provided
+        self.schema_validator = None
         if schema is not None:
             try:
-                Draft202012Validator.check_schema(schema)
-            except ValidationError as e:
+                self.schema_validator = compile_schema(schema)
+            except SchemaError as e:
                 raise ValueError(f"Invalid JSON schema: {e!s}") from e
 
         # Initialize backend options
         self.backend_options = {
-            "mongodb": {"type": "object"},
+            "mongodb": {"type": "object" if storage == "native" else "string"},
             "postgres": {"type": "JSONB"},
             "mysql": {"type": "JSON"},
         }
 
-    async def validate(self, value: Any, context: dict[str, Any] | None = None) -> Any:
-        """Validate JSON value.
+    def _is_native(self, backend: str) -> bool:
+        """Check if values are stored as documents on a backend.
+
+        Args:
+            backend: Database backend type
+
+        Returns:
+            bool: True for native document storage
+        """
+        return self.storage == "native" and backend in NATIVE_BACKENDS
+
+    def check(self, value: Any, context: dict[str, Any] | None = None) -> Any:
+        """Check JSON value.
 
         This method validates:
-        - Value can be serialized to JSON
         - Value matches JSON schema if provided
 
+        Serializability is checked when the value is converted for the
+        database, so it is not serialized twice.
+
         Args:
             value: Value to validate
             context: Validation context with following keys:
@@ -124,29 +247,14 @@ class JSONField(BaseField[Any], FieldComparisonMixin):
         Raises:
             FieldValidationError: If validation fails
         """
-        value = await super().validate(value, context)
-
-        if value is not None:
-            try:
-                # Check if value can be serialized
-                json.dumps(value, cls=self.encoder)
-
-                # Validate against schema if provided
-                if self.schema is not None:
-                    try:
-                        validate(instance=value, schema=self.schema)
-                    except ValidationError as e:
-                        raise FieldValidationError(
-                            message=f"JSON schema validation failed: {e!s}",
-                            field_name=self.name,
-                            code="schema_error",
-                        ) from e
-            except (TypeError, ValueError) as e:
+        if value is not None and self.schema_validator is not None:
+            error = best_match(self.schema_validator.iter_errors(value))
+            if error is not None:
                 raise FieldValidationError(
-                    message=f"Invalid JSON value: {e!s}",
+                    message=f"JSON schema validation failed: {error!s}",
                     field_name=self.name,
-                    code="invalid_json",
-                ) from e
+                    code="schema_error",
+                ) from error
 
         return value
 
@@ -172,7 +280,7 @@ class JSONField(BaseField[Any], FieldComparisonMixin):
 
         try:
             if isinstance(value, str):
-                return json.loads(value, cls=self.decoder)
+                return self.codec.loads(value)
             return value
         except (TypeError, ValueError) as e:
             raise FieldValidationError(
@@ -181,7 +289,7 @@ class JSONField(BaseField[Any], FieldComparisonMixin):
                 code="conversion_error",
             ) from e
 
-    async def to_db(self, value: Any | None, backend: str) -> DatabaseValue:
+    def to_db_sync(self, value: Any | None, backend: str) -> DatabaseValue:
         """Convert value to database format.
 
         Args:
@@ -189,26 +297,28 @@ class JSONField(BaseField[Any], FieldComparisonMixin):
             backend: Database backend type
 
         Returns:
-            Converted JSON value or None
+            Document value (native storage) or JSON string, or None
 
         Raises:
-            FieldValidationError: If value cannot be converted
+            FieldValidationError: With code "invalid_json" if value cannot be serialized
         """
         if value is None:
             return None
 
         try:
-            if backend == "mongodb":
-                return value
-            return json.dumps(value, cls=self.encoder)
+            if self._is_native(backend):
+                if is_native_json(value):
+                    return value
+                return self.codec.loads(self.codec.dumps(value))
+            return self.codec.dumps(value)
         except (TypeError, ValueError) as e:
             raise FieldValidationError(
-                message=f"Cannot convert value to JSON: {e!s}",
+                message=f"Invalid JSON value: {e!s}",
                 field_name=self.name,
-                code="conversion_error",
+                code="invalid_json",
             ) from e
 
-    async def from_db(self, value: DatabaseValue, backend: str) -> Any | None:
+    def from_db_sync(self, value: DatabaseValue, backend: str) -> Any | None:
         """Convert database value to JSON.
 
         Args:
@@ -224,12 +334,10 @@ class JSONField(BaseField[Any], FieldComparisonMixin):
         if value is None:
             return None
 
-        try:
-            if backend == "mongodb":
-                return value
-            if isinstance(value, str):
-                return json.loads(value, cls=self.decoder)
+        if self._is_native(backend) or not isinstance(value, (str, bytes)):
             return value
+        try:
+            return self.codec.loads(value)
         except (TypeError, ValueError) as e:
             raise FieldValidationError(
                 message=f"Cannot convert database value to JSON: {e!s}",
@@ -240,7 +348,8 @@ class JSONField(BaseField[Any], FieldComparisonMixin):
     def _prepare_value(self, value: Any) -> DatabaseValue:
         """Prepare JSON value for comparison.
 
-        Converts value to JSON string for database comparison.
+        Values are compared as documents with native storage and as JSON
+        strings otherwise.
 
         Args:
             value: Value to prepare
@@ -252,8 +361,8 @@ class JSONField(BaseField[Any], FieldComparisonMixin):
             return None
 
         try:
-            return json.dumps(value, cls=self.encoder)
-        except (TypeError, ValueError):
+            return self.to_db_sync(value, "mongodb")
+        except FieldValidationError:
             return None
 
     def has_key(self, key: str, path: str | None = None) -> ComparisonOperator:
@@ -0,0 +1,235 @@
+"""JSON codecs.
+
+This module provides the serializers ``JSONField`` uses for string-backed
+storage. Codecs are looked up by name, so a faster library can be plugged in
+without changing field definitions:
+- ``json``: Standard library, supports custom encoder/decoder classes
+- ``orjson``: Requires the ``orjson`` package
+- ``msgspec``: Requires the ``msgspec`` package
+- ``auto``: The first installed of ``orjson``, ``msgspec`` and ``json``
+
+All codecs raise ``TypeError`` for values they cannot serialize and
+``ValueError`` for malformed input.
+
+Examples:
+    >>> codec = get_codec("orjson")
+    >>> codec.dumps({"theme": "dark"})
+    '{"theme":"dark"}'
+    >>> codec.loads('{"theme":"dark"}')
+    {'theme': 'dark'}
+
+    >>> class Event(Model):
+    ...     payload = JSONField(storage="string", codec="auto")
+"""
+
+import json
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Any
+
+CodecFactory = Callable[[], "JSONCodec"]
+
+
+class JSONCodec(ABC):
+    """JSON serializer.
+
+    Attributes:
+        name: Codec name
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def dumps(self, value: Any) -> str:
+        """Serialize value to JSON string.
+
+        Args:
+            value: JSON-compatible value
+
+        Returns:
+            str: JSON string
+
+        Raises:
+            TypeError: If value cannot be serialized
+        """
+
+    @abstractmethod
+    def loads(self, data: str | bytes) -> Any:
+        """Parse JSON string.
+
+        Args:
+            data: JSON string
+
+        Returns:
+            Any: Parsed value
+
+        Raises:
+            ValueError: If data is not valid JSON
+        """
+
+    def __repr__(self) -> str:
+        """Get string representation."""
+        return f"{self.__class__.__name__}()"
+
+
+class StdlibJSONCodec(JSONCodec):
+    """Codec using the standard library ``json`` module.
+
+    Args:
+        encoder: JSON encoder class
+        decoder: JSON decoder class
+    """
+
+    name = "json"
+
+    def __init__(
+        self,
+        encoder: type[json.JSONEncoder] | None = None,
+        decoder: type[json.JSONDecoder] | None = None,
+    ) -> None:
+        """Initialize codec.
+
+        Args:
+            encoder: JSON encoder class
+            decoder: JSON decoder class
+        """
+        self.encoder = encoder or json.JSONEncoder
+        self.decoder = decoder or json.JSONDecoder
+        self._encode = self.encoder().encode
+        self._decode = self.decoder().decode
+
+    def dumps(self, value: Any) -> str:
+        """Serialize value to JSON string."""
+        return self._encode(value)
+
+    def loads(self, data: str | bytes) -> Any:
+        """Parse JSON string."""
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode()
+        return self._decode(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec using ``orjson``.
+
+    Args:
+        default: Called for values orjson cannot serialize natively
+    """
+
+    name = "orjson"
+
+    def __init__(self, default: Callable[[Any], Any] | None = None) -> None:
+        """Initialize codec.
+
+        Args:
+            default: Called for values orjson cannot serialize natively
+
+        Raises:
+            ImportError: If orjson is not installed
+        """
+        try:
+            import orjson
+        except ImportError as e:
+            raise ImportError("orjson package is not installed. Please install it with: pip install earnorm[orjson]") from e
+
+        self._orjson = orjson
+        self.default = default
+
+    def dumps(self, value: Any) -> str:
+        """Serialize value to JSON string."""
+        return self._orjson.dumps(value, default=self.default).decode()
+
+    def loads(self, data: str | bytes) -> Any:
+        """Parse JSON string."""
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """Codec using ``msgspec.json``.
+
+    Args:
+        enc_hook: Called for values msgspec cannot serialize natively
+    """
+
+    name = "msgspec"
+
+    def __init__(self, enc_hook: Callable[[Any], Any] | None = None) -> None:
+        """Initialize codec.
+
+        Args:
+            enc_hook: Called for values msgspec cannot serialize natively
+
+        Raises:
+            ImportError: If msgspec is not installed
+        """
+        try:
+            import msgspec
+        except ImportError as e:
+            raise ImportError("msgspec package is not installed. Please install it with: pip install msgspec") from e
+
+        self._encode_error = msgspec.EncodeError
+        self._decode_error = msgspec.DecodeError
+        self._encoder = msgspec.json.Encoder(enc_hook=enc_hook)
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, value: Any) -> str:
+        """Serialize value to JSON string."""
+        try:
+            return self._encoder.encode(value).decode()
+        except self._encode_error as e:
+            raise TypeError(str(e)) from e
+
+    def loads(self, data: str | bytes) -> Any:
+        """Parse JSON string."""
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as e:
+            raise ValueError(str(e)) from e
+
+
+CODECS: dict[str, CodecFactory] = {
+    "json": StdlibJSONCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+"""Codec factories by name."""
+
+AUTO_ORDER: tuple[str, ...] = ("orjson", "msgspec", "json")
+"""Codecs tried by ``auto``, fastest first."""
+
+
+def register_codec(name: str, factory: CodecFactory) -> None:
+    """Register codec under a name.
+
+    Args:
+        name: Codec name used in ``JSONField(codec=...)``
+        factory: Callable creating the codec
+    """
+    CODECS[name] = factory
+
+
+def get_codec(codec: str | JSONCodec) -> JSONCodec:
+    """Resolve codec name to codec instance.
+
+    Args:
+        codec: Codec instance, registered name or ``auto``
+
+    Returns:
+        JSONCodec: Codec instance
+
+    Raises:
+        ValueError: If the name is not registered
+        ImportError: If the codec's package is not installed
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec == "auto":
+        for name in AUTO_ORDER:
+            try:
+                return CODECS[name]()
+            except ImportError:
+                continue
+    factory = CODECS.get(codec)
+    if factory is None:
+        raise ValueError(f"Unknown JSON codec: {codec}. Expected one of: auto, {', '.join(sorted(CODECS))}")
+    return factory()
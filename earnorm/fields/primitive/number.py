@@ -185,8 +185,8 @@ class NumberField(Generic[N], BaseField[N], FieldComparisonMixin):
         """
         return ComparisonOperator(self.name, "is_zero", None)
 
-    async def validate(self, value: Any, context: dict[str, Any] | None = None) -> Any:
-        """Validate numeric value.
+    def check(self, value: Any, context: dict[str, Any] | None = None) -> Any:
+        """Check numeric value.
 
         This method validates:
         - Value is numeric type
@@ -208,8 +208,6 @@ class NumberField(Generic[N], BaseField[N], FieldComparisonMixin):
         Raises:
             FieldValidationError: If validation fails
         """
-        value = await super().validate(value, context)
-
         if value is not None:
             if not isinstance(value, (int, float, Decimal)):
                 raise FieldValidationError(
@@ -254,6 +252,8 @@ class IntegerField(NumberField[int]):
     - String parsing
     """
 
+    sync_codec = True
+
     def __init__(
         self,
         *,
@@ -355,7 +355,7 @@ class IntegerField(NumberField[int]):
                 code="conversion_error",
             ) from e
 
-    async def to_db(self, value: int | None, backend: str) -> DatabaseValue:
+    def to_db_sync(self, value: int | None, backend: str) -> DatabaseValue:
         """Convert integer to database format.
 
         Args:
@@ -367,7 +367,7 @@ class IntegerField(NumberField[int]):
         """
         return value
 
-    async def from_db(self, value: DatabaseValue, backend: str) -> int | None:
+    def from_db_sync(self, value: DatabaseValue, backend: str) -> int | None:
         """Convert database value to integer.
 
         Args:
@@ -382,6 +382,8 @@ class IntegerField(NumberField[int]):
         """
         if value is None:
             return None
+        if type(value) is int:
+            return value
 
         try:
             if isinstance(value, bool):
@@ -408,6 +410,8 @@ class FloatField(NumberField[float]):
     - String parsing
     """
 
+    sync_codec = True
+
     def __init__(
         self,
         *,
@@ -491,7 +495,7 @@ class FloatField(NumberField[float]):
                 code="conversion_error",
             ) from e
 
-    async def to_db(self, value: float | None, backend: str) -> DatabaseValue:
+    def to_db_sync(self, value: float | None, backend: str) -> DatabaseValue:
         """Convert float to database format.
 
         Args:
@@ -509,7 +513,7 @@ class FloatField(NumberField[float]):
 
         return value
 
-    async def from_db(self, value: DatabaseValue, backend: str) -> float | None:
+    def from_db_sync(self, value: DatabaseValue, backend: str) -> float | None:
         """Convert database value to float.
 
         Args:
@@ -524,6 +528,8 @@ class FloatField(NumberField[float]):
         """
         if value is None:
             return None
+        if type(value) is float and self.precision is None:
+            return value
 
         try:
             if isinstance(value, bool):
@@ -617,8 +623,8 @@ class DecimalField(NumberField[Decimal]):
             },
         }
 
-    async def validate(self, value: Any, context: dict[str, Any] | None = None) -> None:
-        """Validate decimal value.
+    def check(self, value: Any, context: dict[str, Any] | None = None) -> Any:
+        """Check decimal value.
 
         This method validates:
         - Value is Decimal type
@@ -635,10 +641,13 @@ class DecimalField(NumberField[Decimal]):
                     - values: Values being validated
                     - field_name: Name of field being validated
 
+        Returns:
+            Any: The validated value
+
         Raises:
             FieldValidationError: If validation fails
         """
-        await super().validate(value, context)
+        value = super().check(value, context)
 
         if value is not None:
             if not isinstance(value, Decimal):
@@ -675,6 +684,8 @@ class DecimalField(NumberField[Decimal]):
                             code="decimal_places",
                         )
 
+        return value
+
     async def convert(self, value: Any) -> Decimal | None:
         """Convert value to decimal.
 
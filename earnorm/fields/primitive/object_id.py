@@ -49,6 +49,8 @@ class ObjectIdField(BaseField[ObjectId], FieldComparisonMixin):
     primary_key: bool
     backend_options: dict[str, Any]
 
+    sync_codec = True
+
     def __init__(
         self,
         *,
@@ -73,8 +75,8 @@ class ObjectIdField(BaseField[ObjectId], FieldComparisonMixin):
             "mysql": {"type": "CHAR(24)"},
         }
 
-    async def validate(self, value: Any, context: dict[str, Any] | None = None) -> Any:
-        """Validate ObjectId value.
+    def check(self, value: Any, context: dict[str, Any] | None = None) -> Any:
+        """Check ObjectId value.
 
         This method validates:
         - Value is ObjectId type
@@ -95,8 +97,6 @@ class ObjectIdField(BaseField[ObjectId], FieldComparisonMixin):
         Raises:
             FieldValidationError: If validation fails
         """
-        value = await super().validate(value, context)
-
         if value is not None:
             if not isinstance(value, ObjectId):
                 raise FieldValidationError(
@@ -153,7 +153,7 @@ class ObjectIdField(BaseField[ObjectId], FieldComparisonMixin):
                 code="conversion_error",
             ) from e
 
-    async def to_db(self, value: ObjectId | None, backend: str) -> DatabaseValue:
+    def to_db_sync(self, value: ObjectId | None, backend: str) -> DatabaseValue:
         """Convert ObjectId to database format.
 
         Args:
@@ -170,7 +170,7 @@ class ObjectIdField(BaseField[ObjectId], FieldComparisonMixin):
             return value  # type: ignore
         return str(value)
 
-    async def from_db(self, value: DatabaseValue, backend: str) -> ObjectId | None:
+    def from_db_sync(self, value: DatabaseValue, backend: str) -> ObjectId | None:
         """Convert database value to ObjectId.
 
         Args:
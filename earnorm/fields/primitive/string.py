@@ -55,6 +55,8 @@ class StringField(BaseField[str], FieldComparisonMixin):
     upper: bool
     backend_options: dict[str, Any]
 
+    sync_codec = True
+
     def __init__(
         self,
         min_length: int | None = None,
@@ -103,13 +105,11 @@ class StringField(BaseField[str], FieldComparisonMixin):
             if max_length is not None and max_length < min_length:
                 raise ValueError("max_length cannot be less than min_length")
 
-        # Validate pattern
+        # Compile pattern once, it is matched against every validated value
+        self._pattern: Pattern[str] | None = None
         if pattern is not None:
             try:
-                if isinstance(pattern, Pattern):
-                    re.compile(pattern)
-                else:
-                    re.compile(pattern)
+                self._pattern = re.compile(pattern)
             except re.error as e:
                 raise ValueError(f"Invalid pattern: {e!s}") from e
 
@@ -123,11 +123,10 @@ class StringField(BaseField[str], FieldComparisonMixin):
         options_without_validators = {k: v for k, v in kwargs.items() if k != "validators"}
         super().__init__(validators=field_validators, **options_without_validators)
 
-    async def validate(self, value: Any, context: dict[str, Any] | None = None) -> Any:
-        """Validate string value.
+    def check(self, value: Any, context: dict[str, Any] | None = None) -> Any:
+        """Check string value.
 
         This method checks:
-        - Basic string validation from parent
         - Length constraints
         - Pattern matching if specified
 
@@ -146,7 +145,6 @@ class StringField(BaseField[str], FieldComparisonMixin):
         Raises:
             ValidationError: If validation fails
         """
-        value = await super().validate(value, context)
         if value is None:
             return None
 
@@ -157,9 +155,8 @@ class StringField(BaseField[str], FieldComparisonMixin):
             raise ValueError(f"String length must be at most {self.max_length} characters")
 
         # Validate pattern
-        if self.pattern:
-            pattern = self.pattern if isinstance(self.pattern, Pattern) else re.compile(self.pattern)
-            if not pattern.match(value):
+        if self._pattern is not None:
+            if not self._pattern.match(value):
                 raise ValueError("String does not match required pattern")
 
         return value
@@ -203,7 +200,7 @@ class StringField(BaseField[str], FieldComparisonMixin):
                 code="conversion_error",
             ) from e
 
-    async def to_db(self, value: str | None, backend: str) -> DatabaseValue:
+    def to_db_sync(self, value: str | None, backend: str) -> DatabaseValue:
         """Convert string to database format.
 
         Args:
@@ -215,7 +212,7 @@ class StringField(BaseField[str], FieldComparisonMixin):
         """
         return value
 
-    async def from_db(self, value: DatabaseValue, backend: str) -> str | None:
+    def from_db_sync(self, value: DatabaseValue, backend: str) -> str | None:
         """Convert database value to string.
 
         Args:
@@ -2,14 +2,14 @@
 
 This module provides the base validator system for field validation.
 It supports:
-- Synchronous and asynchronous validation
+- Synchronous and asynchronous validation (``SyncValidator`` for checks without I/O)
 - Validation chaining
 - Custom validation rules
 - Error handling
 - Validation context
 
 Examples:
-    >>> class MinLengthValidator(Validator[str]):
+    >>> class MinLengthValidator(SyncValidator[str]):
     ...     def __init__(self, min_length: int) -> None:
     ...         super().__init__()
     ...         self.min_length = min_length
@@ -22,8 +22,10 @@ Examples:
     ...             )
 """
 
+import re
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
+from re import Pattern
 from typing import (
     Any,
     Final,
@@ -91,6 +93,9 @@ class Validator(Generic[T], ValidatorProtocol[T], ABC):
         code: Error code for identifying error type
     """
 
+    is_sync: bool = False
+    """Whether ``validate_sync`` can check values without awaiting."""
+
     def __init__(self, *, message: str | None = None, code: str | None = None) -> None:
         """Initialize validator.
 
@@ -128,6 +133,42 @@ class Validator(Generic[T], ValidatorProtocol[T], ABC):
         await self.validate(value, context)
 
 
+class SyncValidator(Validator[T]):
+    """Base class for validators that check values without I/O.
+
+    Subclasses implement ``validate_sync``. Batch validation calls it
+    directly for every value of a column instead of awaiting ``validate``
+    once per value.
+    """
+
+    is_sync: bool = True
+
+    @abstractmethod
+    def validate_sync(self, value: T, context: ValidationContext) -> None:
+        """Validate value synchronously.
+
+        Args:
+            value: Value to validate
+            context: Validation context
+
+        Raises:
+            FieldValidationError: If validation fails
+        """
+        raise NotImplementedError("Subclasses must implement validate_sync()")
+
+    async def validate(self, value: T, context: ValidationContext) -> None:
+        """Validate value.
+
+        Args:
+            value: Value to validate
+            context: Validation context
+
+        Raises:
+            FieldValidationError: If validation fails
+        """
+        self.validate_sync(value, context)
+
+
 @final
 class ValidatorChain(Validator[T]):
     """Chain of validators.
@@ -147,6 +188,22 @@ class ValidatorChain(Validator[T]):
         """
         super().__init__()
         self.validators: list[Validator[T]] = list(validators)
+        self.is_sync = all(validator.is_sync for validator in self.validators)
+
+    def validate_sync(self, value: T, context: ValidationContext) -> None:
+        """Validate value using all validators in chain synchronously.
+
+        Only available if every validator in the chain is synchronous.
+
+        Args:
+            value: Value to validate
+            context: Validation context
+
+        Raises:
+            FieldValidationError: If any validator fails
+        """
+        for validator in self.validators:
+            validator.validate_sync(value, context)  # type: ignore[attr-defined]
 
     async def validate(self, value: T, context: ValidationContext) -> None:
         """Validate value using all validators in chain.
@@ -163,7 +220,7 @@ class ValidatorChain(Validator[T]):
 
 
 @final
-class RequiredValidator(Validator[T]):
+class RequiredValidator(SyncValidator[T]):
     """Validator for required fields.
 
     This validator ensures that a value is not None.
@@ -187,7 +244,7 @@ class RequiredValidator(Validator[T]):
         super().__init__(message=message)
         self.code = code
 
-    async def validate(self, value: T, context: ValidationContext) -> None:
+    def validate_sync(self, value: T, context: ValidationContext) -> None:
         """Validate value is not None.
 
         Args:
@@ -206,7 +263,7 @@ class RequiredValidator(Validator[T]):
 
 
 @final
-class TypeValidator(Validator[T]):
+class TypeValidator(SyncValidator[T]):
     """Validator for value type.
 
     This validator ensures that a value is of the correct type.
@@ -235,7 +292,7 @@ class TypeValidator(Validator[T]):
         self.code = code
         self.value_type: type = value_type
 
-    async def validate(self, value: T, context: ValidationContext) -> None:
+    def validate_sync(self, value: T, context: ValidationContext) -> None:
         """Validate value is of correct type.
 
         Args:
@@ -253,7 +310,7 @@ class TypeValidator(Validator[T]):
             )
 
 
-class RangeValidator(Validator[T]):
+class RangeValidator(SyncValidator[T]):
     """Validator for value range.
 
     This validator ensures that a value is within a specified range.
@@ -285,7 +342,7 @@ class RangeValidator(Validator[T]):
         self.min_value = min_value
         self.max_value = max_value
 
-    async def validate(self, value: T, context: ValidationContext) -> None:
+    def validate_sync(self, value: T, context: ValidationContext) -> None:
         """Validate value is within range.
 
         Args:
@@ -310,7 +367,7 @@ class RangeValidator(Validator[T]):
                 )
 
 
-class RegexValidator(Validator[Optional[str]]):
+class RegexValidator(SyncValidator[Optional[str]]):
     """Validator for regex pattern matching.
 
     This validator ensures that a string value matches a regex pattern.
@@ -337,8 +394,9 @@ class RegexValidator(Validator[Optional[str]]):
         """
         super().__init__(message=message, code=code)
         self.pattern = pattern
+        self._regex: Pattern[str] = re.compile(pattern)
 
-    async def validate(self, value: str | None, context: ValidationContext) -> None:
+    def validate_sync(self, value: str | None, context: ValidationContext) -> None:
         """Validate value matches pattern.
 
         Args:
@@ -348,9 +406,7 @@ class RegexValidator(Validator[Optional[str]]):
         Raises:
             FieldValidationError: If value does not match pattern
         """
-        import re
-
-        if value is not None and not re.match(self.pattern, value):
+        if value is not None and not self._regex.match(value):
             raise FieldValidationError(
                 message=self.message or f"Value must match pattern {self.pattern}",
                 field_name=getattr(context.field, "name", "unknown"),
@@ -359,7 +415,7 @@ class RegexValidator(Validator[Optional[str]]):
 
 
 @final
-class ChoicesValidator(Validator[T]):
+class ChoicesValidator(SyncValidator[T]):
     """Validator for choices.
 
     This validator ensures that a value is one of the allowed choices.
@@ -384,7 +440,7 @@ class ChoicesValidator(Validator[T]):
         self.code = code
         self.choices = choices
 
-    async def validate(self, value: T, context: ValidationContext) -> None:
+    def validate_sync(self, value: T, context: ValidationContext) -> None:
         """Validate value is in choices.
 
         Args:
@@ -33,7 +33,7 @@ from typing import (
 from urllib.parse import urlparse
 
 from earnorm.exceptions import FieldValidationError
-from earnorm.fields.validators.base import ValidationContext, Validator
+from earnorm.fields.validators.base import SyncValidator, ValidationContext
 
 # Type variables with constraints
 S = TypeVar("S", str, Sequence[Any])
@@ -47,7 +47,7 @@ class LengthProtocol(Protocol):
 
 
 @final
-class MinLengthValidator(Validator[S]):
+class MinLengthValidator(SyncValidator[S]):
     """Validator for minimum length."""
 
     DEFAULT_CODE: Final[str] = "min_length"
@@ -69,7 +69,7 @@ class MinLengthValidator(Validator[S]):
         self.code = code
         self.min_length: int = min_length
 
-    async def validate(self, value: S, context: ValidationContext) -> None:
+    def validate_sync(self, value: S, context: ValidationContext) -> None:
         """Validate value length.
 
         Args:
@@ -88,7 +88,7 @@ class MinLengthValidator(Validator[S]):
 
 
 @final
-class MaxLengthValidator(Validator[S]):
+class MaxLengthValidator(SyncValidator[S]):
     """Validator for maximum length."""
 
     DEFAULT_CODE: Final[str] = "max_length"
@@ -110,7 +110,7 @@ class MaxLengthValidator(Validator[S]):
         self.code = code
         self.max_length: int = max_length
 
-    async def validate(self, value: S, context: ValidationContext) -> None:
+    def validate_sync(self, value: S, context: ValidationContext) -> None:
         """Validate value length.
 
         Args:
@@ -129,7 +129,7 @@ class MaxLengthValidator(Validator[S]):
 
 
 @final
-class PatternValidator(Validator[str]):
+class PatternValidator(SyncValidator[str]):
     """Validator for pattern matching."""
 
     DEFAULT_CODE: Final[str] = "invalid_pattern"
@@ -151,7 +151,7 @@ class PatternValidator(Validator[str]):
         self.code = code
         self.pattern: Pattern[str] = pattern if isinstance(pattern, Pattern) else re.compile(pattern)
 
-    async def validate(self, value: str, context: ValidationContext) -> None:
+    def validate_sync(self, value: str, context: ValidationContext) -> None:
         """Validate value matches pattern.
 
         Args:
@@ -170,7 +170,7 @@ class PatternValidator(Validator[str]):
 
 
 @final
-class EmailValidator(Validator[str]):
+class EmailValidator(SyncValidator[str]):
     """Validator for email addresses."""
 
     EMAIL_PATTERN: Final[str] = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
@@ -202,7 +202,7 @@ class EmailValidator(Validator[str]):
         """
         return bool(self.pattern.match(value))
 
-    async def validate(self, value: str, context: ValidationContext) -> None:
+    def validate_sync(self, value: str, context: ValidationContext) -> None:
         """Validate email address.
 
         Args:
@@ -221,7 +221,7 @@ class EmailValidator(Validator[str]):
 
 
 @final
-class URLValidator(Validator[str]):
+class URLValidator(SyncValidator[str]):
     """Validator for URLs."""
 
     DEFAULT_SCHEMES: Final[frozenset[str]] = frozenset({"http", "https"})
@@ -259,7 +259,7 @@ class URLValidator(Validator[str]):
         except Exception:
             return False
 
-    async def validate(self, value: str, context: ValidationContext) -> None:
+    def validate_sync(self, value: str, context: ValidationContext) -> None:
         """Validate URL.
 
         Args:
@@ -277,7 +277,7 @@ class URLValidator(Validator[str]):
             )
 
 
-class DateTimeValidator(Validator[datetime]):
+class DateTimeValidator(SyncValidator[datetime]):
     """Validator for datetime values."""
 
     DEFAULT_CODE: Final[str] = "invalid_datetime"
@@ -301,7 +301,7 @@ class DateTimeValidator(Validator[datetime]):
         self.min_value = min_value
         self.max_value = max_value
 
-    async def validate(self, value: datetime, context: ValidationContext) -> None:
+    def validate_sync(self, value: datetime, context: ValidationContext) -> None:
         """Validate datetime value.
 
         Args:
@@ -325,7 +325,7 @@ class DateTimeValidator(Validator[datetime]):
             )
 
 
-class UniqueValidator(Validator[Sequence[Any]]):
+class UniqueValidator(SyncValidator[Sequence[Any]]):
     """Validator for unique values."""
 
     DEFAULT_CODE: Final[str] = "duplicate_values"
@@ -343,7 +343,7 @@ class UniqueValidator(Validator[Sequence[Any]]):
         """
         super().__init__(message=message, code=code)
 
-    async def validate(self, value: Sequence[Any], context: ValidationContext) -> None:
+    def validate_sync(self, value: Sequence[Any], context: ValidationContext) -> None:
         """Validate sequence contains no duplicates.
 
         Args:
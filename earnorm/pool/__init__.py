@@ -38,7 +38,7 @@ from .constants import (
     DEFAULT_MAX_POOL_SIZE,
     DEFAULT_MIN_POOL_SIZE,
 )
-from .core import CircuitBreaker, CircuitState, RetryPolicy, with_resilience
+from .core import CircuitBreaker, CircuitState, RetryPolicy, SizingPolicy, with_resilience
 from .factory import PoolFactory, create_mongo_pool, create_redis_pool
 from .protocols import AsyncPoolProtocol
 from .registry import PoolRegistry
@@ -94,6 +94,7 @@ __all__ = [
     "CircuitBreaker",
     "CircuitState",
     "RetryPolicy",
+    "SizingPolicy",
     "with_resilience",
     # Utils
     "ConnectionMetrics",
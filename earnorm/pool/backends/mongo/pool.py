@@ -16,6 +16,7 @@ from earnorm.exceptions import MongoDBConnectionError, PoolExhaustedError
 from earnorm.pool.backends.mongo.connection import MongoConnection
 from earnorm.pool.core.circuit import CircuitBreaker
 from earnorm.pool.core.retry import RetryPolicy
+from earnorm.pool.core.sizing import PoolSizer, SizingPolicy, pre_warm
 from earnorm.pool.protocols.connection import AsyncConnectionProtocol
 from earnorm.pool.protocols.pool import AsyncPoolProtocol
 
@@ -74,6 +75,7 @@ class MongoPool(AsyncPoolProtocol[DB, COLL]):
         max_size: int = 10,
         retry_policy: RetryPolicy | None = None,
         circuit_breaker: CircuitBreaker | None = None,
+        sizing: SizingPolicy | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize pool.
@@ -85,6 +87,7 @@ class MongoPool(AsyncPoolProtocol[DB, COLL]):
             max_size: Maximum pool size
             retry_policy: Optional retry policy
             circuit_breaker: Optional circuit breaker
+            sizing: Optional adaptive sizing policy
             **kwargs: Additional client options
 
         Raises:
@@ -162,6 +165,11 @@ class MongoPool(AsyncPoolProtocol[DB, COLL]):
         self._available: set[AsyncConnectionProtocol[DB, COLL]] = set()
         self._in_use: set[AsyncConnectionProtocol[DB, COLL]] = set()
         self._lock = asyncio.Lock()
+        # Notified when connections opened by grow() are added
+        self._grown = asyncio.Condition(self._lock)
+        self._waiters = 0
+        self._growing = 0
+        self._sizer = PoolSizer(self, sizing) if sizing else None
 
     def _map_options(self, options: dict[str, Any]) -> dict[str, Any]:
         """Map configuration options to PyMongo client options.
@@ -180,6 +188,8 @@ class MongoPool(AsyncPoolProtocol[DB, COLL]):
             "retry_reads": "retryReads",
             "w": "w",
             "j": "journal",
+            "read_preference": "readPreference",
+            "read_concern_level": "readConcernLevel",
         }
 
         client_options: dict[str, Any] = {}
@@ -235,6 +245,17 @@ class MongoPool(AsyncPoolProtocol[DB, COLL]):
         """Get number of connections in use."""
         return len(self._in_use)
 
+    @property
+    def waiters(self) -> int:
+        """Get number of callers waiting in acquire().
+
+        Callers wait for the pool lock, e.g. while another caller opens a
+        connection, or for connections being opened by grow(). A caller
+        finding the pool full fails with PoolExhaustedError at once and is
+        not counted.
+        """
+        return self._waiters
+
     async def init(self) -> None:
         """Initialize pool.
 
@@ -255,6 +276,9 @@ class MongoPool(AsyncPoolProtocol[DB, COLL]):
 
                 # Map options to PyMongo format
                 client_options = self._map_options(self._kwargs.get("options", {}))
+                if self._sizer and "maxIdleTimeMS" not in client_options:
+                    # Let the driver close sockets the sizing controller released
+                    client_options["maxIdleTimeMS"] = int(self._sizer.policy.idle_timeout * 1000)
                 logger.debug("Using client options: %s", client_options)
 
                 # Create client with mapped options and retry logic
@@ -288,20 +312,13 @@ class MongoPool(AsyncPoolProtocol[DB, COLL]):
                         await asyncio.sleep(retry_delay)
                         retry_delay *= 2  # Exponential backoff
 
-                # Create initial connections
-                connection_errors: list[str] = []
-                for i in range(self._min_size):
-                    try:
-                        conn = self._create_connection()
-                        await conn.ping()  # Verify connection works
-                        self._available.add(conn)
-                        logger.debug("Created connection %d/%d", i + 1, self._min_size)
-                    except Exception as e:
-                        connection_errors.append(str(e))
+                # Create initial connections concurrently
+                connections, errors = await pre_warm(self._open_connection, self._min_size)
+                self._available.update(connections)
 
-                if connection_errors:
+                if errors:
                     raise MongoDBConnectionError(
-                        f"Failed to create some initial connections: {'; '.join(connection_errors)}"
+                        f"Failed to create some initial connections: {'; '.join(str(e) for e in errors)}"
                     )
 
                 logger.info(
@@ -315,6 +332,9 @@ class MongoPool(AsyncPoolProtocol[DB, COLL]):
                     self._client = None
                 raise
 
+        if self._sizer:
+            self._sizer.start()
+
     def _create_connection(self) -> AsyncConnectionProtocol[DB, COLL]:
         """Create new connection.
 
@@ -345,6 +365,73 @@ class MongoPool(AsyncPoolProtocol[DB, COLL]):
                 f"Failed to create MongoDB connection: {e!s}",
             ) from e
 
+    async def _open_connection(self) -> AsyncConnectionProtocol[DB, COLL]:
+        """Create connection and verify it with a ping.
+
+        Returns:
+            AsyncConnectionProtocol[DB, COLL]: Verified connection
+        """
+        conn = self._create_connection()
+        await conn.ping()
+        return conn
+
+    async def grow(self, count: int) -> int:
+        """Open connections concurrently, up to max_size.
+
+        Connections are opened outside the pool lock so that acquire()
+        and release() keep running while sockets are established. Their
+        slots are reserved up front, so acquire() does not open more
+        connections meanwhile; any opened past max_size are dropped, as in
+        shrink().
+
+        Args:
+            count: Number of connections to open
+
+        Returns:
+            int: Number of connections added to the pool
+        """
+        async with self._lock:
+            count = min(count, self.max_size - self.size - self._growing)
+            if count <= 0 or not self._client:
+                return 0
+            self._growing += count
+
+        connections: list[AsyncConnectionProtocol[DB, COLL]] = []
+        try:
+            connections, errors = await pre_warm(self._open_connection, count)
+        finally:
+            async with self._lock:
+                self._growing -= count
+                # Re-check the limit, connections opened past it are dropped
+                room = max(self.max_size - self.size - self._growing, 0)
+                self._available.update(connections[:room])
+                self._grown.notify_all()
+
+        for error in errors:
+            logger.warning("Failed to grow MongoDB pool: %s", str(error))
+        if len(connections) > room:
+            logger.warning("Dropped %d connections opened past max_size", len(connections) - room)
+        return min(len(connections), room)
+
+    async def shrink(self, count: int) -> int:
+        """Drop idle connections, down to min_size.
+
+        Connections share one client, so dropped connections are not closed
+        individually; the driver closes their idle sockets after
+        ``maxIdleTimeMS``.
+
+        Args:
+            count: Number of connections to drop
+
+        Returns:
+            int: Number of connections removed from the pool
+        """
+        async with self._lock:
+            count = max(min(count, self.size - self.min_size, len(self._available)), 0)
+            for _ in range(count):
+                self._available.pop()
+            return count
+
     async def acquire(self) -> AsyncConnectionProtocol[DB, COLL]:
         """Acquire connection from pool.
 
@@ -355,9 +442,22 @@ class MongoPool(AsyncPoolProtocol[DB, COLL]):
             PoolExhaustedError: If no connections are available
             ConnectionError: If connection creation fails
         """
+        self._waiters += 1
+        try:
+            return await self._acquire()
+        finally:
+            self._waiters -= 1
+
+    async def _acquire(self) -> AsyncConnectionProtocol[DB, COLL]:
+        """Take available connection or create a new one."""
         async with self._lock:
+            # Slots reserved by grow() count toward max_size, wait for
+            # those connections rather than opening more
+            while not self._available and self._growing and self.size + self._growing >= self.max_size:
+                await self._grown.wait()
+
             # Get available connection or create new one
-            if not self._available and self.size < self.max_size:
+            if not self._available and self.size + self._growing < self.max_size:
                 try:
                     conn = self._create_connection()
                     await conn.ping()  # Verify connection works
@@ -446,6 +546,8 @@ class MongoPool(AsyncPoolProtocol[DB, COLL]):
 
     async def destroy(self) -> None:
         """Destroy pool and all connections."""
+        if self._sizer:
+            await self._sizer.stop()
         if self._client:
             try:
                 # Clear connections
@@ -507,6 +609,8 @@ class MongoPool(AsyncPoolProtocol[DB, COLL]):
             "min_size": self.min_size,
             "available": self.available,
             "in_use": self.in_use,
+            "waiters": self.waiters,
+            "sizing": self._sizer.get_stats() if self._sizer else None,
         }
 
     @property
@@ -19,13 +19,17 @@ Example:
     >>> await conn.execute("get", "key")
     "value"
     >>> await pool.release(conn)
+    >>> await pool.execute_many([("set", ("a", 1)), ("incr", ("a",))])
+    [True, 2]
     >>> await pool.close()
 """
 
-from earnorm.pool.backends.redis.connection import RedisConnection
+from earnorm.pool.backends.redis.connection import RedisBatch, RedisCommand, RedisConnection
 from earnorm.pool.backends.redis.pool import RedisPool
 
 __all__ = [
+    "RedisBatch",
+    "RedisCommand",
     "RedisConnection",
     "RedisPool",
 ]
@@ -1,7 +1,7 @@
 """Redis connection implementation."""
 
 import time
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Callable, Iterable, Mapping, Sequence
 from typing import Any, TypeVar, cast
 
 from redis.asyncio import Redis
@@ -11,7 +11,7 @@ from redis.exceptions import (
     TimeoutError as RedisTimeoutError,
 )
 
-from earnorm.exceptions import QueryError, RedisConnectionError
+from earnorm.exceptions import BatchQueryError, QueryError, RedisConnectionError
 from earnorm.pool.core.circuit import CircuitBreaker
 from earnorm.pool.core.decorators import with_resilience
 from earnorm.pool.core.retry import RetryPolicy
@@ -19,6 +19,146 @@ from earnorm.pool.protocols.connection import AsyncConnectionProtocol
 
 DB = TypeVar("DB", bound=Redis)
 
+RedisCommand = tuple[str, Sequence[Any]] | tuple[str, Sequence[Any], Mapping[str, Any]]
+"""Batched command: ``(operation, args)`` or ``(operation, args, kwargs)``."""
+
+
+def _unpack_command(command: RedisCommand) -> tuple[str, Sequence[Any], Mapping[str, Any]]:
+    """Split batched command into operation, args and kwargs.
+
+    Args:
+        command: Command tuple
+
+    Returns:
+        Operation name, positional and keyword arguments
+    """
+    if len(command) == 3:
+        operation, args, kwargs = cast(tuple[str, Sequence[Any], Mapping[str, Any]], command)
+        return operation, args, kwargs
+    operation, args = cast(tuple[str, Sequence[Any]], command)
+    return operation, args, {}
+
+
+def _collect_batch_errors(
+    commands: Sequence[RedisCommand], replies: list[Any], raise_on_error: bool
+) -> list[Any]:
+    """Wrap per-command failures of a pipeline reply.
+
+    Args:
+        commands: Commands sent in the batch
+        replies: Raw pipeline replies, exceptions in place of failed commands
+        raise_on_error: Whether to raise if any command failed
+
+    Returns:
+        Replies in command order, failed entries replaced by QueryError
+
+    Raises:
+        BatchQueryError: If any command failed and raise_on_error is set
+    """
+    errors: dict[int, Exception] = {}
+    for index, reply in enumerate(replies):
+        if isinstance(reply, Exception):
+            operation = commands[index][0]
+            error = QueryError(
+                f"Failed to execute operation {operation}: {reply!s}",
+                backend="redis",
+                query=operation,
+            )
+            error.__cause__ = reply
+            errors[index] = error
+            replies[index] = error
+
+    if errors and raise_on_error:
+        raise BatchQueryError(
+            f"{len(errors)} of {len(commands)} batched commands failed",
+            backend="redis",
+            query="pipeline",
+            results=replies,
+            errors=errors,
+        )
+    return replies
+
+
+class RedisBatch:
+    """Queue of Redis commands sent in one round-trip.
+
+    Commands are buffered with :meth:`add` and flushed as a single pipeline
+    when the context exits without an exception (or on :meth:`execute`).
+    Results are available in command order through :attr:`results`.
+
+    Examples:
+        >>> async with conn.batch() as batch:
+        ...     batch.add("mset", {"a": 1, "b": 2})
+        ...     batch.add("expire", "a", 60)
+        ...     batch.add("delete", "stale")
+        >>> batch.results
+        [True, True, 1]
+    """
+
+    def __init__(
+        self,
+        execute_many: Callable[..., Awaitable[list[Any]]],
+        transaction: bool = False,
+        raise_on_error: bool = True,
+    ) -> None:
+        """Initialize batch.
+
+        Args:
+            execute_many: Coroutine function that sends a list of commands
+            transaction: Whether to wrap the batch in MULTI/EXEC
+            raise_on_error: Whether to raise BatchQueryError on command failures
+        """
+        self._execute_many = execute_many
+        self._transaction = transaction
+        self._raise_on_error = raise_on_error
+        self._commands: list[RedisCommand] = []
+        self.results: list[Any] = []
+
+    def __len__(self) -> int:
+        """Get number of queued commands."""
+        return len(self._commands)
+
+    def add(self, operation: str, *args: Any, **kwargs: Any) -> int:
+        """Queue command.
+
+        Args:
+            operation: Operation name (e.g. get, set, delete)
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            int: Index of the command's result in :attr:`results`
+        """
+        self._commands.append((operation, args, kwargs))
+        return len(self._commands) - 1
+
+    async def execute(self) -> list[Any]:
+        """Send queued commands and clear the queue.
+
+        Returns:
+            list[Any]: Results in command order
+
+        Raises:
+            QueryError: If the batch could not be sent
+            BatchQueryError: If any command failed and raise_on_error is set
+        """
+        commands, self._commands = self._commands, []
+        self.results = await self._execute_many(
+            commands,
+            transaction=self._transaction,
+            raise_on_error=self._raise_on_error,
+        )
+        return self.results
+
+    async def __aenter__(self) -> "RedisBatch":
+        """Enter batch context."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Flush queued commands unless the block raised."""
+        if exc_type is None and self._commands:
+            await self.execute()
+
 
 class RedisConnection(AsyncConnectionProtocol[DB, None]):
     """Redis connection implementation.
@@ -39,6 +179,9 @@ class RedisConnection(AsyncConnectionProtocol[DB, None]):
         >>> pipe.set("key2", "value2")
         >>> await pipe.execute()
         [True, True]
+        >>> # Batched commands, one round-trip
+        >>> await conn.execute_many([("set", ("key1", "v1")), ("get", ("key1",))])
+        [True, "v1"]
     """
 
     def __init__(
@@ -257,3 +400,79 @@ class RedisConnection(AsyncConnectionProtocol[DB, None]):
             [True, True]
         """
         return self._client.pipeline()
+
+    @with_resilience(backend="redis")
+    async def _execute_many_impl(self, commands: Sequence[RedisCommand], transaction: bool) -> list[Any]:
+        """Internal batch implementation.
+
+        Per-command failures are returned in place of their reply, only
+        failures of the round-trip itself raise.
+        """
+        self.touch()
+        try:
+            async with self._client.pipeline(transaction=transaction) as pipe:
+                for command in commands:
+                    operation, args, kwargs = _unpack_command(command)
+                    getattr(pipe, operation)(*args, **kwargs)
+                return list(await pipe.execute(raise_on_error=False))
+        except Exception as e:
+            raise QueryError(
+                f"Failed to execute batch of {len(commands)} commands: {e!s}",
+                backend=self.backend,
+                query="pipeline",
+            ) from e
+
+    async def execute_many(
+        self,
+        commands: Iterable[RedisCommand],
+        *,
+        transaction: bool = False,
+        raise_on_error: bool = True,
+    ) -> list[Any]:
+        """Execute several Redis operations in one round-trip.
+
+        Args:
+            commands: ``(operation, args)`` or ``(operation, args, kwargs)`` tuples
+            transaction: Whether to wrap the batch in MULTI/EXEC
+            raise_on_error: Whether to raise if any command failed. If False,
+                failed positions hold a QueryError instead of a reply.
+
+        Returns:
+            list[Any]: Results in command order
+
+        Raises:
+            QueryError: If the batch could not be sent
+            BatchQueryError: If any command failed and raise_on_error is set
+
+        Examples:
+            >>> await conn.execute_many([
+            ...     ("mset", ({"a": 1, "b": 2},)),
+            ...     ("expire", ("a", 60)),
+            ...     ("delete", ("stale",)),
+            ... ])
+            [True, True, 1]
+        """
+        commands = list(commands)
+        if not commands:
+            return []
+        replies = await self._execute_many_impl(commands, transaction)
+        return _collect_batch_errors(commands, replies, raise_on_error)
+
+    def batch(self, *, transaction: bool = False, raise_on_error: bool = True) -> RedisBatch:
+        """Get batch that sends queued commands in one round-trip.
+
+        Args:
+            transaction: Whether to wrap the batch in MULTI/EXEC
+            raise_on_error: Whether to raise if any command failed
+
+        Returns:
+            RedisBatch: Batch bound to this connection
+
+        Examples:
+            >>> async with conn.batch() as batch:
+            ...     batch.add("delete", "key1")
+            ...     batch.add("expire", "key2", 60)
+            >>> batch.results
+            [1, True]
+        """
+        return RedisBatch(self.execute_many, transaction=transaction, raise_on_error=raise_on_error)
@@ -28,11 +28,22 @@ Examples:
             "get",
             key="test",
         )
+
+    # Batched commands share one connection and one round-trip
+    await pool.execute_many([
+        ("mget", (["a", "b"],)),
+        ("delete", ("stale",)),
+    ])
+
+    async with pool.batch() as batch:
+        batch.add("expire", "a", 60)
+        batch.add("expire", "b", 60)
     ```
 """
 
 import asyncio
 import logging
+from collections.abc import Iterable
 from typing import Any, AsyncContextManager, TypeVar, cast
 
 try:
@@ -43,9 +54,10 @@ except ImportError as e:
     ) from e
 
 from earnorm.exceptions import PoolExhaustedError, RedisConnectionError
-from earnorm.pool.backends.redis.connection import RedisConnection
+from earnorm.pool.backends.redis.connection import RedisBatch, RedisCommand, RedisConnection
 from earnorm.pool.core.circuit import CircuitBreaker
 from earnorm.pool.core.retry import RetryPolicy
+from earnorm.pool.core.sizing import PoolSizer, SizingPolicy, pre_warm
 from earnorm.pool.protocols.connection import AsyncConnectionProtocol
 from earnorm.pool.protocols.pool import AsyncPoolProtocol
 
@@ -72,6 +84,7 @@ class RedisPool(AsyncPoolProtocol[DB, COLL]):
         socket_keepalive: bool = True,
         retry_policy: RetryPolicy | None = None,
         circuit_breaker: CircuitBreaker | None = None,
+        sizing: SizingPolicy | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize Redis pool.
@@ -89,6 +102,7 @@ class RedisPool(AsyncPoolProtocol[DB, COLL]):
             socket_keepalive: Whether to enable socket keepalive
             retry_policy: Retry policy
             circuit_breaker: Circuit breaker
+            sizing: Optional adaptive sizing policy
             **kwargs: Additional client options
         """
         self._host = host
@@ -109,6 +123,11 @@ class RedisPool(AsyncPoolProtocol[DB, COLL]):
         self._available: set[AsyncConnectionProtocol[DB, COLL]] = set()
         self._in_use: set[AsyncConnectionProtocol[DB, COLL]] = set()
         self._lock = asyncio.Lock()
+        # Notified when connections opened by grow() are added
+        self._grown = asyncio.Condition(self._lock)
+        self._waiters = 0
+        self._growing = 0
+        self._sizer = PoolSizer(self, sizing) if sizing else None
 
     @property
     def backend(self) -> str:
@@ -178,10 +197,17 @@ class RedisPool(AsyncPoolProtocol[DB, COLL]):
                         **self._kwargs,
                     )
 
-                # Create initial connections
-                for _ in range(self._min_size):
-                    conn = self._create_connection()
-                    self._available.add(conn)
+                # Create initial connections, warming client sockets concurrently
+                connections, errors = await pre_warm(self._open_connection, self._min_size)
+                self._available.update(connections)
+                if errors:
+                    logger.warning(
+                        "Failed to pre-warm %d Redis connections: %s",
+                        len(errors),
+                        str(errors[0]),
+                    )
+                    for _ in errors:
+                        self._available.add(self._create_connection())
 
                 logger.info(
                     "Initialized Redis pool with %d connections",
@@ -192,6 +218,9 @@ class RedisPool(AsyncPoolProtocol[DB, COLL]):
                     f"Failed to initialize Redis pool: {e!s}",
                 ) from e
 
+        if self._sizer:
+            self._sizer.start()
+
     async def clear(self) -> None:
         """Clear all connections."""
         async with self._lock:
@@ -207,6 +236,8 @@ class RedisPool(AsyncPoolProtocol[DB, COLL]):
 
     async def destroy(self) -> None:
         """Destroy pool and all connections."""
+        if self._sizer:
+            await self._sizer.stop()
         await self.clear()
         if self._client:
             await self._client.close()
@@ -217,6 +248,72 @@ class RedisPool(AsyncPoolProtocol[DB, COLL]):
         """Close pool and cleanup resources."""
         await self.destroy()
 
+    async def _open_connection(self) -> AsyncConnectionProtocol[DB, COLL]:
+        """Create connection and verify it with a ping.
+
+        Concurrent pings make the client open one socket each.
+
+        Returns:
+            AsyncConnectionProtocol: Verified connection
+        """
+        conn = self._create_connection()
+        await conn.ping()
+        return conn
+
+    async def grow(self, count: int) -> int:
+        """Open connections concurrently, up to max_size.
+
+        Slots are reserved up front, so acquire() does not open more
+        connections meanwhile; any opened past max_size are dropped, as in
+        shrink().
+
+        Args:
+            count: Number of connections to open
+
+        Returns:
+            int: Number of connections added to the pool
+        """
+        async with self._lock:
+            count = min(count, self.max_size - self.size - self._growing)
+            if count <= 0 or not self._client:
+                return 0
+            self._growing += count
+
+        connections: list[AsyncConnectionProtocol[DB, COLL]] = []
+        try:
+            connections, errors = await pre_warm(self._open_connection, count)
+        finally:
+            async with self._lock:
+                self._growing -= count
+                # Re-check the limit, connections opened past it are dropped
+                room = max(self.max_size - self.size - self._growing, 0)
+                self._available.update(connections[:room])
+                self._grown.notify_all()
+
+        for error in errors:
+            logger.warning("Failed to grow Redis pool: %s", str(error))
+        if len(connections) > room:
+            logger.warning("Dropped %d connections opened past max_size", len(connections) - room)
+        return min(len(connections), room)
+
+    async def shrink(self, count: int) -> int:
+        """Drop idle connections, down to min_size.
+
+        Connections share one client, so dropped connections are not closed
+        individually.
+
+        Args:
+            count: Number of connections to drop
+
+        Returns:
+            int: Number of connections removed from the pool
+        """
+        async with self._lock:
+            count = max(min(count, self.size - self.min_size, len(self._available)), 0)
+            for _ in range(count):
+                self._available.pop()
+            return count
+
     async def acquire(self) -> AsyncConnectionProtocol[DB, COLL]:
         """Acquire connection from pool.
 
@@ -227,9 +324,22 @@ class RedisPool(AsyncPoolProtocol[DB, COLL]):
             PoolExhaustedError: If no connections are available
             ConnectionError: If connection creation fails
         """
+        self._waiters += 1
+        try:
+            return await self._acquire()
+        finally:
+            self._waiters -= 1
+
+    async def _acquire(self) -> AsyncConnectionProtocol[DB, COLL]:
+        """Take available connection or create a new one."""
         async with self._lock:
+            # Slots reserved by grow() count toward max_size, wait for
+            # those connections rather than opening more
+            while not self._available and self._growing and self.size + self._growing >= self.max_size:
+                await self._grown.wait()
+
             # Get available connection or create new one
-            if not self._available and self.size < self.max_size:
+            if not self._available and self.size + self._growing < self.max_size:
                 try:
                     conn = self._create_connection()
                     self._available.add(conn)
@@ -271,6 +381,54 @@ class RedisPool(AsyncPoolProtocol[DB, COLL]):
                     self.available,
                 )
 
+    async def execute_many(
+        self,
+        commands: Iterable[RedisCommand],
+        *,
+        transaction: bool = False,
+        raise_on_error: bool = True,
+    ) -> list[Any]:
+        """Execute several Redis operations in one round-trip on a pooled connection.
+
+        Args:
+            commands: ``(operation, args)`` or ``(operation, args, kwargs)`` tuples
+            transaction: Whether to wrap the batch in MULTI/EXEC
+            raise_on_error: Whether to raise if any command failed. If False,
+                failed positions hold a QueryError instead of a reply.
+
+        Returns:
+            list[Any]: Results in command order
+
+        Raises:
+            PoolExhaustedError: If no connections are available
+            QueryError: If the batch could not be sent
+            BatchQueryError: If any command failed and raise_on_error is set
+        """
+        commands = list(commands)
+        if not commands:
+            return []
+
+        conn = cast(RedisConnection, await self.acquire())
+        try:
+            return await conn.execute_many(commands, transaction=transaction, raise_on_error=raise_on_error)
+        finally:
+            await self.release(cast(AsyncConnectionProtocol[DB, COLL], conn))
+
+    def batch(self, *, transaction: bool = False, raise_on_error: bool = True) -> RedisBatch:
+        """Get batch that is flushed through the pool in one round-trip.
+
+        A connection is only held while the batch is sent, not while
+        commands are queued.
+
+        Args:
+            transaction: Whether to wrap the batch in MULTI/EXEC
+            raise_on_error: Whether to raise if any command failed
+
+        Returns:
+            RedisBatch: Batch bound to this pool
+        """
+        return RedisBatch(self.execute_many, transaction=transaction, raise_on_error=raise_on_error)
+
     @property
     def size(self) -> int:
         """Get current pool size."""
@@ -296,6 +454,17 @@ class RedisPool(AsyncPoolProtocol[DB, COLL]):
         """Get number of connections in use."""
         return len(self._in_use)
 
+    @property
+    def waiters(self) -> int:
+        """Get number of callers waiting in acquire().
+
+        Callers wait for the pool lock, e.g. while another caller opens a
+        connection, or for connections being opened by grow(). A caller
+        finding the pool full fails with PoolExhaustedError at once and is
+        not counted.
+        """
+        return self._waiters
+
     @property
     def database_name(self) -> str:
         """Get database name."""
@@ -327,7 +496,9 @@ class RedisPool(AsyncPoolProtocol[DB, COLL]):
             "min_size": self.min_size,
             "available": self.available,
             "in_use": self.in_use,
+            "waiters": self.waiters,
             "database": self.database_name,
+            "sizing": self._sizer.get_stats() if self._sizer else None,
         }
 
 
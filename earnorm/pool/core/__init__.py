@@ -1,12 +1,13 @@
 """Core functionality for connection pooling.
 
 This module provides core functionality for connection pooling,
-including retry mechanism, circuit breaker, and decorators.
+including retry mechanism, circuit breaker, adaptive sizing and decorators.
 """
 
 from .circuit import CircuitBreaker, CircuitState, CircuitStats
 from .decorators import ResilienceError, with_resilience
 from .retry import RetryContext, RetryError, RetryPolicy
+from .sizing import PoolSizer, SizingDecision, SizingPolicy, pre_warm
 
 __all__ = [
     # Circuit breaker
@@ -17,6 +18,11 @@ __all__ = [
     "RetryContext",
     "RetryError",
     "RetryPolicy",
+    # Adaptive sizing
+    "PoolSizer",
+    "SizingDecision",
+    "SizingPolicy",
+    "pre_warm",
     # Decorators
     "ResilienceError",
     "with_resilience",
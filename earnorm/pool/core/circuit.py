@@ -3,20 +3,39 @@
 This module provides circuit breaker functionality to prevent cascading failures.
 It helps handle system overload and network partition scenarios.
 
+Failures are tracked in a sliding time window split into buckets. The circuit
+opens when, within the window, at least ``failure_threshold`` calls failed and
+the failure rate reaches ``failure_rate_threshold``. Old buckets expire as time
+moves on, so sporadic errors on a healthy system never accumulate.
+
+All bookkeeping is synchronous: the event loop runs one coroutine at a time, so
+plain counter updates need no lock. A successful call in the closed state is a
+couple of integer increments with no ``await``.
+
 Examples:
     ```python
     breaker = CircuitBreaker(
         failure_threshold=5,
+        failure_rate_threshold=0.5,
+        window_size=60.0,
         reset_timeout=30.0,
         half_open_timeout=5.0,
     )
 
     async with breaker as cb:
         await cb.execute(async_operation)
+
+    # Manual fast path
+    breaker.before_call()
+    try:
+        result = await async_operation()
+    except Exception as e:
+        breaker.record_failure(e)
+        raise
+    breaker.record_success()
     ```
 """
 
-import asyncio
 import enum
 import time
 from collections.abc import Awaitable, Callable
@@ -62,6 +81,54 @@ class CircuitStats:
     """Timestamp of last state change."""
 
 
+class _SlidingWindow:
+    """Time-bucketed success/failure counters.
+
+    The window is split into ``bucket_count`` buckets of equal width. Each
+    bucket remembers the epoch (``int(now / width)``) it was last written in,
+    so stale buckets are reset lazily when reused instead of by a timer.
+    """
+
+    __slots__ = ("_epochs", "_failures", "_successes", "_width")
+
+    def __init__(self, window_size: float, bucket_count: int) -> None:
+        self._width = window_size / bucket_count
+        self._epochs = [-1] * bucket_count
+        self._successes = [0] * bucket_count
+        self._failures = [0] * bucket_count
+
+    def _bucket(self, now: float) -> int:
+        epoch = int(now / self._width)
+        index = epoch % len(self._epochs)
+        if self._epochs[index] != epoch:
+            self._epochs[index] = epoch
+            self._successes[index] = 0
+            self._failures[index] = 0
+        return index
+
+    def add_success(self, now: float) -> None:
+        self._successes[self._bucket(now)] += 1
+
+    def add_failure(self, now: float) -> None:
+        self._failures[self._bucket(now)] += 1
+
+    def totals(self, now: float) -> tuple[int, int]:
+        """Get (requests, failures) inside the window ending at ``now``."""
+        oldest = int(now / self._width) - len(self._epochs) + 1
+        requests = failures = 0
+        for index, epoch in enumerate(self._epochs):
+            if epoch >= oldest:
+                requests += self._successes[index] + self._failures[index]
+                failures += self._failures[index]
+        return requests, failures
+
+    def reset(self) -> None:
+        for index in range(len(self._epochs)):
+            self._epochs[index] = -1
+            self._successes[index] = 0
+            self._failures[index] = 0
+
+
 class CircuitBreaker:
     """Circuit breaker implementation."""
 
@@ -72,15 +139,21 @@ class CircuitBreaker:
         half_open_timeout: float = 5.0,
         excluded_exceptions: list[type[Exception]] | None = None,
         backend: str = "unknown",
+        failure_rate_threshold: float = 0.5,
+        window_size: float = 60.0,
+        bucket_count: int = 10,
     ) -> None:
         """Initialize circuit breaker.
 
         Args:
-            failure_threshold: Number of consecutive failures before opening circuit
+            failure_threshold: Minimum number of failures inside the window before opening circuit
             reset_timeout: Time in seconds before attempting reset
             half_open_timeout: Time in seconds to wait in half-open state
             excluded_exceptions: Exceptions that don't count as failures
             backend: Database backend name
+            failure_rate_threshold: Failure rate (0-1] inside the window that opens circuit
+            window_size: Length of the sliding failure window in seconds
+            bucket_count: Number of buckets the window is split into
         """
         if failure_threshold < 1:
             raise ValueError("failure_threshold must be >= 1")
@@ -88,16 +161,23 @@ class CircuitBreaker:
             raise ValueError("reset_timeout must be >= 0")
         if half_open_timeout < 0:
             raise ValueError("half_open_timeout must be >= 0")
+        if not 0 < failure_rate_threshold <= 1:
+            raise ValueError("failure_rate_threshold must be in (0, 1]")
+        if window_size <= 0:
+            raise ValueError("window_size must be > 0")
+        if bucket_count < 1:
+            raise ValueError("bucket_count must be >= 1")
 
         self._failure_threshold = failure_threshold
+        self._failure_rate_threshold = failure_rate_threshold
         self._reset_timeout = reset_timeout
         self._half_open_timeout = half_open_timeout
-        self._excluded_exceptions = excluded_exceptions or []
+        self._excluded_exceptions = tuple(excluded_exceptions or ())
         self._backend = backend
 
         self._state = CircuitState.CLOSED
         self._stats = CircuitStats()
-        self._lock = asyncio.Lock()
+        self._window = _SlidingWindow(window_size, bucket_count)
 
     @property
     def state(self) -> CircuitState:
@@ -109,7 +189,17 @@ class CircuitBreaker:
         """Get circuit statistics."""
         return self._stats
 
-    def _should_count_failure(self, exc: Exception) -> bool:
+    @property
+    def failure_rate(self) -> float:
+        """Get failure rate inside the current window.
+
+        Returns:
+            Failed calls divided by total calls, 0.0 if the window is empty
+        """
+        requests, failures = self._window.totals(time.time())
+        return failures / requests if requests else 0.0
+
+    def _should_count_failure(self, exc: BaseException) -> bool:
         """Check if exception should count as failure.
 
         Args:
@@ -118,68 +208,88 @@ class CircuitBreaker:
         Returns:
             True if exception should count as failure
         """
-        return not any(isinstance(exc, exc_type) for exc_type in self._excluded_exceptions)
+        return not isinstance(exc, self._excluded_exceptions)
 
-    async def _update_state(self) -> None:
-        """Update circuit state based on current conditions."""
-        now = time.time()
-
-        if self._state == CircuitState.OPEN:
-            if now - self._stats.state_change_time >= self._reset_timeout:
-                self._state = CircuitState.HALF_OPEN
-                self._stats.state_change_time = now
-
-        elif self._state == CircuitState.HALF_OPEN:
-            if now - self._stats.state_change_time >= self._half_open_timeout:
-                if self._stats.consecutive_failures == 0:
-                    self._state = CircuitState.CLOSED
-                else:
-                    self._state = CircuitState.OPEN
-                self._stats.state_change_time = now
-
-        elif self._state == CircuitState.CLOSED:
-            if self._stats.consecutive_failures >= self._failure_threshold:
-                self._state = CircuitState.OPEN
-                self._stats.state_change_time = now
-
-    async def _on_success(self) -> None:
-        """Handle successful operation."""
-        async with self._lock:
-            self._stats.total_requests += 1
-            self._stats.successful_requests += 1
-            self._stats.consecutive_failures = 0
-            self._stats.last_success_time = time.time()
-            await self._update_state()
-
-    async def _on_failure(self, exc: Exception) -> None:
-        """Handle failed operation.
+    def _transition(self, state: CircuitState, now: float) -> None:
+        """Move circuit to a new state.
 
         Args:
-            exc: Exception that occurred
+            state: Target state
+            now: Current timestamp
         """
-        async with self._lock:
-            self._stats.total_requests += 1
-            self._stats.failed_requests += 1
-            if self._should_count_failure(exc):
-                self._stats.consecutive_failures += 1
-            self._stats.last_failure_time = time.time()
-            await self._update_state()
+        self._state = state
+        self._stats.state_change_time = now
+        if state is CircuitState.CLOSED:
+            self._window.reset()
 
-    async def _check_state(self) -> None:
-        """Check if requests are allowed in current state.
+    def before_call(self) -> None:
+        """Check if a request may proceed.
+
+        Open circuits move to half-open once ``reset_timeout`` elapsed.
 
         Raises:
             CircuitBreakerError: If circuit is open
         """
-        if self._state == CircuitState.OPEN:
+        if self._state is CircuitState.CLOSED:
+            return
+
+        if self._state is CircuitState.OPEN:
+            now = time.time()
             reset_time = self._stats.state_change_time + self._reset_timeout
-            raise CircuitBreakerError(
-                "Circuit is open",
-                backend=self._backend,
-                failures=self._stats.consecutive_failures,
-                last_failure_time=self._stats.last_failure_time,
-                reset_time=reset_time,
-            )
+            if now < reset_time:
+                raise CircuitBreakerError(
+                    "Circuit is open",
+                    backend=self._backend,
+                    failures=self._stats.consecutive_failures,
+                    last_failure_time=self._stats.last_failure_time,
+                    reset_time=reset_time,
+                )
+            self._transition(CircuitState.HALF_OPEN, now)
+
+    def record_success(self) -> None:
+        """Record successful operation.
+
+        In the closed state this only bumps counters.
+        """
+        stats = self._stats
+        stats.total_requests += 1
+        stats.successful_requests += 1
+        stats.consecutive_failures = 0
+        now = time.time()
+        stats.last_success_time = now
+
+        if self._state is CircuitState.CLOSED:
+            self._window.add_success(now)
+        elif self._state is CircuitState.HALF_OPEN:
+            if now - stats.state_change_time >= self._half_open_timeout:
+                self._transition(CircuitState.CLOSED, now)
+
+    def record_failure(self, exc: BaseException) -> None:
+        """Record failed operation.
+
+        Args:
+            exc: Exception that occurred
+        """
+        stats = self._stats
+        stats.total_requests += 1
+        stats.failed_requests += 1
+        now = time.time()
+        stats.last_failure_time = now
+
+        if not self._should_count_failure(exc):
+            return
+
+        stats.consecutive_failures += 1
+
+        if self._state is CircuitState.HALF_OPEN:
+            self._transition(CircuitState.OPEN, now)
+            return
+
+        if self._state is CircuitState.CLOSED:
+            self._window.add_failure(now)
+            requests, failures = self._window.totals(now)
+            if failures >= self._failure_threshold and failures / requests >= self._failure_rate_threshold:
+                self._transition(CircuitState.OPEN, now)
 
     async def __aenter__(self) -> "CircuitBreaker":
         """Enter circuit breaker context.
@@ -190,7 +300,7 @@ class CircuitBreaker:
         Raises:
             CircuitBreakerError: If circuit is open
         """
-        await self._check_state()
+        self.before_call()
         return self
 
     async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
@@ -205,11 +315,10 @@ class CircuitBreaker:
             True if exception was handled
         """
         if exc is None:
-            await self._on_success()
-            return False
+            self.record_success()
         else:
-            await self._on_failure(exc)
-            return False
+            self.record_failure(exc)
+        return False
 
     async def execute(self, operation: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
         """Execute operation with circuit breaker.
@@ -225,5 +334,11 @@ class CircuitBreaker:
         Raises:
             CircuitBreakerError: If circuit is open
         """
-        async with self:
-            return await operation(*args, **kwargs)
+        self.before_call()
+        try:
+            result = await operation(*args, **kwargs)
+        except Exception as e:
+            self.record_failure(e)
+            raise
+        self.record_success()
+        return result
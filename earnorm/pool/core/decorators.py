@@ -35,15 +35,17 @@ Examples:
     ```
 """
 
+import asyncio
 import functools
 import logging
+import time
 from collections.abc import Awaitable, Callable
 from typing import Any, TypeVar, overload
 
 from earnorm.exceptions import CircuitBreakerError, RetryError
 
 from .circuit import CircuitBreaker
-from .retry import RetryContext, RetryPolicy
+from .retry import RetryPolicy
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -181,59 +183,100 @@ def with_resilience(
     return _with_resilience(func, retry_policy, circuit_breaker, backend)
 
 
+async def _retry_after_failure(
+    func: AsyncFunc[T],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    retry_policy: RetryPolicy,
+    circuit_breaker: CircuitBreaker | None,
+    backend: str,
+    first_error: Exception,
+) -> T:
+    """Retry operation after its first attempt failed.
+
+    This is the slow path of ``with_resilience``: it only runs once an
+    operation has already failed, so successful calls never pay for it.
+
+    Args:
+        func: Operation to retry
+        args: Positional arguments
+        kwargs: Keyword arguments
+        retry_policy: Retry policy configuration
+        circuit_breaker: Optional circuit breaker consulted before each attempt
+        backend: Database backend name
+        first_error: Error raised by the first attempt
+
+    Returns:
+        Result of the first successful retry
+
+    Raises:
+        RetryError: If all retry attempts fail
+        CircuitBreakerError: If the circuit opens while retrying
+    """
+    start_time = time.time()
+    attempt = 0
+    last_error = first_error
+
+    while retry_policy.should_retry(attempt, last_error):
+        await asyncio.sleep(retry_policy.calculate_delay(attempt))
+        attempt += 1
+
+        if circuit_breaker is not None:
+            circuit_breaker.before_call()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            if circuit_breaker is not None:
+                circuit_breaker.record_failure(e)
+            last_error = e
+            continue
+
+        if circuit_breaker is not None:
+            circuit_breaker.record_success()
+        return result
+
+    raise RetryError(
+        "Operation failed after maximum retries",
+        backend=backend,
+        attempts=attempt,
+        elapsed=time.time() - start_time,
+        last_error=last_error,
+    )
+
+
 def _with_resilience(
     func: AsyncFunc[T],
     retry_policy: RetryPolicy | None = None,
     circuit_breaker: CircuitBreaker | None = None,
     backend: str = "unknown",
 ) -> AsyncFunc[T]:
-    """Internal implementation of with_resilience decorator."""
+    """Internal implementation of with_resilience decorator.
+
+    The returned wrapper has a fast path for the healthy case: one direct
+    ``await`` of the wrapped function plus, if a circuit breaker is set,
+    two synchronous counter updates. Retry state is only created after a
+    failure.
+    """
+    operation_name = f"{func.__module__}.{func.__qualname__}"
+    if circuit_breaker is not None:
+        circuit_breaker._backend = backend  # type: ignore
 
     @functools.wraps(func)
     async def wrapper(*args: Any, **kwargs: Any) -> T:
-        operation_name = f"{func.__module__}.{func.__qualname__}"
-        logger.debug(
-            "Executing operation %s with resilience (retry=%s, circuit_breaker=%s, backend=%s)",
-            operation_name,
-            bool(retry_policy),
-            bool(circuit_breaker),
-            backend,
-        )
-
-        # Create retry context if policy provided
-        retry_ctx = RetryContext(retry_policy, backend=backend) if retry_policy else None
-
-        # Create circuit breaker context if provided
-        circuit_ctx = circuit_breaker if circuit_breaker else None
-        if circuit_ctx:
-            circuit_ctx._backend = backend  # type: ignore
-
-        # Combine retry and circuit breaker
-        async def execute_with_resilience() -> T:
-            """Execute the wrapped function with retry and circuit breaker.
-
-            Returns:
-                Result from the wrapped function
-
-            Raises:
-                RetryError: If all retry attempts fail
-                CircuitBreakerError: If circuit breaker is open
-                Exception: Any exception from the wrapped function
-            """
-            if circuit_ctx:
-                return await circuit_ctx.execute(func, *args, **kwargs)
-            return await func(*args, **kwargs)
-
         try:
-            if retry_ctx:
-                result = await retry_ctx.execute(execute_with_resilience)
-            else:
-                result = await execute_with_resilience()
-
-            logger.debug(
-                "Operation %s completed successfully",
-                operation_name,
-            )
+            if circuit_breaker is not None:
+                circuit_breaker.before_call()
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                if circuit_breaker is not None:
+                    circuit_breaker.record_failure(e)
+                if retry_policy is None:
+                    raise
+                return await _retry_after_failure(func, args, kwargs, retry_policy, circuit_breaker, backend, e)
+
+            if circuit_breaker is not None:
+                circuit_breaker.record_success()
             return result
 
         except (RetryError, CircuitBreakerError) as e:
@@ -0,0 +1,327 @@
+"""Adaptive pool sizing.
+
+This module provides concurrent pool pre-warming and a background controller
+that resizes a pool based on load:
+- Grows toward ``max_size`` while callers are waiting in ``acquire()``
+- Shrinks back toward ``min_size`` once the pool stayed idle for ``idle_timeout``
+- Records every sizing decision as a metric event
+
+Examples:
+    ```python
+    pool = MongoPool(
+        uri="mongodb://localhost:27017",
+        database="test",
+        min_size=2,
+        max_size=50,
+        sizing=SizingPolicy(
+            interval=1.0,
+            idle_timeout=300.0,
+            on_decision=lambda d: statsd.gauge(f"pool.{d.backend}.size", d.new_size),
+        ),
+    )
+    await pool.init()  # opens min_size connections concurrently, starts controller
+
+    pool.get_stats()["sizing"]
+    # {"grows": 3, "shrinks": 1, "connections_opened": 12, "connections_closed": 10, ...}
+    ```
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, Protocol, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+async def pre_warm(open_connection: Callable[[], Awaitable[T]], count: int) -> tuple[list[T], list[Exception]]:
+    """Open connections concurrently.
+
+    Args:
+        open_connection: Coroutine function creating one verified connection
+        count: Number of connections to open
+
+    Returns:
+        Opened connections and errors of failed attempts
+    """
+    if count <= 0:
+        return [], []
+
+    results = await asyncio.gather(*(open_connection() for _ in range(count)), return_exceptions=True)
+    connections: list[T] = []
+    errors: list[Exception] = []
+    for result in results:
+        if isinstance(result, Exception):
+            errors.append(result)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            connections.append(result)
+    return connections, errors
+
+
+class ResizablePool(Protocol):
+    """Pool interface required by the sizing controller."""
+
+    @property
+    def backend(self) -> str:
+        """Get backend name."""
+        ...
+
+    @property
+    def size(self) -> int:
+        """Get current pool size."""
+        ...
+
+    @property
+    def min_size(self) -> int:
+        """Get minimum pool size."""
+        ...
+
+    @property
+    def max_size(self) -> int:
+        """Get maximum pool size."""
+        ...
+
+    @property
+    def in_use(self) -> int:
+        """Get number of connections in use."""
+        ...
+
+    @property
+    def waiters(self) -> int:
+        """Get number of callers waiting in acquire()."""
+        ...
+
+    async def grow(self, count: int) -> int:
+        """Open up to ``count`` connections, return number opened."""
+        ...
+
+    async def shrink(self, count: int) -> int:
+        """Close up to ``count`` idle connections, return number closed."""
+        ...
+
+
+@dataclass
+class SizingDecision:
+    """Single resize performed by the controller."""
+
+    backend: str
+    """Database backend name."""
+
+    action: str
+    """Either ``"grow"`` or ``"shrink"``."""
+
+    previous_size: int
+    """Pool size before the decision."""
+
+    new_size: int
+    """Pool size after the decision."""
+
+    waiters: int
+    """Callers waiting in acquire() when the decision was taken."""
+
+    reason: str
+    """Human readable trigger."""
+
+    timestamp: float = field(default_factory=time.time)
+    """Time of the decision."""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert decision to dictionary."""
+        return {
+            "backend": self.backend,
+            "action": self.action,
+            "previous_size": self.previous_size,
+            "new_size": self.new_size,
+            "waiters": self.waiters,
+            "reason": self.reason,
+            "timestamp": self.timestamp,
+        }
+
+
+@dataclass
+class SizingPolicy:
+    """Adaptive sizing configuration."""
+
+    interval: float = 1.0
+    """Seconds between controller evaluations."""
+
+    idle_timeout: float = 300.0
+    """Seconds without any connection in use before shrinking to min_size."""
+
+    grow_step: int = 0
+    """Connections opened per grow decision. 0 opens one per waiter."""
+
+    history_size: int = 100
+    """Number of recent decisions kept for inspection."""
+
+    on_decision: Callable[[SizingDecision], None] | None = None
+    """Optional metrics hook called for every decision."""
+
+    def __post_init__(self) -> None:
+        """Validate sizing policy configuration."""
+        if self.interval <= 0:
+            raise ValueError("interval must be > 0")
+        if self.idle_timeout < 0:
+            raise ValueError("idle_timeout must be >= 0")
+        if self.grow_step < 0:
+            raise ValueError("grow_step must be >= 0")
+        if self.history_size < 0:
+            raise ValueError("history_size must be >= 0")
+
+
+class PoolSizer:
+    """Background controller resizing a pool based on load."""
+
+    def __init__(self, pool: ResizablePool, policy: SizingPolicy | None = None) -> None:
+        """Initialize controller.
+
+        Args:
+            pool: Pool to resize
+            policy: Sizing configuration
+        """
+        self._pool = pool
+        self._policy = policy or SizingPolicy()
+        self._task: asyncio.Task[None] | None = None
+        self._last_busy = time.monotonic()
+
+        self._decisions: deque[SizingDecision] = deque(maxlen=self._policy.history_size)
+        self._grows = 0
+        self._shrinks = 0
+        self._opened = 0
+        self._closed = 0
+
+    @property
+    def policy(self) -> SizingPolicy:
+        """Get sizing policy."""
+        return self._policy
+
+    @property
+    def running(self) -> bool:
+        """Check if background loop is running."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def decisions(self) -> list[SizingDecision]:
+        """Get recent sizing decisions, oldest first."""
+        return list(self._decisions)
+
+    def start(self) -> None:
+        """Start background loop."""
+        if not self.running:
+            self._last_busy = time.monotonic()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop background loop."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        """Evaluate pool load every ``interval`` seconds."""
+        while True:
+            try:
+                await asyncio.sleep(self._policy.interval)
+                await self.step()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error("Error in %s pool sizing loop: %s", self._pool.backend, str(e))
+
+    async def step(self) -> SizingDecision | None:
+        """Evaluate pool load once and resize if needed.
+
+        Returns:
+            Decision taken, or None if the pool was left as is
+        """
+        pool = self._pool
+        now = time.monotonic()
+        waiters = pool.waiters
+
+        if waiters or pool.in_use:
+            self._last_busy = now
+
+        if waiters and pool.size < pool.max_size:
+            count = self._policy.grow_step or waiters
+            previous = pool.size
+            opened = await pool.grow(count)
+            if opened:
+                self._grows += 1
+                self._opened += opened
+                return self._record("grow", previous, waiters, f"{waiters} waiting callers")
+            return None
+
+        idle_for = now - self._last_busy
+        if pool.size > pool.min_size and idle_for >= self._policy.idle_timeout:
+            previous = pool.size
+            closed = await pool.shrink(pool.size - pool.min_size)
+            if closed:
+                self._shrinks += 1
+                self._closed += closed
+                return self._record("shrink", previous, waiters, f"idle for {idle_for:.0f}s")
+
+        return None
+
+    def _record(self, action: str, previous: int, waiters: int, reason: str) -> SizingDecision:
+        """Store and publish sizing decision.
+
+        Args:
+            action: Decision type
+            previous: Pool size before the decision
+            waiters: Waiting callers
+            reason: Decision trigger
+
+        Returns:
+            Recorded decision
+        """
+        decision = SizingDecision(
+            backend=self._pool.backend,
+            action=action,
+            previous_size=previous,
+            new_size=self._pool.size,
+            waiters=waiters,
+            reason=reason,
+        )
+        self._decisions.append(decision)
+        logger.info(
+            "Pool sizing (%s): %s %d -> %d (%s)",
+            decision.backend,
+            action,
+            previous,
+            decision.new_size,
+            reason,
+        )
+
+        if self._policy.on_decision:
+            try:
+                self._policy.on_decision(decision)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning("Pool sizing metrics hook failed: %s", str(e))
+        return decision
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get sizing statistics.
+
+        Returns:
+            Dict[str, Any]: Counters and the most recent decision
+        """
+        last = self._decisions[-1].to_dict() if self._decisions else None
+        return {
+            "running": self.running,
+            "grows": self._grows,
+            "shrinks": self._shrinks,
+            "connections_opened": self._opened,
+            "connections_closed": self._closed,
+            "last_decision": last,
+        }
@@ -25,6 +25,7 @@ from typing import Any, TypeVar, cast
 
 from earnorm.pool.backends.mongo.pool import MongoPool
 from earnorm.pool.backends.redis.pool import RedisPool
+from earnorm.pool.core.sizing import SizingPolicy
 from earnorm.pool.protocols.pool import AsyncPoolProtocol
 
 # Define type variables for database and collection types
@@ -95,6 +96,7 @@ async def create_mongo_pool(
     max_size: int = 10,
     retry_policy: Any | None = None,
     circuit_breaker: Any | None = None,
+    sizing: SizingPolicy | None = None,
     **kwargs: Any,
 ) -> MongoPool[Any, Any]:
     """Create MongoDB connection pool.
@@ -106,6 +108,7 @@ async def create_mongo_pool(
         max_size: Maximum pool size
         retry_policy: Optional retry policy
         circuit_breaker: Optional circuit breaker
+        sizing: Optional adaptive sizing policy
         **kwargs: Additional pool options
 
     Returns:
@@ -128,6 +131,7 @@ async def create_mongo_pool(
         max_size=max_size,
         retry_policy=retry_policy,
         circuit_breaker=circuit_breaker,
+        sizing=sizing,
         **kwargs,
     )
 
@@ -149,6 +153,7 @@ async def create_redis_pool(
     socket_keepalive: bool = True,
     retry_policy: Any | None = None,
     circuit_breaker: Any | None = None,
+    sizing: SizingPolicy | None = None,
     **kwargs: Any,
 ) -> RedisPool[Any, None]:
     """Create Redis connection pool.
@@ -166,6 +171,7 @@ async def create_redis_pool(
         socket_keepalive: Whether to enable socket keepalive
         retry_policy: Optional retry policy
         circuit_breaker: Optional circuit breaker
+        sizing: Optional adaptive sizing policy
         **kwargs: Additional pool options
 
     Returns:
@@ -198,6 +204,7 @@ async def create_redis_pool(
         socket_keepalive=socket_keepalive,
         retry_policy=retry_policy,
         circuit_breaker=circuit_breaker,
+        sizing=sizing,
         **kwargs,
     )
 
@@ -7,7 +7,7 @@ from earnorm.base.database.adapters.mongo import MongoAdapter
 from earnorm.base.env import Environment
 from earnorm.config import SystemConfig
 from earnorm.di import container
-from earnorm.pool import PoolRegistry, create_mongo_pool
+from earnorm.pool import PoolRegistry, SizingPolicy, create_mongo_pool
 from earnorm.pool.protocols import AsyncPoolProtocol
 from earnorm.pool.types import MongoCollectionType, MongoDBType
 from earnorm.types.models import ModelProtocol
@@ -86,6 +86,10 @@ async def register_database_services(config: SystemConfig) -> None:
 
     # Create and register MongoDB pool if not exists
     if not container.has("mongodb_pool"):
+        options = config.database_options
+        sizing = None
+        if options.get("adaptive_pool_sizing"):
+            sizing = SizingPolicy(idle_timeout=float(options.get("pool_idle_timeout") or 300))
         mongo_pool = cast(
             AsyncPoolProtocol[MongoDBType, MongoCollectionType],
             await create_mongo_pool(
@@ -93,6 +97,8 @@ async def register_database_services(config: SystemConfig) -> None:
                 database=config.database_name,
                 min_size=int(config.database_options.get("min_pool_size") or 1),
                 max_size=int(config.database_options.get("max_pool_size") or 10),
+                sizing=sizing,
+                options=options,
             ),
         )
         await mongo_pool.init()
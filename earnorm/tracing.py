@@ -0,0 +1,148 @@
+"""Zero-cost trace points for EarnORM hot paths.
+
+This module provides lazily formatted, level-guarded trace logging for code
+that runs on every field access, query or decorated method call.
+
+Trace points differ from regular logging calls in two ways:
+    1. They are disabled globally unless tracing is switched on, either
+       through the ``trace_enabled`` config option or the ``EARNORM_TRACE``
+       environment variable. While disabled a trace point costs one
+       attribute lookup and never touches the logging machinery.
+    2. Messages use ``%``-style arguments, so values (and the ``repr`` of
+       large recordsets or documents) are only formatted when the record
+       is actually emitted at the ``TRACE`` level.
+
+Examples:
+    >>> from earnorm.tracing import get_tracer
+    >>> trace = get_tracer(__name__)
+
+    >>> # Cheap trace point: arguments are not formatted unless emitted
+    >>> trace("Fetching %s for %s:%s", name, model, record_id)
+
+    >>> # Guard expensive argument computation explicitly
+    >>> if trace.enabled:
+    ...     trace("Found %d documents", len(docs))
+
+    >>> # Switch tracing on at runtime
+    >>> from earnorm.tracing import set_trace_enabled
+    >>> set_trace_enabled(True)
+    >>> logging.getLogger("earnorm").setLevel(TRACE)
+"""
+
+import logging
+import os
+from typing import Any
+
+__all__ = [
+    "TRACE",
+    "Tracer",
+    "get_tracer",
+    "is_trace_enabled",
+    "set_trace_enabled",
+]
+
+TRACE = 5
+"""Log level used by trace points (below ``logging.DEBUG``)."""
+
+logging.addLevelName(TRACE, "TRACE")
+
+
+def _env_flag(name: str) -> bool:
+    """Read boolean flag from environment variable.
+
+    Args:
+        name: Environment variable name
+
+    Returns:
+        True if variable is set to a truthy value
+    """
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class _TraceState:
+    """Process-wide trace switch shared by all tracers."""
+
+    __slots__ = ("enabled",)
+
+    def __init__(self) -> None:
+        self.enabled = _env_flag("EARNORM_TRACE")
+
+
+_state = _TraceState()
+
+
+def set_trace_enabled(enabled: bool) -> None:
+    """Enable or disable all trace points.
+
+    Args:
+        enabled: Whether trace points should be evaluated
+    """
+    _state.enabled = bool(enabled)
+
+
+def is_trace_enabled() -> bool:
+    """Check whether trace points are enabled.
+
+    Returns:
+        bool: True if tracing is switched on
+    """
+    return _state.enabled
+
+
+class Tracer:
+    """Level-guarded trace logger bound to a module logger.
+
+    Calling a tracer logs a message at the ``TRACE`` level, but only when
+    tracing is switched on and the underlying logger accepts ``TRACE``
+    records. Arguments are passed through to the logger unformatted.
+
+    Args:
+        name: Logger name, usually ``__name__``
+
+    Attributes:
+        logger: Underlying logger instance
+    """
+
+    __slots__ = ("logger",)
+
+    def __init__(self, name: str) -> None:
+        """Initialize tracer.
+
+        Args:
+            name: Logger name
+        """
+        self.logger = logging.getLogger(name)
+
+    @property
+    def enabled(self) -> bool:
+        """Check whether this tracer would emit a record.
+
+        Use this to guard trace points whose arguments are expensive to
+        compute (e.g. ``len()`` of a cursor result or a list comprehension).
+
+        Returns:
+            bool: True if tracing is on and the logger accepts TRACE
+        """
+        return _state.enabled and self.logger.isEnabledFor(TRACE)
+
+    def __call__(self, msg: str, *args: Any) -> None:
+        """Emit trace record.
+
+        Args:
+            msg: Message with ``%``-style placeholders
+            *args: Placeholder values, formatted lazily
+        """
+        if _state.enabled and self.logger.isEnabledFor(TRACE):
+            self.logger.log(TRACE, msg, *args, stacklevel=2)
+
+
+def get_tracer(name: str) -> Tracer:
+    """Get tracer for module.
+
+    Args:
+        name: Logger name, usually ``__name__``
+
+    Returns:
+        Tracer: Tracer bound to the named logger
+    """
+    return Tracer(name)
@@ -3,12 +3,13 @@
 This module provides validators for ensuring field values are unique in the database.
 """
 
-from collections.abc import Coroutine
+from collections.abc import Coroutine, Sequence
 from typing import Any
 
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorCollection
 
+from earnorm.base.database.unique import CASE_INSENSITIVE_COLLATION
 from earnorm.types import ModelProtocol
 from earnorm.validators.base import BaseValidator, ValidationError
 
@@ -28,6 +29,9 @@ class UniqueValidator(BaseValidator):
         # Use validator
         await validate_unique("user@example.com")  # OK if email is unique
         await validate_unique("existing@example.com")  # Raises ValidationError
+
+        # Check a batch with one query
+        await validate_unique.validate_many(["a@example.com", "b@example.com"])
         ```
     """
 
@@ -83,21 +87,64 @@ class UniqueValidator(BaseValidator):
         if not isinstance(value, str):
             raise ValidationError("Value must be a string")
 
-        # Build query
-        query: dict[str, Any] = {}
-        if self.case_sensitive:
-            query[self.field] = value
-        else:
-            query[self.field] = {"$regex": f"^{value}$", "$options": "i"}
+        # Check if document exists
+        document = await self.collection.find_one(self._query(value), **self._options())
+        if document is not None:
+            raise ValidationError(self.message or f"Value '{value}' already exists for field '{self.field}'")
+
+    async def validate_many(self, values: Sequence[Any]) -> None:
+        """Validate many values with a single query.
+
+        Args:
+            values: Values to validate
+
+        Raises:
+            ValidationError: If any value is not unique or repeated in values
+        """
+        if any(not isinstance(value, str) for value in values):
+            raise ValidationError("Value must be a string")
+
+        seen: set[str] = set()
+        for value in values:
+            key = value if self.case_sensitive else value.casefold()
+            if key in seen:
+                raise ValidationError(self.message or f"Value '{value}' is repeated for field '{self.field}'")
+            seen.add(key)
+
+        document = await self.collection.find_one(self._query({"$in": list(values)}), **self._options())
+        if document is not None:
+            raise ValidationError(
+                self.message or f"Value '{document.get(self.field)}' already exists for field '{self.field}'"
+            )
+
+    def _query(self, condition: Any) -> dict[str, Any]:
+        """Build lookup query.
+
+        Args:
+            condition: Value or operator document matched against the field
+
+        Returns:
+            MongoDB filter
+        """
+        query: dict[str, Any] = {self.field: condition}
 
         # Exclude current document if updating
         if self.exclude_id is not None:
             query["_id"] = {"$ne": self.exclude_id}
+        return query
 
-        # Check if document exists
-        document = await self.collection.find_one(query)
-        if document is not None:
-            raise ValidationError(self.message or f"Value '{value}' already exists for field '{self.field}'")
+    def _options(self) -> dict[str, Any]:
+        """Get query options.
+
+        Case-insensitive lookups use a collation instead of a regex, so values
+        are matched literally and a unique index with the same collation is used.
+
+        Returns:
+            Keyword arguments for find_one
+        """
+        if self.case_sensitive:
+            return {}
+        return {"collation": dict(CASE_INSENSITIVE_COLLATION)}
 
 
 def validate_unique(
@@ -0,0 +1,13 @@
+"""Shared fixtures for benchmarks."""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def run():
+    """Run coroutine functions to completion on one event loop per benchmark."""
+    loop = asyncio.new_event_loop()
+    yield lambda coro: loop.run_until_complete(coro())
+    loop.close()
@@ -0,0 +1,56 @@
+"""Benchmarks for whole-document conversion.
+
+Compares awaiting ``to_db``/``from_db`` once per field, as ``_convert_to_db``
+did before, with the precompiled model codec converting primitive fields in
+one synchronous loop.
+
+Run with:
+    pytest tests/benchmarks --benchmark-only
+"""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+
+from earnorm.base.model.codec import ModelCodec
+from earnorm.fields.primitive import (
+    BooleanField,
+    DateTimeField,
+    DecimalField,
+    FloatField,
+    IntegerField,
+    StringField,
+)
+
+FIELDS: dict[str, Any] = {}
+VALUES: dict[str, Any] = {}
+for i in range(5):
+    FIELDS[f"name_{i}"], VALUES[f"name_{i}"] = StringField(), f"value {i}"
+    FIELDS[f"count_{i}"], VALUES[f"count_{i}"] = IntegerField(), i
+    FIELDS[f"ratio_{i}"], VALUES[f"ratio_{i}"] = FloatField(), i / 3
+    FIELDS[f"flag_{i}"], VALUES[f"flag_{i}"] = BooleanField(), bool(i % 2)
+    FIELDS[f"amount_{i}"], VALUES[f"amount_{i}"] = DecimalField(decimal_places=2), Decimal(f"{i}.25")
+    FIELDS[f"date_{i}"], VALUES[f"date_{i}"] = DateTimeField(), datetime(2024, 1, i + 1, tzinfo=UTC)
+
+CODEC = ModelCodec(FIELDS)
+DOCS = [CODEC.encode_sync(VALUES)] * 200
+
+
+async def per_field_decode() -> None:
+    """Decode documents awaiting from_db once per field."""
+    for doc in DOCS:
+        {name: await FIELDS[name].from_db(value, "mongodb") for name, value in doc.items()}
+
+
+async def codec_decode() -> None:
+    """Decode documents with the model codec."""
+    for doc in DOCS:
+        await CODEC.decode(doc)
+
+
+def test_per_field_decode(benchmark, run):
+    benchmark(run, per_field_decode)
+
+
+def test_codec_decode(benchmark, run):
+    benchmark(run, codec_decode)
@@ -0,0 +1,55 @@
+"""Benchmarks for JSONField writes.
+
+Compares validating and converting payloads the way ``JSONField`` did before
+(``json.dumps`` in ``validate`` and again in ``to_db``) with native document
+storage and string storage through the orjson codec.
+
+Run with:
+    pytest tests/benchmarks --benchmark-only
+"""
+
+import json
+from functools import partial
+from typing import Any
+
+import pytest
+
+from earnorm.fields.primitive.json import JSONField
+
+PAYLOADS: list[dict[str, Any]] = [
+    {
+        "sku": f"SKU-{i}",
+        "tags": ["red", "large", f"batch-{i % 7}"],
+        "dimensions": {"w": 10.5, "h": 4, "d": i},
+        "attributes": [{"name": f"attr-{j}", "value": j * i} for j in range(5)],
+        "active": bool(i % 2),
+    }
+    for i in range(200)
+]
+
+
+async def dumps_twice() -> None:
+    """Serialize to validate, then serialize again to store."""
+    for payload in PAYLOADS:
+        json.dumps(payload)
+        json.dumps(payload)
+
+
+async def write(field: JSONField) -> None:
+    """Validate and convert with a field."""
+    for payload in PAYLOADS:
+        await field.validate(payload)
+        await field.to_db(payload, "mongodb")
+
+
+def test_dumps_twice(benchmark, run):
+    benchmark(run, dumps_twice)
+
+
+def test_native_write(benchmark, run):
+    benchmark(run, partial(write, JSONField()))
+
+
+def test_orjson_write(benchmark, run):
+    pytest.importorskip("orjson")
+    benchmark(run, partial(write, JSONField(storage="string", codec="orjson")))
@@ -0,0 +1,65 @@
+"""Benchmarks for JSON schema validation.
+
+Compares ``jsonschema.validate``, which checks the schema against its
+meta-schema and builds a validator on every call, with the compiled
+validator ``JSONField`` keeps for its schema. The schema describes a typical
+config blob with 50 keys.
+
+Run with:
+    pytest tests/benchmarks --benchmark-only
+"""
+
+from typing import Any
+
+import jsonschema
+
+from earnorm.fields.primitive.json import JSONField
+
+PROPERTY_TYPES: list[dict[str, Any]] = [
+    {"type": "string", "maxLength": 64},
+    {"type": "integer", "minimum": 0, "maximum": 10000},
+    {"type": "boolean"},
+    {"type": "string", "enum": ["low", "medium", "high"]},
+    {"type": "array", "items": {"type": "string"}, "maxItems": 10},
+]
+VALUES: list[Any] = ["value", 42, True, "medium", ["a", "b"]]
+
+SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {f"key_{i}": PROPERTY_TYPES[i % 5] for i in range(50)},
+    "required": [f"key_{i}" for i in range(0, 50, 5)],
+    "additionalProperties": False,
+}
+CONFIGS = [{f"key_{i}": VALUES[i % 5] for i in range(50)}] * 20
+
+FIELD = JSONField(schema=SCHEMA)
+FIELD.name = "config"
+
+
+async def per_call_validate() -> None:
+    """Validate every config against the raw schema."""
+    for config in CONFIGS:
+        jsonschema.validate(instance=config, schema=SCHEMA)
+
+
+async def cached_validate() -> None:
+    """Validate every config with the field's compiled validator."""
+    for config in CONFIGS:
+        await FIELD.validate(config)
+
+
+async def cached_validate_many() -> None:
+    """Validate all configs as one column."""
+    await FIELD.validate_many(CONFIGS)
+
+
+def test_per_call_validate(benchmark, run):
+    benchmark(run, per_call_validate)
+
+
+def test_cached_validate(benchmark, run):
+    benchmark(run, cached_validate)
+
+
+def test_cached_validate_many(benchmark, run):
+    benchmark(run, cached_validate_many)
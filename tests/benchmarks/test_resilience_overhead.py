@@ -0,0 +1,71 @@
+"""Benchmarks for per-call overhead of the resilience decorators.
+
+Measures what a healthy database call pays for ``with_resilience`` and the
+circuit breaker: a bare coroutine call is the baseline, then the decorator
+without policies, with a circuit breaker, and with retry plus breaker.
+
+Run with:
+    pytest tests/benchmarks --benchmark-only
+"""
+
+import asyncio
+
+import pytest
+
+from earnorm.pool.core.circuit import CircuitBreaker
+from earnorm.pool.core.decorators import with_resilience
+from earnorm.pool.core.retry import RetryPolicy
+
+CALLS = 1000
+
+
+async def operation() -> int:
+    """Healthy no-op database call."""
+    return 1
+
+
+plain = with_resilience(backend="mongodb")(operation)
+with_breaker = with_resilience(circuit_breaker=CircuitBreaker(), backend="mongodb")(operation)
+with_retry_and_breaker = with_resilience(
+    retry_policy=RetryPolicy(max_retries=3),
+    circuit_breaker=CircuitBreaker(),
+    backend="mongodb",
+)(operation)
+
+
+@pytest.fixture
+def loop():
+    """Dedicated event loop for benchmark rounds."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def run_calls(loop: asyncio.AbstractEventLoop, func) -> None:
+    """Await ``func`` CALLS times inside one event loop iteration."""
+
+    async def batch() -> None:
+        for _ in range(CALLS):
+            await func()
+
+    loop.run_until_complete(batch())
+
+
+def test_bare_call(benchmark, loop):
+    """Baseline: undecorated coroutine."""
+    benchmark(run_calls, loop, operation)
+
+
+def test_decorator_without_policies(benchmark, loop):
+    """Decorator with no retry policy or circuit breaker."""
+    benchmark(run_calls, loop, plain)
+
+
+def test_decorator_with_circuit_breaker(benchmark, loop):
+    """Closed circuit breaker fast path."""
+    benchmark(run_calls, loop, with_breaker)
+
+
+def test_decorator_with_retry_and_circuit_breaker(benchmark, loop):
+    """Retry policy and circuit breaker on a healthy system."""
+    benchmark(run_calls, loop, with_retry_and_breaker)
@@ -0,0 +1,85 @@
+"""Benchmarks for ORM trace point overhead.
+
+Compares the eager f-string logging previously used on hot paths
+(``BaseModel.__getattr__``, ``api.multi``) with lazily formatted trace points.
+Both variants run with logging disabled at the relevant level, which is the
+production configuration: the eager variant still pays for formatting the
+record values, the trace variant only pays for one flag check.
+
+Run with:
+    pytest tests/benchmarks --benchmark-only
+"""
+
+import logging
+from typing import Any
+
+import pytest
+
+from earnorm.tracing import TRACE, get_tracer, set_trace_enabled
+
+logger = logging.getLogger("earnorm.benchmarks.tracing")
+trace = get_tracer("earnorm.benchmarks.tracing")
+
+# Roughly the size of a cached record dict on a typical model
+RECORD: dict[str, Any] = {f"field_{i}": f"value_{i}" * 4 for i in range(40)}
+RECORD_IDS = tuple(f"{i:024x}" for i in range(500))
+
+
+def eager_field_access() -> None:
+    """Emulate the former per-field-access logging in ``__getattr__``."""
+    logger.info(f"Getting attribute name for data.user:{RECORD_IDS[0]}")
+    logger.info(f"Cache object: {RECORD}")
+    logger.info(f"Cached value for name: {RECORD['field_0']}")
+    logger.info(f"Database result: {RECORD}")
+    logger.info(f"Converted value: {RECORD['field_0']}")
+    logger.debug(f"Calling User.write on records {RECORD_IDS} with args=({RECORD},), kwargs={{}}")
+
+
+def traced_field_access() -> None:
+    """Emulate the same call sites using trace points."""
+    trace("Getting attribute %s for %s:%s", "name", "data.user", RECORD_IDS[0])
+    trace("Cache hit for %s:%s.%s", "data.user", RECORD_IDS[0], "name")
+    trace("Fetching %s:%s.%s from database", "data.user", RECORD_IDS[0], "name")
+    trace("No result found for %s:%s.%s", "data.user", RECORD_IDS[0], "name")
+    trace("Method %s.%s returned: %s", "User", "write", RECORD)
+    if trace.enabled:
+        trace("Calling %s.%s on %d records", "User", "write", len(RECORD_IDS))
+
+
+@pytest.fixture(autouse=True)
+def quiet_logger():
+    """Disable the benchmark logger below WARNING, as in production."""
+    previous = logger.level
+    logger.setLevel(logging.WARNING)
+    set_trace_enabled(False)
+    yield
+    logger.setLevel(previous)
+    set_trace_enabled(False)
+
+
+def test_eager_fstring_logging(benchmark):
+    """Baseline: f-strings are formatted even though INFO is disabled."""
+    benchmark(eager_field_access)
+
+
+def test_trace_points_disabled(benchmark):
+    """Trace points with tracing switched off (default)."""
+    benchmark(traced_field_access)
+
+
+def test_trace_points_enabled_level_filtered(benchmark):
+    """Trace points switched on but filtered by logger level."""
+    set_trace_enabled(True)
+    benchmark(traced_field_access)
+
+
+def test_trace_points_emit_when_enabled(caplog):
+    """Trace points emit formatted records once enabled at TRACE level."""
+    set_trace_enabled(True)
+    logger.setLevel(TRACE)
+    with caplog.at_level(TRACE, logger=logger.name):
+        traced_field_access()
+
+    messages = [r.getMessage() for r in caplog.records if r.levelno == TRACE]
+    assert f"Getting attribute name for data.user:{RECORD_IDS[0]}" in messages
+    assert "Calling User.write on 500 records" in messages
@@ -0,0 +1,52 @@
+"""Benchmarks for batch validation.
+
+Compares awaiting ``validate`` once per field and row, as ``_validate_write``
+did before, with column-wise ``validate_batch``.
+
+Run with:
+    pytest tests/benchmarks --benchmark-only
+"""
+
+from earnorm.base.model.base import BaseModel
+from earnorm.fields.primitive import BooleanField, FloatField, IntegerField, StringField
+
+
+class ImportedContact(BaseModel):
+    """Model validated during imports."""
+
+    _name = "bench_imported_contact"
+
+    name = StringField(required=True, max_length=64)
+    email = StringField(pattern=r"^[^@\s]+@[^@\s]+\.[a-z]{2,}$")
+    age = IntegerField(min_value=0, max_value=150)
+    score = FloatField()
+    active = BooleanField()
+
+
+ROWS = [
+    {"name": f"Contact {i}", "email": f"contact{i}@example.com", "age": i % 90, "score": i / 7, "active": bool(i % 2)}
+    for i in range(5000)
+]
+
+
+async def per_value_validate() -> None:
+    """Validate rows awaiting validate once per value."""
+    fields = ImportedContact.__fields__
+    context = {"model": ImportedContact, "operation": "create"}
+    for row in ROWS:
+        for name, value in row.items():
+            await fields[name].validate(value, {**context, "values": row, "field_name": name})
+
+
+async def batch_validate() -> None:
+    """Validate rows column by column."""
+    errors = await ImportedContact.validate_batch(ROWS)
+    assert not errors
+
+
+def test_per_value_validate(benchmark, run):
+    benchmark(run, per_value_validate)
+
+
+def test_batch_validate(benchmark, run):
+    benchmark(run, batch_validate)
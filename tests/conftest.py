@@ -7,6 +7,7 @@ import asyncio
 import os
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, AsyncGenerator, Dict, Generator
 
 import pytest
@@ -88,6 +89,33 @@ async def mock_mongo_database(mock_mongo_client: AsyncMongoMockClient) -> AsyncI
     return mock_mongo_client.earnorm_test
 
 
+class BulkWriteCollection:
+    """Mock collection applying bulk writes one update at a time.
+
+    mongomock does not accept every ``UpdateOne`` option sent by recent
+    pymongo versions, so ``bulk_write`` is replayed through ``update_one``.
+    """
+
+    def __init__(self, collection: Any) -> None:
+        self._collection = collection
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._collection, name)
+
+    async def bulk_write(self, operations: list[Any], ordered: bool = True) -> Any:
+        modified = 0
+        for op in operations:
+            result = await self._collection.update_one(op._filter, op._doc)
+            modified += result.modified_count
+        return SimpleNamespace(modified_count=modified)
+
+
+@pytest_asyncio.fixture
+async def bulk_collection(mock_mongo_database: AsyncIOMotorDatabase[Dict[str, Any]]) -> BulkWriteCollection:
+    """Create a mock collection supporting bulk_write of update operations."""
+    return BulkWriteCollection(mock_mongo_database.records)
+
+
 @pytest_asyncio.fixture
 async def test_config() -> SystemConfigData:
     """Create test configuration."""
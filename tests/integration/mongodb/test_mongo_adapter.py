@@ -328,7 +328,8 @@ class TestMongoAdapterErrorHandling:
         """Test delete operation with database error."""
         # Mock collection to raise exception
         collection = mock_adapter._get_collection(TestModel)
-        collection.delete_one = AsyncMock(side_effect=Exception("Database connection failed"))
+        collection.delete_many = AsyncMock(side_effect=Exception("Database connection failed"))
+        mock_adapter._get_collection = lambda model_type: collection
         
         filter_dict = {"_id": "507f1f77bcf86cd799439011"}
         
@@ -0,0 +1,234 @@
+"""Unit tests for the change stream watcher."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from pymongo.errors import OperationFailure
+
+from earnorm.base.database.adapters.mongo import MongoAdapter
+from earnorm.base.database.watcher import ChangeWatcher, LocalEventSource, compile_matcher
+from earnorm.base.model.base import BaseModel
+from earnorm.fields.primitive import IntegerField, StringField
+
+
+class WatchedOrder(BaseModel):
+    """Order model."""
+
+    _name = "test_watched_order"
+
+    state = StringField()
+    amount = IntegerField()
+
+
+class TabledWatchedOrder(BaseModel):
+    """Order model with a table name."""
+
+    _name = "test_tabled_watched_order"
+    _table = "test_tabled_watched_orders"
+
+    state = StringField()
+
+
+@pytest.fixture
+def source():
+    return LocalEventSource()
+
+
+@pytest.fixture
+async def watcher(mock_mongo_database, source, monkeypatch):
+    adapter = MongoAdapter()
+    adapter._sync_db = mock_mongo_database
+    watcher = ChangeWatcher(adapter, [WatchedOrder], source=source, retry_delay=0)
+    monkeypatch.setattr(WatchedOrder, "_env", SimpleNamespace(adapter=adapter, watcher=watcher), raising=False)
+    await watcher.start()
+    await asyncio.sleep(0)
+    yield watcher
+    await watcher.stop()
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def take(subscription, count):
+    return [await asyncio.wait_for(subscription.__anext__(), 1) for _ in range(count)]
+
+
+class TestInvalidation:
+    """Test cache invalidation."""
+
+    async def test_changes_drop_cached_counts(self, watcher, source):
+        cache = watcher._adapter.count_cache
+        cache.set("test_watched_order", None, 3)
+        cache.set("other", None, 1)
+
+        source.push("test_watched_order", "insert", {"_id": "a1", "state": "draft"})
+        await settle()
+
+        assert cache.get("test_watched_order", None) is None
+        assert cache.get("other", None) == 1
+
+    async def test_watches_collection_written_by_adapter(self, mock_mongo_database, source, monkeypatch):
+        adapter = MongoAdapter()
+        adapter._sync_db = mock_mongo_database
+        watcher = ChangeWatcher(adapter, [TabledWatchedOrder], source=source, retry_delay=0)
+        env = SimpleNamespace(adapter=adapter, watcher=watcher)
+        monkeypatch.setattr(TabledWatchedOrder, "_env", env, raising=False)
+        await watcher.start()
+        try:
+            changes = TabledWatchedOrder.subscribe()
+            await TabledWatchedOrder.search_count()
+            await settle()
+            name = adapter._get_collection(TabledWatchedOrder).name
+
+            source.push(name, "insert", {"_id": "a1", "state": "draft"})
+
+            [event] = await take(changes, 1)
+            assert event.id == "a1"
+            assert len(adapter.count_cache) == 0
+        finally:
+            await watcher.stop()
+
+    async def test_listeners(self, watcher, source):
+        seen = []
+
+        async def listener(event):
+            seen.append((event.operation, event.id, event.updated_fields))
+
+        remove = watcher.add_listener(listener)
+        source.push("test_watched_order", "update", {"_id": "a1", "state": "done"}, updated_fields=["state.code"])
+        await settle()
+        remove()
+        source.push("test_watched_order", "delete", id="a1")
+        await settle()
+
+        assert seen == [("update", "a1", frozenset({"state"}))]
+
+
+class TestSubscribe:
+    """Test domain subscriptions."""
+
+    async def test_domain_filtering(self, watcher, source):
+        changes = WatchedOrder.subscribe([("state", "=", "done"), "&", ("amount", ">", 10)])
+
+        source.push("test_watched_order", "insert", {"_id": "a1", "state": "done", "amount": 5})
+        source.push("test_watched_order", "insert", {"_id": "a2", "state": "done", "amount": 50})
+        source.push("test_watched_order", "update", {"_id": "a3", "state": "draft", "amount": 50})
+        source.push("test_watched_order", "delete", id="a1")
+
+        events = await take(changes, 2)
+        assert [(event.operation, event.id) for event in events] == [("insert", "a2"), ("delete", "a1")]
+        assert events[0].document == {"_id": "a2", "state": "done", "amount": 50}
+
+    async def test_stop_ends_subscriptions(self, watcher, source):
+        received = []
+
+        async def consume():
+            async with WatchedOrder.subscribe() as changes:
+                async for change in changes:
+                    received.append(change.id)
+
+        consumer = asyncio.create_task(consume())
+        source.push("test_watched_order", "insert", {"_id": "a1"})
+        await settle()
+        await watcher.stop()
+
+        await asyncio.wait_for(consumer, 1)
+        assert received == ["a1"]
+        with pytest.raises(RuntimeError):
+            WatchedOrder.subscribe()
+
+    async def test_close_unsubscribes(self, watcher):
+        changes = WatchedOrder.subscribe()
+        changes.close()
+
+        assert watcher._subscriptions["test_watched_order"] == []
+        with pytest.raises(StopAsyncIteration):
+            await changes.__anext__()
+
+    @pytest.mark.parametrize(
+        ("domain", "expected"),
+        [
+            ([("id", "in", ["a1", "a2"])], True),
+            ([("state", "like", "d%e")], True),
+            ([("state", "!=", "done"), "|", ("amount", "<=", 5)], True),
+            ([("tags", "=", "x")], True),
+            ([("partner.name", "ilike", "ACME")], True),
+            (["!", ("state", "in", ["done"])], False),
+            ([("missing", "is null", True)], True),
+        ],
+    )
+    def test_matcher(self, domain, expected):
+        matches = compile_matcher(WatchedOrder, domain)
+        document = {"_id": "a1", "state": "done", "amount": 5, "tags": ["x", "y"], "partner": {"name": "Acme Corp"}}
+
+        assert matches(document) is expected
+
+
+    @pytest.mark.parametrize(
+        ("domain", "expected"),
+        [
+            ([("state", "like", "Jo%")], [0, 1]),
+            ([("state", "ilike", "jo%n")], [0]),
+            ([("state", "not like", "J.%")], [0, 1, 3, 4]),
+            ([("state", "is null", None)], [3, 4]),
+            ([("state", "is not null", None)], [0, 1, 2]),
+        ],
+    )
+    async def test_matcher_agrees_with_search(self, watcher, mock_mongo_database, domain, expected):
+        documents = [{"state": "John"}, {"state": "Jo%x"}, {"state": "J.K."}, {"state": None}, {"amount": 1}]
+        result = await mock_mongo_database.test_watched_order.insert_many([dict(doc) for doc in documents])
+        ids = [str(record_id) for record_id in result.inserted_ids]
+        matches = compile_matcher(WatchedOrder, domain)
+
+        found = await WatchedOrder.search(domain)
+
+        assert [index for index, document in enumerate(documents) if matches(document)] == expected
+        assert sorted(found.ids) == sorted(ids[index] for index in expected)
+
+
+class TestResume:
+    """Test stream recovery."""
+
+    async def test_resumes_after_last_token(self, watcher, source):
+        changes = WatchedOrder.subscribe()
+        source.push("test_watched_order", "insert", {"_id": "a1"})
+        await settle()
+
+        source.interrupt("test_watched_order")
+        source.push("test_watched_order", "insert", {"_id": "a2"})
+
+        events = await take(changes, 2)
+        assert [event.id for event in events] == ["a1", "a2"]
+        assert source.opened == [("test_watched_order", None), ("test_watched_order", 1)]
+        assert watcher.tokens["test_watched_order"] == 2
+
+    async def test_reopens_ended_stream(self, watcher, source):
+        changes = WatchedOrder.subscribe()
+        source.push("test_watched_order", "insert", {"_id": "a1"})
+        source.push("test_watched_order", "invalidate")
+        await settle()
+
+        source.push("test_watched_order", "insert", {"_id": "a2"})
+
+        events = await take(changes, 3)
+        assert [(event.operation, event.id) for event in events] == [
+            ("insert", "a1"),
+            ("invalidate", None),
+            ("insert", "a2"),
+        ]
+        assert source.opened == [("test_watched_order", None), ("test_watched_order", None)]
+        assert watcher.running
+
+    async def test_lost_history_invalidates_everything(self, watcher, source):
+        changes = WatchedOrder.subscribe()
+        watcher._adapter.count_cache.set("test_watched_order", None, 3)
+        source.interrupt("test_watched_order", OperationFailure("history lost", code=286))
+
+        [event] = await take(changes, 1)
+
+        assert (event.operation, event.id) == ("invalidate", None)
+        assert watcher._adapter.count_cache.get("test_watched_order", None) is None
+        assert source.opened[-1] == ("test_watched_order", None)
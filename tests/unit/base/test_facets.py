@@ -0,0 +1,150 @@
+"""Unit tests for distinct values and facet counts."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from earnorm.base.database.adapters.mongo import MongoAdapter
+from earnorm.base.model.base import BaseModel
+from earnorm.fields.composite.list import ListField
+from earnorm.fields.primitive import BooleanField, StringField
+
+
+class FacetProduct(BaseModel):
+    """Product model."""
+
+    _name = "test_facet_product"
+
+    brand = StringField()
+    active = BooleanField()
+    tags = ListField(StringField())
+
+
+class TabledProduct(BaseModel):
+    """Product model with a table name."""
+
+    _name = "test_tabled_product"
+    _table = "test_tabled_products"
+
+    brand = StringField()
+
+
+class RecordingCollection:
+    """Collection recording aggregation pipelines."""
+
+    def __init__(self, collection, pipelines):
+        self._collection = collection
+        self._pipelines = pipelines
+
+    def __getattr__(self, name):
+        return getattr(self._collection, name)
+
+    def aggregate(self, pipeline, *args, **kwargs):
+        self._pipelines.append(pipeline)
+        return self._collection.aggregate(pipeline, *args, **kwargs)
+
+
+class RecordingDatabase:
+    """Database handing out recording collections."""
+
+    def __init__(self, database):
+        self._database = database
+        self.pipelines = []
+
+    def __getattr__(self, name):
+        return getattr(self._database, name)
+
+    def __getitem__(self, name):
+        return RecordingCollection(self._database[name], self.pipelines)
+
+
+@pytest.fixture
+def database(mock_mongo_database):
+    return RecordingDatabase(mock_mongo_database)
+
+
+@pytest.fixture
+async def adapter(database, mock_mongo_database, monkeypatch):
+    adapter = MongoAdapter()
+    adapter._sync_db = database
+    env = SimpleNamespace(adapter=adapter)
+
+    async def get_env(cls):
+        return env
+
+    for model in (FacetProduct, TabledProduct):
+        monkeypatch.setattr(model, "_env", env, raising=False)
+        monkeypatch.setattr(model, "_get_env", classmethod(get_env))
+    await mock_mongo_database.test_facet_product.insert_many(
+        [
+            {"brand": "acme", "active": True, "tags": ["sale", "new"]},
+            {"brand": "acme", "active": True, "tags": ["sale"]},
+            {"brand": "globex", "active": True, "tags": []},
+            {"active": True},
+            {"brand": "initech", "active": False, "tags": ["sale"]},
+        ]
+    )
+    return adapter
+
+
+class TestFacets:
+    """Test facet counts."""
+
+    async def test_counts_all_fields_in_one_pipeline(self, adapter, database):
+        result = await FacetProduct.facets([("active", "=", True)], fields=["brand", "tags"])
+
+        assert result == {
+            "brand": [("acme", 2), (None, 1), ("globex", 1)],
+            "tags": [("sale", 2), ("new", 1)],
+        }
+        [pipeline] = database.pipelines
+        assert [next(iter(stage)) for stage in pipeline] == ["$match", "$facet"]
+
+    async def test_limit_per_facet(self, adapter):
+        result = await FacetProduct.facets(None, fields=["brand", "tags"], limit_per_facet=1)
+
+        assert result == {"brand": [("acme", 2)], "tags": [("sale", 3)]}
+
+    async def test_distinct(self, adapter):
+        assert await FacetProduct.distinct("brand", [("active", "=", True)]) == ["acme", "globex"]
+        assert await FacetProduct.distinct("tags") == ["sale", "new"]
+
+    @pytest.mark.parametrize(
+        ("fields", "limit"),
+        [([], None), (["missing"], None), (["brand"], 0)],
+    )
+    async def test_invalid(self, adapter, fields, limit):
+        with pytest.raises(ValueError):
+            await FacetProduct.facets(None, fields=fields, limit_per_facet=limit)
+
+
+class TestCache:
+    """Test caching per domain."""
+
+    async def test_reused_until_write(self, adapter, database):
+        domain = [("active", "=", True)]
+        first = await FacetProduct.facets(domain, fields=["brand"])
+        first["brand"].clear()
+
+        assert await FacetProduct.distinct("brand", [("active", "=", True)]) == ["acme", "globex"]
+        assert len(database.pipelines) == 1
+
+        await FacetProduct.create({"brand": "globex", "active": True})
+        result = await FacetProduct.facets(domain, fields=["brand"])
+
+        assert result["brand"][:2] == [("acme", 2), ("globex", 2)]
+        assert len(database.pipelines) == 2
+
+    async def test_keyed_by_domain_and_spec(self, adapter, database):
+        await FacetProduct.facets([("active", "=", True)], fields=["brand"])
+        await FacetProduct.facets([("active", "=", False)], fields=["brand"])
+        await FacetProduct.facets([("active", "=", True)], fields=["brand"], limit_per_facet=1)
+
+        assert len(database.pipelines) == 3
+
+    async def test_writes_invalidate_model_with_table(self, adapter, database):
+        await TabledProduct.facets(None, fields=["brand"])
+        await TabledProduct.create({"brand": "acme"})
+        await TabledProduct.facets(None, fields=["brand"])
+
+        assert len(database.pipelines) == 2
@@ -0,0 +1,306 @@
+"""Unit tests for materialized aggregate views."""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, ClassVar
+
+import pytest
+
+from earnorm.base.database.adapters.mongo import MongoAdapter
+from earnorm.base.database.materialized import ChangeStreamTailer, materialized_specs
+from earnorm.base.model.base import BaseModel
+from earnorm.fields.primitive import IntegerField, StringField
+
+T0 = datetime(2024, 3, 1)
+EARLIER = T0 - timedelta(hours=1)
+
+BY_STATE = [
+    {"$match": {"kind": "sale"}},
+    {"$group": {"_id": "$state", "total": {"$sum": "$amount"}, "orders": {"$sum": 1}}},
+]
+
+BY_DAY = [
+    {"$addFields": {"key": {"$concat": ["$day", "/", "$state"]}}},
+    {"$group": {"_id": {"key": "$key"}, "total": {"$sum": "$amount"}}},
+    {"$set": {"large": {"$gt": ["$total", 10]}}},
+]
+
+
+class ViewOrder(BaseModel):
+    """Order model with materialized views."""
+
+    _name = "test_view_order"
+    _materialized: ClassVar[dict[str, Any]] = {
+        "by_state": BY_STATE,
+        "by_day": {"pipeline": BY_DAY, "into": "test_view_order_daily"},
+    }
+
+    state = StringField()
+    kind = StringField()
+    day = StringField()
+    amount = IntegerField()
+
+
+class TabledViewOrder(BaseModel):
+    """Order model with a table name and a materialized view."""
+
+    _name = "test_tabled_view_order"
+    _table = "test_tabled_view_orders"
+    _materialized: ClassVar[dict[str, Any]] = {"by_state": BY_STATE}
+
+    state = StringField()
+    kind = StringField()
+    amount = IntegerField()
+
+
+class MergeCollection:
+    """Collection running ``$merge`` stages, which mongomock lacks, client side."""
+
+    def __init__(self, database, collection):
+        self._database = database
+        self._collection = collection
+
+    def __getattr__(self, name):
+        return getattr(self._collection, name)
+
+    def aggregate(self, pipeline):
+        self._database.pipelines.append(pipeline)
+        if "$merge" not in pipeline[-1]:
+            return self._collection.aggregate(pipeline)
+        merge = pipeline[-1]["$merge"]
+        return MergeCursor(self._collection.aggregate(pipeline[:-1]), self._database[merge["into"]])
+
+
+class MergeCursor:
+    """Cursor replacing merged groups in the target collection."""
+
+    def __init__(self, cursor, target):
+        self._cursor = cursor
+        self._target = target
+
+    async def to_list(self, length=None):
+        for doc in await self._cursor.to_list(None):
+            await self._target.replace_one({"_id": doc["_id"]}, doc, upsert=True)
+        return []
+
+
+class MergeDatabase:
+    """Database handing out merge-capable collections."""
+
+    def __init__(self, database):
+        self._database = database
+        self.pipelines = []
+
+    def __getattr__(self, name):
+        return getattr(self._database, name)
+
+    def __getitem__(self, name):
+        return MergeCollection(self, self._database[name])
+
+
+@pytest.fixture
+def database(mock_mongo_database):
+    return MergeDatabase(mock_mongo_database)
+
+
+@pytest.fixture
+def adapter(database, monkeypatch):
+    adapter = MongoAdapter()
+    adapter._sync_db = database
+    for model in (ViewOrder, TabledViewOrder):
+        monkeypatch.setattr(model, "_env", SimpleNamespace(adapter=adapter), raising=False)
+    return adapter
+
+
+@pytest.fixture
+async def source(adapter, mock_mongo_database):
+    collection = mock_mongo_database.test_view_order
+    await collection.insert_many(
+        [
+            {"_id": 1, "state": "done", "kind": "sale", "day": "d1", "amount": 10, "updated_at": EARLIER},
+            {"_id": 2, "state": "done", "kind": "sale", "day": "d2", "amount": 5, "updated_at": EARLIER},
+            {"_id": 3, "state": "draft", "kind": "sale", "day": "d1", "amount": 7, "updated_at": T0},
+            {"_id": 4, "state": "done", "kind": "refund", "day": "d1", "amount": 3, "updated_at": EARLIER},
+        ]
+    )
+    return collection
+
+
+async def totals(view):
+    return {row["_id"]: row["total"] for row in await view.rows()}
+
+
+class TestDeclaration:
+    """Test view declarations."""
+
+    def test_specs(self):
+        specs = materialized_specs(ViewOrder, "test_view_order")
+
+        assert specs["by_state"].into == "test_view_order__by_state"
+        assert specs["by_state"].watermark == "updated_at"
+        assert specs["by_state"].key_fields == {"state", "kind"}
+        assert specs["by_day"].into == "test_view_order_daily"
+        assert specs["by_day"].key_fields == {"key", "day", "state"}
+
+    @pytest.mark.parametrize(
+        "pipeline",
+        [
+            [{"$match": {}}],
+            [{"$group": {"_id": "$a"}}, {"$group": {"_id": "$b"}}],
+            [{"$group": {"_id": "$a"}}, {"$sort": {"_id": 1}}],
+            [{"$lookup": {}}, {"$group": {"_id": "$a"}}],
+        ],
+    )
+    def test_invalid_pipelines(self, pipeline):
+        model = SimpleNamespace(_name="bad", _materialized={"bad": pipeline})
+
+        with pytest.raises(ValueError):
+            materialized_specs(model, "bad")
+
+    def test_default_into_follows_source_collection(self, adapter):
+        view = TabledViewOrder.materialized("by_state")
+
+        assert view._source.name == "test_tabled_view_order"
+        assert view._target.name == "test_tabled_view_order__by_state"
+
+    def test_unknown_view(self, adapter):
+        with pytest.raises(KeyError):
+            ViewOrder.materialized("missing")
+
+    async def test_watermark_index_synced(self, adapter, mock_mongo_database):
+        assert await adapter.sync_schema(ViewOrder) == ["updated_at_watermark"]
+
+
+class TestRefresh:
+    """Test full and incremental refreshes."""
+
+    async def test_first_refresh_is_full(self, source, database):
+        view = ViewOrder.materialized("by_state")
+
+        assert await view.refresh() == 2
+        assert await totals(view) == {"done": 15, "draft": 7}
+        assert await view.get("done") == {"_id": "done", "total": 15, "orders": 2}
+        assert await view.watermark() == T0
+        assert "$out" in database.pipelines[-1][-1]
+
+    async def test_incremental_recomputes_updated_groups(self, source, database):
+        view = ViewOrder.materialized("by_state")
+        await view.refresh()
+        await source.insert_one(
+            {"_id": 5, "state": "draft", "kind": "sale", "amount": 1, "updated_at": T0 + timedelta(hours=1)}
+        )
+        database.pipelines.clear()
+
+        assert await view.refresh() == 1
+        assert await totals(view) == {"done": 15, "draft": 8}
+        assert await view.watermark() == T0 + timedelta(hours=1)
+        merge = database.pipelines[-1]
+        assert merge[0] == {"$match": {"state": {"$in": ["draft"]}}}
+        assert merge[-1]["$merge"]["whenMatched"] == "replace"
+
+        # Groups updated within the overlap are recomputed to the same values
+        assert await view.refresh() == 1
+        assert await totals(view) == {"done": 15, "draft": 8}
+
+    async def test_ids_refresh_keeps_watermark(self, source):
+        view = ViewOrder.materialized("by_state")
+        await view.refresh()
+        await source.insert_many(
+            [
+                {"_id": 5, "state": "draft", "kind": "sale", "amount": 1, "updated_at": T0 + timedelta(hours=1)},
+                {"_id": 6, "state": "done", "kind": "sale", "amount": 2, "updated_at": T0 + timedelta(hours=2)},
+            ]
+        )
+
+        assert await view.refresh(ids=[6]) == 1
+        assert await view.watermark() == T0
+
+        assert await view.refresh() == 2
+        assert await totals(view) == {"done": 17, "draft": 8}
+        assert await view.watermark() == T0 + timedelta(hours=2)
+
+    async def test_rereads_writes_at_watermark(self, source):
+        view = ViewOrder.materialized("by_state")
+        await view.refresh()
+        await source.insert_one({"_id": 5, "state": "draft", "kind": "sale", "amount": 1, "updated_at": T0})
+
+        await view.refresh()
+
+        assert await totals(view) == {"done": 15, "draft": 8}
+
+    async def test_computed_keys_compared_before_group(self, source, database):
+        view = ViewOrder.materialized("by_day")
+        await view.refresh(full=True)
+        await source.update_one({"_id": 2}, {"$set": {"amount": 50}})
+
+        assert await view.refresh(ids=[2]) == 1
+        assert await view.get({"key": "d2/done"}) == {"key": "d2/done", "total": 50, "large": True}
+        assert await view.get({"key": "d1/done"}) == {"key": "d1/done", "total": 13, "large": True}
+        assert database.pipelines[-1][1] == {"$match": {"$expr": {"$in": [{"key": "$key"}, [{"key": "d2/done"}]]}}}
+
+
+async def events(*items):
+    for item in items:
+        yield item
+
+
+def update(doc_id, *fields):
+    return {
+        "operationType": "update",
+        "documentKey": {"_id": doc_id},
+        "updateDescription": {"updatedFields": dict.fromkeys(fields), "removedFields": []},
+    }
+
+
+class TestChangeStreamTailer:
+    """Test refreshes driven by change events."""
+
+    @pytest.fixture
+    def calls(self, adapter, monkeypatch):
+        calls = []
+        view = ViewOrder.materialized("by_state")
+        original = view.refresh
+
+        async def refresh(full=False, ids=None):
+            calls.append((full, ids))
+            return await original(full=full, ids=ids)
+
+        monkeypatch.setattr(view, "refresh", refresh)
+        return calls
+
+    async def test_batches_changed_documents(self, source, calls):
+        view = ViewOrder.materialized("by_state")
+        await source.update_one({"_id": 3}, {"$set": {"amount": 70}})
+        stream = events(
+            {"operationType": "insert", "documentKey": {"_id": 1}},
+            update(3, "amount"),
+            update(3, "amount"),
+            update(2, "amount"),
+        )
+
+        await ChangeStreamTailer([view], source=stream, batch_size=2).run()
+
+        assert calls == [(False, [1, 3]), (False, [3, 2])]
+        assert await totals(view) == {"done": 15, "draft": 70}
+
+    async def test_key_changes_and_deletes_rebuild(self, source, calls):
+        view = ViewOrder.materialized("by_state")
+
+        await ChangeStreamTailer([view], source=events(update(1, "state"), update(2, "amount"))).run()
+        await ChangeStreamTailer([view], source=events({"operationType": "delete", "documentKey": {"_id": 1}})).run()
+
+        assert calls == [(True, None), (True, None)]
+
+    async def test_flushes_after_max_delay(self, source, calls):
+        view = ViewOrder.materialized("by_state")
+
+        async def slow():
+            yield update(1, "amount")
+            await asyncio.sleep(0.05)
+            assert calls == [(False, [1])]
+            yield update(2, "amount")
+
+        await ChangeStreamTailer([view], source=slow(), max_delay=0.01).run()
+
+        assert calls == [(False, [1]), (False, [2])]
@@ -0,0 +1,143 @@
+"""Unit tests for precompiled model codecs."""
+
+import enum
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+from bson import ObjectId
+from bson.decimal128 import Decimal128
+
+from earnorm.base.model.base import BaseModel
+from earnorm.base.model.codec import ModelCodec
+from earnorm.fields.composite.list import ListField
+from earnorm.fields.primitive import (
+    BooleanField,
+    DateTimeField,
+    DecimalField,
+    EnumField,
+    FloatField,
+    IntegerField,
+    JSONField,
+    ObjectIdField,
+    StringField,
+)
+
+
+class Status(enum.Enum):
+    DRAFT = "draft"
+    DONE = "done"
+
+
+class CodecOrder(BaseModel):
+    """Model with one field of every primitive type."""
+
+    _name = "test_codec_order"
+
+    name = StringField()
+    quantity = IntegerField()
+    ratio = FloatField()
+    paid = BooleanField()
+    amount = DecimalField(decimal_places=2)
+    status = EnumField(Status)
+    partner_id = ObjectIdField()
+    date_order = DateTimeField()
+    payload = JSONField()
+    tags = ListField(StringField())
+
+
+class OverridingField(StringField):
+    """Field customizing its awaited conversion."""
+
+    async def to_db(self, value, backend):
+        return value.upper()
+
+
+MOMENT = datetime(2024, 3, 1, 12, 30, tzinfo=UTC)
+PARTNER = ObjectId()
+
+
+class TestModelCodec:
+    """Test codec compilation and conversion."""
+
+    def test_metaclass_compiles_codec(self):
+        codec = CodecOrder.__codec__
+
+        assert isinstance(codec, ModelCodec)
+        assert codec.backend == "mongodb"
+        assert set(codec.sync_fields) >= {
+            "id",
+            "created_at",
+            "updated_at",
+            "name",
+            "quantity",
+            "ratio",
+            "paid",
+            "amount",
+            "status",
+            "partner_id",
+            "date_order",
+            "payload",
+        }
+        assert codec.async_fields == ("tags",)
+        assert not codec.is_sync
+
+    def test_overridden_to_db_stays_async(self):
+        codec = ModelCodec({"code": OverridingField()})
+
+        assert codec.async_fields == ("code",)
+
+    def test_round_trip_sync(self):
+        codec = CodecOrder.__codec__
+        values = {
+            "name": "SO001",
+            "quantity": 3,
+            "ratio": 0.5,
+            "paid": True,
+            "amount": Decimal("10.50"),
+            "status": Status.DONE,
+            "partner_id": PARTNER,
+            "date_order": MOMENT,
+            "unknown": 1,
+        }
+
+        doc = codec.encode_sync(values)
+
+        assert doc == {
+            "name": "SO001",
+            "quantity": 3,
+            "ratio": 0.5,
+            "paid": True,
+            "amount": Decimal128("10.50"),
+            "status": "done",
+            "partner_id": PARTNER,
+            "date_order": MOMENT,
+        }
+        del values["unknown"]
+        assert codec.decode_sync(doc) == values
+
+    @pytest.mark.asyncio
+    async def test_matches_field_conversion(self):
+        codec = CodecOrder.__codec__
+        doc = {"quantity": "4", "status": "draft", "date_order": MOMENT.replace(tzinfo=None)}
+
+        decoded = await codec.decode(doc)
+
+        for name, value in doc.items():
+            assert decoded[name] == await CodecOrder.__fields__[name].from_db(value, "mongodb")
+
+    @pytest.mark.asyncio
+    async def test_async_fields_are_awaited(self):
+        codec = ModelCodec({"code": OverridingField(), "name": StringField()})
+
+        assert await codec.encode({"code": "abc", "name": "abc"}) == {"code": "ABC", "name": "abc"}
+
+    def test_codec_for_other_backend(self):
+        try:
+            codec = CodecOrder._get_codec("postgres")
+
+            assert codec.backend == "postgres"
+            assert codec.encode_sync({"amount": Decimal("1.5")}) == {"amount": "1.5"}
+            assert CodecOrder._get_codec("postgres") is codec
+        finally:
+            CodecOrder._get_codec("mongodb")
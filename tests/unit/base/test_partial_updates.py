@@ -0,0 +1,213 @@
+"""Unit tests for partial update operators on recordsets."""
+
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import ClassVar
+
+import pytest
+from bson.decimal128 import Decimal128
+
+from earnorm.base.database.adapters.mongo import MongoAdapter
+from earnorm.base.database.update_ops import FieldUpdate, compile_updates
+from earnorm.base.model.base import BaseModel
+from earnorm.exceptions import FieldValidationError
+from earnorm.fields.composite.dict import DictField
+from earnorm.fields.composite.list import ListField
+from earnorm.fields.composite.set import SetField
+from earnorm.fields.primitive import DecimalField, IntegerField, JSONField, StringField
+
+
+class CountingStringField(StringField):
+    """String field counting validated values."""
+
+    validated: ClassVar[list[str]] = []
+
+    def check(self, value, context=None):
+        CountingStringField.validated.append(value)
+        return super().check(value, context)
+
+
+class PartialPost(BaseModel):
+    """Model with list, set, dictionary and numeric fields."""
+
+    _name = "test_partial_post"
+
+    tags = ListField(CountingStringField(max_length=10))
+    labels = SetField(StringField())
+    scores = DictField(IntegerField(min_value=0))
+    settings = JSONField()
+    raw = JSONField(storage="string")
+    views = IntegerField()
+    rating = DecimalField(decimal_places=2)
+    code = StringField(readonly=True)
+
+
+@pytest.fixture
+def adapter(mock_mongo_database, monkeypatch):
+    adapter = MongoAdapter()
+    adapter._sync_db = mock_mongo_database
+    monkeypatch.setattr(PartialPost, "_env", SimpleNamespace(adapter=adapter), raising=False)
+    return adapter
+
+
+@pytest.fixture
+async def posts(adapter, mock_mongo_database):
+    result = await mock_mongo_database.test_partial_post.insert_many(
+        [
+            {"tags": ["a", "b"], "labels": ["x"], "scores": {"math": 1}, "settings": {"theme": "light"}, "views": 1},
+            {"tags": ["b"], "labels": [], "scores": {}, "settings": {}, "views": 5},
+        ]
+    )
+    return PartialPost._browse(PartialPost._env, [str(record_id) for record_id in result.inserted_ids])
+
+
+async def stored(mock_mongo_database):
+    return await mock_mongo_database.test_partial_post.find({}, sort=[("_id", 1)]).to_list(None)
+
+
+class TestCompileUpdates:
+    """Test update document compilation."""
+
+    def test_operators(self):
+        document = compile_updates(
+            [
+                FieldUpdate("push", "tags", ("c",)),
+                FieldUpdate("add_to_set", "labels", ("x", "y")),
+                FieldUpdate("pull", "old", ("a",)),
+                FieldUpdate("pull", "older", ("a", "b")),
+                FieldUpdate("set", "settings.theme", ("dark",)),
+                FieldUpdate("inc", "views", (2,)),
+            ]
+        )
+
+        assert document == {
+            "$push": {"tags": {"$each": ["c"]}},
+            "$addToSet": {"labels": {"$each": ["x", "y"]}},
+            "$pull": {"old": "a", "older": {"$in": ["a", "b"]}},
+            "$set": {"settings.theme": "dark"},
+            "$inc": {"views": 2},
+        }
+
+    def test_rejects_repeated_path(self):
+        with pytest.raises(ValueError):
+            compile_updates([FieldUpdate("push", "tags", ("a",)), FieldUpdate("pull", "tags", ("b",))])
+        with pytest.raises(ValueError):
+            compile_updates([])
+
+
+class TestArrayOperators:
+    """Test list and set element updates."""
+
+    async def test_append_validates_only_new_element(self, posts, mock_mongo_database):
+        CountingStringField.validated.clear()
+
+        await posts.append("tags", "c")
+
+        assert CountingStringField.validated == ["c"]
+        assert [doc["tags"] for doc in await stored(mock_mongo_database)] == [["a", "b", "c"], ["b", "c"]]
+
+    async def test_extend_and_remove(self, posts, mock_mongo_database):
+        await posts.extend("tags", ["c", "d"])
+        await posts.remove("tags", "b", "d")
+
+        assert [doc["tags"] for doc in await stored(mock_mongo_database)] == [["a", "c"], ["c"]]
+
+    async def test_add_to_set_and_set_append(self, posts, mock_mongo_database):
+        await posts.add_to_set("tags", "a", "z")
+        await posts.append("labels", "x")
+
+        docs = await stored(mock_mongo_database)
+        assert [doc["tags"] for doc in docs] == [["a", "b", "z"], ["b", "a", "z"]]
+        assert [doc["labels"] for doc in docs] == [["x"], ["x"]]
+
+    async def test_invalid_element(self, posts, mock_mongo_database):
+        with pytest.raises(FieldValidationError) as exc_info:
+            await posts.extend("tags", ["ok", "far too long tag"])
+
+        assert exc_info.value.error.code == "invalid_element"
+        assert "index 1" in str(exc_info.value)
+        assert [doc["tags"] for doc in await stored(mock_mongo_database)] == [["a", "b"], ["b"]]
+
+    async def test_array_operator_on_scalar(self, posts):
+        with pytest.raises(FieldValidationError) as exc_info:
+            await posts.append("views", 1)
+        assert exc_info.value.error.code == "invalid_operator"
+
+
+class TestPathOperators:
+    """Test dotted path and counter updates."""
+
+    async def test_dict_set_validates_value(self, posts, mock_mongo_database):
+        await posts.dict_set("scores.art", 3)
+
+        assert [doc["scores"] for doc in await stored(mock_mongo_database)] == [{"math": 1, "art": 3}, {"art": 3}]
+        with pytest.raises(FieldValidationError) as exc_info:
+            await posts.dict_set("scores.art", -1)
+        assert exc_info.value.error.code == "invalid_value"
+
+    async def test_dict_set_inside_json(self, posts, mock_mongo_database):
+        await posts.dict_set("settings.notifications.email", False)
+
+        docs = await stored(mock_mongo_database)
+        assert docs[0]["settings"] == {"theme": "light", "notifications": {"email": False}}
+
+    async def test_invalid_paths(self, posts):
+        for path, code in (
+            ("scores.art.deep", "invalid_path"),
+            ("scores", "invalid_path"),
+            ("settings.$where", "invalid_path"),
+            ("raw.key", "invalid_value"),
+            ("missing.key", "field_not_found"),
+            ("code.key", "field_readonly"),
+        ):
+            with pytest.raises(FieldValidationError) as exc_info:
+                await posts.dict_set(path, 1)
+            assert exc_info.value.error.code == code, path
+
+    async def test_increment(self, posts, mock_mongo_database):
+        await posts.increment("views", 2)
+        await posts.increment("scores.math", -1)
+        await posts.increment("settings.counter")
+
+        docs = await stored(mock_mongo_database)
+        assert [doc["views"] for doc in docs] == [3, 7]
+        assert [doc["scores"]["math"] for doc in docs] == [0, -1]
+        assert [doc["settings"]["counter"] for doc in docs] == [1, 1]
+
+    async def test_increment_decimal(self, posts, mock_mongo_database, monkeypatch):
+        sent = []
+
+        async def spy(self, model_type, filter_or_domain, updates):
+            sent.extend(updates)
+            return 0
+
+        monkeypatch.setattr(MongoAdapter, "apply_updates", spy)
+        await posts.increment("rating", Decimal("0.5"))
+
+        assert sent[0] == FieldUpdate("inc", "rating", (Decimal128("0.5"),))
+        assert [update.path for update in sent[1:]] == ["updated_at"]
+
+    async def test_increment_sets_updated_at(self, posts, mock_mongo_database):
+        await mock_mongo_database.test_partial_post.update_many({}, {"$set": {"updated_at": datetime(2020, 1, 1)}})
+
+        await posts.increment("views")
+
+        docs = await stored(mock_mongo_database)
+        assert all(doc["updated_at"] > datetime(2020, 1, 1) for doc in docs)
+        assert all("created_at" not in doc for doc in docs)
+
+    async def test_increment_type_errors(self, posts):
+        for path, amount, code in (
+            ("views", 1.5, "invalid_type"),
+            ("views", True, "invalid_type"),
+            ("tags", 1, "invalid_operator"),
+        ):
+            with pytest.raises(FieldValidationError) as exc_info:
+                await posts.increment(path, amount)
+            assert exc_info.value.error.code == code, path
+
+    async def test_empty_recordset_is_noop(self, adapter):
+        empty = PartialPost._browse(PartialPost._env, [])
+
+        assert await empty.append("tags", "far too long tag") is empty
@@ -0,0 +1,156 @@
+"""Unit tests for the MongoDB aggregation pipeline optimizer."""
+
+from typing import Any, ClassVar
+
+import mongomock
+import pytest
+
+from earnorm.base.database.query.backends.mongo.operations.join import MongoJoin
+from earnorm.base.database.query.backends.mongo.optimizer import optimize_pipeline
+from earnorm.base.database.query.backends.mongo.query import MongoQuery
+
+
+class Order:
+    """Queried model."""
+
+    __fields__: ClassVar[dict[str, Any]] = {"id": None, "date": None, "state": None, "user_id": None}
+
+
+def lookup(foreign_field="_id", target="user"):
+    return {"$lookup": {"from": "user", "localField": "user_id", "foreignField": foreign_field, "as": target}}
+
+
+def unwind(target="user", preserve=True):
+    return {"$unwind": {"path": f"${target}", "preserveNullAndEmptyArrays": preserve}}
+
+
+def join_stages(join_type, conditions=None):
+    join = MongoJoin(None, Order)  # type: ignore[arg-type]
+    join.join("user", conditions or {"user_id": "_id"}, join_type)
+    return join.get_pipeline_stages()
+
+
+PAGE = [{"$sort": {"date": -1}}, {"$skip": 20}, {"$limit": 10}]
+
+
+class TestHoisting:
+    """Test moving page stages ahead of joins."""
+
+    def test_page_before_unique_left_join(self):
+        stages = [{"$match": {"state": "open"}}, *join_stages("left"), *PAGE]
+
+        assert optimize_pipeline(stages) == [{"$match": {"state": "open"}}, *PAGE, *join_stages("left")]
+
+    def test_page_before_lookup_without_unwind(self):
+        stages = [lookup(foreign_field="order_id", target="lines"), *PAGE]
+
+        assert optimize_pipeline(stages) == [*PAGE, lookup(foreign_field="order_id", target="lines")]
+
+    def test_inner_join_keeps_paging_after(self):
+        stages = [*join_stages("inner"), *PAGE]
+
+        assert optimize_pipeline(stages) == [PAGE[0], *join_stages("inner"), *PAGE[1:]]
+
+    def test_non_unique_left_join_keeps_paging_after(self):
+        stages = [lookup(foreign_field="user_id"), unwind(), *PAGE]
+
+        assert optimize_pipeline(stages) == [PAGE[0], lookup(foreign_field="user_id"), unwind(), *PAGE[1:]]
+
+    def test_sort_on_joined_field_stays(self):
+        stages = [*join_stages("left"), {"$sort": {"user.name": 1}}, {"$limit": 5}]
+
+        assert optimize_pipeline(stages) == stages
+
+    def test_unknown_stages_are_barriers(self):
+        stages = [lookup(), {"$group": {"_id": "$state"}}, {"$limit": 5}]
+
+        assert optimize_pipeline(stages) == stages
+
+
+class TestMergingAndPruning:
+    """Test stage merging and projection pruning."""
+
+    def test_adjacent_matches(self):
+        stages = [{"$match": {"a": 1}}, {"$match": {"b": 2}}, {"$match": {"a": {"$gt": 0}}}]
+
+        assert optimize_pipeline(stages) == [{"$match": {"$and": [{"a": 1, "b": 2}, {"a": {"$gt": 0}}]}}]
+
+    def test_adjacent_projections(self):
+        stages = [{"$project": {"a": 1, "b.c": 1, "d": 1}}, {"$project": {"a": 1, "b": 1, "_id": 0}}]
+
+        assert optimize_pipeline(stages) == [{"$project": {"a": 1, "b.c": 1, "_id": 0}}]
+
+    def test_projection_pruned_to_consumed_fields(self):
+        stages = [
+            {"$project": {"state": 1, "date": 1, "note": 1, "user_id": 1}},
+            lookup(),
+            {"$sort": {"date": 1}},
+            {"$project": {"state": 1, "user": 1}},
+        ]
+
+        assert optimize_pipeline(stages)[0] == {"$project": {"state": 1, "date": 1, "user_id": 1}}
+
+    def test_unused_join_removed(self):
+        stages = [*join_stages("left"), {"$project": {"state": 1}}]
+
+        assert optimize_pipeline(stages) == [{"$project": {"state": 1}}]
+
+    def test_unused_inner_join_kept(self):
+        stages = [*join_stages("inner"), {"$project": {"state": 1}}]
+
+        assert optimize_pipeline(stages) == stages
+
+    def test_input_not_modified(self):
+        stages = [{"$match": {"a": 1}}, {"$match": {"b": 2}}]
+
+        optimize_pipeline(stages)
+
+        assert stages == [{"$match": {"a": 1}}, {"$match": {"b": 2}}]
+
+
+class TestMongoQueryPipeline:
+    """Test pipelines built by MongoQuery."""
+
+    def test_paginated_join_looks_up_page_only(self):
+        query = MongoQuery(collection=None, model_type=Order, filter={"state": "open"})  # type: ignore[arg-type]
+        query.join("user", {"user_id": "_id"}, "left")
+        query.order_by("-date").offset(20).limit(10).select("id", "date")
+
+        pipeline = query._build_pipeline()
+
+        assert pipeline == [
+            {"$match": {"state": "open"}},
+            *PAGE,
+            *join_stages("left"),
+            {"$project": {"_id": 1, "date": 1, "user": 1}},
+        ]
+
+    def test_sort_sees_unselected_fields(self):
+        query = MongoQuery(collection=None, model_type=Order)  # type: ignore[arg-type]
+        query.order_by("date").select("id")
+
+        assert query._build_pipeline() == [{"$sort": {"date": 1}}, {"$project": {"_id": 1}}]
+
+    def test_queries_do_not_share_defaults(self):
+        MongoQuery(collection=None, model_type=Order).order_by("date")  # type: ignore[arg-type]
+
+        assert MongoQuery(collection=None, model_type=Order)._build_pipeline() == []  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "stages",
+    [
+        [lookup(), unwind(), {"$sort": {"date": -1}}, {"$skip": 3}, {"$limit": 4}],
+        [lookup(foreign_field="user_id"), unwind(), {"$sort": {"date": 1}}, {"$limit": 4}],
+        [lookup(), unwind(preserve=False), {"$sort": {"date": 1}}, {"$limit": 2}],
+        [{"$match": {"state": "open"}}, {"$match": {"date": {"$gte": 2}}}, lookup(), {"$project": {"date": 1}}],
+    ],
+)
+def test_results_unchanged(stages):
+    db = mongomock.MongoClient().db
+    db.user.insert_many([{"_id": i, "user_id": i % 2, "name": f"user {i}"} for i in range(3)])
+    db.order.insert_many(
+        [{"_id": i, "date": i, "state": "open" if i % 3 else "done", "user_id": i % 4} for i in range(10)]
+    )
+
+    assert list(db.order.aggregate(optimize_pipeline(stages))) == list(db.order.aggregate(stages))
@@ -0,0 +1,241 @@
+"""Unit tests for grouped reads."""
+
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from bson.decimal128 import Decimal128
+
+from earnorm.base.database.adapters.mongo import MongoAdapter
+from earnorm.base.model.base import BaseModel
+from earnorm.base.model.read_group import GroupSpec, _key_domain, combine
+from earnorm.fields.primitive import DateTimeField, DecimalField, IntegerField, StringField
+
+
+class GroupOrder(BaseModel):
+    """Order model."""
+
+    _name = "test_group_order"
+
+    state = StringField()
+    partner = StringField()
+    amount = DecimalField(decimal_places=2)
+    qty = IntegerField()
+    create_date = DateTimeField()
+    sent_date = DateTimeField(storage="iso")
+
+
+@pytest.fixture
+def adapter(mock_mongo_database, monkeypatch):
+    adapter = MongoAdapter()
+    adapter._sync_db = mock_mongo_database
+    monkeypatch.setattr(GroupOrder, "_env", SimpleNamespace(adapter=adapter), raising=False)
+    return adapter
+
+
+@pytest.fixture
+async def orders(adapter, mock_mongo_database):
+    rows = [
+        ("done", "acme", "10.50", 1),
+        ("done", "acme", "4.50", 2),
+        ("done", "globex", "20.00", 3),
+        ("draft", "acme", "1.25", None),
+        (None, "globex", "3.00", 5),
+    ]
+    await mock_mongo_database.test_group_order.insert_many(
+        [
+            {"state": state, "partner": partner, "amount": Decimal128(amount), "qty": qty}
+            for state, partner, amount, qty in rows
+        ]
+    )
+
+
+def spy_pipeline(monkeypatch):
+    """Capture pipelines instead of running them."""
+    pipelines = []
+
+    class Cursor:
+        async def to_list(self, length=None):
+            return []
+
+    def aggregate(self, pipeline):
+        pipelines.append(pipeline)
+        return Cursor()
+
+    monkeypatch.setattr(type(GroupOrder._env.adapter._sync_db.test_group_order), "aggregate", aggregate)
+    return pipelines
+
+
+class TestPipeline:
+    """Test compiled aggregation pipelines."""
+
+    async def test_single_pipeline_with_date_buckets(self, adapter, monkeypatch):
+        pipelines = spy_pipeline(monkeypatch)
+
+        await GroupOrder.read_group(
+            [("state", "!=", "cancel")],
+            groupby=["state", "create_date:week", "sent_date:year"],
+            aggregates=["amount:sum", "id:count", "qty:count", "partner:count_distinct"],
+            orderby="amount:sum desc, state",
+            limit=5,
+            lazy=False,
+        )
+
+        assert pipelines == [
+            [
+                {"$match": {"state": {"$ne": "cancel"}}},
+                {
+                    "$group": {
+                        "_id": {
+                            "state": {"$ifNull": ["$state", None]},
+                            "create_date:week": {
+                                "$dateTrunc": {"date": "$create_date", "unit": "week", "startOfWeek": "monday"}
+                            },
+                            "sent_date:year": {
+                                "$dateTrunc": {"date": {"$dateFromString": {"dateString": "$sent_date"}}, "unit": "year"}
+                            },
+                        },
+                        "amount:sum": {"$sum": "$amount"},
+                        "id:count": {"$sum": 1},
+                        "qty:count": {"$sum": {"$cond": [{"$gt": ["$qty", None]}, 1, 0]}},
+                        "partner:count_distinct": {"$addToSet": "$partner"},
+                        "__count": {"$sum": 1},
+                    }
+                },
+                {"$addFields": {"partner:count_distinct": {"$size": "$partner:count_distinct"}}},
+                {
+                    "$sort": {
+                        "amount:sum": -1,
+                        "_id.state": 1,
+                        "_id.create_date:week": 1,
+                        "_id.sent_date:year": 1,
+                    }
+                },
+                {"$limit": 5},
+            ]
+        ]
+
+    async def test_date_fields_default_to_month(self, adapter, monkeypatch):
+        pipelines = spy_pipeline(monkeypatch)
+
+        await GroupOrder.read_group([], groupby=["create_date"])
+
+        assert pipelines[0][0]["$group"]["_id"] == {
+            "create_date": {"$dateTrunc": {"date": "$create_date", "unit": "month"}}
+        }
+
+    @pytest.mark.parametrize(
+        ("groupby", "aggregates", "orderby"),
+        [
+            (["missing"], [], None),
+            (["state:month"], [], None),
+            (["create_date:decade"], [], None),
+            (["state"], ["amount"], None),
+            (["state"], ["amount:median"], None),
+            (["state"], [], "amount:sum"),
+            (["state"], [], "state up"),
+            ([], [], None),
+        ],
+    )
+    async def test_invalid_specs(self, adapter, groupby, aggregates, orderby):
+        with pytest.raises(ValueError):
+            await GroupOrder.read_group([], groupby=groupby, aggregates=aggregates, orderby=orderby)
+
+
+class TestExecution:
+    """Test groups read from the database."""
+
+    async def test_groups_with_aggregates(self, orders):
+        groups = await GroupOrder.read_group(
+            [],
+            groupby=["state"],
+            aggregates=["amount:sum", "qty:count", "qty:max", "partner:count_distinct"],
+        )
+
+        assert [(group["state"], group.count) for group in groups] == [(None, 1), ("done", 3), ("draft", 1)]
+        done = groups[1]
+        assert done.values == {
+            "state": "done",
+            "amount:sum": Decimal("35.00"),
+            "qty:count": 3,
+            "qty:max": 3,
+            "partner:count_distinct": 2,
+        }
+        assert groups[2]["qty:count"] == 0
+
+    async def test_order_and_limit(self, orders):
+        groups = await GroupOrder.read_group(
+            [],
+            groupby=["partner"],
+            aggregates=["amount:sum", "qty:sum"],
+            orderby="qty:sum desc",
+            limit=1,
+        )
+        by_count = await GroupOrder.read_group([], groupby=["partner"], orderby="__count desc", offset=1)
+
+        assert [(group["partner"], group["amount:sum"]) for group in groups] == [("globex", Decimal("23.00"))]
+        assert [group["partner"] for group in by_count] == ["globex"]
+
+    async def test_lazy_expand_and_records(self, orders):
+        groups = await GroupOrder.read_group(
+            [("qty", ">", 1), "|", ("state", "=", "draft")],
+            groupby=["state", "partner"],
+            aggregates=["id:count"],
+        )
+        done = next(group for group in groups if group["state"] == "done")
+
+        assert done.groupby == ["partner"]
+        assert "partner" not in done.values
+        assert done.domain == [
+            ("qty", ">", 1),
+            "&",
+            ("state", "=", "done"),
+            "|",
+            ("state", "=", "draft"),
+            "&",
+            ("state", "=", "done"),
+        ]
+
+        partners = await done.expand()
+        assert [(group["partner"], group.count) for group in partners] == [("acme", 1), ("globex", 1)]
+        assert partners[0].groupby == []
+        assert await partners[0].expand() == []
+
+        records = await partners[1].records()
+        assert len(records) == 1
+
+
+    async def test_null_group_matches_missing_and_explicit_null(self, orders, mock_mongo_database):
+        await mock_mongo_database.test_group_order.insert_one({"partner": "initech", "qty": 7})
+
+        [empty, *_] = await GroupOrder.read_group([], groupby=["state", "partner"])
+        partners = await empty.expand()
+
+        assert (empty["state"], empty.count) == (None, 2)
+        assert empty.domain == [("state", "=", None)]
+        assert len(await empty.records()) == 2
+        assert sum(group.count for group in partners) == 2
+
+
+class TestCombine:
+    """Test domain combination."""
+
+    def test_adds_conditions_to_each_branch(self):
+        assert combine([], [("a", "=", 1)]) == [("a", "=", 1)]
+        assert combine([("a", "=", 1), "&", ("b", "=", 2)], [("c", "=", 3)]) == [
+            ("a", "=", 1),
+            "&",
+            ("b", "=", 2),
+            "&",
+            ("c", "=", 3),
+        ]
+
+    def test_date_bucket_domain(self):
+        spec = GroupSpec("create_date:quarter", "create_date", "quarter")
+
+        assert _key_domain(spec, datetime(2024, 10, 1)) == [
+            ("create_date", ">=", datetime(2024, 10, 1)),
+            "&",
+            ("create_date", "<", datetime(2025, 1, 1)),
+        ]
@@ -0,0 +1,103 @@
+"""Tests for read preference and read concern routing."""
+
+import pytest
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.read_preferences import ReadPreference
+
+from earnorm.base.database.adapters.mongo import MongoAdapter
+from earnorm.base.database.read_options import (
+    ReadOptions,
+    current_read_options,
+    use_read_options,
+)
+from earnorm.base.model.context import ModelContext
+
+
+class Report:
+    """Model-like class with read options."""
+
+    _name = "sale_report"
+    _table = None
+    _read_preference = "secondaryPreferred"
+    _read_concern = None
+
+
+class Order:
+    """Model-like class without read options."""
+
+    _name = "sale_order"
+    _table = None
+
+    @classmethod
+    async def search(cls) -> ReadOptions:
+        return current_read_options()
+
+
+@pytest.fixture
+def adapter():
+    """Adapter over a lazily connecting client."""
+    adapter = MongoAdapter()
+    client = AsyncIOMotorClient("mongodb://localhost:27017", connect=False)
+    adapter._sync_db = client["earnorm_test"]
+    yield adapter
+    client.close()
+
+
+class TestReadOptions:
+    """Test option normalization and scoping."""
+
+    def test_normalizes_names(self):
+        options = ReadOptions(preference="secondary_preferred", concern="MAJORITY")
+        assert options.preference == "secondaryPreferred"
+        assert options.concern == "majority"
+
+    def test_rejects_unknown_names(self):
+        with pytest.raises(ValueError):
+            ReadOptions(preference="replica")
+        with pytest.raises(ValueError):
+            ReadOptions(concern="eventual")
+
+    def test_nested_scopes_merge(self):
+        with use_read_options(ReadOptions(preference="secondary")):
+            with use_read_options(ReadOptions(concern="majority")) as effective:
+                assert effective == ReadOptions(preference="secondary", concern="majority")
+        assert not current_read_options()
+
+
+class TestAdapterReadCollections:
+    """Test collection handle selection."""
+
+    def test_default_uses_plain_collection(self, adapter):
+        collection = adapter._get_read_collection(Order)
+        assert collection.read_preference == ReadPreference.PRIMARY
+
+    def test_model_preference(self, adapter):
+        collection = adapter._get_read_collection(Report)
+        assert collection.read_preference == ReadPreference.SECONDARY_PREFERRED
+        assert adapter._get_read_collection(Report) is collection
+
+    def test_call_options_override_model(self, adapter):
+        with use_read_options(ReadOptions(preference="nearest", concern="majority")):
+            collection = adapter._get_read_collection(Report)
+
+        assert collection.read_preference == ReadPreference.NEAREST
+        assert collection.read_concern.level == "majority"
+        assert len(adapter._read_collections) == 1
+
+
+class TestModelContext:
+    """Test with_context proxy."""
+
+    @pytest.mark.asyncio
+    async def test_applies_options_while_awaiting(self):
+        proxy = ModelContext(Order, ReadOptions(preference="secondary"))
+
+        assert (await proxy.search()).preference == "secondary"
+        assert proxy._name == "sale_order"
+        assert not current_read_options()
+
+    @pytest.mark.asyncio
+    async def test_chained_context(self):
+        proxy = ModelContext(Order, ReadOptions(preference="secondary")).with_context(read_concern="local")
+
+        assert await proxy.search() == ReadOptions(preference="secondary", concern="local")
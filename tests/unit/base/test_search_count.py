@@ -0,0 +1,146 @@
+"""Unit tests for search_count modes and the count cache."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from earnorm.base.database.adapters.mongo import MongoAdapter
+from earnorm.base.database.count_cache import CountCache, normalize_domain
+from earnorm.base.database.query.backends.mongo.query import MongoQuery
+from earnorm.base.model.base import BaseModel
+from earnorm.fields.primitive import IntegerField, StringField
+
+
+class CountedTask(BaseModel):
+    """Task model."""
+
+    _name = "test_counted_task"
+
+    state = StringField()
+    priority = IntegerField()
+
+
+class TabledTask(BaseModel):
+    """Task model with a table name."""
+
+    _name = "test_tabled_task"
+    _table = "test_tabled_tasks"
+
+    state = StringField()
+
+
+class Clock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def adapter(mock_mongo_database, monkeypatch, clock):
+    adapter = MongoAdapter()
+    adapter._sync_db = mock_mongo_database
+    adapter.count_cache = CountCache(ttl=5.0, clock=clock)
+    env = SimpleNamespace(adapter=adapter)
+
+    async def get_env(cls):
+        return env
+
+    for model in (CountedTask, TabledTask):
+        monkeypatch.setattr(model, "_env", env, raising=False)
+        monkeypatch.setattr(model, "_get_env", classmethod(get_env))
+    return adapter
+
+
+@pytest.fixture
+async def tasks(adapter, mock_mongo_database):
+    await mock_mongo_database.test_counted_task.insert_many(
+        [{"state": "open" if i % 2 else "done", "priority": i} for i in range(6)]
+    )
+
+
+class TestModes:
+    """Test count modes."""
+
+    async def test_exact(self, tasks):
+        assert await CountedTask.search_count() == 6
+        assert await CountedTask.search_count([("state", "=", "open")]) == 3
+
+    async def test_capped_stops_after_cap(self, tasks):
+        assert await CountedTask.search_count(mode="capped", cap=2) == 3
+        assert await CountedTask.search_count([("state", "=", "open")], mode="capped", cap=10) == 3
+
+    async def test_estimated_uses_metadata_without_domain(self, tasks, monkeypatch):
+        calls = []
+
+        async def estimated_count(self):
+            calls.append(self._filter)
+            return 1000
+
+        monkeypatch.setattr(MongoQuery, "estimated_count", estimated_count)
+
+        assert await CountedTask.search_count(mode="estimated") == 1000
+        assert await CountedTask.search_count([("priority", ">", 3)], mode="estimated") == 2
+        assert calls == [{}]
+
+    async def test_invalid_arguments(self, adapter):
+        with pytest.raises(ValueError):
+            await CountedTask.search_count(mode="approximate")  # type: ignore[arg-type]
+        with pytest.raises(ValueError):
+            await CountedTask.search_count(mode="capped", cap=-1)
+
+
+class TestCache:
+    """Test exact count caching."""
+
+    async def test_exact_counts_reused_until_expiry(self, tasks, adapter, mock_mongo_database, clock):
+        assert await CountedTask.search_count([("state", "=", "open")]) == 3
+        await mock_mongo_database.test_counted_task.insert_one({"state": "open"})
+
+        assert await CountedTask.search_count([["state", "=", "open"]]) == 3
+        assert await CountedTask.search_count([("state", "=", "open")], mode="capped") == 4
+
+        clock.now = 5.0
+        assert await CountedTask.search_count([("state", "=", "open")]) == 4
+
+    async def test_adapter_writes_invalidate(self, tasks, adapter):
+        assert await CountedTask.search_count() == 6
+
+        await CountedTask.create({"state": "open"})
+        assert await CountedTask.search_count() == 7
+
+        await adapter.delete(CountedTask, {"state": "done"})
+        assert await CountedTask.search_count() == 4
+        assert len(adapter.count_cache) == 1
+
+    async def test_writes_invalidate_model_with_table(self, adapter):
+        await TabledTask.search_count()
+        assert len(adapter.count_cache) == 1
+
+        await TabledTask.create({"state": "open"})
+        assert len(adapter.count_cache) == 0
+
+    def test_normalized_keys(self):
+        assert normalize_domain([("id", "in", ["b", "a"])]) == normalize_domain([["id", "in", ("a", "b")]])
+        assert normalize_domain([("a", "=", 1)]) != normalize_domain([("a", "=", 2)])
+
+    def test_bounded_size_and_disabled_ttl(self):
+        cache = CountCache(max_entries=2)
+        for value in range(3):
+            cache.set("task", [("a", "=", value)], value)
+
+        assert len(cache) == 2
+        assert cache.get("task", [("a", "=", 0)]) is None
+        assert cache.get("task", [("a", "=", 2)]) == 2
+
+        disabled = CountCache(ttl=0)
+        disabled.set("task", None, 1)
+        assert disabled.get("task", None) is None
@@ -0,0 +1,217 @@
+"""Unit tests for time-series collections."""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, ClassVar
+
+import pytest
+
+from earnorm.base.database.adapters.mongo import MongoAdapter
+from earnorm.base.database.query.backends.mongo.query import MongoQuery
+from earnorm.base.database.timeseries import TimeseriesSpec, bucket_filter, model_timeseries_spec, timeseries_spec
+from earnorm.base.model.base import BaseModel
+from earnorm.exceptions import DatabaseError
+from earnorm.fields.primitive import DateTimeField, FloatField, StringField
+
+D1 = datetime(2024, 3, 1)
+D2 = datetime(2024, 3, 2)
+D3 = datetime(2024, 3, 3)
+
+
+class SensorReading(BaseModel):
+    """Time-series model."""
+
+    _name = "test_sensor_reading"
+    _timeseries: ClassVar[dict[str, Any] | None] = {"timeField": "at", "metaField": "sensor", "granularity": "minutes"}
+    _expire_after = timedelta(days=30)
+
+    at = DateTimeField(required=True)
+    sensor = StringField()
+    value = FloatField()
+
+
+class Cursor:
+    """Command cursor over fixed results."""
+
+    def __init__(self, items):
+        self._items = items
+
+    async def to_list(self, length=None):
+        return list(self._items)
+
+
+class CatalogDatabase:
+    """Database recording collection catalog commands, which mongomock lacks."""
+
+    def __init__(self, database, infos=()):
+        self._database = database
+        self.infos = list(infos)
+        self.calls = []
+
+    def __getattr__(self, name):
+        return getattr(self._database, name)
+
+    def __getitem__(self, name):
+        return self._database[name]
+
+    async def list_collections(self, filter=None):
+        return Cursor(info for info in self.infos if info["name"] == filter["name"])
+
+    async def create_collection(self, name, **options):
+        self.calls.append(("create", name, options))
+
+    async def command(self, command):
+        self.calls.append(("command", command))
+
+
+def catalog(mock_mongo_database, *infos):
+    adapter = MongoAdapter()
+    adapter._sync_db = CatalogDatabase(mock_mongo_database, infos)
+    return adapter, adapter._sync_db
+
+
+def reading_info(**options):
+    timeseries = {"timeField": "at", "metaField": "sensor", "granularity": "minutes"}
+    return {
+        "name": "test_sensor_reading",
+        "type": "timeseries",
+        "options": {"timeseries": {**timeseries, **options.pop("timeseries", {})}, **options},
+    }
+
+
+class TestDeclaration:
+    """Test model declarations."""
+
+    def test_spec(self):
+        spec = timeseries_spec(SensorReading)
+
+        assert spec == TimeseriesSpec("at", "sensor", "minutes", expire_after=2592000)
+        assert spec.create_options() == {
+            "timeseries": {"timeField": "at", "metaField": "sensor", "granularity": "minutes"},
+            "expireAfterSeconds": 2592000,
+        }
+        assert timeseries_spec(SimpleNamespace(_name="plain")) is None
+
+    def test_spec_cached_per_model(self):
+        class SubReading(SensorReading):
+            _name = "test_sub_reading"
+            _timeseries: ClassVar[dict[str, Any] | None] = {"timeField": "at", "granularity": "hours"}
+
+            at = DateTimeField(required=True)
+
+        spec = model_timeseries_spec(SensorReading)
+
+        assert spec == timeseries_spec(SensorReading)
+        assert model_timeseries_spec(SensorReading) is spec
+        assert model_timeseries_spec(SubReading) == TimeseriesSpec("at", None, "hours", expire_after=2592000)
+
+    @pytest.mark.parametrize(
+        ("options", "expire_after"),
+        [
+            ({"metaField": "sensor"}, None),
+            ({"timeField": "value"}, None),
+            ({"timeField": "at", "metaField": "missing"}, None),
+            ({"timeField": "at", "granularity": "days"}, None),
+            ({"timeField": "at", "bucketMaxSpanSeconds": 60}, None),
+            ({"timeField": "at", "granularity": "hours", "bucketMaxSpanSeconds": 9, "bucketRoundingSeconds": 9}, None),
+            ({"timeField": "at", "expireAfter": 5}, None),
+            ({"timeField": "at"}, -1),
+            (None, 60),
+        ],
+    )
+    def test_invalid(self, options, expire_after):
+        model = SimpleNamespace(
+            _name="bad", _timeseries=options, _expire_after=expire_after, __fields__=SensorReading.__fields__
+        )
+
+        with pytest.raises(ValueError):
+            timeseries_spec(model)
+
+
+class TestSync:
+    """Test collection creation on schema sync."""
+
+    async def test_creates_collection(self, mock_mongo_database):
+        adapter, database = catalog(mock_mongo_database)
+
+        assert await adapter.sync_schema(SensorReading) == []
+        assert database.calls == [("create", "test_sensor_reading", timeseries_spec(SensorReading).create_options())]
+
+    async def test_updates_mutable_options(self, mock_mongo_database):
+        info = reading_info(timeseries={"granularity": "seconds"}, expireAfterSeconds=60)
+        adapter, database = catalog(mock_mongo_database, info)
+
+        await adapter.sync_schema(SensorReading)
+
+        assert database.calls == [
+            (
+                "command",
+                {
+                    "collMod": "test_sensor_reading",
+                    "expireAfterSeconds": 2592000,
+                    "timeseries": {"granularity": "minutes"},
+                },
+            )
+        ]
+
+    async def test_up_to_date_collection_untouched(self, mock_mongo_database):
+        adapter, database = catalog(mock_mongo_database, reading_info(expireAfterSeconds=2592000))
+
+        await adapter.sync_schema(SensorReading)
+
+        assert database.calls == []
+
+    @pytest.mark.parametrize(
+        "info",
+        [
+            {"name": "test_sensor_reading", "type": "collection", "options": {}},
+            reading_info(timeseries={"metaField": "device"}),
+        ],
+    )
+    async def test_conflicting_collection(self, mock_mongo_database, info):
+        adapter, _ = catalog(mock_mongo_database, info)
+
+        with pytest.raises(DatabaseError):
+            await adapter.sync_schema(SensorReading)
+
+
+class TestBucketFilter:
+    """Test time bounds added to filters."""
+
+    spec = TimeseriesSpec("at", "sensor")
+
+    def test_plain_ranges_untouched(self):
+        query = {"at": {"$gte": D1, "$lt": D2}, "sensor": "s1"}
+
+        assert bucket_filter(self.spec, query) == query
+        assert bucket_filter(self.spec, {"at": D1}) == {"at": D1}
+        assert bucket_filter(self.spec, {"sensor": {"$in": ["s1"]}}) == {"sensor": {"$in": ["s1"]}}
+
+    def test_in_list_bounded(self):
+        query = {"at": {"$in": [D3, D1]}}
+
+        assert bucket_filter(self.spec, query) == {"at": {"$in": [D3, D1], "$gte": D1, "$lte": D3}}
+
+    def test_or_of_ranges_bounded_by_hull(self):
+        query = {"$or": [{"at": {"$gte": D1, "$lt": D2}}, {"at": {"$gt": D2, "$lte": D3}}]}
+
+        assert bucket_filter(self.spec, query) == {**query, "at": {"$gte": D1, "$lte": D3}}
+
+    def test_unbounded_branch_and_conflicting_operators(self):
+        unbounded = {"$or": [{"at": {"$gte": D1}}, {"sensor": "s1"}]}
+        assert bucket_filter(self.spec, unbounded) == unbounded
+
+        query = {"at": {"$in": [D2, D3], "$gte": D1}}
+        assert bucket_filter(self.spec, query) == {"$and": [query, {"at": {"$gte": D2, "$lte": D3}}]}
+
+    def test_domains_bounded(self):
+        query = MongoQuery(collection=None, model_type=SensorReading)  # type: ignore[arg-type]
+        query.filter(
+            [("at", ">=", "2024-03-01"), "&", ("at", "<", "2024-03-02"), "|", ("at", "in", ["2024-03-03T00:00:00"])]
+        )
+
+        d1, d2, d3 = (value.replace(tzinfo=UTC) for value in (D1, D2, D3))
+        assert query._filter == {
+            "$or": [{"$and": [{"at": {"$gte": d1}}, {"at": {"$lt": d2}}]}, {"at": {"$in": [d3]}}],
+            "at": {"$gte": d1, "$lte": d3},
+        }
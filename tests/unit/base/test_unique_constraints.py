@@ -0,0 +1,243 @@
+"""Unit tests for unique indexes and batched uniqueness pre-checks."""
+
+from types import SimpleNamespace
+
+import pytest
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from earnorm.base.database.adapters.mongo import MongoAdapter
+from earnorm.base.database.query.interfaces.domain import DomainExpression
+from earnorm.base.database.unique import duplicate_key_error, non_null_filter, unique_fields, unique_indexes
+from earnorm.base.model.base import BaseModel
+from earnorm.exceptions import FieldValidationError
+from earnorm.fields.composite.list import ListField
+from earnorm.fields.primitive import IntegerField, StringField
+from earnorm.validators.models.unique import UniqueValidator
+
+
+class UniquePartner(BaseModel):
+    """Model with unique fields."""
+
+    _name = "test_unique_partner"
+
+    email = StringField(unique=True, case_sensitive=False)
+    ref = StringField(unique=True, required=True)
+    tags = ListField(StringField(), unique=True)
+    age = IntegerField()
+
+
+class PartialIndexCollection:
+    """Collection enforcing partial unique indexes itself, mongomock ignores their filter."""
+
+    def __init__(self, collection, partial):
+        self._collection = collection
+        self._partial = partial
+
+    def __getattr__(self, name):
+        return getattr(self._collection, name)
+
+    async def create_indexes(self, indexes):
+        for index in indexes:
+            if "partialFilterExpression" in index.document:
+                self._partial.setdefault(index.document["name"], index.document)
+            else:
+                await self._collection.create_indexes([index])
+        return [index.document["name"] for index in indexes]
+
+    async def index_information(self):
+        return {**await self._collection.index_information(), **self._partial}
+
+    async def drop_index(self, name):
+        if self._partial.pop(name, None) is None:
+            await self._collection.drop_index(name)
+
+    async def insert_one(self, document):
+        for name, index in self._partial.items():
+            [field] = index["key"]
+            value = document.get(field)
+            # Partial filters of unique fields only select non-null values
+            if value is not None and await self._collection.find_one({field: value}):
+                raise DuplicateKeyError(
+                    f"E11000 duplicate key error index: {name} dup key",
+                    11000,
+                    {"keyPattern": {field: 1}, "keyValue": {field: value}},
+                )
+        return await self._collection.insert_one(document)
+
+
+@pytest.fixture
+def adapter(mock_mongo_database, monkeypatch):
+    partial = {}
+
+    class Database:
+        def __getitem__(self, name):
+            return PartialIndexCollection(mock_mongo_database[name], partial)
+
+    adapter = MongoAdapter()
+    adapter._sync_db = Database()
+    monkeypatch.setattr(UniquePartner, "_env", SimpleNamespace(adapter=adapter), raising=False)
+    return adapter
+
+
+class TestUniqueIndexes:
+    """Test index definitions and schema sync."""
+
+    def test_unique_fields(self):
+        assert list(unique_fields(UniquePartner)) == ["email", "ref"]
+
+    def test_index_definitions(self):
+        indexes = {index.document["name"]: index.document for index in unique_indexes(UniquePartner)}
+
+        assert indexes["email_unique"]["unique"] is True
+        assert indexes["email_unique"]["partialFilterExpression"] == non_null_filter("email")
+        assert "sparse" not in indexes["email_unique"]
+        assert indexes["email_unique"]["collation"] == {"locale": "en", "strength": 2}
+        assert "partialFilterExpression" not in indexes["ref_unique"]
+        assert "collation" not in indexes["ref_unique"]
+
+    async def test_sync_schema_creates_indexes(self, adapter):
+        names = await adapter.sync_schema(UniquePartner)
+
+        assert sorted(names) == ["email_unique", "ref_unique"]
+        info = await adapter._get_collection(UniquePartner).index_information()
+        assert {"email_unique", "ref_unique"} <= set(info)
+
+
+class TestNullValues:
+    """Test optional unique fields accept any number of records without a value."""
+
+    async def test_nulls_do_not_conflict(self, adapter):
+        await adapter.sync_schema(UniquePartner)
+
+        await adapter.create(UniquePartner, {"ref": "R1", "email": None})
+        await adapter.create(UniquePartner, {"ref": "R2", "email": None})
+        await adapter.create(UniquePartner, {"ref": "R3"})
+        await adapter.create(UniquePartner, {"ref": "R4", "email": "a@example.com"})
+
+        with pytest.raises(FieldValidationError) as exc_info:
+            await adapter.create(UniquePartner, {"ref": "R5", "email": "a@example.com"})
+        assert exc_info.value.error.field_name == "email"
+
+    async def test_sparse_index_is_recreated(self, adapter):
+        collection = adapter._get_collection(UniquePartner)
+        sparse = IndexModel([("email", ASCENDING)], name="email_unique", unique=True, sparse=True)
+        await collection.create_indexes([sparse])
+
+        await adapter.sync_schema(UniquePartner)
+
+        info = await collection.index_information()
+        assert "sparse" not in info["email_unique"]
+        assert info["email_unique"]["partialFilterExpression"] == non_null_filter("email")
+
+
+class TestDuplicateKeyMapping:
+    """Test duplicate-key errors surface as FieldValidationError."""
+
+    def test_maps_key_pattern(self):
+        error = DuplicateKeyError(
+            "E11000 duplicate key error collection: db.partners index: ref_unique dup key",
+            11000,
+            {"keyPattern": {"ref": 1}, "keyValue": {"ref": "R1"}},
+        )
+
+        mapped = duplicate_key_error(UniquePartner, error)
+
+        assert mapped.error.field_name == "ref"
+        assert mapped.error.code == "unique"
+        assert "R1" in str(mapped)
+
+    def test_maps_index_name_of_bulk_error(self):
+        error = BulkWriteError(
+            {"writeErrors": [{"index": 1, "code": 11000, "errmsg": "E11000 index: email_unique dup key"}]}
+        )
+
+        assert duplicate_key_error(UniquePartner, error).error.field_name == "email"
+
+    async def test_create_raises_field_validation_error(self, adapter):
+        await adapter.sync_schema(UniquePartner)
+        await adapter.create(UniquePartner, {"ref": "R1"})
+
+        with pytest.raises(FieldValidationError) as exc_info:
+            await adapter.create(UniquePartner, {"ref": "R1"})
+        assert exc_info.value.error.field_name == "ref"
+
+        with pytest.raises(FieldValidationError):
+            await adapter.create(UniquePartner, [{"ref": "R2"}, {"ref": "R2"}])
+
+    async def test_update_raises_field_validation_error(self, adapter):
+        await adapter.sync_schema(UniquePartner)
+        await adapter.create(UniquePartner, [{"ref": "R1"}, {"ref": "R2"}])
+
+        with pytest.raises(FieldValidationError) as exc_info:
+            await adapter.update(UniquePartner, DomainExpression([("ref", "=", "R2")]), {"ref": "R1"})
+        assert exc_info.value.error.code == "unique"
+
+
+class TestBatchPreCheck:
+    """Test one $in query per unique field."""
+
+    async def test_reports_taken_and_repeated_values(self, adapter, mock_mongo_database):
+        await mock_mongo_database.test_unique_partner.insert_many([{"ref": "R1"}, {"ref": "R2"}])
+        calls = []
+        find_existing = adapter.find_existing
+
+        async def counting(model, field_name, values, exclude_ids=None):
+            calls.append((field_name, sorted(values)))
+            return await find_existing(model, field_name, values, exclude_ids)
+
+        adapter.find_existing = counting
+        rows = [{"ref": "R1"}, {"ref": "R3"}, {"ref": "R3"}, {"ref": "R4"}, {"ref": "R2"}]
+
+        errors = await UniquePartner.validate_batch(rows, check_unique=True)
+
+        assert sorted(errors) == [0, 2, 4]
+        assert all(row_errors["ref"].error.code == "unique" for row_errors in errors.values())
+        assert calls == [("ref", ["R1", "R2", "R3", "R4"])]
+
+    async def test_case_insensitive_repeats(self, adapter):
+        rows = [{"ref": "A", "email": "Bob@example.com"}, {"ref": "B", "email": "bob@EXAMPLE.com"}]
+
+        errors = await UniquePartner.validate_batch(rows, check_unique=True)
+
+        assert list(errors) == [1]
+        assert list(errors[1]) == ["email"]
+
+    async def test_skipped_by_default(self, adapter, mock_mongo_database):
+        await mock_mongo_database.test_unique_partner.insert_one({"ref": "R1"})
+
+        assert await UniquePartner.validate_batch([{"ref": "R1"}]) == {}
+
+
+class FakeCollection:
+    """Collection recording find_one calls."""
+
+    def __init__(self, document=None):
+        self.document = document
+        self.calls = []
+
+    async def find_one(self, query, **kwargs):
+        self.calls.append((query, kwargs))
+        return self.document
+
+
+class TestUniqueValidator:
+    """Test the standalone unique validator."""
+
+    async def test_case_insensitive_uses_collation(self):
+        collection = FakeCollection()
+        validator = UniqueValidator(collection, "email", UniquePartner, case_sensitive=False)
+
+        await validator("a.b+c@example.com")
+
+        query, options = collection.calls[0]
+        assert query == {"email": "a.b+c@example.com"}
+        assert options == {"collation": {"locale": "en", "strength": 2}}
+
+    async def test_validate_many_uses_one_query(self):
+        collection = FakeCollection()
+        validator = UniqueValidator(collection, "email", UniquePartner)
+
+        await validator.validate_many(["a@example.com", "b@example.com"])
+
+        assert collection.calls == [({"email": {"$in": ["a@example.com", "b@example.com"]}}, {})]
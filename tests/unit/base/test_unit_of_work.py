@@ -0,0 +1,278 @@
+"""Unit tests for the environment unit of work."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import BulkWriteError, PyMongoError
+from pymongo.operations import DeleteMany, DeleteOne, InsertOne, UpdateMany, UpdateOne
+
+from earnorm.base.database.adapters.mongo import MongoAdapter
+from earnorm.base.database.transaction import MongoTransactionError, TransactionError, current_unit_of_work
+from earnorm.base.model.base import BaseModel
+from earnorm.exceptions import FieldValidationError
+from earnorm.fields.composite.list import ListField
+from earnorm.fields.primitive import IntegerField, StringField
+
+
+class UowOrder(BaseModel):
+    """Order model."""
+
+    _name = "test_uow_order"
+
+    name = StringField()
+    tags = ListField(StringField())
+
+
+class UowLine(BaseModel):
+    """Order line model."""
+
+    _name = "test_uow_line"
+
+    order_ref = StringField()
+    qty = IntegerField()
+
+
+class UowTabledOrder(BaseModel):
+    """Order model declaring a table."""
+
+    _name = "test_uow_tabled_order"
+    _table = "uow_tabled_orders"
+
+    name = StringField()
+
+
+class FakeSession:
+    """Session recording transaction calls."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def start_transaction(self, **kwargs):
+        self.client.calls.append("start")
+
+    async def commit_transaction(self):
+        self.client.calls.append("commit")
+        if self.client.commit_errors:
+            raise self.client.commit_errors.pop(0)
+
+    async def abort_transaction(self):
+        self.client.calls.append("abort")
+
+    async def end_session(self):
+        self.client.calls.append("end")
+
+
+class FakeClient:
+    """Client handing out fake sessions."""
+
+    def __init__(self):
+        self.calls = []
+        self.commit_errors = []
+        self.write_errors = []
+
+    async def start_session(self):
+        return FakeSession(self)
+
+
+class FakeCollection:
+    """Collection applying bulk writes through mongomock one operation at a time."""
+
+    def __init__(self, client, collection):
+        self._client = client
+        self._collection = collection
+
+    def __getattr__(self, name):
+        return getattr(self._collection, name)
+
+    async def bulk_write(self, operations, ordered=True, session=None):
+        assert isinstance(session, FakeSession)
+        self._client.calls.append(("bulk_write", self._collection.name, len(operations)))
+        if self._client.write_errors:
+            raise self._client.write_errors.pop(0)
+        for op in operations:
+            if isinstance(op, InsertOne):
+                await self._collection.insert_one(op._doc)
+            elif isinstance(op, UpdateOne):
+                await self._collection.update_one(op._filter, op._doc)
+            elif isinstance(op, UpdateMany):
+                await self._collection.update_many(op._filter, op._doc)
+            elif isinstance(op, DeleteOne):
+                await self._collection.delete_one(op._filter)
+            elif isinstance(op, DeleteMany):
+                await self._collection.delete_many(op._filter)
+        return SimpleNamespace(operations=len(operations))
+
+
+class FakeDatabase:
+    """Database whose collections support sessions."""
+
+    def __init__(self, database):
+        self.client = FakeClient()
+        self._database = database
+
+    def __getattr__(self, name):
+        return getattr(self._database, name)
+
+    def __getitem__(self, name):
+        return FakeCollection(self.client, self._database[name])
+
+
+@pytest.fixture
+def database(mock_mongo_database):
+    return FakeDatabase(mock_mongo_database)
+
+
+@pytest.fixture
+def env(database, monkeypatch):
+    adapter = MongoAdapter()
+    adapter._sync_db = database
+    env = SimpleNamespace(adapter=adapter, transaction=adapter.unit_of_work)
+
+    async def get_env(cls):
+        return env
+
+    for model in (UowOrder, UowLine):
+        monkeypatch.setattr(model, "_env", env, raising=False)
+        monkeypatch.setattr(model, "_get_env", classmethod(get_env))
+    return env
+
+
+def bulk_writes(client):
+    return [call for call in client.calls if isinstance(call, tuple)]
+
+
+class TestRecording:
+    """Test ORM writes are recorded and flushed per collection."""
+
+    async def test_writes_flushed_in_one_transaction(self, env, database, mock_mongo_database):
+        existing = await mock_mongo_database.test_uow_line.insert_one({"order_ref": "old", "qty": 1})
+        old_line = UowLine._browse(env, [str(existing.inserted_id)])
+
+        async with env.transaction() as tx:
+            order = await UowOrder.create({"name": "SO1"})
+            lines = await UowLine.create([{"order_ref": order.id, "qty": qty} for qty in (1, 2, 3)])
+            await order.write({"name": "SO1 confirmed"})
+            await order.append("tags", "paid")
+            await lines.write({"qty": 5})
+            assert await old_line.unlink() == 1
+
+            assert tx.pending == 8
+            assert await mock_mongo_database.test_uow_order.count_documents({}) == 0
+
+        assert bulk_writes(database.client) == [
+            ("bulk_write", "test_uow_order", 3),
+            ("bulk_write", "test_uow_line", 5),
+        ]
+        assert database.client.calls[0] == "start" and database.client.calls[-2:] == ["commit", "end"]
+        assert set(tx.results) == {"test_uow_order", "test_uow_line"}
+
+        stored = await mock_mongo_database.test_uow_order.find_one({"_id": ObjectId(order.id)})
+        assert stored["name"] == "SO1 confirmed"
+        assert stored["tags"] == ["paid"]
+        assert await mock_mongo_database.test_uow_line.distinct("qty") == [5]
+        assert await mock_mongo_database.test_uow_line.count_documents({}) == 3
+
+    async def test_error_discards_writes(self, env, database, mock_mongo_database):
+        with pytest.raises(RuntimeError):
+            async with env.transaction():
+                await UowOrder.create({"name": "SO1"})
+                raise RuntimeError("payment declined")
+
+        assert database.client.calls == []
+        assert await mock_mongo_database.test_uow_order.count_documents({}) == 0
+
+    async def test_rollback_inside_block(self, env, database):
+        async with env.transaction() as tx:
+            await UowOrder.create({"name": "SO1"})
+            tx.rollback()
+
+        assert tx.pending == 0
+        assert database.client.calls == []
+
+    async def test_writes_outside_block_run_immediately(self, env, mock_mongo_database):
+        async with env.transaction():
+            assert current_unit_of_work() is not None
+        assert current_unit_of_work() is None
+
+        await UowOrder.create({"name": "SO1"})
+        assert await mock_mongo_database.test_uow_order.count_documents({}) == 1
+
+    async def test_tasks_record_into_unit(self, env, database):
+        async with env.transaction() as tx:
+            await asyncio.gather(*(UowOrder.create({"name": f"SO{i}"}) for i in range(3)))
+            assert tx.pending == 3
+
+        assert bulk_writes(database.client) == [("bulk_write", "test_uow_order", 3)]
+
+    async def test_units_cannot_nest(self, env):
+        async with env.transaction():
+            with pytest.raises(TransactionError):
+                async with env.transaction():
+                    pass
+
+
+class TestRetries:
+    """Test retry of transient failures."""
+
+    async def test_transient_error_replays_transaction(self, env, database, mock_mongo_database):
+        database.client.write_errors.append(PyMongoError("conflict", error_labels=["TransientTransactionError"]))
+
+        async with env.transaction() as tx:
+            await UowOrder.create({"name": "SO1"})
+
+        assert tx.attempts == 2
+        assert database.client.calls.count("abort") == 1
+        assert await mock_mongo_database.test_uow_order.count_documents({}) == 1
+
+    async def test_unknown_commit_result_retries_commit(self, env, database, mock_mongo_database):
+        database.client.commit_errors.append(
+            PyMongoError("timeout", error_labels=["UnknownTransactionCommitResult"])
+        )
+
+        async with env.transaction() as tx:
+            await UowOrder.create({"name": "SO1"})
+
+        assert tx.attempts == 1
+        assert database.client.calls.count("commit") == 2
+        assert len(bulk_writes(database.client)) == 1
+
+    async def test_gives_up_after_max_retries(self, env, database):
+        database.client.write_errors.extend(
+            PyMongoError("conflict", error_labels=["TransientTransactionError"]) for _ in range(2)
+        )
+
+        with pytest.raises(MongoTransactionError):
+            async with env.adapter.unit_of_work(max_retries=2):
+                await UowOrder.create({"name": "SO1"})
+
+        assert database.client.calls.count("end") == 2
+
+    async def test_duplicate_key_maps_to_field_error(self, env, database):
+        database.client.write_errors.append(
+            BulkWriteError(
+                {
+                    "writeErrors": [
+                        {"index": 0, "code": 11000, "keyPattern": {"name": 1}, "keyValue": {"name": "SO1"}}
+                    ]
+                }
+            )
+        )
+
+        with pytest.raises(FieldValidationError) as exc_info:
+            async with env.transaction():
+                await UowOrder.create({"name": "SO1"})
+
+        assert exc_info.value.error.code == "unique"
+        assert exc_info.value.error.field_name == "name"
+
+
+class TestTransactionManager:
+    """Test model transactions opened by the adapter."""
+
+    async def test_uses_adapter_collection(self, env, database):
+        async with await env.adapter.transaction(UowTabledOrder) as tx:
+            assert tx._collection.name == env.adapter._get_collection(UowTabledOrder).name
+
+        assert database.client.calls == ["start", "commit"]
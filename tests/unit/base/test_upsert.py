@@ -0,0 +1,174 @@
+"""Unit tests for upserts and atomic read-modify-write."""
+
+from types import SimpleNamespace
+
+import pytest
+from bson import ObjectId
+
+from earnorm.base.database.adapters.mongo import MongoAdapter
+from earnorm.base.model.base import BaseModel
+from earnorm.exceptions import DatabaseError, FieldValidationError
+from earnorm.fields.primitive import IntegerField, StringField
+
+
+class Counter(BaseModel):
+    """Counter model."""
+
+    _name = "test_upsert_counter"
+
+    key = StringField(required=True)
+    value = IntegerField(min_value=0)
+    label = StringField()
+
+
+class RecordingCollection:
+    """Collection counting round trips, applying bulk writes one operation at a time."""
+
+    def __init__(self, collection, calls):
+        self._collection = collection
+        self._calls = calls
+
+    @property
+    def name(self):
+        return self._collection.name
+
+    def __getattr__(self, name):
+        self._calls.append(name)
+        return getattr(self._collection, name)
+
+    async def bulk_write(self, operations, ordered=True):
+        self._calls.append("bulk_write")
+        result = {"matched": 0, "modified": 0, "upserted": 0}
+        for op in operations:
+            outcome = await self._collection.update_one(op._filter, op._doc, upsert=op._upsert)
+            result["matched"] += outcome.matched_count
+            result["modified"] += outcome.modified_count
+            result["upserted"] += outcome.upserted_id is not None
+        return SimpleNamespace(
+            matched_count=result["matched"], modified_count=result["modified"], upserted_count=result["upserted"]
+        )
+
+
+class RecordingDatabase:
+    """Database handing out recording collections."""
+
+    def __init__(self, database):
+        self._database = database
+        self.calls = []
+
+    def __getattr__(self, name):
+        return getattr(self._database, name)
+
+    def __getitem__(self, name):
+        return RecordingCollection(self._database[name], self.calls)
+
+
+@pytest.fixture
+def database(mock_mongo_database):
+    return RecordingDatabase(mock_mongo_database)
+
+
+@pytest.fixture
+def adapter(database, monkeypatch):
+    adapter = MongoAdapter()
+    adapter._sync_db = database
+    env = SimpleNamespace(adapter=adapter)
+
+    async def get_env(cls):
+        return env
+
+    monkeypatch.setattr(Counter, "_env", env, raising=False)
+    monkeypatch.setattr(Counter, "_get_env", classmethod(get_env))
+    return adapter
+
+
+async def stored(database):
+    return await database._database["test_upsert_counter"].find({}, {"_id": 0}).sort("key", 1).to_list(None)
+
+
+class TestUpsert:
+    """Test single record upserts."""
+
+    async def test_creates_then_updates(self, adapter, database):
+        domain = [("key", "=", "visits")]
+
+        created = await Counter.upsert(domain, {"value": 1}, on_insert={"label": "Visits"})
+        [first] = await stored(database)
+        updated = await Counter.upsert(domain, {"value": 2}, on_insert={"label": "Ignored"})
+        [second] = await stored(database)
+
+        assert created.id == updated.id
+        assert first["key"] == "visits"
+        assert (second["value"], second["label"]) == (2, "Visits")
+        assert second["created_at"] == first["created_at"]
+        assert second["updated_at"] >= first["updated_at"]
+        assert database.calls.count("find_one_and_update") == 2
+
+    async def test_get_or_create_leaves_match_untouched(self, adapter, database):
+        record, created = await Counter.get_or_create([("key", "=", "a")], {"value": 5})
+        [before] = await stored(database)
+        again, created_again = await Counter.get_or_create([("key", "=", "a")], {"value": 9})
+
+        assert (created, created_again) == (True, False)
+        assert again.id == record.id
+        assert await stored(database) == [before]
+        assert before["value"] == 5
+
+    async def test_filter_on_id_keeps_id(self, adapter):
+        record_id = ObjectId()
+
+        assert await adapter.upsert(Counter, {"_id": record_id}, {"value": 1}) == (str(record_id), True)
+        assert await adapter.upsert(Counter, {"_id": record_id}, {"value": 2}) == (str(record_id), False)
+
+    async def test_invalid(self, adapter, database):
+        with pytest.raises(ValueError):
+            await Counter.upsert([], {"value": 1})
+        with pytest.raises(FieldValidationError):
+            await Counter.upsert([("key", "=", "a")], {"value": -1})
+        assert await stored(database) == []
+
+    async def test_rejected_in_unit_of_work(self, adapter, database):
+        async with adapter.unit_of_work():
+            with pytest.raises(DatabaseError):
+                await Counter.upsert([("key", "=", "a")], {"value": 1})
+
+
+class TestUpsertMany:
+    """Test bulk upserts."""
+
+    async def test_one_bulk_write(self, adapter, database):
+        await Counter.create({"key": "a", "value": 1})
+        database.calls.clear()
+
+        result = await Counter.upsert_many(
+            [{"key": "a", "value": 2}, {"key": "b", "value": 3}], keys=["key"], on_insert={"label": "new"}
+        )
+
+        assert result == {"matched": 1, "modified": 1, "inserted": 1}
+        assert database.calls == ["bulk_write"]
+        rows = await stored(database)
+        assert [(row["key"], row["value"], row.get("label")) for row in rows] == [("a", 2, None), ("b", 3, "new")]
+        assert all(row["created_at"] for row in rows)
+
+    async def test_missing_key(self, adapter):
+        with pytest.raises(ValueError, match="key"):
+            await Counter.upsert_many([{"value": 1}], keys=["key"])
+
+
+class TestFindAndModify:
+    """Test atomic read-modify-write."""
+
+    async def test_increment_returns_old_or_new_values(self, adapter):
+        counter = await Counter.create({"key": "seq", "value": 10})
+
+        before = await counter.find_and_modify(increment={"value": 1}, return_new=False)
+        after = await counter.find_and_modify({"label": "Sequence"}, increment={"value": 1})
+
+        assert (before["id"], before["value"], before.get("label")) == (counter.id, 10, None)
+        assert (after["value"], after["label"]) == (12, "Sequence")
+
+    async def test_missing_record(self, adapter):
+        counter = await Counter.create({"key": "gone", "value": 1})
+        await adapter._sync_db._database["test_upsert_counter"].delete_many({})
+
+        assert await counter.find_and_modify({"value": 2}) is None
@@ -0,0 +1,137 @@
+"""Unit tests for MongoDB window functions."""
+
+from typing import Any, ClassVar
+
+import pytest
+
+from earnorm.base.database.query.backends.mongo.operations.window import MongoWindow
+from earnorm.base.database.query.backends.mongo.query import MongoQuery
+
+
+class Reading:
+    """Queried model."""
+
+    __fields__: ClassVar[dict[str, Any]] = {"id": None, "sensor": None, "at": None, "value": None}
+
+
+def stage(window):
+    [result] = window.get_pipeline_stages()
+    return result["$setWindowFields"]
+
+
+class TestFrame:
+    """Test partitioning and ordering."""
+
+    def test_mixed_sort_directions(self):
+        window = MongoWindow().over(partition_by=["sensor"], order_by=["-value", "at"]).row_number()
+
+        assert stage(window) == {
+            "partitionBy": "$sensor",
+            "sortBy": {"value": -1, "at": 1},
+            "output": {"row_number": {"$documentNumber": {}}},
+        }
+
+    def test_compound_partition_and_whole_partition_totals(self):
+        window = MongoWindow().over(partition_by=["sensor", "kind"]).sum("value", "total").count()
+
+        assert stage(window) == {
+            "partitionBy": {"sensor": "$sensor", "kind": "$kind"},
+            "output": {"total": {"$sum": "$value"}, "count": {"$count": {}}},
+        }
+
+    def test_ordered_functions_require_order(self):
+        with pytest.raises(ValueError, match="requires order_by"):
+            MongoWindow().over(partition_by=["sensor"]).lag("value").get_pipeline_stages()
+        with pytest.raises(ValueError, match="exactly one"):
+            MongoWindow().over(order_by=["sensor", "at"]).rank().get_pipeline_stages()
+        with pytest.raises(ValueError, match="exactly one"):
+            MongoWindow().over(order_by=["sensor", "at"]).moving_avg("value", 7, unit="day").get_pipeline_stages()
+
+
+class TestFunctions:
+    """Test window function outputs."""
+
+    def test_moving_and_cumulative(self):
+        window = (
+            MongoWindow()
+            .over(order_by=["at"])
+            .moving_sum("value", 3)
+            .moving_avg("value", 7, unit="day", alias="weekly")
+            .cumulative_sum("value")
+            .max("value", documents=("unbounded", 2))
+        )
+
+        assert stage(window)["output"] == {
+            "value_moving_sum": {"$sum": "$value", "window": {"documents": [-2, "current"]}},
+            "weekly": {"$avg": "$value", "window": {"range": [-7, "current"], "unit": "day"}},
+            "value_cumulative_sum": {"$sum": "$value", "window": {"documents": ["unbounded", "current"]}},
+            "value_max": {"$max": "$value", "window": {"documents": ["unbounded", 2]}},
+        }
+
+    def test_lag_lead(self):
+        window = MongoWindow().over(order_by=["at"]).lag("value", default=0).lead("value", 2, alias="later")
+
+        assert stage(window)["output"] == {
+            "value_lag": {"$shift": {"output": "$value", "by": -1, "default": 0}},
+            "later": {"$shift": {"output": "$value", "by": 2, "default": None}},
+        }
+
+    def test_derivative_and_exp_moving_avg(self):
+        window = (
+            MongoWindow()
+            .over(order_by=["at"])
+            .derivative("value", unit="hour")
+            .derivative("value", "hourly", unit="hour", range=(-1, 0))
+            .exp_moving_avg("value", n=10)
+            .exp_moving_avg("value", alpha=0.5, alias="smooth")
+        )
+
+        assert stage(window)["output"] == {
+            "value_derivative": {
+                "$derivative": {"input": "$value", "unit": "hour"},
+                "window": {"documents": [-1, "current"]},
+            },
+            "hourly": {
+                "$derivative": {"input": "$value", "unit": "hour"},
+                "window": {"range": [-1, 0], "unit": "hour"},
+            },
+            "value_exp_moving_avg": {"$expMovingAvg": {"input": "$value", "N": 10}},
+            "smooth": {"$expMovingAvg": {"input": "$value", "alpha": 0.5}},
+        }
+
+    @pytest.mark.parametrize(
+        "add",
+        [
+            lambda window: window.sum("value", documents=(-1, 1), range=(-1, 1)),
+            lambda window: window.sum("value", documents=(-1.5, 0)),
+            lambda window: window.sum("value", documents=(2, -2)),
+            lambda window: window.sum("value", documents=("first", "current")),
+            lambda window: window.avg("value", documents=(-1, 0), unit="day"),
+            lambda window: window.moving_avg("value", 0),
+            lambda window: window.moving_avg("value", 2, unit="fortnight"),
+            lambda window: window.exp_moving_avg("value"),
+            lambda window: window.exp_moving_avg("value", alpha=1.5),
+            lambda window: window.row_number().row_number(),
+        ],
+    )
+    def test_invalid(self, add):
+        with pytest.raises(ValueError):
+            add(MongoWindow().over(order_by=["at"]))
+
+
+def test_query_pipeline_computes_windows_before_paging():
+    query = MongoQuery(collection=None, model_type=Reading, filter={"sensor": "s1"})  # type: ignore[arg-type]
+    query.window().over(order_by=["at"]).moving_avg("value", 3)
+    query.order_by("-at").limit(10)
+
+    assert query._build_pipeline() == [
+        {"$match": {"sensor": "s1"}},
+        {
+            "$setWindowFields": {
+                "sortBy": {"at": 1},
+                "output": {"value_moving_avg": {"$avg": "$value", "window": {"documents": [-2, "current"]}}},
+            }
+        },
+        {"$sort": {"at": -1}},
+        {"$limit": 10},
+    ]
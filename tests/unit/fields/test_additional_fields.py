@@ -120,7 +120,7 @@ class TestDecimalField:
         assert isinstance(field, DecimalField)
         assert field.required is False
         # DecimalField has default values for max_digits and decimal_places
-        assert field.max_digits == 65  # Default value
+        assert field.max_digits == 34  # Default value, the Decimal128 limit
         assert field.decimal_places == 30  # Default value
     
     def test_create_decimal_field_with_constraints(self):
@@ -282,9 +282,12 @@ class TestFieldDatabaseOperations:
 
         result = await field.to_db(now, "mongodb")
 
-        # DateTime is serialized to ISO string for MongoDB
-        assert isinstance(result, str)
-        assert "T" in result  # ISO format contains T
+        # DateTime is stored as native BSON date for MongoDB
+        assert isinstance(result, datetime)
+
+        iso = await DateTimeField(storage="iso").to_db(now, "mongodb")
+        assert isinstance(iso, str)
+        assert "T" in iso  # ISO format contains T
     
     @pytest.mark.asyncio
     async def test_datetime_field_from_db(self):
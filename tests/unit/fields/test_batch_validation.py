@@ -0,0 +1,149 @@
+"""Unit tests for column-wise batch validation."""
+
+import re
+
+import pytest
+
+from earnorm.base.model.base import BaseModel
+from earnorm.exceptions import FieldValidationError
+from earnorm.fields.primitive import IntegerField, StringField, string as string_module
+from earnorm.fields.validators.base import RegexValidator, SyncValidator, Validator
+from earnorm.fields.validators.common import MinLengthValidator
+
+
+class CountingValidator(Validator[str]):
+    """Async validator recording the values it checked."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.seen: list[str] = []
+        self.values: list[dict] = []
+
+    async def validate(self, value, context):
+        self.seen.append(value)
+        self.values.append(context.values)
+        if value == "taken":
+            raise FieldValidationError(message="Value is taken", field_name=context.field.name, code="taken")
+
+
+class BatchPartner(BaseModel):
+    """Model validated in batches."""
+
+    _name = "test_batch_partner"
+
+    name = StringField(required=True, max_length=10)
+    code = StringField(pattern=r"^[A-Z]{3}$")
+    age = IntegerField(min_value=0)
+    ref = StringField(readonly=True)
+
+
+class TestValidators:
+    """Test synchronous validator API."""
+
+    def test_builtin_validators_are_sync(self):
+        assert isinstance(MinLengthValidator(2), SyncValidator)
+        assert MinLengthValidator(2).is_sync
+        assert not CountingValidator().is_sync
+
+    async def test_sync_validator_can_be_awaited(self):
+        field = StringField()
+        field.name = "name"
+        validator = MinLengthValidator(3)
+
+        with pytest.raises(FieldValidationError):
+            await validator("ab", field._validation_context({}, "ab"))
+
+    def test_regex_validator_compiles_pattern_once(self, monkeypatch):
+        validator = RegexValidator(r"^\d+$")
+        field = StringField()
+        context = field._validation_context({})
+
+        def fail(*args, **kwargs):
+            raise AssertionError("pattern compiled per value")
+
+        monkeypatch.setattr(re, "compile", fail)
+        monkeypatch.setattr(re, "match", fail)
+        validator.validate_sync("123", context)
+        with pytest.raises(FieldValidationError):
+            validator.validate_sync("12a", context)
+
+
+class TestValidateMany:
+    """Test field-level batch validation."""
+
+    async def test_returns_errors_by_index(self):
+        field = StringField(max_length=3)
+        field.name = "code"
+
+        errors = await field.validate_many(["abc", "abcd", None, 5])
+
+        assert sorted(errors) == [1, 3]
+        assert errors[1].error.code == "field_validation_error"
+        assert errors[3].error.code == "invalid_type"
+
+    async def test_string_pattern_is_precompiled(self, monkeypatch):
+        field = StringField(pattern=r"^[A-Z]{3}$")
+        field.name = "code"
+        monkeypatch.setattr(string_module, "re", None)
+
+        errors = await field.validate_many(["ABC", "abc", "ABCD"])
+
+        assert sorted(errors) == [1, 2]
+
+    async def test_async_validators_skip_failed_rows(self):
+        validator = CountingValidator()
+        field = StringField(max_length=5)
+        field.name = "login"
+        field.validators.append(validator)
+
+        errors = await field.validate_many(["alice", "taken", "too long", "bob"], rows=[{"n": i} for i in range(4)])
+
+        assert sorted(errors) == [1, 2]
+        assert errors[1].error.code == "taken"
+        assert validator.seen == ["alice", "taken", "bob"]
+        assert validator.values == [{"n": 0}, {"n": 1}, {"n": 3}]
+
+    async def test_matches_validate(self):
+        field = IntegerField(min_value=0, max_value=10)
+        field.name = "qty"
+        values = [0, 5, 11, -1, "x", None]
+
+        errors = await field.validate_many(values)
+
+        for index, value in enumerate(values):
+            if index in errors:
+                with pytest.raises((FieldValidationError, ValueError, TypeError)):
+                    await field.validate(value)
+            else:
+                assert await field.validate(value) == value
+
+
+class TestValidateBatch:
+    """Test model-level batch validation."""
+
+    async def test_valid_rows(self):
+        rows = [{"name": f"p{i}", "code": "ABC", "age": i} for i in range(100)]
+
+        assert await BatchPartner.validate_batch(rows) == {}
+
+    async def test_per_row_error_map(self):
+        rows = [
+            {"name": "ok", "code": "ABC", "age": 1},
+            {"name": "much too long", "code": "abc"},
+            {"code": "XYZ", "age": -1},
+            {"name": "ok", "unknown": 1, "ref": "R1"},
+        ]
+
+        errors = await BatchPartner.validate_batch(rows)
+
+        assert sorted(errors) == [1, 2, 3]
+        assert sorted(errors[1]) == ["code", "name"]
+        assert sorted(errors[2]) == ["age", "name"]
+        assert errors[2]["name"].error.code == "required"
+        assert errors[3]["unknown"].error.code == "field_not_found"
+        assert errors[3]["ref"].error.code == "field_readonly"
+
+    async def test_write_does_not_require_fields(self):
+        errors = await BatchPartner.validate_batch([{"age": 3}], operation="write")
+
+        assert errors == {}
@@ -0,0 +1,115 @@
+"""Unit tests for DateTimeField storage modes and string timestamp conversion."""
+
+from datetime import UTC, date, datetime
+from types import SimpleNamespace
+
+import pytest
+
+from earnorm.base.database.migration import convert_datetime_strings
+from earnorm.base.database.query.backends.mongo.query import MongoQuery
+from earnorm.fields.primitive.datetime import DateTimeField
+from earnorm.fields.primitive.string import StringField
+
+MOMENT = datetime(2024, 3, 1, 12, 30, tzinfo=UTC)
+
+
+class TestDateTimeStorage:
+    """Test to_db / from_db in both storage modes."""
+
+    @pytest.mark.asyncio
+    async def test_native_storage_is_default(self):
+        field = DateTimeField()
+
+        assert field.storage == "native"
+        assert await field.to_db(MOMENT, "mongodb") == MOMENT
+
+    @pytest.mark.asyncio
+    async def test_iso_storage(self):
+        field = DateTimeField(storage="iso")
+
+        assert await field.to_db(MOMENT, "mongodb") == MOMENT.isoformat()
+
+    @pytest.mark.asyncio
+    async def test_from_db_reads_both_formats(self):
+        field = DateTimeField()
+        naive_bson = MOMENT.replace(tzinfo=None)
+
+        assert await field.from_db(naive_bson, "mongodb") == MOMENT
+        assert await field.from_db(MOMENT.isoformat(), "mongodb") == MOMENT
+
+    def test_unknown_storage(self):
+        with pytest.raises(ValueError):
+            DateTimeField(storage="epoch")
+
+
+class TestQueryValues:
+    """Test comparison values compiled by the query layer."""
+
+    def test_to_query_value(self):
+        native = DateTimeField()
+        iso = DateTimeField(storage="iso")
+
+        assert native.to_query_value("2024-03-01T12:30:00Z") == MOMENT
+        assert native.to_query_value(date(2024, 3, 1)) == datetime(2024, 3, 1, tzinfo=UTC)
+        assert iso.to_query_value(MOMENT) == MOMENT.isoformat()
+        assert native.to_query_value("not a date") == "not a date"
+
+    def test_mongo_query_coerces_domain_values(self):
+        model = SimpleNamespace(__fields__={"created_at": DateTimeField(), "name": StringField()})
+        query = MongoQuery(collection=None, model_type=model, filter={})  # type: ignore[arg-type]
+
+        query.filter(
+            [
+                "&",
+                "&",
+                ("created_at", ">=", "2024-03-01T12:30:00+00:00"),
+                ("created_at", "in", ["2024-03-01T12:30:00+00:00"]),
+                ("name", "like", "2024%"),
+            ]
+        )
+
+        assert query._filter == {
+            "$and": [
+                {"created_at": {"$gte": MOMENT}},
+                {"created_at": {"$in": [MOMENT]}},
+                {"name": {"$regex": "2024.*"}},
+            ]
+        }
+
+
+class TestConvertDatetimeStrings:
+    """Test online string timestamp converter."""
+
+    @pytest.fixture
+    def model(self, bulk_collection):
+        collection = bulk_collection
+        adapter = SimpleNamespace(
+            _get_collection_name=lambda model: "event",
+            _get_collection=lambda name: collection,
+        )
+        return SimpleNamespace(
+            _name="event",
+            _env=SimpleNamespace(adapter=adapter),
+            __fields__={"created_at": DateTimeField(), "legacy": DateTimeField(storage="iso")},
+            collection=collection,
+        )
+
+    @pytest.mark.asyncio
+    async def test_converts_in_batches(self, model):
+        await model.collection.insert_many(
+            [{"created_at": f"2024-03-{day:02d}T00:00:00+00:00", "legacy": "x"} for day in range(1, 6)]
+            + [{"created_at": "garbage"}, {"created_at": MOMENT}]
+        )
+
+        result = await convert_datetime_strings(model, batch_size=2)
+
+        assert result.to_dict() == {"scanned": 6, "converted": 5, "failed": 1, "batches": 3}
+        remaining = await model.collection.count_documents({"created_at": {"$type": "string"}})
+        assert remaining == 1
+        doc = await model.collection.find_one({"legacy": "x"})
+        assert isinstance(doc["created_at"], datetime)
+
+    @pytest.mark.asyncio
+    async def test_rejects_iso_fields(self, model):
+        with pytest.raises(ValueError):
+            await convert_datetime_strings(model, ["legacy"])
@@ -0,0 +1,138 @@
+"""Unit tests for DecimalField Decimal128 storage and server-side aggregation."""
+
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from bson.decimal128 import Decimal128
+
+from earnorm.base.database.adapters.mongo import MongoAdapter
+from earnorm.base.database.migration import convert_decimal_strings
+from earnorm.base.database.query.backends.mongo.operations.aggregate import MongoAggregate
+from earnorm.exceptions import FieldValidationError
+from earnorm.fields.primitive.decimal import DecimalField
+from earnorm.fields.primitive.string import StringField
+
+
+class TestDecimalStorage:
+    """Test to_db / from_db in both storage modes."""
+
+    @pytest.mark.asyncio
+    async def test_decimal128_storage_is_default(self):
+        field = DecimalField()
+        value = Decimal("12345678901234567890.123456789")
+
+        stored = await field.to_db(value, "mongodb")
+
+        assert field.storage == "decimal128"
+        assert isinstance(stored, Decimal128)
+        assert await field.from_db(stored, "mongodb") == value
+
+    @pytest.mark.asyncio
+    async def test_rounds_to_decimal_places(self):
+        field = DecimalField(max_digits=10, decimal_places=2)
+
+        assert await field.to_db(Decimal("1.005"), "mongodb") == Decimal128("1.00")
+        assert await field.to_db(Decimal("1.5"), "mongodb") == Decimal128("1.5")
+
+    @pytest.mark.asyncio
+    async def test_string_storage(self):
+        field = DecimalField(storage="string")
+
+        assert await field.to_db(Decimal("0.1"), "mongodb") == "0.1"
+        assert await field.from_db("0.1", "mongodb") == Decimal("0.1")
+
+    def test_unknown_storage(self):
+        with pytest.raises(ValueError):
+            DecimalField(storage="float")
+
+    def test_max_digits_fit_decimal128(self):
+        assert DecimalField().max_digits == 34
+        assert DecimalField(storage="string").max_digits == 65
+        assert DecimalField(max_digits=40, storage="string").max_digits == 40
+        with pytest.raises(ValueError, match="34"):
+            DecimalField(max_digits=35)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("value", ["1" * 35, "1E+7000"])
+    async def test_rejects_values_decimal128_cannot_hold(self, value):
+        field = DecimalField(decimal_places=0)
+
+        with pytest.raises(FieldValidationError) as exc_info:
+            await field.to_db(Decimal(value), "mongodb")
+        assert exc_info.value.error.code == "not_representable"
+        assert await field.to_db(Decimal(value), "postgres") == value
+
+    def test_to_query_value(self):
+        field = DecimalField(decimal_places=2)
+
+        assert field.to_query_value("10.50") == Decimal128("10.50")
+        assert field.to_query_value(3) == Decimal128("3")
+        assert field.to_query_value("n/a") == "n/a"
+
+    @pytest.mark.asyncio
+    async def test_adapter_decodes_exactly(self):
+        adapter = MongoAdapter()
+        value = Decimal128("0.1000000000000000055511151231257827")
+
+        result = await adapter.convert_value(value, "decimal")
+
+        assert result == Decimal("0.1000000000000000055511151231257827")
+
+
+class TestServerSideAggregate:
+    """Test $sum of Decimal128 values through MongoAggregate."""
+
+    @pytest.mark.asyncio
+    async def test_sum_decimals(self, mock_mongo_database):
+        collection = mock_mongo_database.orders
+        field = DecimalField(decimal_places=2)
+        amounts = ["0.10", "0.20", "1000000000000.01"]
+        await collection.insert_many(
+            [{"state": "done", "currency": "EUR", "amount": await field.to_db(Decimal(a), "mongodb")} for a in amounts]
+            + [{"state": "draft", "currency": "EUR", "amount": Decimal128("5")}]
+        )
+        model = SimpleNamespace(__fields__={"amount": field, "state": StringField()})
+
+        rows = await (
+            MongoAggregate(collection, model)  # type: ignore[arg-type]
+            .filter([("state", "=", "done")])
+            .group_by("currency")
+            .sum("amount", "revenue")
+            .count()
+            .execute()
+        )
+
+        assert rows == [{"currency": "EUR", "revenue": Decimal("1000000000000.31"), "count": 3}]
+
+    def test_filter_precedes_group(self):
+        model = SimpleNamespace(__fields__={"amount": DecimalField()})
+
+        stages = MongoAggregate(None, model).filter([("amount", ">=", 1)]).sum("amount").get_pipeline_stages()  # type: ignore[arg-type]
+
+        assert stages[0] == {"$match": {"amount": {"$gte": Decimal128("1")}}}
+        assert stages[1] == {"$group": {"_id": None, "sum_amount": {"$sum": "$amount"}}}
+
+
+class TestConvertDecimalStrings:
+    """Test online decimal string converter."""
+
+    @pytest.mark.asyncio
+    async def test_converts_strings(self, bulk_collection):
+        adapter = SimpleNamespace(
+            _get_collection_name=lambda model: "records",
+            _get_collection=lambda name: bulk_collection,
+        )
+        model = SimpleNamespace(
+            _name="order",
+            _env=SimpleNamespace(adapter=adapter),
+            __fields__={"amount": DecimalField(decimal_places=2)},
+        )
+        await bulk_collection.insert_many(
+            [{"amount": "10.555"}, {"amount": "abc"}, {"amount": "1" * 40}, {"amount": Decimal128("1")}]
+        )
+
+        result = await convert_decimal_strings(model)
+
+        assert result.to_dict() == {"scanned": 3, "converted": 1, "failed": 2, "batches": 1}
+        assert await bulk_collection.find_one({"amount": Decimal128("10.56")}) is not None
@@ -0,0 +1,293 @@
+"""Unit tests for streaming FileField storage."""
+
+import hashlib
+import io
+import os
+from pathlib import Path
+
+import pytest
+from bson import ObjectId
+
+from earnorm.exceptions import FieldValidationError
+from earnorm.fields.primitive.file import FileField
+from earnorm.fields.primitive.file_storage import FileTooLargeError, iter_chunks, limit_size
+
+
+class FakeGridIn:
+    """GridFS upload stream keeping chunks in memory."""
+
+    def __init__(self, bucket, filename, metadata):
+        self._id = ObjectId()
+        self.bucket = bucket
+        self.filename = filename
+        self.metadata = metadata
+        self.chunks: list[bytes] = []
+        self.aborted = False
+
+    async def write(self, data):
+        self.chunks.append(data)
+
+    async def set(self, name, value):
+        setattr(self, name, value)
+
+    async def close(self):
+        self.bucket.files[self._id] = b"".join(self.chunks)
+        if self.bucket.collection is not None:
+            await self.bucket.collection.insert_one({"_id": self._id, "metadata": self.metadata})
+
+    async def abort(self):
+        self.aborted = True
+
+
+class FakeGridOut:
+    """GridFS download stream over stored bytes."""
+
+    def __init__(self, data):
+        self.data = data
+        self.length = len(data)
+        self.position = 0
+        self.reads: list[int] = []
+        self.seeks: list[int] = []
+
+    def seek(self, pos):
+        self.seeks.append(pos)
+        self.position = pos
+
+    async def read(self, size=-1):
+        self.reads.append(size)
+        chunk = self.data[self.position : self.position + size]
+        self.position += len(chunk)
+        return chunk
+
+
+class FakeBucket:
+    """GridFS bucket storing files in a dict."""
+
+    def __init__(self, collection=None):
+        self.collection = collection
+        self.files: dict[ObjectId, bytes] = {}
+        self.uploads: list[FakeGridIn] = []
+        self.downloads: list[FakeGridOut] = []
+
+    def open_upload_stream(self, filename, metadata=None):
+        grid_in = FakeGridIn(self, filename, metadata)
+        self.uploads.append(grid_in)
+        return grid_in
+
+    async def open_download_stream(self, file_id):
+        grid_out = FakeGridOut(self.files[file_id])
+        self.downloads.append(grid_out)
+        return grid_out
+
+    async def delete(self, file_id):
+        del self.files[file_id]
+        if self.collection is not None:
+            await self.collection.delete_one({"_id": file_id})
+
+
+async def produce(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.fixture
+def local_field(tmp_path):
+    field = FileField(storage="local", upload_to=str(tmp_path), chunk_size=4, max_size=32)
+    field.name = "attachment"
+    return field
+
+
+@pytest.fixture
+def gridfs_field():
+    field = FileField(storage="gridfs", chunk_size=4, max_size=32)
+    field.name = "attachment"
+    field._fs = FakeBucket()
+    return field
+
+
+async def test_iter_chunks_sources(tmp_path):
+    path = tmp_path / "source.bin"
+    path.write_bytes(b"0123456789")
+
+    for source in (b"0123456789", path, str(path), io.BytesIO(b"0123456789"), produce(b"0123", b"", b"456789")):
+        chunks = [chunk async for chunk in iter_chunks(source, 4)]
+        assert b"".join(chunks) == b"0123456789"
+        assert all(len(chunk) <= 6 for chunk in chunks)
+
+
+async def test_limit_size_stops_before_consuming_rest():
+    consumed: list[bytes] = []
+
+    async def source():
+        for chunk in (b"aaaa", b"bbbb", b"cccc"):
+            consumed.append(chunk)
+            yield chunk
+
+    with pytest.raises(FileTooLargeError):
+        async for _ in limit_size(source(), 6):
+            pass
+    assert consumed == [b"aaaa", b"bbbb"]
+
+
+async def test_local_save_and_stream(local_field, tmp_path):
+    path = await local_field.save(produce(b"hello ", b"streaming ", b"world"), filename="hello.txt")
+
+    assert Path(path) == tmp_path / "hello.txt"
+    assert Path(path).read_bytes() == b"hello streaming world"
+
+    local_field._value = path
+    chunks = [chunk async for chunk in local_field.stream()]
+    assert all(len(chunk) <= 4 for chunk in chunks)
+    assert b"".join(chunks) == b"hello streaming world"
+    assert await local_field.read() == b"hello streaming world"
+
+
+async def test_local_save_too_large_leaves_nothing(local_field, tmp_path):
+    with pytest.raises(FieldValidationError) as exc_info:
+        await local_field.save(produce(*([b"x" * 8] * 10)), filename="big.bin")
+
+    assert exc_info.value.error.code == "file_too_large"
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_local_save_missing_path(local_field, tmp_path):
+    with pytest.raises(FieldValidationError) as exc_info:
+        await local_field.save(tmp_path / "missing.bin")
+    assert exc_info.value.error.code == "file_not_found"
+
+
+async def test_local_delete(local_field):
+    local_field._value = await local_field.save(b"data", filename="gone.txt")
+    await local_field.delete()
+    assert not Path(local_field._value).exists()
+
+
+async def test_gridfs_save_streams_chunks(gridfs_field):
+    file_id = await gridfs_field.save(b"0123456789", filename="digits.txt", content_type="text/plain")
+
+    upload = gridfs_field._fs.uploads[0]
+    assert upload.chunks == [b"0123", b"4567", b"89"]
+    assert gridfs_field._fs.files[file_id] == b"0123456789"
+
+
+async def test_gridfs_save_too_large_aborts(gridfs_field):
+    with pytest.raises(FieldValidationError) as exc_info:
+        await gridfs_field.save(produce(*([b"x" * 8] * 10)), filename="big.bin")
+
+    assert exc_info.value.error.code == "file_too_large"
+    upload = gridfs_field._fs.uploads[0]
+    assert upload.aborted
+    assert len(upload.chunks) == 4
+    assert gridfs_field._fs.files == {}
+
+
+async def test_gridfs_stream_reads_bounded_chunks(gridfs_field):
+    gridfs_field._value = await gridfs_field.save(b"0123456789", filename="digits.txt")
+
+    chunks = [chunk async for chunk in gridfs_field.stream(chunk_size=3)]
+    assert chunks == [b"012", b"345", b"678", b"9"]
+    assert gridfs_field._fs.downloads[0].reads == [3, 3, 3, 1]
+
+
+async def test_content_type_check(tmp_path):
+    field = FileField(storage="local", upload_to=str(tmp_path), allowed_types=["image/*"])
+    field.name = "picture"
+
+    with pytest.raises(FieldValidationError) as exc_info:
+        await field.save(b"text", filename="notes.txt")
+    assert exc_info.value.error.code == "invalid_content_type"
+
+    assert Path(await field.save(b"png", filename="pixel.png")).read_bytes() == b"png"
+
+
+async def test_gridfs_save_records_digest(gridfs_field):
+    gridfs_field._value = await gridfs_field.save(b"0123456789", filename="digits.txt", content_type="text/plain")
+
+    upload = gridfs_field._fs.uploads[0]
+    assert upload.metadata == {"content_type": "text/plain", "sha256": hashlib.sha256(b"0123456789").hexdigest()}
+
+
+async def test_read_range_local(local_field):
+    local_field._value = await local_field.save(b"0123456789", filename="digits.txt")
+
+    assert await local_field.read_range(3, 7) == b"3456"
+    assert await local_field.read_range(8) == b"89"
+    assert await local_field.read_range(5, 100) == b"56789"
+    assert await local_field.read_range(20, 30) == b""
+
+
+async def test_read_range_gridfs_seeks(gridfs_field):
+    gridfs_field._value = await gridfs_field.save(b"0123456789", filename="digits.txt")
+
+    assert await gridfs_field.read_range(5, 9) == b"5678"
+    download = gridfs_field._fs.downloads[0]
+    assert download.seeks == [5]
+    assert download.reads == [4]
+
+
+async def test_read_range_invalid(local_field):
+    local_field._value = await local_field.save(b"data", filename="data.txt")
+
+    for start, end in ((-1, 2), (3, 1)):
+        with pytest.raises(FieldValidationError) as exc_info:
+            await local_field.read_range(start, end)
+        assert exc_info.value.error.code == "invalid_range"
+
+
+def test_dedup_requires_hash():
+    with pytest.raises(ValueError):
+        FileField(storage="gridfs", hash_algorithm=None, dedup=True)
+    with pytest.raises(ValueError):
+        FileField(storage="gridfs", hash_algorithm="nope")
+
+
+@pytest.mark.parametrize("algorithm", ["shake_128", "shake_256", "md5-sha1"])
+def test_hash_algorithm_must_be_portable(algorithm):
+    with pytest.raises(ValueError, match="Unsupported hash algorithm"):
+        FileField(storage="gridfs", hash_algorithm=algorithm)
+
+
+async def test_local_dedup_shares_blob(tmp_path):
+    field = FileField(storage="local", upload_to=str(tmp_path / "%Y"), dedup=True)
+    field.name = "attachment"
+
+    first = Path(await field.save(b"same content", filename="a.txt"))
+    second = Path(await field.save(produce(b"same ", b"content"), filename="b.txt"))
+    other = Path(await field.save(b"other content", filename="c.txt"))
+
+    digest = hashlib.sha256(b"same content").hexdigest()
+    blob = tmp_path / ".blobs" / digest[:2] / f"{digest}.txt"
+    assert os.path.samefile(first, blob)
+    assert os.path.samefile(second, blob)
+    assert not os.path.samefile(other, blob)
+    assert blob.stat().st_nlink == 3
+
+    field._value = str(first)
+    await field.delete()
+    field._value = str(second)
+    await field.delete()
+    assert await field._local.prune() == 1
+    assert not blob.exists()
+    assert other.read_bytes() == b"other content"
+
+
+async def test_gridfs_dedup_references_oldest(mock_mongo_database):
+    field = FileField(storage="gridfs", dedup=True)
+    field.name = "attachment"
+    field._fs = FakeBucket(mock_mongo_database["fs.files"])
+    field._files = mock_mongo_database["fs.files"]
+
+    first = await field.save(b"same content", filename="a.txt")
+    second = await field.save(b"same content", filename="b.txt")
+    other = await field.save(b"other content", filename="c.txt")
+
+    assert second == first
+    assert other != first
+    assert set(field._fs.files) == {first, other}
+    assert (await field._files.find_one({"_id": first}))["metadata"]["refs"] == 1
+
+    field._value = first
+    await field.delete()
+    assert first in field._fs.files
+    await field.delete()
+    assert first not in field._fs.files
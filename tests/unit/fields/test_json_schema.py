@@ -0,0 +1,59 @@
+"""Unit tests for compiled JSONField schemas."""
+
+import pytest
+
+from earnorm.exceptions import FieldValidationError
+from earnorm.fields.primitive import json as json_module
+from earnorm.fields.primitive.json import JSONField, compile_schema
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "theme": {"type": "string", "enum": ["light", "dark"]},
+        "retries": {"type": "integer", "minimum": 0},
+    },
+    "required": ["theme"],
+}
+
+
+class TestCompiledSchema:
+    """Test schema compilation and reuse."""
+
+    def test_equal_schemas_share_validator(self):
+        reordered = {"required": ["theme"], "properties": dict(SCHEMA["properties"]), "type": "object"}
+
+        assert JSONField(schema=SCHEMA).schema_validator is JSONField(schema=reordered).schema_validator
+        assert compile_schema(SCHEMA) is not compile_schema({"type": "array"})
+
+    def test_draft_from_schema_keyword(self):
+        validator = compile_schema({"$schema": "http://json-schema.org/draft-07/schema#", "type": "object"})
+
+        assert type(validator).__name__ == "Draft7Validator"
+
+    def test_invalid_schema(self):
+        with pytest.raises(ValueError):
+            JSONField(schema={"type": "nope"})
+
+    async def test_schema_not_rechecked_per_value(self, monkeypatch):
+        field = JSONField(schema=SCHEMA)
+        field.name = "settings"
+
+        def fail(*args, **kwargs):
+            raise AssertionError("schema compiled again")
+
+        monkeypatch.setattr(json_module, "validator_for", fail)
+
+        assert await field.validate({"theme": "dark", "retries": 2}) == {"theme": "dark", "retries": 2}
+        errors = await field.validate_many([{"theme": "dark"}, {"theme": "blue"}, {"retries": -1}])
+
+        assert sorted(errors) == [1, 2]
+        assert all(error.error.code == "schema_error" for error in errors.values())
+        assert "'blue' is not one of" in str(errors[1])
+
+    async def test_schema_error(self):
+        field = JSONField(schema=SCHEMA)
+        field.name = "settings"
+
+        with pytest.raises(FieldValidationError) as exc_info:
+            await field.validate({"theme": "dark", "retries": "many"})
+        assert exc_info.value.error.code == "schema_error"
@@ -0,0 +1,174 @@
+"""Unit tests for JSONField storage modes and codecs."""
+
+import enum
+import json
+from datetime import date
+
+import pytest
+
+from earnorm.exceptions import FieldValidationError
+from earnorm.fields.primitive import json_codec
+from earnorm.fields.primitive.json import JSONField, is_native_json
+from earnorm.fields.primitive.json_codec import JSONCodec, OrjsonCodec, StdlibJSONCodec, get_codec
+
+
+class Color(enum.StrEnum):
+    RED = "red"
+
+
+class DateEncoder(json.JSONEncoder):
+    """Encoder writing dates as ISO strings."""
+
+    def default(self, o):
+        if isinstance(o, date):
+            return o.isoformat()
+        return super().default(o)
+
+
+class CountingCodec(StdlibJSONCodec):
+    """Codec counting serializations."""
+
+    name = "counting"
+
+    def __init__(self):
+        super().__init__()
+        self.dumped = 0
+
+    def dumps(self, value):
+        self.dumped += 1
+        return super().dumps(value)
+
+
+PAYLOAD = {"tags": ["a", "b"], "size": {"w": 1.5, "h": 2}, "active": True, "note": None}
+
+
+class TestNativeStorage:
+    """Test document storage on MongoDB."""
+
+    def test_is_native_json(self):
+        assert is_native_json(PAYLOAD)
+        assert not is_native_json({1: "a"})
+        assert not is_native_json({"a": ("b",)})
+        assert not is_native_json([Color.RED])
+
+    async def test_plain_values_pass_through(self):
+        codec = CountingCodec()
+        field = JSONField(codec=codec)
+
+        assert await field.to_db(PAYLOAD, "mongodb") is PAYLOAD
+        assert await field.from_db(PAYLOAD, "mongodb") is PAYLOAD
+        assert codec.dumped == 0
+
+    async def test_other_values_normalized_once(self):
+        codec = CountingCodec()
+        field = JSONField(codec=codec)
+
+        assert await field.to_db({"color": Color.RED, "pair": (1, 2), 3: "x"}, "mongodb") == {
+            "color": "red",
+            "pair": [1, 2],
+            "3": "x",
+        }
+        assert codec.dumped == 1
+
+    async def test_custom_encoder(self):
+        field = JSONField(encoder=DateEncoder)
+
+        assert await field.to_db({"day": date(2024, 5, 1)}, "mongodb") == {"day": "2024-05-01"}
+
+    async def test_unserializable_rejected_on_conversion(self):
+        field = JSONField()
+        field.name = "payload"
+
+        assert await field.validate({"value": object()}) is not None
+        with pytest.raises(FieldValidationError) as exc_info:
+            await field.to_db({"value": object()}, "mongodb")
+        assert exc_info.value.error.code == "invalid_json"
+
+    async def test_validate_does_not_serialize(self):
+        codec = CountingCodec()
+        field = JSONField(codec=codec, schema={"type": "object", "required": ["tags"]})
+
+        assert await field.validate(PAYLOAD) == PAYLOAD
+        assert await field.validate_many([PAYLOAD, {"size": 1}]) != {}
+        assert codec.dumped == 0
+
+    def test_comparison_uses_documents(self):
+        field = JSONField()
+        field.name = "settings"
+
+        assert field.has_value({"theme": "dark"}).value["value"] == {"theme": "dark"}
+        assert JSONField(storage="string").contains({"a": 1}).value == '{"a": 1}'
+
+
+class TestStringStorage:
+    """Test JSON string storage."""
+
+    async def test_string_storage_round_trip(self):
+        field = JSONField(storage="string")
+
+        stored = await field.to_db(PAYLOAD, "mongodb")
+        assert isinstance(stored, str)
+        assert await field.from_db(stored, "mongodb") == PAYLOAD
+
+    async def test_other_backends_use_strings(self):
+        field = JSONField()
+
+        stored = await field.to_db(PAYLOAD, "postgres")
+        assert json.loads(stored) == PAYLOAD
+        assert await field.from_db(stored, "postgres") == PAYLOAD
+
+    async def test_orjson_codec(self):
+        pytest.importorskip("orjson")
+        field = JSONField(storage="string", codec="orjson")
+
+        assert isinstance(field.codec, OrjsonCodec)
+        assert await field.to_db({"a": [1, 2]}, "mongodb") == '{"a":[1,2]}'
+        assert await field.from_db('{"a":[1,2]}', "mongodb") == {"a": [1, 2]}
+
+    async def test_orjson_errors_are_field_errors(self):
+        pytest.importorskip("orjson")
+        field = JSONField(storage="string", codec="orjson")
+        field.name = "payload"
+
+        with pytest.raises(FieldValidationError) as exc_info:
+            await field.to_db({"value": object()}, "mongodb")
+        assert exc_info.value.error.code == "invalid_json"
+        with pytest.raises(FieldValidationError) as exc_info:
+            await field.from_db("{broken", "mongodb")
+        assert exc_info.value.error.code == "conversion_error"
+
+
+class TestCodecs:
+    """Test codec lookup."""
+
+    def test_get_codec(self):
+        codec = StdlibJSONCodec()
+
+        assert get_codec(codec) is codec
+        assert isinstance(get_codec("json"), StdlibJSONCodec)
+        assert isinstance(get_codec("auto"), JSONCodec)
+        with pytest.raises(ValueError):
+            get_codec("yaml")
+
+    def test_auto_falls_back_to_stdlib(self, monkeypatch):
+        def missing():
+            raise ImportError("not installed")
+
+        monkeypatch.setitem(json_codec.CODECS, "orjson", missing)
+        monkeypatch.setitem(json_codec.CODECS, "msgspec", missing)
+
+        assert isinstance(get_codec("auto"), StdlibJSONCodec)
+        with pytest.raises(ImportError):
+            JSONField(codec="orjson")
+
+    def test_register_codec(self, monkeypatch):
+        monkeypatch.setattr(json_codec, "CODECS", dict(json_codec.CODECS))
+        json_codec.register_codec("counting", CountingCodec)
+
+        assert isinstance(JSONField(codec="counting").codec, CountingCodec)
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            JSONField(storage="binary")
+        with pytest.raises(ValueError):
+            JSONField(encoder=DateEncoder, codec="orjson")
@@ -0,0 +1,130 @@
+"""Tests for the sliding-window circuit breaker."""
+
+import pytest
+
+from earnorm.exceptions import CircuitBreakerError
+from earnorm.pool.core import circuit
+from earnorm.pool.core.circuit import CircuitBreaker, CircuitState
+from earnorm.pool.core.decorators import with_resilience
+from earnorm.pool.core.retry import RetryPolicy
+
+
+class FakeClock:
+    """Deterministic replacement for time.time()."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Patch the circuit module clock."""
+    fake = FakeClock()
+    monkeypatch.setattr(circuit.time, "time", fake)
+    return fake
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions."""
+
+    def test_success_keeps_circuit_closed(self, clock):
+        breaker = CircuitBreaker(failure_threshold=2)
+        for _ in range(100):
+            breaker.before_call()
+            breaker.record_success()
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.stats.successful_requests == 100
+
+    def test_opens_on_failure_rate(self, clock):
+        breaker = CircuitBreaker(failure_threshold=3, failure_rate_threshold=0.5)
+        breaker.record_success()
+        breaker.record_failure(RuntimeError())
+        breaker.record_failure(RuntimeError())
+        assert breaker.state is CircuitState.CLOSED
+
+        breaker.record_failure(RuntimeError())
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitBreakerError):
+            breaker.before_call()
+
+    def test_low_failure_rate_does_not_open(self, clock):
+        breaker = CircuitBreaker(failure_threshold=3, failure_rate_threshold=0.5)
+        for _ in range(10):
+            breaker.record_success()
+        for _ in range(3):
+            breaker.record_failure(RuntimeError())
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_failures_expire_with_window(self, clock):
+        breaker = CircuitBreaker(failure_threshold=3, window_size=10.0, bucket_count=5)
+        breaker.record_failure(RuntimeError())
+        breaker.record_failure(RuntimeError())
+        clock.now += 11.0
+        breaker.record_failure(RuntimeError())
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.failure_rate == 1.0
+
+    def test_excluded_exceptions_are_not_failures(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, excluded_exceptions=[KeyError])
+        breaker.record_failure(KeyError("missing"))
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.stats.failed_requests == 1
+
+    def test_half_open_recovers(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0, half_open_timeout=0.0)
+        breaker.record_failure(RuntimeError())
+        assert breaker.state is CircuitState.OPEN
+
+        clock.now += 31.0
+        breaker.before_call()
+        assert breaker.state is CircuitState.HALF_OPEN
+
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_failure_reopens(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0)
+        breaker.record_failure(RuntimeError())
+        clock.now += 31.0
+        breaker.before_call()
+        breaker.record_failure(RuntimeError())
+
+        assert breaker.state is CircuitState.OPEN
+
+
+class TestWithResilience:
+    """Test decorator fast and slow paths."""
+
+    @pytest.mark.asyncio
+    async def test_retries_after_failure(self):
+        calls = []
+
+        @with_resilience(retry_policy=RetryPolicy(max_retries=2, base_delay=0.0, max_delay=0.0))
+        async def flaky() -> str:
+            calls.append(1)
+            if len(calls) < 2:
+                raise RuntimeError("transient")
+            return "ok"
+
+        assert await flaky() == "ok"
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_rejects_call(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+
+        @with_resilience(circuit_breaker=breaker)
+        async def broken() -> None:
+            raise RuntimeError("down")
+
+        with pytest.raises(RuntimeError):
+            await broken()
+        with pytest.raises(CircuitBreakerError):
+            await broken()
@@ -0,0 +1,187 @@
+"""Tests for pool pre-warming and adaptive sizing."""
+
+import asyncio
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from mongomock_motor import AsyncMongoMockClient
+
+from earnorm.pool.backends.mongo import MongoPool
+from earnorm.pool.backends.redis import RedisPool
+from earnorm.pool.core.sizing import PoolSizer, SizingPolicy, pre_warm
+
+
+class FakePool:
+    """Minimal resizable pool."""
+
+    backend = "fake"
+
+    def __init__(self, size: int = 1, min_size: int = 1, max_size: int = 10) -> None:
+        self.size = size
+        self.min_size = min_size
+        self.max_size = max_size
+        self.in_use = 0
+        self.waiters = 0
+
+    async def grow(self, count: int) -> int:
+        count = min(count, self.max_size - self.size)
+        self.size += count
+        return count
+
+    async def shrink(self, count: int) -> int:
+        count = min(count, self.size - self.min_size)
+        self.size -= count
+        return count
+
+
+@pytest.mark.asyncio
+async def test_pre_warm_opens_connections_concurrently():
+    active = 0
+    peak = 0
+
+    async def open_connection() -> object:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return object()
+
+    connections, errors = await pre_warm(open_connection, 5)
+
+    assert len(connections) == 5
+    assert errors == []
+    assert peak == 5
+
+
+@pytest.mark.asyncio
+async def test_pre_warm_collects_errors():
+    calls = 0
+
+    async def open_connection() -> int:
+        nonlocal calls
+        calls += 1
+        if calls % 2:
+            raise ConnectionError("refused")
+        return calls
+
+    connections, errors = await pre_warm(open_connection, 4)
+
+    assert connections == [2, 4]
+    assert len(errors) == 2
+
+
+class TestPoolSizer:
+    """Test sizing decisions."""
+
+    @pytest.mark.asyncio
+    async def test_grows_on_waiters(self):
+        pool = FakePool(size=2, max_size=5)
+        decisions = []
+        sizer = PoolSizer(pool, SizingPolicy(on_decision=decisions.append))
+
+        pool.waiters = 2
+        decision = await sizer.step()
+        assert decision is not None
+        assert (decision.action, decision.previous_size, decision.new_size) == ("grow", 2, 4)
+
+        pool.waiters = 4
+        await sizer.step()
+        assert pool.size == 5
+        assert await sizer.step() is None
+
+        assert [d.action for d in decisions] == ["grow", "grow"]
+        assert sizer.get_stats()["connections_opened"] == 3
+
+    @pytest.mark.asyncio
+    async def test_grow_step(self):
+        pool = FakePool(size=1, max_size=10)
+        sizer = PoolSizer(pool, SizingPolicy(grow_step=4))
+
+        pool.waiters = 1
+        await sizer.step()
+
+        assert pool.size == 5
+
+    @pytest.mark.asyncio
+    async def test_shrinks_after_idle_timeout(self):
+        pool = FakePool(size=6, min_size=2)
+        sizer = PoolSizer(pool, SizingPolicy(idle_timeout=0.05))
+
+        pool.in_use = 1
+        assert await sizer.step() is None
+        pool.in_use = 0
+        assert await sizer.step() is None
+
+        await asyncio.sleep(0.06)
+        decision = await sizer.step()
+
+        assert decision is not None
+        assert decision.action == "shrink"
+        assert pool.size == 2
+        assert sizer.get_stats()["shrinks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_background_loop(self):
+        pool = FakePool(size=1, max_size=3)
+        sizer = PoolSizer(pool, SizingPolicy(interval=0.01, idle_timeout=60))
+        pool.waiters = 5
+
+        sizer.start()
+        await asyncio.sleep(0.05)
+        await sizer.stop()
+
+        assert pool.size == 3
+        assert not sizer.running
+
+
+class TestRedisPoolSizing:
+    """Test grow/shrink on Redis pool."""
+
+    @pytest.fixture
+    def pool(self):
+        pool = RedisPool(min_size=1, max_size=4, sizing=SizingPolicy(idle_timeout=0))
+        pool._client = FakeAsyncRedis()
+        return pool
+
+    @pytest.mark.asyncio
+    async def test_grow_respects_max_size(self, pool):
+        assert await pool.grow(10) == 4
+        assert pool.size == 4
+        assert await pool.grow(1) == 0
+
+    @pytest.mark.asyncio
+    async def test_shrink_keeps_min_size_and_in_use(self, pool):
+        await pool.grow(4)
+        conn = await pool.acquire()
+
+        assert await pool.shrink(10) == 3
+        assert pool.size == 1
+        assert pool.in_use == 1
+
+        await pool.release(conn)
+        assert pool.get_stats()["waiters"] == 0
+
+    @pytest.mark.asyncio
+    async def test_grow_and_acquire_stay_within_max_size(self, pool):
+        opened, *conns = await asyncio.gather(pool.grow(4), *(pool.acquire() for _ in range(4)))
+
+        assert opened == 4
+        assert len(set(conns)) == 4
+        assert pool.size == 4
+        assert pool.waiters == 0
+
+
+class TestMongoPoolSizing:
+    """Test grow on MongoDB pool."""
+
+    @pytest.mark.asyncio
+    async def test_grow_and_acquire_stay_within_max_size(self):
+        pool = MongoPool(uri="mongodb://localhost:27017", database="test", min_size=0, max_size=3)
+        pool._client = AsyncMongoMockClient()
+
+        opened, *conns = await asyncio.gather(pool.grow(3), *(pool.acquire() for _ in range(3)))
+
+        assert opened == 3
+        assert len(set(conns)) == 3
+        assert pool.size == 3
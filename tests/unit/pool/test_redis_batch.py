@@ -0,0 +1,113 @@
+"""Tests for batched Redis commands."""
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from earnorm.exceptions import BatchQueryError, QueryError
+from earnorm.pool.backends.redis import RedisConnection, RedisPool
+
+
+@pytest.fixture
+def client():
+    """In-memory Redis client."""
+    return FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.fixture
+def conn(client):
+    """Redis connection over fake client."""
+    return RedisConnection(client)
+
+
+@pytest.fixture
+def pool(client):
+    """Redis pool over fake client."""
+    pool = RedisPool(min_size=1, max_size=2)
+    pool._client = client
+    return pool
+
+
+class TestRedisConnectionBatch:
+    """Test RedisConnection.execute_many and batch."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_order(self, conn):
+        results = await conn.execute_many(
+            [
+                ("mset", ({"a": "1", "b": "2"},)),
+                ("expire", ("a", 60)),
+                ("mget", (["a", "b", "c"],)),
+                ("delete", ("b",)),
+                ("set", ("c", "3"), {"ex": 30}),
+            ]
+        )
+
+        assert results == [True, True, ["1", "2", None], 1, True]
+        assert await conn.execute("ttl", name="c") > 0
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self, conn):
+        assert await conn.execute_many([]) == []
+
+    @pytest.mark.asyncio
+    async def test_per_command_errors(self, conn):
+        await conn.execute("set", name="text", value="x")
+        commands = [("set", ("k", "v")), ("incr", ("text",)), ("get", ("k",))]
+
+        with pytest.raises(BatchQueryError) as exc_info:
+            await conn.execute_many(commands)
+
+        error = exc_info.value
+        assert list(error.errors) == [1]
+        assert isinstance(error.errors[1], QueryError)
+        assert error.results[0] is True
+        assert error.results[2] == "v"
+
+        results = await conn.execute_many(commands, raise_on_error=False)
+        assert isinstance(results[1], QueryError)
+        assert results[2] == "v"
+
+    @pytest.mark.asyncio
+    async def test_unknown_operation(self, conn):
+        with pytest.raises(QueryError):
+            await conn.execute_many([("not_a_command", ())])
+
+    @pytest.mark.asyncio
+    async def test_batch_context(self, conn):
+        async with conn.batch() as batch:
+            first = batch.add("set", "a", "1")
+            second = batch.add("get", "a")
+
+        assert len(batch) == 0
+        assert batch.results[first] is True
+        assert batch.results[second] == "1"
+
+    @pytest.mark.asyncio
+    async def test_batch_discarded_on_exception(self, conn):
+        with pytest.raises(RuntimeError):
+            async with conn.batch() as batch:
+                batch.add("set", "a", "1")
+                raise RuntimeError("abort")
+
+        assert await conn.execute("get", name="a") is None
+
+
+class TestRedisPoolBatch:
+    """Test RedisPool.execute_many and batch."""
+
+    @pytest.mark.asyncio
+    async def test_execute_many_releases_connection(self, pool):
+        results = await pool.execute_many([("set", ("a", "1")), ("incr", ("a",))])
+
+        assert results == [True, 2]
+        assert pool.in_use == 0
+        assert pool.available == 1
+
+    @pytest.mark.asyncio
+    async def test_batch(self, pool):
+        async with pool.batch(transaction=True) as batch:
+            batch.add("rpush", "queue", "x", "y")
+            batch.add("lrange", "queue", 0, -1)
+
+        assert batch.results == [2, ["x", "y"]]
+        assert pool.in_use == 0